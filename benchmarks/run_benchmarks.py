@@ -0,0 +1,651 @@
+#!/usr/bin/env python3
+"""Headless micro-benchmarks for the detection, rendering and dataset hot paths.
+
+Covers:
+- SignRecorder CSV load + KNN training and predict_with_confidence at 1k/10k/100k rows
+- process_tasks_landmarks on synthetic MediaPipe-style landmarks
+- Temporal vote throughput (GameplayMixin._apply_temporal_vote)
+- cv2_to_pygame + smoothscale (camera blit path)
+- HUD text rendering with and without the text-surface cache
+- Each effect's update/render against a dummy SDL video driver
+- Dataset tools (validate / augment / polish) on a synthetic 200k-row CSV
+- Launcher import time (`python -X importtime`) and which heavy modules it pulls in
+
+Everything runs without a camera or window. Results are written as JSON so two
+commits can be compared with --compare.
+
+Usage examples:
+  python benchmarks/run_benchmarks.py
+  python benchmarks/run_benchmarks.py --quick --only knn,vote
+  python benchmarks/run_benchmarks.py --json-out before.json
+  python benchmarks/run_benchmarks.py --json-out after.json --compare before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+HAND_FLOATS = 63
+LABELS = ["idle", "tiger", "ram", "snake", "horse", "rat", "boar", "dog", "bird", "monkey", "ox", "dragon", "hare", "clap"]
+KNN_ROW_COUNTS = (1_000, 10_000, 100_000)
+DATASET_ROWS = 200_000
+SCREEN_SIZE = (1280, 720)
+FRAME_SIZE = (640, 480)
+LAUNCHER_MODULE = "src.jutsu_academy.main_pygame_app"
+DEFERRED_MODULES = ("mediapipe", "ultralytics", "torch", "supabase", "requests", "flask")
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    def register(fn):
+        BENCHMARKS[name] = fn
+        return fn
+    return register
+
+
+def measure(fn, repeat=20, warmup=2) -> dict:
+    """Time fn() `repeat` times after `warmup` untimed calls."""
+    for _ in range(max(0, warmup)):
+        fn()
+    samples = []
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    mean = sum(samples) / len(samples)
+    p95 = samples[min(len(samples) - 1, int(round((len(samples) - 1) * 0.95)))]
+    return {
+        "repeat": len(samples),
+        "mean_ms": round(mean * 1000.0, 4),
+        "p50_ms": round(statistics.median(samples) * 1000.0, 4),
+        "p95_ms": round(p95 * 1000.0, 4),
+        "min_ms": round(samples[0] * 1000.0, 4),
+        "ops_per_s": round(1.0 / mean, 1) if mean > 0 else None,
+    }
+
+
+# ─── Synthetic data ─────────────────────────────────────────────────────────
+def synthetic_hand(rng: random.Random, center_x=0.5, center_y=0.5):
+    return [
+        SimpleNamespace(
+            x=center_x + rng.uniform(-0.08, 0.08),
+            y=center_y + rng.uniform(-0.12, 0.12),
+            z=rng.uniform(-0.05, 0.05),
+        )
+        for _ in range(21)
+    ]
+
+
+def synthetic_row(rng: random.Random, one_hand_ratio=0.1):
+    label = rng.choice(LABELS)
+    # Cluster rows per label so the KNN sees realistic, separable neighbourhoods.
+    base = (LABELS.index(label) + 1) * 0.05
+    h1 = [round(base + rng.gauss(0.0, 0.08), 5) for _ in range(HAND_FLOATS)]
+    if rng.random() < one_hand_ratio:
+        h2 = [0.0] * HAND_FLOATS
+    else:
+        h2 = [round(-base + rng.gauss(0.0, 0.08), 5) for _ in range(HAND_FLOATS)]
+    return [label] + h1 + h2
+
+
+def write_synthetic_csv(path: Path, rows: int, seed=7) -> Path:
+    rng = random.Random(seed)
+    header = ["label"] + [f"h1_{i}_{ax}" for i in range(21) for ax in "xyz"] + \
+                         [f"h2_{i}_{ax}" for i in range(21) for ax in "xyz"]
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for _ in range(rows):
+            writer.writerow(synthetic_row(rng))
+    return path
+
+
+def synthetic_frame(width=FRAME_SIZE[0], height=FRAME_SIZE[1]):
+    import numpy as np
+
+    rng = np.random.default_rng(3)
+    return rng.integers(0, 255, size=(height, width, 3), dtype=np.uint8)
+
+
+def effect_context(frame, **overrides):
+    from src.jutsu_academy.effects.base import EffectContext
+
+    h, w = frame.shape[:2]
+    scale = min(SCREEN_SIZE[0] / float(w), SCREEN_SIZE[1] / float(h))
+    values = {
+        "dt": 1.0 / 60.0,
+        "effect_duration": 6.0,
+        "frame_bgr": frame,
+        "frame_shape": frame.shape,
+        "hand_pos": (w // 2, h // 2),
+        "mouth_pos": (w // 2, int(h * 0.45)),
+        "face_center": (w // 2, int(h * 0.35)),
+        "left_eye_pos": (int(w * 0.44), int(h * 0.32)),
+        "right_eye_pos": (int(w * 0.56), int(h * 0.32)),
+        "left_eye_size": (26, 20),
+        "right_eye_size": (26, 20),
+        "cam_x": int((SCREEN_SIZE[0] - w * scale) / 2),
+        "cam_y": int((SCREEN_SIZE[1] - h * scale) / 2),
+        "scale_x": scale,
+        "scale_y": scale,
+    }
+    values.update(overrides)
+    return EffectContext(**values)
+
+
+def init_display():
+    import pygame
+
+    pygame.display.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode(SCREEN_SIZE)
+    return pygame.Surface(SCREEN_SIZE)
+
+
+# ─── Detection ──────────────────────────────────────────────────────────────
+def _recorder_for(csv_path: Path, max_rows: int):
+    import src.mp_trainer as mp_trainer
+
+    os.environ["MP_TRAINER_MAX_ROWS"] = str(max_rows)
+    return mp_trainer.SignRecorder(data_file=csv_path)
+
+
+@benchmark("knn")
+def bench_knn(workdir: Path, quick: bool) -> dict:
+    """CSV load + KNN training, then single-sample predict_with_confidence."""
+    import numpy as np
+
+    counts = KNN_ROW_COUNTS[:2] if quick else KNN_ROW_COUNTS
+    rng = np.random.default_rng(11)
+    queries = rng.normal(0.0, 0.2, size=(64, HAND_FLOATS * 2)).astype(np.float32)
+    out = {}
+    for rows in counts:
+        csv_path = write_synthetic_csv(workdir / f"knn_{rows}.csv", rows)
+        recorder = _recorder_for(csv_path, rows)
+        load = measure(recorder._load_and_train, repeat=2 if rows >= 100_000 else 4, warmup=0)
+        idx = {"i": 0}
+
+        def predict_once():
+            recorder.predict_with_confidence(queries[idx["i"] % len(queries)])
+            idx["i"] += 1
+
+        out[f"rows_{rows}"] = {
+            "load_and_train": load,
+            "predict_with_confidence": measure(predict_once, repeat=200 if quick else 1000, warmup=10),
+        }
+    return out
+
+
+@benchmark("features")
+def bench_features(workdir: Path, quick: bool) -> dict:
+    """process_tasks_landmarks on one- and two-hand synthetic landmarks."""
+    recorder = _recorder_for(write_synthetic_csv(workdir / "features.csv", 200), 500)
+    rng = random.Random(5)
+    two_hands = [synthetic_hand(rng, 0.35, 0.55), synthetic_hand(rng, 0.65, 0.55)]
+    one_hand = two_hands[:1]
+    handedness = [[SimpleNamespace(category_name="Left", score=0.98)], [SimpleNamespace(category_name="Right", score=0.97)]]
+    repeat = 500 if quick else 3000
+    return {
+        "two_hands": measure(lambda: recorder.process_tasks_landmarks(two_hands, handedness), repeat=repeat, warmup=20),
+        "one_hand": measure(lambda: recorder.process_tasks_landmarks(one_hand, handedness[:1]), repeat=repeat, warmup=20),
+        "no_hands": measure(lambda: recorder.process_tasks_landmarks([], []), repeat=repeat, warmup=20),
+    }
+
+
+@benchmark("vote")
+def bench_vote(workdir: Path, quick: bool) -> dict:
+    """Temporal vote throughput, and the full classify path (KNN + gate + vote) per frame."""
+    signs_db = write_synthetic_csv(workdir / "vote.csv", 2_000)
+    os.environ["MP_TRAINER_MAX_ROWS"] = "2000"
+    from src.replay_detection import ReplayDetector
+
+    detector = ReplayDetector(restricted_signs=False, signs_db=signs_db)
+    rng = random.Random(9)
+    signs = [(rng.choice(LABELS[1:]), rng.uniform(0.3, 0.95)) for _ in range(256)]
+    clock = {"t": 0.0, "i": 0}
+
+    def vote_once():
+        sign, conf = signs[clock["i"] % len(signs)]
+        clock["i"] += 1
+        clock["t"] += 1.0 / 30.0
+        detector._apply_temporal_vote(sign, conf, True, hands_now=2, now=clock["t"])
+
+    hands = [synthetic_hand(rng, 0.35, 0.55), synthetic_hand(rng, 0.65, 0.55)]
+    handedness = [[SimpleNamespace(category_name="Left", score=0.98)], [SimpleNamespace(category_name="Right", score=0.97)]]
+
+    def classify_once():
+        clock["t"] += 1.0 / 30.0
+        detector._classify_hand_landmarks(hands, handedness, True, now=clock["t"])
+
+    repeat = 1000 if quick else 10000
+    return {
+        "apply_temporal_vote": measure(vote_once, repeat=repeat, warmup=50),
+        "classify_hand_landmarks": measure(classify_once, repeat=repeat // 5, warmup=20),
+    }
+
+
+# ─── Rendering ──────────────────────────────────────────────────────────────
+@benchmark("camera_blit")
+def bench_camera_blit(workdir: Path, quick: bool) -> dict:
+    """cv2_to_pygame + smoothscale to the camera rect, then blit."""
+    import pygame
+    from src.jutsu_academy.main_pygame_mixins.gameplay import GameplayMixin
+
+    screen = init_display()
+    frame = synthetic_frame()
+    host = GameplayMixin()
+    target = (960, 720)
+    state = {}
+
+    def convert():
+        state["surf"] = host.cv2_to_pygame(frame)
+
+    def convert_scale_blit():
+        surf = host.cv2_to_pygame(frame)
+        screen.blit(pygame.transform.smoothscale(surf, target), (160, 0))
+
+    convert()
+    repeat = 60 if quick else 300
+    return {
+        "cv2_to_pygame": measure(convert, repeat=repeat, warmup=5),
+        "smoothscale": measure(lambda: pygame.transform.smoothscale(state["surf"], target), repeat=repeat, warmup=5),
+        "convert_scale_blit": measure(convert_scale_blit, repeat=repeat, warmup=5),
+    }
+
+
+@benchmark("text")
+def bench_text(workdir: Path, quick: bool) -> dict:
+    """A HUD-sized batch of labels per frame: raw font.render vs the text-surface cache."""
+    import pygame
+    from src.jutsu_academy.text_cache import CachedFont, TextSurfaceCache
+
+    screen = init_display()
+    pygame.font.init()
+    sizes = (80, 40, 28, 24, 18)
+    raw_fonts = [pygame.font.Font(None, size) for size in sizes]
+    cache = TextSurfaceCache()
+    cached_fonts = [CachedFont(font, cache) for font in raw_fonts]
+    labels = [f"{word} {i}" for i, word in enumerate(LABELS * 4)]
+    frame = [0]
+
+    def draw(fonts):
+        # Mostly static strings plus one per-frame timer, like the gameplay HUD.
+        y = 0
+        for i, label in enumerate(labels):
+            font = fonts[i % len(fonts)]
+            screen.blit(font.render(label, True, (240, 240, 240)), (10, y % SCREEN_SIZE[1]))
+            y += 12
+        timer = f"{frame[0] * 0.016:.2f}s"
+        screen.blit(fonts[1].render(timer, True, (255, 200, 80)), (600, 10))
+        frame[0] += 1
+
+    repeat = 60 if quick else 300
+    results = {
+        "raw_render": measure(lambda: draw(raw_fonts), repeat=repeat, warmup=5),
+        "cached_render": measure(lambda: draw(cached_fonts), repeat=repeat, warmup=5),
+    }
+    results["labels_per_frame"] = len(labels) + 1
+    results["cache"] = cache.stats()
+    return results
+
+
+class SimClock:
+    """Stand-in for an effect module's `time`: perf_counter() only advances through tick()."""
+
+    def __init__(self):
+        self.now = time.perf_counter()
+
+    def tick(self, dt: float) -> None:
+        self.now += dt
+
+    def perf_counter(self) -> float:
+        return self.now
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+def _bench_effect(effect, jutsu_name: str, quick: bool, warm_s: float = 2.0) -> dict:
+    screen = init_display()
+    frame = synthetic_frame()
+    # Effects phase on time.perf_counter(). A simulated clock makes warm-up reach the main phase
+    # (past intros like the water dragon's gather/ramp) however fast the host is, and the long
+    # duration keeps the timed frames there instead of in the fade-out.
+    ctx = effect_context(frame, jutsu_name=jutsu_name, effect_duration=3600.0)
+    module = sys.modules[type(effect).__module__]
+    real_time = getattr(module, "time", None)
+    clock = SimClock()
+    if real_time is not None:
+        module.time = clock
+
+    def step():
+        clock.tick(ctx.dt)
+        effect.update(ctx)
+
+    try:
+        effect.on_jutsu_start(ctx)
+        for _ in range(int(round(warm_s / ctx.dt))):
+            step()
+        repeat = 60 if quick else 300
+        return {
+            "update": measure(step, repeat=repeat, warmup=5),
+            "render": measure(lambda: effect.render(screen, ctx), repeat=repeat, warmup=5),
+        }
+    finally:
+        if real_time is not None:
+            module.time = real_time
+
+
+@benchmark("effects")
+def bench_effects(workdir: Path, quick: bool) -> dict:
+    """update/render for every effect; effects that fail to build are reported as skipped."""
+    init_display()
+    out = {}
+
+    def run(name, build, jutsu_name):
+        try:
+            out[name] = _bench_effect(build(), jutsu_name, quick)
+        except Exception as e:
+            print(f"[!] effects.{name} skipped: {e}")
+            out[name] = {"skipped": str(e)}
+
+    def build_water_dragon():
+        from src.jutsu_academy.effects.water_dragon_effect import WaterDragonEffect
+        return WaterDragonEffect()
+
+    def build_sharingan():
+        from src.jutsu_academy.effects.sharingan_effect import SharinganEffect
+        return SharinganEffect()
+
+    def build_shadow_clone():
+        from src.jutsu_academy.effects.shadow_clone_effect import ShadowCloneEffect
+        return ShadowCloneEffect()
+
+    def build_reaper():
+        from src.jutsu_academy.effects.reaper_death_seal_effect import ReaperDeathSealEffect
+        return ReaperDeathSealEffect()
+
+    run("water_dragon", build_water_dragon, "Water Dragon")
+    run("sharingan", build_sharingan, "Sharingan")
+    run("shadow_clone", build_shadow_clone, "Shadow Clone")
+    run("reaper_death_seal", build_reaper, "Reaper Death Seal")
+
+    for style, max_particles in (("fireball", 200), ("fireball", 1200), ("phoenix", 200)):
+        key = f"fire_{style}_{max_particles}"
+        try:
+            out[key] = _bench_fire(style, max_particles, quick)
+        except Exception as e:
+            print(f"[!] effects.{key} skipped: {e}")
+            out[key] = {"skipped": str(e)}
+    return out
+
+
+def _bench_fire(style: str, max_particles: int, quick: bool) -> dict:
+    from src.jutsu_academy.main_pygame_shared import FireParticleSystem
+
+    screen = init_display()
+    fire = FireParticleSystem(max_particles=max_particles)
+    fire.set_style(style)
+    fire.set_position(SCREEN_SIZE[0] // 2, SCREEN_SIZE[1] // 2)
+    fire.emitting = True
+    dt = 1.0 / 60.0
+    # The game's pools (200 / 72) fill at its own emission rate; larger pools get
+    # extra particles per frame here so they reach capacity within the warm-up.
+    extra = max(0, max_particles // 40 - 18) if style == "fireball" else 0
+
+    def step():
+        fire.update(dt)
+        if extra:
+            fire.emit(extra)
+
+    for _ in range(30 if quick else 90):
+        step()
+    repeat = 60 if quick else 300
+    return {
+        "particles": len(fire.particles),
+        "update": measure(step, repeat=repeat, warmup=5),
+        "render": measure(lambda: fire.render(screen), repeat=repeat, warmup=5),
+    }
+
+
+# ─── Dataset tools ──────────────────────────────────────────────────────────
+@benchmark("dataset_tools")
+def bench_dataset_tools(workdir: Path, quick: bool) -> dict:
+    """validate / augment / polish on a synthetic 200k-row CSV (20k with --quick)."""
+    from src import augment_mediapipe_csv as augment
+    from src import polish_mediapipe_csv as polish
+    from src import validate_mediapipe_csv as validate
+
+    rows = DATASET_ROWS // 10 if quick else DATASET_ROWS
+    csv_path = workdir / f"dataset_{rows}.csv"
+    gen_start = time.perf_counter()
+    write_synthetic_csv(csv_path, rows)
+    gen_s = time.perf_counter() - gen_start
+
+    with csv_path.open("r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        loaded = list(reader)
+
+    def polish_pass():
+        kept = 0
+        for row in loaded:
+            parsed = polish.row_to_values(row)
+            if parsed is None:
+                continue
+            values = parsed[1]
+            if polish.hand_present(values[:HAND_FLOATS], 1e-6, 8) and polish.hand_present(values[HAND_FLOATS:], 1e-6, 8):
+                kept += 1
+        return kept
+
+    return {
+        "rows": rows,
+        "file_size_bytes": csv_path.stat().st_size,
+        "generate_s": round(gen_s, 3),
+        "validate_inspect_dataset": measure(lambda: validate.inspect_dataset(csv_path, 1e-6, 8), repeat=2, warmup=0),
+        "augment_rows": measure(lambda: augment.augment_rows(loaded, 1 + HAND_FLOATS * 2, True), repeat=2, warmup=0),
+        "polish_filter": measure(polish_pass, repeat=2, warmup=0),
+    }
+
+
+# ─── Startup ────────────────────────────────────────────────────────────────
+def _import_launcher(importtime=False) -> str:
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += ["-c", f"import {LAUNCHER_MODULE}"]
+    out = subprocess.run(cmd, cwd=str(ROOT), capture_output=True, text=True, timeout=300)
+    if out.returncode != 0:
+        tail = out.stderr.strip().splitlines()[-1:] or ["no output"]
+        raise RuntimeError(f"launcher import failed: {tail[0]}")
+    return out.stderr
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int, int]]:
+    """Map module -> (self_us, cumulative_us, depth) from `-X importtime` output."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        except ValueError:
+            continue
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        modules[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return modules
+
+
+@benchmark("startup")
+def bench_startup(workdir: Path, quick: bool) -> dict:
+    """Fresh-interpreter import of the desktop launcher; everything here is paid before the menu shows."""
+    modules = parse_importtime(_import_launcher(importtime=True))
+    top_level_us = sum(cumulative for _, cumulative, depth in modules.values() if depth == 0)
+    heaviest = sorted(((name, self_us) for name, (self_us, _, _) in modules.items()), key=lambda item: item[1], reverse=True)[:10]
+    return {
+        "launcher_import": measure(_import_launcher, repeat=3 if quick else 10, warmup=1),
+        "importtime_total_ms": round(top_level_us / 1000.0, 1),
+        "modules_imported": len(modules),
+        "heaviest_self_ms": {name: round(us / 1000.0, 1) for name, us in heaviest},
+        "deferred_modules_loaded": sorted(name for name in DEFERRED_MODULES if name in modules),
+    }
+
+
+# ─── Reporting ──────────────────────────────────────────────────────────────
+def git_revision() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=str(ROOT), capture_output=True, text=True, timeout=10,
+        )
+        return out.stdout.strip() or "unknown"
+    except Exception:
+        return "unknown"
+
+
+def flatten_means(results: dict, prefix="") -> dict[str, float]:
+    flat = {}
+    for key, value in results.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            if "mean_ms" in value:
+                flat[path] = float(value["mean_ms"])
+            else:
+                flat.update(flatten_means(value, path))
+    return flat
+
+
+def compare(current: dict, baseline: dict, threshold_pct: float) -> list[dict]:
+    now = flatten_means(current.get("results", {}))
+    before = flatten_means(baseline.get("results", {}))
+    rows = []
+    for key in sorted(set(now) & set(before)):
+        if before[key] <= 0:
+            continue
+        delta_pct = (now[key] - before[key]) / before[key] * 100.0
+        rows.append({
+            "benchmark": key,
+            "baseline_ms": before[key],
+            "current_ms": now[key],
+            "delta_pct": round(delta_pct, 1),
+            "regressed": delta_pct > threshold_pct,
+        })
+    return rows
+
+
+def print_results(results: dict) -> None:
+    for key, mean_ms in flatten_means(results).items():
+        print(f"  {key:<58} {mean_ms:>10.4f} ms")
+
+
+def print_comparison(rows: list[dict]) -> None:
+    print("[Compare]")
+    for row in rows:
+        marker = "  <-- slower" if row["regressed"] else ""
+        print(
+            f"  {row['benchmark']:<58} {row['baseline_ms']:>10.4f} -> {row['current_ms']:>10.4f} ms "
+            f"({row['delta_pct']:+.1f}%){marker}"
+        )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run headless hot-path benchmarks and emit JSON")
+    parser.add_argument("--only", default="", help=f"Comma-separated subset of: {', '.join(BENCHMARKS)}")
+    parser.add_argument("--quick", action="store_true", help="Smaller datasets and fewer repeats")
+    parser.add_argument("--json-out", default="", help="Output JSON path (default: benchmarks/results/<git-rev>.json)")
+    parser.add_argument("--compare", default="", help="Baseline JSON from an earlier run to diff against")
+    parser.add_argument(
+        "--regression-threshold-pct",
+        type=float,
+        default=15.0,
+        help="With --compare, exit 2 if any benchmark mean is slower than baseline by more than this",
+    )
+    parser.add_argument("--seed", type=int, default=1234, help="Seed for python/numpy RNGs used by effects")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    selected = [name.strip() for name in args.only.split(",") if name.strip()] or list(BENCHMARKS)
+    unknown = [name for name in selected if name not in BENCHMARKS]
+    if unknown:
+        print(f"[-] Unknown benchmark(s): {', '.join(unknown)}")
+        return 1
+
+    random.seed(args.seed)
+    try:
+        import numpy as np
+        np.random.seed(args.seed)
+    except ImportError:
+        pass
+
+    revision = git_revision()
+    payload = {
+        "revision": revision,
+        "captured_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": bool(args.quick),
+        "results": {},
+        "skipped": {},
+    }
+
+    with tempfile.TemporaryDirectory(prefix="jutsu_bench_") as tmp:
+        workdir = Path(tmp)
+        for name in selected:
+            print(f"[+] Running {name}...")
+            start = time.perf_counter()
+            try:
+                payload["results"][name] = BENCHMARKS[name](workdir, args.quick)
+            except Exception as e:
+                print(f"[!] {name} skipped: {e}")
+                payload["skipped"][name] = str(e)
+                continue
+            print(f"    done in {time.perf_counter() - start:.1f}s")
+
+    print("[Results]")
+    print_results(payload["results"])
+
+    exit_code = 0
+    if args.compare:
+        baseline_path = Path(args.compare)
+        if not baseline_path.exists():
+            print(f"[-] Baseline not found: {baseline_path}")
+            return 1
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        rows = compare(payload, baseline, args.regression_threshold_pct)
+        payload["compare"] = {"baseline": str(baseline_path), "revision": baseline.get("revision"), "rows": rows}
+        print_comparison(rows)
+        if any(row["regressed"] for row in rows):
+            exit_code = 2
+
+    out_path = Path(args.json_out) if args.json_out else ROOT / "benchmarks" / "results" / f"{revision}.json"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    print(f"[+] Wrote JSON: {out_path}")
+    return exit_code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
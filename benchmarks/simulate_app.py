@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+"""Run the real JutsuAcademy app headless and record frame times per state.
+
+run_benchmarks.py times hot paths in isolation; this drives the whole pygame
+app loop (JutsuAcademy.run(): events, redraw planning, rendering, pacing,
+effects, flip) through a scripted session on the SDL dummy drivers, so it
+runs on CI-style Linux machines with no display, GPU or webcam:
+
+  tutorial (skip) -> menu -> practice select -> free play library ->
+  pick --jutsu -> loading -> playing: sign sequence -> jutsu effect ->
+  reward panels -> back to menu
+
+Input is a virtual mouse (pygame.mouse.get_pos/get_pressed are patched, clicks
+and key presses are posted as real pygame events). The camera is the app's own
+_start_camera() on a frame source (--source, see src/frame_source.py): the
+synthetic pattern by default, or a looping video file / image directory, read
+unpaced since the camera lane already paces reads. Signs are either scripted (the
+current target sign is fed through the real temporal vote as a two-hand
+detection, hand/face anchors are fixed so effects have somewhere to draw) or
+come from the real MediaPipe + KNN path (--signs model, needs mediapipe and a
+video with real hands). Backend/Discord checks are stubbed: the run is a local
+guest session at the level that unlocks --jutsu, and it runs in a temporary
+working directory so no settings, session or progression files are touched.
+
+Frame time is the work between clock ticks (the tick's sleep excluded). Each
+frame is attributed to the state it started in, PLAYING split by the frame
+pacer phase (playing:sequence / playing:effect); frames that change state
+(e.g. the synchronous model/camera start) are listed as transitions instead.
+
+Usage examples:
+  python benchmarks/simulate_app.py
+  python benchmarks/simulate_app.py --jutsu "Phoenix Flower" --pacing low_latency
+  python benchmarks/simulate_app.py --source recordings/session.mp4 --signs model
+  python benchmarks/simulate_app.py --uncapped --json-out sim.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+DEFAULT_JUTSU = "Fireball"
+SIGN_CONFIDENCE = 0.92
+
+
+def git_revision() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=str(ROOT), capture_output=True, text=True, timeout=10,
+        )
+        return out.stdout.strip() or "unknown"
+    except Exception:
+        return "unknown"
+
+
+# ─── Input and timing ───────────────────────────────────────────────────────
+class VirtualMouse:
+    """Stands in for pygame.mouse while the simulation runs (the dummy driver has no pointer)."""
+
+    def __init__(self, pygame):
+        self._pygame = pygame
+        self._saved = {}
+        self.pos = (0, 0)
+        self.down = False
+
+    def install(self):
+        mouse = self._pygame.mouse
+        for name in ("get_pos", "get_pressed", "set_cursor"):
+            self._saved[name] = getattr(mouse, name)
+        mouse.get_pos = lambda: self.pos
+        mouse.get_pressed = lambda num_buttons=3: (self.down,) + (False,) * (num_buttons - 1)
+        mouse.set_cursor = lambda *args, **kwargs: None
+
+    def uninstall(self):
+        for name, fn in self._saved.items():
+            setattr(self._pygame.mouse, name, fn)
+        self._saved.clear()
+
+    def move(self, pos):
+        self.pos = (int(pos[0]), int(pos[1]))
+        self._pygame.event.post(self._pygame.event.Event(self._pygame.MOUSEMOTION, pos=self.pos, rel=(0, 0), buttons=(0, 0, 0)))
+
+    def press(self):
+        self.down = True
+        self._pygame.event.post(self._pygame.event.Event(self._pygame.MOUSEBUTTONDOWN, pos=self.pos, button=1))
+
+    def release(self):
+        self.down = False
+        self._pygame.event.post(self._pygame.event.Event(self._pygame.MOUSEBUTTONUP, pos=self.pos, button=1))
+
+    def key(self, key):
+        for kind in (self._pygame.KEYDOWN, self._pygame.KEYUP):
+            self._pygame.event.post(self._pygame.event.Event(kind, key=key, mod=0, unicode="", scancode=0))
+
+
+class TimedClock:
+    """Wraps the app's pygame Clock; reports each frame's work time (tick sleep excluded)."""
+
+    def __init__(self, clock, on_frame, uncapped=False):
+        self._clock = clock
+        self._on_frame = on_frame
+        self._uncapped = uncapped
+        self._frame_start = None
+
+    def tick(self, framerate=0):
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            self._on_frame(now - self._frame_start)
+        ms = self._clock.tick(0 if self._uncapped else framerate)
+        self._frame_start = time.perf_counter()
+        return ms
+
+    def __getattr__(self, name):
+        return getattr(self._clock, name)
+
+
+def summarize(samples: list[float], wall: float, budget_s: float) -> dict:
+    samples = sorted(samples)
+    n = len(samples)
+
+    def pct(q):
+        return samples[min(n - 1, int(round((n - 1) * q)))]
+
+    return {
+        "frames": n,
+        "mean_ms": round(statistics.fmean(samples) * 1000.0, 3),
+        "p50_ms": round(pct(0.50) * 1000.0, 3),
+        "p95_ms": round(pct(0.95) * 1000.0, 3),
+        "p99_ms": round(pct(0.99) * 1000.0, 3),
+        "max_ms": round(samples[-1] * 1000.0, 3),
+        "over_budget_pct": round(100.0 * sum(1 for s in samples if s > budget_s) / n, 2),
+        "fps": round(n / wall, 1) if wall > 0 else None,
+    }
+
+
+# ─── Simulated app ──────────────────────────────────────────────────────────
+def build_app(args):
+    from src.jutsu_academy.main_pygame_app import JutsuAcademy
+    from src.jutsu_academy.main_pygame_shared import GameState, pygame
+
+    class HeadlessAcademy(JutsuAcademy):
+        """JutsuAcademy with backend, Discord and webcam replaced for an offline scripted run."""
+
+        def __init__(self):
+            self.sim_args = args
+            self.sim_mouse = VirtualMouse(pygame)
+            self.sim_samples = {}
+            self.sim_wall = {}
+            self.sim_transitions = []
+            self.sim_step = "init"
+            self.sim_failure = ""
+            self._sim_label = None
+            self._sim_scenario = None
+            super().__init__()
+            # Practice requires a logged-in account; a fake Discord identity passes that gate while
+            # username stays Guest so progression and quests stay local.
+            self.discord_user = {"id": "headless-sim", "username": "Guest"}
+            jutsu = self.jutsu_list[args.jutsu]
+            level = max(int(args.level), int(jutsu.get("min_level", 0)))
+            self.progression.level = level
+            self.progression.xp = self.progression.get_xp_for_level(level)
+            self.progression.update_rank()
+            self.unlocked_jutsus_known = {
+                name for name, data in self.jutsu_list.items() if level >= data.get("min_level", 0)
+            }
+            if args.pacing:
+                self.settings["frame_pacing"] = args.pacing
+                self._apply_frame_pacing()
+            self.clock = TimedClock(self.clock, self._sim_record_frame, uncapped=args.uncapped)
+
+        # Backend / account stubs
+        def _load_user_session(self):
+            pass
+
+        def _has_backend_connection(self, timeout_s=1.5):
+            return True
+
+        def _handle_connection_lost(self, force_logout=True):
+            print("[*] Simulation: ignoring backend connection loss")
+
+        def _is_authoritative_competitive_user(self):
+            return False
+
+        def _fetch_announcements(self):
+            pass
+
+        def _save_player_meta(self):
+            pass
+
+        # Detection
+        def _load_ml_models(self):
+            if self.sim_args.signs == "model":
+                return super()._load_ml_models()
+            return True
+
+        def detect_hands(self, frame):
+            if self.sim_args.signs == "model":
+                return super().detect_hands(frame)
+            h, w = frame.shape[:2]
+            sway = 0.03 * w * ((self.camera_frame_seq % 60) / 30.0 - 1.0)
+            self.hand_pos = (int(w * 0.5 + sway), int(h * 0.62))
+            self.smooth_hand_pos = self.hand_pos
+            self.tracked_hand_label = "Right"
+            self.hand_lost_frames = 0
+
+        def detect_face(self, frame):
+            if self.sim_args.signs == "model":
+                return super().detect_face(frame)
+            h, w = frame.shape[:2]
+            self.mouth_pos = (int(w * 0.5), int(h * 0.45))
+            self.left_eye_pos = (int(w * 0.45), int(h * 0.36))
+            self.right_eye_pos = (int(w * 0.55), int(h * 0.36))
+            self.left_eye_size = self.right_eye_size = (w * 0.05, h * 0.025)
+            self.left_eye_angle = self.right_eye_angle = 0.0
+            self.head_yaw = self.head_pitch = 0.0
+
+        def predict_sign_with_filters(self, frame, lighting_ok):
+            if self.sim_args.signs == "model":
+                return super().predict_sign_with_filters(frame, lighting_ok)
+            with self.profiler.stage("hands"):
+                self.detect_hands(frame)
+            raw_sign = "idle"
+            if not self.jutsu_active and self.current_step < len(self.sequence):
+                raw_sign = self._normalize_sign_token(self.sequence[self.current_step]) or "idle"
+            raw_conf = SIGN_CONFIDENCE if raw_sign != "idle" else 0.0
+            with self.profiler.stage("vote"):
+                stable_sign, stable_conf = self._apply_temporal_vote(raw_sign, raw_conf, True, hands_now=2)
+            self.raw_detected_sign = raw_sign
+            self.raw_detected_confidence = float(raw_conf)
+            self.detected_sign = stable_sign
+            self.detected_confidence = float(stable_conf)
+            self.last_detected_hands = 2
+            self.last_imputed_hands = 0
+            return stable_sign
+
+        # Scripted input and frame attribution
+        def _sim_state_label(self):
+            if self.state == GameState.PLAYING:
+                return f"{self.state}:{self.pacer.phase}"
+            return str(self.state)
+
+        def handle_events(self):
+            if self._sim_scenario is None:
+                self._sim_scenario = scenario(self, GameState)
+                self._sim_started_at = time.perf_counter()
+            self._sim_label = self._sim_state_label()
+            try:
+                next(self._sim_scenario)
+            except StopIteration:
+                self.running = False
+            if time.perf_counter() - self._sim_started_at > self.sim_args.max_seconds:
+                self.sim_failure = f"timed out after {self.sim_args.max_seconds:.0f}s in {self._sim_state_label()} ({self.sim_step})"
+                self.running = False
+            super().handle_events()
+
+        def _sim_record_frame(self, seconds):
+            start = self._sim_label
+            if start is None:
+                return
+            end = self._sim_state_label()
+            if end.split(":")[0] != start.split(":")[0]:
+                self.sim_transitions.append({"from": start, "to": end, "ms": round(seconds * 1000.0, 3)})
+            else:
+                self.sim_samples.setdefault(start, []).append(seconds)
+            wall = time.perf_counter() - getattr(self, "_sim_last_tick", time.perf_counter())
+            self.sim_wall[start] = self.sim_wall.get(start, 0.0) + wall
+            self._sim_last_tick = time.perf_counter()
+
+        def run(self):
+            self.sim_mouse.install()
+            try:
+                super().run()
+            finally:
+                self.sim_mouse.uninstall()
+
+    return HeadlessAcademy()
+
+
+def scenario(app, GameState):
+    """One step per frame: yields after posting that frame's input."""
+    args = app.sim_args
+    mouse = app.sim_mouse
+    pygame = sys.modules["pygame"]
+
+    def dwell(seconds):
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            yield
+
+    def wait_for(step, condition):
+        app.sim_step = step
+        while not condition():
+            if app.state == GameState.ERROR_MODAL:
+                title = getattr(app, "error_title", "Error")
+                message = str(getattr(app, "error_message", "")).replace("\n", " ")
+                app.sim_failure = f"{title} while {step}: {message}"
+                app.running = False
+            yield
+
+    def click(rect):
+        mouse.move(rect.center)
+        yield
+        mouse.press()
+        yield
+        mouse.release()
+        yield
+
+    def library_item():
+        for item in getattr(app, "library_item_rects", []):
+            if item["name"] == args.jutsu:
+                return item
+        return None
+
+    if app.state == GameState.TUTORIAL:
+        yield from dwell(args.dwell)
+        yield from click(app.tutorial_buttons["skip"].rect)
+    yield from wait_for("reaching the menu", lambda: app.state == GameState.MENU)
+    yield from dwell(args.dwell)
+
+    yield from click(app.menu_buttons["practice"].rect)
+    yield from wait_for("opening practice select", lambda: app.state == GameState.PRACTICE_SELECT)
+    yield from dwell(args.dwell)
+
+    yield from click(app.practice_buttons["freeplay"].rect)
+    yield from wait_for("opening the jutsu library", lambda: app.state == GameState.JUTSU_LIBRARY and library_item())
+    yield from dwell(args.dwell)
+
+    yield from click(library_item()["rect"])
+    yield from wait_for("starting the game", lambda: app.state == GameState.PLAYING)
+    yield from wait_for("performing the sign sequence", lambda: app.jutsu_active)
+    yield from wait_for("playing the jutsu effect", lambda: not app.jutsu_active)
+
+    app.sim_step = "closing reward panels"
+    for _ in dwell(args.dwell):
+        if app.active_alert:
+            mouse.key(pygame.K_RETURN)
+        elif getattr(app, "mastery_panel_data", None) and hasattr(app, "_mastery_cont_rect"):
+            yield from click(app._mastery_cont_rect)
+        elif getattr(app, "level_up_panel_data", None) and hasattr(app, "_level_up_cont_rect"):
+            yield from click(app._level_up_cont_rect)
+        yield
+
+    mouse.key(pygame.K_ESCAPE)
+    yield
+    yield from wait_for("returning to the menu", lambda: app.state == GameState.MENU)
+    yield from dwell(args.dwell)
+    app.sim_step = "done"
+
+
+# ─── Reporting ──────────────────────────────────────────────────────────────
+def print_report(payload: dict) -> None:
+    print("[States]")
+    print(f"  {'state':<22} {'frames':>7} {'fps':>7} {'mean':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9} {'>budget':>8}")
+    for label, row in payload["states"].items():
+        print(
+            f"  {label:<22} {row['frames']:>7} {row['fps'] or 0:>7.1f} {row['mean_ms']:>7.2f}ms {row['p50_ms']:>7.2f}ms "
+            f"{row['p95_ms']:>7.2f}ms {row['p99_ms']:>7.2f}ms {row['max_ms']:>7.2f}ms {row['over_budget_pct']:>7.1f}%"
+        )
+    if payload["transitions"]:
+        print("[Transitions]")
+        for row in payload["transitions"]:
+            print(f"  {row['from']} -> {row['to']}: {row['ms']:.1f} ms")
+
+
+def parse_args() -> argparse.Namespace:
+    from src.jutsu_registry import OFFICIAL_JUTSUS
+    from src.jutsu_academy.frame_pacer import PRESET_NAMES
+
+    parser = argparse.ArgumentParser(description="Drive the pygame app headless through a scripted session and time frames per state")
+    parser.add_argument("--source", "--camera", dest="source", default="synthetic", help="Frame source for the game camera: 'synthetic', a video file or an image directory")
+    parser.add_argument("--signs", choices=["scripted", "model"], default="scripted", help="Scripted sign oracle or the real MediaPipe + KNN path")
+    parser.add_argument("--jutsu", default=DEFAULT_JUTSU, choices=list(OFFICIAL_JUTSUS), help="Jutsu to perform")
+    parser.add_argument("--level", type=int, default=0, help="Player level (raised to the jutsu's unlock level)")
+    parser.add_argument("--pacing", choices=PRESET_NAMES, default="", help="Frame pacing preset (default: settings default)")
+    parser.add_argument("--uncapped", action="store_true", help="Do not sleep in clock.tick; run UI frames back to back")
+    parser.add_argument("--dwell", type=float, default=1.5, help="Seconds to stay on each screen before moving on")
+    parser.add_argument("--max-seconds", type=float, default=120.0, help="Fail if the scenario has not finished by then")
+    parser.add_argument("--json-out", default="", help="Write per-state frame stats as JSON")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    if args.signs == "scripted":
+        # The scripted oracle never calls the detectors; don't load them in the background either.
+        os.environ.setdefault("JUTSU_MODEL_WARMUP", "0")
+    kind, sep, target = args.source.partition(":")
+    if kind != "synthetic":
+        if not sep or kind not in ("video", "images"):
+            kind, target = "", args.source
+        path = Path(target)
+        if not path.exists():
+            print(f"[-] Frame source not found: {target}")
+            return 1
+        # The run happens in a temporary working directory.
+        args.source = f"{kind}:{path.resolve()}" if kind else str(path.resolve())
+    os.environ["JUTSU_FRAME_SOURCE"] = args.source
+    os.environ["JUTSU_FRAME_SOURCE_FAST"] = "1"
+
+    with tempfile.TemporaryDirectory(prefix="jutsu_sim_") as tmp:
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        if not (ROOT / "src" / "mediapipe_signs_db.csv").exists():
+            # SignRecorder creates its dataset when none exists; keep that out of the checkout.
+            os.environ.setdefault("MP_SIGNS_DB_PATH", str(Path(tmp) / "mediapipe_signs_db.csv"))
+        try:
+            app = build_app(args)
+            budget_s = 1.0 / max(1, app.pacer.ui_fps())
+            pacing = app.pacer.stats()
+            started = time.perf_counter()
+            app.run()
+            elapsed = time.perf_counter() - started
+        finally:
+            os.chdir(cwd)
+
+    payload = {
+        "revision": git_revision(),
+        "captured_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "source": args.source,
+        "signs": args.signs,
+        "jutsu": args.jutsu,
+        "pacing": {"preset": pacing["preset"], "rates": {lane: row["target"] for lane, row in pacing["lanes"].items()}},
+        "uncapped": bool(args.uncapped),
+        "seconds": round(elapsed, 2),
+        "completed": not app.sim_failure,
+        "failure": app.sim_failure,
+        "states": {
+            label: summarize(samples, app.sim_wall.get(label, 0.0), budget_s)
+            for label, samples in app.sim_samples.items()
+        },
+        "transitions": app.sim_transitions,
+        "redraw": app.redraw.stats(),
+        "pacer": app.pacer.stats(),
+    }
+
+    print_report(payload)
+    if args.json_out:
+        out_path = Path(args.json_out)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        print(f"[+] Wrote JSON: {out_path}")
+    if app.sim_failure:
+        print(f"[-] Simulation failed: {app.sim_failure}")
+        return 1
+    print(f"[+] Simulation finished in {elapsed:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Build the pre-processed asset pack the game memory-maps at startup.
+
+Runs the game's own asset loaders (AssetsMixin) against a hidden dummy display
+at every RESOLUTION_OPTIONS entry and waits for their background preloads,
+then writes everything they asked the AssetManager for - decoded sources and
+the exact pre-scaled variants, backgrounds cropped per resolution - as raw
+RGBA, plus the sound effects decoded to PCM. See
+src/jutsu_academy/asset_pack.py for the format and the runtime fallbacks.
+
+Rebuild after changing UI images or sounds; entries whose source file changed
+since the build are ignored at runtime, not served stale.
+
+Usage examples:
+  python scripts/build_asset_pack.py
+  python scripts/build_asset_pack.py --lz4
+  python scripts/build_asset_pack.py --out dist/JutsuAcademy/_internal/src/asset_pack/assets.pack
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Decode from the original files, not from a previously built pack.
+os.environ["JUTSU_ASSET_PACK"] = "0"
+os.environ.setdefault("JUTSU_ASSET_BUDGET_MB", "4096")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import pygame  # noqa: E402
+
+from src.jutsu_academy.asset_manager import get_asset_manager  # noqa: E402
+from src.jutsu_academy.asset_pack import DEFAULT_PACK_PATH, AssetPackWriter, image_key  # noqa: E402
+from src.jutsu_academy.main_pygame_mixins.assets import AssetsMixin  # noqa: E402
+from src.jutsu_academy.main_pygame_mixins.core import CoreMixin  # noqa: E402
+from src.jutsu_academy.main_pygame_shared import OFFICIAL_JUTSUS, RESOLUTION_OPTIONS, Dropdown  # noqa: E402
+from src.utils.paths import get_project_root  # noqa: E402
+
+
+class PackHost(AssetsMixin):
+    """Just enough of JutsuAcademy for the AssetsMixin loaders to run."""
+
+    def __init__(self):
+        self.assets = get_asset_manager()
+        self.jutsu_list = OFFICIAL_JUTSUS.copy()
+        self.icon_paths = {}
+        self.logo = None
+        self.bg_image = None
+        self.social_icons = {}
+        self.mute_icons = {"mute": None, "unmute": None}
+        self.arrow_icons = {"left": None, "right": None}
+
+
+def run_loaders(host: PackHost) -> None:
+    host._load_feature_icons()
+    host._load_icons()
+    host._load_logo()
+    host._load_social_icons()
+    host._load_mute_icons()
+    host._load_arrow_icons()
+    Dropdown(0, 0, 100, ["-"])._load_icons()
+    for _, width, height in RESOLUTION_OPTIONS:
+        pygame.display.set_mode((width, height), pygame.HIDDEN)
+        CoreMixin._sync_screen_constants(host, width, height)
+        host._load_background()
+    while host.assets.stats()["pending"]:
+        time.sleep(0.02)
+
+
+def pack_key(path: str) -> str:
+    return Path(path).relative_to(get_project_root()).as_posix()
+
+
+def build(out: Path, compress: bool) -> dict:
+    pygame.init()
+    pygame.mixer.init()
+    host = PackHost()
+    t0 = time.perf_counter()
+    run_loaders(host)
+    manager = host.assets
+
+    images = sounds = 0
+    with AssetPackWriter(out, compress=compress) as writer:
+        for key in sorted(manager.requested, key=repr):
+            path = key[1]
+            if key[0] == "src":
+                surf = manager.source(path)
+                name = image_key(pack_key(path))
+            else:
+                _, _, size, fit = key
+                surf = manager.scaled(path, size, fit)
+                name = image_key(pack_key(path), size, fit)
+            if surf is None:
+                print(f"[!] Skipped {name}: could not decode")
+                continue
+            writer.add_image(name, surf, path)
+            images += 1
+
+        for name, path, _ in host._sound_paths():
+            try:
+                sound = pygame.mixer.Sound(str(path))
+            except Exception as e:
+                print(f"[!] Skipped sound {name}: {e}")
+                continue
+            writer.add_sound(pack_key(str(path)), sound, path)
+            sounds += 1
+        total_bytes = writer.bytes_written
+
+    return {
+        "images": images,
+        "sounds": sounds,
+        "mb": round(total_bytes / (1024 * 1024), 1),
+        "mixer": pygame.mixer.get_init(),
+        "seconds": round(time.perf_counter() - t0, 2),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build the memory-mapped UI image / sound asset pack")
+    parser.add_argument("--out", default=str(ROOT / DEFAULT_PACK_PATH), help="Pack file to write (index goes next to it as .json)")
+    parser.add_argument("--lz4", action="store_true", help="LZ4-compress payloads (needs the lz4 package at build and run time)")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    out = Path(args.out)
+    summary = build(out, compress=args.lz4)
+    print(f"[+] Wrote {out}: {summary['images']} images, {summary['sounds']} sounds, "
+          f"{summary['mb']} MB, mixer {summary['mixer']} in {summary['seconds']}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
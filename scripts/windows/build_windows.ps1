@@ -4,7 +4,8 @@ param(
     [switch]$SkipDeps,
     [switch]$NoClean,
     [switch]$MakeInstaller,
-    [switch]$AllowDefaultEnv
+    [switch]$AllowDefaultEnv,
+    [switch]$SkipAssetPack
 )
 
 Set-StrictMode -Version Latest
@@ -133,6 +134,12 @@ if (-not $NoClean) {
     if (Test-Path "dist") { Remove-Item "dist" -Recurse -Force }
 }
 
+if (-not $SkipAssetPack) {
+    Write-Host "Building asset pack..."
+    & $pythonExe scripts/build_asset_pack.py
+    if ($LASTEXITCODE -ne 0) { throw "Asset pack build failed." }
+}
+
 Write-Host "Running PyInstaller..."
 & $pythonExe -m PyInstaller `
     --noconfirm `
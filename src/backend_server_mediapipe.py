@@ -13,6 +13,7 @@ architecture used by the pygame MediaPipe pipeline:
 
 Usage:
   python src/backend_server_mediapipe.py --host 127.0.0.1 --port 8765 --camera 0
+  python src/backend_server_mediapipe.py --record-landmarks --record-dir captures/landmarks
 """
 
 import argparse
@@ -48,6 +49,8 @@ RUNTIME_ROOT = resolve_runtime_root()
 sys.path.insert(0, str(RUNTIME_ROOT))
 
 import src.mp_trainer as mp_trainer
+from src.frame_source import add_frame_source_args, open_frame_source, source_spec
+from src.landmark_stream import LandmarkStreamRecorder
 
 SignRecorder = mp_trainer.SignRecorder
 
@@ -101,47 +104,24 @@ def resolve_dataset_path(runtime_root: Path) -> Path | None:
     return None
 
 
-def open_camera(camera_index=0, width=640, height=480):
+def open_camera(camera_index=0, width=640, height=480, realtime=None, loop=None):
     """
-    Try camera backends in order and verify actual frame delivery.
-    Mirrors src/mp_trainer.py behavior.
+    Open a frame source at 30 fps and verify actual frame delivery.
+    Same probing as src/mp_trainer.py (see src/frame_source.py).
     """
-    backends = [("DSHOW", cv2.CAP_DSHOW), ("DEFAULT", None)]
-    if hasattr(cv2, "CAP_MSMF"):
-        backends.append(("MSMF", cv2.CAP_MSMF))
-
-    for backend_name, backend in backends:
-        cap = cv2.VideoCapture(camera_index) if backend is None else cv2.VideoCapture(camera_index, backend)
-        if not cap.isOpened():
-            cap.release()
-            continue
-
-        cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
-        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
-        cap.set(cv2.CAP_PROP_FPS, 30)
-
-        for _ in range(20):
-            ok, _ = cap.read()
-            if ok:
-                print(f"[+] Camera {camera_index} opened via {backend_name} ({width}x{height}).")
-                return cap
-            time.sleep(0.03)
-
-        print(f"[!] Camera {camera_index} via {backend_name} returned no frames; trying next backend.")
-        cap.release()
-
-    return None
+    return open_frame_source(camera_index, width, height, fps=30, realtime=realtime, loop=loop)
 
 
 class GodotMediaPipeServer:
-    def __init__(self, camera_index=0):
+    def __init__(self, camera_index=0, record_landmarks=False, record_dir=None, source="", realtime=None, loop=None):
         print("[*] Initializing Godot MediaPipe backend...")
         print(f"[*] Runtime root: {RUNTIME_ROOT}")
 
         self.camera_index = int(camera_index)
-        self.cap = open_camera(self.camera_index, width=640, height=480)
+        self.source = source_spec(source, self.camera_index)
+        self.cap = open_camera(self.source, width=640, height=480, realtime=realtime, loop=loop)
         if self.cap is None:
-            raise RuntimeError(f"Could not open camera {self.camera_index}.")
+            raise RuntimeError(f"Could not open frame source {self.source!r}.")
 
         model_path = resolve_model_path(RUNTIME_ROOT)
         if model_path is None:
@@ -195,8 +175,26 @@ class GodotMediaPipeServer:
         self.fps_start_time = time.time()
         self.current_fps = 0.0
 
+        self.landmark_recorder = LandmarkStreamRecorder(out_dir=record_dir, prefix="backend")
+        if record_landmarks:
+            self._set_landmark_recording(True)
+
         print("[+] Backend initialized.")
 
+    def _set_landmark_recording(self, enabled):
+        if enabled:
+            return self.landmark_recorder.start(meta={
+                "source": "backend_server_mediapipe",
+                "camera": self.camera_index,
+                "frame_source": self.source,
+                "restricted_signs": bool(self.settings.get("restricted_signs", True)),
+                "vote_window_size": int(self.vote_window_size),
+                "vote_required_hits": int(self.vote_required_hits),
+                "vote_min_confidence": float(self.vote_min_confidence),
+            })
+        self.landmark_recorder.stop()
+        return False
+
     def _next_timestamp_ms(self):
         now_ms = int(time.time() * 1000)
         if now_ms <= self.last_mp_timestamp_ms:
@@ -386,6 +384,20 @@ class GodotMediaPipeServer:
         stable_sign, stable_conf = self._apply_temporal_vote(raw_sign, raw_conf, allow_detection)
         dist_value = None if not math.isfinite(min_dist) else round(float(min_dist), 4)
 
+        if self.landmark_recorder.active:
+            self.landmark_recorder.record(
+                mp_result.hand_landmarks if num_hands > 0 else [],
+                (mp_result.handedness or []) if num_hands > 0 else [],
+                raw_sign=raw_sign,
+                raw_conf=raw_conf,
+                stable_sign=stable_sign,
+                stable_conf=stable_conf,
+                lighting_status=lighting_status,
+                lighting_mean=lighting_mean,
+                lighting_contrast=lighting_contrast,
+                lighting_ok=lighting_ok,
+            )
+
         response = {
             "type": "frame_data",
             "timestamp": time.time(),
@@ -411,6 +423,7 @@ class GodotMediaPipeServer:
                 "vote_required_hits": int(self.vote_required_hits),
                 "vote_min_confidence": round(float(self.vote_min_confidence), 3),
                 "debug_hands": bool(self.settings.get("debug_hands", False)),
+                "recording": bool(self.landmark_recorder.active),
             },
         }
 
@@ -434,6 +447,8 @@ class GodotMediaPipeServer:
             self.settings["frame_quality"] = max(10, min(95, int(patch["frame_quality"])))
         if "target_fps" in patch:
             self.settings["target_fps"] = max(5, min(60, int(patch["target_fps"])))
+        if "record_landmarks" in patch:
+            self._set_landmark_recording(bool(patch["record_landmarks"]))
 
         if "vote_required_hits" in patch:
             self.vote_required_hits = max(2, min(self.vote_window_size, int(patch["vote_required_hits"])))
@@ -526,7 +541,7 @@ class GodotMediaPipeServer:
         print("Godot MediaPipe Backend Server")
         print("=" * 56)
         print(f"WebSocket: ws://{host}:{port}")
-        print(f"Camera: {self.camera_index}")
+        print(f"Frame source: {self.cap.describe()}")
         print("Architecture: mediapipe_knn_pygame_v1")
         print("Press Ctrl+C to stop.")
         print("=" * 56)
@@ -534,6 +549,8 @@ class GodotMediaPipeServer:
             await asyncio.Future()
 
     def cleanup(self):
+        if getattr(self, "landmark_recorder", None) is not None:
+            self.landmark_recorder.stop()
         if self.cap is not None:
             self.cap.release()
         if self.hand_landmarker is not None and hasattr(self.hand_landmarker, "close"):
@@ -546,11 +563,21 @@ async def main():
     parser.add_argument("--host", type=str, default="127.0.0.1", help="Host to bind (default: 127.0.0.1)")
     parser.add_argument("--port", type=int, default=8765, help="WebSocket port (default: 8765)")
     parser.add_argument("--camera", type=int, default=0, help="Camera index (default: 0)")
+    parser.add_argument("--record-landmarks", action="store_true", help="Record per-frame landmarks to JSONL.gz for replay")
+    parser.add_argument("--record-dir", type=str, default="", help="Landmark log directory (default: ~/.jutsu_academy/landmark_logs)")
+    add_frame_source_args(parser)
     args = parser.parse_args()
 
     server = None
     try:
-        server = GodotMediaPipeServer(camera_index=args.camera)
+        server = GodotMediaPipeServer(
+            camera_index=args.camera,
+            record_landmarks=args.record_landmarks,
+            record_dir=args.record_dir or None,
+            source=args.source,
+            realtime=False if args.source_fast else None,
+            loop=False if args.source_once else None,
+        )
         await server.start(host=args.host, port=args.port)
     except KeyboardInterrupt:
         print("\n[*] Shutting down...")
@@ -34,6 +34,7 @@ from src.utils.paths import (
     get_class_names,
 )
 from src.utils.visualization import draw_label_with_background
+from src.frame_source import add_frame_source_args, open_frame_source, source_spec
 
 
 LIGHTING_BUCKETS = ["dark_light", "bright_light", "backlit", "mixed_light", "normal_light"]
@@ -191,6 +192,7 @@ def main():
         default=0.22,
         help="Guided auto-shot delay per frame (seconds, default: 0.22)",
     )
+    add_frame_source_args(parser)
     args = parser.parse_args()
 
     if args.batch_shots <= 0:
@@ -203,15 +205,18 @@ def main():
         print("[-] --target-per-class must be >= 0")
         return
 
-    print(f"[*] Opening camera {args.camera} in RAW mode...")
-    if sys.platform.startswith("win"):
-        cap = cv2.VideoCapture(args.camera, cv2.CAP_DSHOW)
-    else:
-        cap = cv2.VideoCapture(args.camera)
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, args.width)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, args.height)
-
-    if not cap.isOpened():
+    spec = source_spec(args.source, args.camera)
+    print(f"[*] Opening frame source {spec} in RAW mode...")
+    cap = open_frame_source(
+        spec,
+        args.width,
+        args.height,
+        realtime=False if args.source_fast else None,
+        loop=False if args.source_once else None,
+        probe_backends=False,
+        verify_reads=0,
+    )
+    if cap is None:
         print("[-] Error: Could not open camera.")
         return
 
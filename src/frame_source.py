@@ -0,0 +1,447 @@
+"""
+Pluggable camera frame sources.
+
+The game, mp_trainer, backend_server_mediapipe, capture_dataset and the
+intertwine annotator each opened cv2.VideoCapture(camera_index) themselves
+(three of them with their own copy of the backend-probing open_camera), so
+nothing could run without a webcam or on recorded input. They now open a
+FrameSource from a spec string:
+
+- "0", "1", "webcam:1": a webcam. With probing, DSHOW / DEFAULT / MSMF are
+  tried in turn until one actually delivers frames;
+- "video:clip.mp4" or a path to a video file: the file, looping;
+- "images:frames/" or a path to a directory: its images in name order, looping;
+- "synthetic" or "synthetic:1280x720": a generated moving pattern that passes
+  the lighting gate, for runs with no camera or media at all.
+
+File, directory and synthetic sources are paced at their frame rate like a
+webcam by default; realtime=False (--source-fast, JUTSU_FRAME_SOURCE_FAST=1)
+returns frames as fast as they can be read, for throughput benchmarks and
+offline batch processing. loop=False (--source-once, JUTSU_FRAME_SOURCE_ONCE=1)
+stops at the end: read() fails and isOpened() turns False.
+
+Every source has the cv2.VideoCapture surface callers already use (read,
+isOpened, set, get, release). Non-webcam sources treat
+set(CAP_PROP_FRAME_WIDTH / HEIGHT) as a bounding box: frames are scaled to fit
+it with their aspect ratio kept, and get() reports the size actually
+delivered, as a webcam that picks its nearest mode would. Tools take the
+spec from --source (add_frame_source_args) and fall back to JUTSU_FRAME_SOURCE,
+then to their --camera index.
+"""
+
+import os
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+DEFAULT_FPS = 30.0
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".webp")
+SOURCE_KINDS = ("webcam", "video", "images", "synthetic")
+
+_TRUE = ("1", "true", "yes", "on")
+
+
+def _env_flag(name):
+    return str(os.getenv(name, "")).strip().lower() in _TRUE
+
+
+class FrameSource:
+    """Base class; subclasses implement _read_frame() and may override open()/release()."""
+
+    kind = "source"
+
+    def __init__(self, fps=DEFAULT_FPS, realtime=True, loop=True):
+        self.fps = float(fps or DEFAULT_FPS)
+        self.realtime = bool(realtime)
+        self.loop = bool(loop)
+        self.width = None
+        self.height = None
+        self.frames_read = 0
+        self.loops = 0
+        self._fit_size = None
+        self._opened = False
+        self._next_due = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+    def describe(self):
+        return self.kind
+
+    def open(self):
+        self._opened = True
+        return True
+
+    def isOpened(self):
+        return self._opened
+
+    def read(self):
+        if not self._opened:
+            return False, None
+        self._pace()
+        frame = self._read_frame()
+        if frame is None:
+            self._opened = False
+            return False, None
+        self.frames_read += 1
+        return True, self._fit(frame)
+
+    def _read_frame(self):
+        raise NotImplementedError
+
+    def _pace(self):
+        if not self.realtime or self.fps <= 0:
+            return
+        now = time.perf_counter()
+        if now < self._next_due:
+            time.sleep(self._next_due - now)
+            now = self._next_due
+        # Don't bank time after a slow consumer; a webcam drops frames rather than bursting.
+        self._next_due = max(self._next_due + 1.0 / self.fps, now)
+
+    def _fit(self, frame):
+        h, w = frame.shape[:2]
+        if self.width and self.height and (w, h) != (self.width, self.height):
+            # Uniform scale into the requested box; stretching would distort hand shapes for the classifier.
+            scale = min(self.width / w, self.height / h)
+            size = (max(1, int(round(w * scale))), max(1, int(round(h * scale))))
+            if size != (w, h):
+                frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR)
+                w, h = size
+        self._fit_size = (w, h)
+        return frame
+
+    def set(self, prop, value):
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            self.width = int(value)
+            self._fit_size = None
+            return True
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            self.height = int(value)
+            self._fit_size = None
+            return True
+        if prop == cv2.CAP_PROP_FPS and value:
+            self.fps = float(value)
+            return True
+        return False
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return float(self._fit_size[0] if self._fit_size else self.width or 0)
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return float(self._fit_size[1] if self._fit_size else self.height or 0)
+        if prop == cv2.CAP_PROP_FPS:
+            return float(self.fps)
+        return 0.0
+
+    def release(self):
+        self._opened = False
+
+
+class WebcamSource(FrameSource):
+    kind = "webcam"
+
+    def __init__(self, index=0, width=640, height=480, fps=None, probe_backends=True, verify_reads=20):
+        super().__init__(fps=fps or DEFAULT_FPS, realtime=False, loop=False)
+        self.index = int(index)
+        self.width = int(width) if width else None
+        self.height = int(height) if height else None
+        self.request_fps = fps
+        self.probe_backends = bool(probe_backends)
+        self.verify_reads = int(verify_reads)
+        self.backend_name = ""
+        self.device_fps = 0.0
+        self._cap = None
+
+    def describe(self):
+        return f"webcam {self.index}" + (f" via {self.backend_name}" if self.backend_name else "")
+
+    def _backends(self):
+        if not self.probe_backends:
+            return [("DSHOW", cv2.CAP_DSHOW)] if os.name == "nt" else [("DEFAULT", None)]
+        backends = [("DSHOW", cv2.CAP_DSHOW), ("DEFAULT", None)]
+        if hasattr(cv2, "CAP_MSMF"):
+            backends.append(("MSMF", cv2.CAP_MSMF))
+        return backends
+
+    def open(self):
+        """Open the first backend that delivers frames (some report opened=True and then return empty reads forever)."""
+        for backend_name, backend in self._backends():
+            cap = cv2.VideoCapture(self.index) if backend is None else cv2.VideoCapture(self.index, backend)
+            if not cap.isOpened():
+                cap.release()
+                continue
+            if self.width:
+                cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+            if self.height:
+                cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+            if self.request_fps:
+                cap.set(cv2.CAP_PROP_FPS, self.request_fps)
+            # A short driver queue keeps reads close to the newest frame when the caller reads slower
+            # than the device delivers (not every backend honours it).
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            if self.verify_reads <= 0:
+                self._use(cap, backend_name)
+                return True
+            for _ in range(self.verify_reads):
+                ok, _ = cap.read()
+                if ok:
+                    print(f"[+] Camera {self.index} opened via {backend_name}.")
+                    self._use(cap, backend_name)
+                    return True
+                time.sleep(0.03)
+            print(f"[!] Camera {self.index} via {backend_name} returned no frames; trying next backend.")
+            cap.release()
+        return False
+
+    def _use(self, cap, backend_name):
+        self._cap, self.backend_name = cap, backend_name
+        fps = float(cap.get(cv2.CAP_PROP_FPS) or 0.0)
+        self.device_fps = fps if 1.0 <= fps <= 240.0 else float(self.request_fps or DEFAULT_FPS)
+
+    def isOpened(self):
+        return self._cap is not None and self._cap.isOpened()
+
+    def read(self):
+        if self._cap is None:
+            return False, None
+        ok, frame = self._cap.read()
+        if ok:
+            self.frames_read += 1
+        return ok, frame
+
+    def set(self, prop, value):
+        return self._cap.set(prop, value) if self._cap is not None else False
+
+    def get(self, prop):
+        return self._cap.get(prop) if self._cap is not None else 0.0
+
+    def release(self):
+        if self._cap is not None:
+            self._cap.release()
+            self._cap = None
+
+
+class VideoFileSource(FrameSource):
+    kind = "video"
+
+    def __init__(self, path, realtime=True, loop=True):
+        super().__init__(realtime=realtime, loop=loop)
+        self.path = Path(path)
+        self._cap = None
+
+    def describe(self):
+        return f"video {self.path.name}"
+
+    def open(self):
+        self._cap = cv2.VideoCapture(str(self.path))
+        if not self._cap.isOpened():
+            self._cap.release()
+            self._cap = None
+            return False
+        fps = float(self._cap.get(cv2.CAP_PROP_FPS) or 0.0)
+        if 1.0 <= fps <= 240.0:
+            self.fps = fps
+        return super().open()
+
+    def _read_frame(self):
+        ok, frame = self._cap.read()
+        if ok:
+            return frame
+        if not self.loop or self.frames_read == 0:
+            return None
+        self.loops += 1
+        if not self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0):
+            self._cap.release()
+            self._cap = cv2.VideoCapture(str(self.path))
+        ok, frame = self._cap.read()
+        return frame if ok else None
+
+    def release(self):
+        super().release()
+        if self._cap is not None:
+            self._cap.release()
+            self._cap = None
+
+
+class ImageDirectorySource(FrameSource):
+    kind = "images"
+
+    def __init__(self, directory, fps=DEFAULT_FPS, realtime=True, loop=True):
+        super().__init__(fps=fps, realtime=realtime, loop=loop)
+        self.directory = Path(directory)
+        self.paths = []
+        self._idx = 0
+
+    def describe(self):
+        return f"images {self.directory} ({len(self.paths)} files)"
+
+    def open(self):
+        if not self.directory.is_dir():
+            return False
+        self.paths = sorted(p for p in self.directory.iterdir() if p.suffix.lower() in IMAGE_EXTENSIONS)
+        if not self.paths:
+            print(f"[!] No images in {self.directory}")
+            return False
+        self._idx = 0
+        return super().open()
+
+    def _read_frame(self):
+        # Unreadable files are skipped; a full pass without a readable one ends the source.
+        for _ in range(len(self.paths)):
+            if self._idx >= len(self.paths):
+                if not self.loop:
+                    return None
+                self._idx = 0
+                self.loops += 1
+            path = self.paths[self._idx]
+            self._idx += 1
+            frame = cv2.imread(str(path), cv2.IMREAD_COLOR)
+            if frame is not None:
+                return frame
+            print(f"[!] Skipping unreadable image: {path.name}")
+        return None
+
+
+class SyntheticSource(FrameSource):
+    """Moving gradient pattern, lit well enough to pass the game's lighting gate."""
+
+    kind = "synthetic"
+
+    def __init__(self, width=640, height=480, fps=DEFAULT_FPS, frames=60, seed=7, realtime=True):
+        super().__init__(fps=fps, realtime=realtime, loop=True)
+        self.width = int(width)
+        self.height = int(height)
+        self.frame_count = max(1, int(frames))
+        self.seed = int(seed)
+        self._frames = []
+        self._frames_size = None
+        self._idx = 0
+
+    def describe(self):
+        return f"synthetic {self.width}x{self.height}"
+
+    def _render(self):
+        w, h = self.width, self.height
+        rng = np.random.default_rng(self.seed)
+        ramp = np.linspace(60, 190, w, dtype=np.float32)[None, :].repeat(h, axis=0)
+        yy, xx = np.mgrid[0:h, 0:w]
+        self._frames = []
+        for i in range(self.frame_count):
+            cx = w * (0.5 + 0.08 * np.sin(i * 2.0 * np.pi / self.frame_count))
+            blob = 70.0 * np.exp(-(((xx - cx) / (w * 0.16)) ** 2 + ((yy - h * 0.55) / (h * 0.3)) ** 2))
+            gray = np.clip(ramp + blob + rng.normal(0.0, 6.0, (h, w)), 0, 255).astype(np.uint8)
+            bgr = np.dstack([gray, (gray * 0.9).astype(np.uint8), (gray * 0.8).astype(np.uint8)])
+            self._frames.append(np.ascontiguousarray(bgr))
+        self._frames_size = (w, h)
+
+    def _read_frame(self):
+        if self._frames_size != (self.width, self.height):
+            self._render()
+        frame = self._frames[self._idx % self.frame_count]
+        self._idx += 1
+        if self._idx % self.frame_count == 0:
+            self.loops += 1
+        return frame.copy()
+
+
+def _parse_size(text, default):
+    if not text:
+        return default
+    try:
+        w, h = str(text).lower().split("x", 1)
+        return max(16, int(w)), max(16, int(h))
+    except ValueError:
+        return default
+
+
+def create_frame_source(spec, width=640, height=480, fps=None, realtime=None, loop=None, probe_backends=True, verify_reads=20):
+    """Unopened FrameSource for spec (see the module docstring); realtime/loop default from the environment."""
+    if realtime is None:
+        realtime = not _env_flag("JUTSU_FRAME_SOURCE_FAST")
+    if loop is None:
+        loop = not _env_flag("JUTSU_FRAME_SOURCE_ONCE")
+    spec = str(spec if spec is not None else 0).strip() or "0"
+    kind, sep, target = spec.partition(":")
+    kind = kind.lower()
+    # Anything else with a colon ("C:\\clips\\a.mp4") is a path.
+    if not sep or kind not in SOURCE_KINDS:
+        kind, target = "", spec
+    if not kind:
+        if spec.lower() == "synthetic":
+            kind = "synthetic"
+        elif spec.lstrip("-").isdigit():
+            kind = "webcam"
+        elif Path(spec).expanduser().is_dir():
+            kind = "images"
+        else:
+            kind = "video"
+
+    if kind == "synthetic":
+        w, h = _parse_size(target, (int(width or 640), int(height or 480)))
+        return SyntheticSource(w, h, fps=fps or DEFAULT_FPS, realtime=realtime)
+    if kind == "webcam":
+        target = target.strip() or "0"
+        if not target.lstrip("-").isdigit():
+            raise ValueError(f"Webcam source needs a camera index, got {spec!r} (e.g. 'webcam:0')")
+        return WebcamSource(int(target), width, height, fps=fps, probe_backends=probe_backends, verify_reads=verify_reads)
+    if kind == "images":
+        source = ImageDirectorySource(Path(target).expanduser(), fps=fps or DEFAULT_FPS, realtime=realtime, loop=loop)
+    else:
+        source = VideoFileSource(Path(target).expanduser(), realtime=realtime, loop=loop)
+    if width and height:
+        source.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        source.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    return source
+
+
+def open_frame_source(spec, width=640, height=480, fps=None, realtime=None, loop=None, probe_backends=True, verify_reads=20):
+    """create_frame_source() and open it; None if it cannot deliver frames."""
+    try:
+        source = create_frame_source(
+            spec, width, height, fps=fps, realtime=realtime, loop=loop,
+            probe_backends=probe_backends, verify_reads=verify_reads,
+        )
+    except ValueError as exc:
+        print(f"[-] {exc}")
+        return None
+    if not source.open():
+        source.release()
+        return None
+    if source.kind != "webcam":
+        print(f"[+] Frame source: {source.describe()}" + ("" if source.realtime else " (as fast as possible)"))
+    return source
+
+
+def add_frame_source_args(parser):
+    parser.add_argument(
+        "--source",
+        default="",
+        help="Frame source: camera index, video file, image directory or 'synthetic' (default: JUTSU_FRAME_SOURCE, then --camera)",
+    )
+    parser.add_argument("--source-fast", action="store_true", help="Read file/synthetic sources as fast as possible instead of at their frame rate")
+    parser.add_argument("--source-once", action="store_true", help="Stop at the end of a video/image source instead of looping")
+    return parser
+
+
+def source_spec(cli_source="", camera_index=0):
+    """--source, else JUTSU_FRAME_SOURCE, else the camera index."""
+    return str(cli_source or "").strip() or str(os.getenv("JUTSU_FRAME_SOURCE", "")).strip() or str(camera_index)
+
+
+def open_frame_source_from_args(args, camera_index=0, width=640, height=480, fps=None):
+    """open_frame_source() for a parser set up with add_frame_source_args()."""
+    return open_frame_source(
+        source_spec(getattr(args, "source", ""), camera_index),
+        width,
+        height,
+        fps=fps,
+        realtime=False if getattr(args, "source_fast", False) else None,
+        loop=False if getattr(args, "source_once", False) else None,
+    )
@@ -0,0 +1,315 @@
+"""
+Central image asset cache with pre-scaled variants and a memory budget.
+
+AssetsMixin used to pygame.image.load() every icon, texture and background
+itself and callers smoothscaled them again ad hoc, some every frame (the
+practice/calibration backgrounds, the sign icon bar, the two-hands guide that
+was even loaded from disk inside the playing loop). AssetManager decodes each
+file once and hands out variants at the sizes callers ask for:
+
+- "stretch" scales to the exact size,
+- "cover" scales to fill the size and centre-crops (backgrounds, card art),
+- "fit" scales to fit inside the size keeping the aspect ratio (logo).
+
+screen_variant() ties a variant to the active resolution; set_screen_size()
+drops the ones made for the previous RESOLUTION_OPTIONS entry. Sources and
+variants share one LRU bounded by surface memory (JUTSU_ASSET_BUDGET_MB).
+Surfaces callers still hold stay valid after eviction; the cache just
+rebuilds them on the next request.
+
+preload() decodes non-critical files on a background thread. Decoded surfaces
+are converted to the display format on the main thread when first handed out;
+a request with block=False returns None while its file is still queued.
+
+With an AssetPack (see asset_pack.py) sources and variants are taken from the
+memory-mapped pack before anything is decoded. `requested` records every
+source and variant callers asked for, which is what the pack build stores.
+"""
+
+import math
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pygame
+
+from src.jutsu_academy.asset_pack import get_asset_pack
+
+DEFAULT_BUDGET_MB = 256.0
+
+FIT_STRETCH = "stretch"
+FIT_COVER = "cover"
+FIT_FIT = "fit"
+
+
+def _path_key(path):
+    return str(Path(path))
+
+
+def decode_image(path):
+    """Decode an image file to an (unconverted) Surface; OpenCV is the fallback decoder."""
+    try:
+        return pygame.image.load(str(path))
+    except Exception:
+        pass
+    try:
+        frame = cv2.imread(str(path), cv2.IMREAD_COLOR)
+        if frame is None:
+            return None
+        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        return pygame.surfarray.make_surface(np.transpose(frame, (1, 0, 2)))
+    except Exception:
+        return None
+
+
+def scale_surface(surf, size, fit=FIT_STRETCH):
+    w, h = int(size[0]), int(size[1])
+    src_w, src_h = surf.get_size()
+    if fit == FIT_COVER:
+        scale = max(w / src_w, h / src_h)
+        new_w = int(math.ceil(src_w * scale))
+        new_h = int(math.ceil(src_h * scale))
+        scaled = pygame.transform.smoothscale(surf, (new_w, new_h))
+        x = max(0, (new_w - w) // 2)
+        y = max(0, (new_h - h) // 2)
+        return scaled.subsurface(pygame.Rect(x, y, w, h)).copy()
+    if fit == FIT_FIT:
+        scale = min(w / src_w, h / src_h)
+        w = max(1, int(round(src_w * scale)))
+        h = max(1, int(round(src_h * scale)))
+    return pygame.transform.smoothscale(surf, (w, h))
+
+
+def _surface_bytes(surf):
+    return surf.get_bytesize() * surf.get_width() * surf.get_height()
+
+
+class AssetManager:
+    def __init__(self, budget_mb=DEFAULT_BUDGET_MB, pack=None):
+        self.budget_bytes = int(float(budget_mb) * 1024 * 1024)
+        self.pack = pack
+        self.requested = set()          # ("src", path) / ("var", path, size, fit) asked for by callers
+        self._lock = threading.RLock()
+        self._entries = OrderedDict()   # key -> [surface, nbytes, converted]
+        self._pending = {}              # path -> preload requests still queued or decoding
+        self._screen_keys = set()
+        self._queue = queue.Queue()
+        self._worker = None
+        self.screen_size = None
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.decode_ms = 0.0
+
+    def __len__(self):
+        return len(self._entries)
+
+    # ─── Cache bookkeeping ──────────────────────────────────────────────────
+    def _lookup(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._materialize(entry)
+
+    def _materialize(self, entry):
+        # convert_alpha() needs the display, so worker-decoded surfaces convert on the main thread.
+        if not entry[2] and threading.current_thread() is threading.main_thread():
+            if pygame.display.get_surface() is not None:
+                surf = entry[0].convert_alpha()
+                self.bytes += _surface_bytes(surf) - entry[1]
+                entry[0], entry[1] = surf, _surface_bytes(surf)
+            entry[2] = True
+        return entry[0]
+
+    def _store(self, key, surf, converted):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = [surf, _surface_bytes(surf), converted]
+                self._entries[key] = entry
+                self.bytes += entry[1]
+                self._evict(keep=key)
+            return self._materialize(entry)
+
+    def _evict(self, keep):
+        while self.bytes > self.budget_bytes and len(self._entries) > 1:
+            key = next(iter(self._entries))
+            if key == keep:
+                self._entries.move_to_end(key)
+                continue
+            self._drop(key)
+            self.evictions += 1
+
+    def _drop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[1]
+        self._screen_keys.discard(key)
+
+    # ─── Lookups ────────────────────────────────────────────────────────────
+    def is_pending(self, path):
+        with self._lock:
+            return _path_key(path) in self._pending
+
+    def _decode(self, path):
+        raw = self.pack.image(path) if self.pack is not None else None
+        if raw is None:
+            t0 = time.perf_counter()
+            raw = decode_image(path)
+            self.decode_ms += (time.perf_counter() - t0) * 1000.0
+        return raw
+
+    def source(self, path, block=True):
+        """Full-size surface for path, decoded once; None if it cannot be decoded."""
+        path = _path_key(path)
+        self.requested.add(("src", path))
+        return self._source(path, block)
+
+    def _source(self, path, block):
+        key = ("src", path)
+        surf = self._lookup(key)
+        if surf is not None:
+            return surf
+        if not block and self.is_pending(path):
+            return None
+        raw = self._decode(path)
+        if raw is None:
+            return None
+        return self._store(key, raw, converted=False)
+
+    def scaled(self, path, size, fit=FIT_STRETCH, block=True):
+        """Variant of path at size (see the module docstring for fit modes)."""
+        path = _path_key(path)
+        size = (int(size[0]), int(size[1]))
+        key = ("var", path, size, fit)
+        self.requested.add(key)
+        surf = self._lookup(key)
+        if surf is not None:
+            return surf
+        packed = self.pack.image(path, size, fit) if self.pack is not None else None
+        if packed is not None:
+            return self._store(key, packed, converted=False)
+        base = self._source(path, block)
+        if base is None:
+            return None
+        try:
+            variant = scale_surface(base, size, fit)
+        except Exception as e:
+            print(f"[!] Asset scale failed for {path} at {size}: {e}")
+            return None
+        return self._store(key, variant, converted=True)
+
+    def screen_variant(self, path, fit=FIT_COVER, block=True):
+        """Variant at the active screen size; dropped again when the resolution changes."""
+        size = self.screen_size
+        if size is None:
+            screen = pygame.display.get_surface()
+            if screen is None:
+                return None
+            size = screen.get_size()
+        surf = self.scaled(path, size, fit, block=block)
+        if surf is not None:
+            with self._lock:
+                self._screen_keys.add(("var", _path_key(path), tuple(size), fit))
+        return surf
+
+    def set_screen_size(self, size):
+        size = (int(size[0]), int(size[1]))
+        with self._lock:
+            if size == self.screen_size:
+                return
+            self.screen_size = size
+            for key in [key for key in self._screen_keys if key[2] != size]:
+                self._drop(key)
+
+    # ─── Background loading ─────────────────────────────────────────────────
+    def preload(self, path, sizes=()):
+        """Decode path (and build (size, fit) variants) on the background thread."""
+        path = _path_key(path)
+        self.requested.add(("src", path))
+        self.requested.update(("var", path, (int(size[0]), int(size[1])), fit) for size, fit in sizes)
+        with self._lock:
+            if ("src", path) in self._entries and not sizes:
+                return
+            self._pending[path] = self._pending.get(path, 0) + 1
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._worker_loop, name="asset-preload", daemon=True)
+                self._worker.start()
+        self._queue.put((path, tuple(sizes)))
+
+    def _worker_loop(self):
+        while True:
+            path, sizes = self._queue.get()
+            try:
+                self._preload_one(path, sizes)
+            except Exception as e:
+                print(f"[!] Asset preload failed for {path}: {e}")
+            finally:
+                with self._lock:
+                    left = self._pending.get(path, 1) - 1
+                    if left > 0:
+                        self._pending[path] = left
+                    else:
+                        self._pending.pop(path, None)
+
+    def _preload_one(self, path, sizes):
+        with self._lock:
+            entry = self._entries.get(("src", path))
+            base = entry[0] if entry is not None else None
+        if base is None:
+            base = self._decode(path)
+            if base is None:
+                return
+            self._store(("src", path), base, converted=False)
+        # smoothscale only takes 24/32-bit surfaces; palette images scale on first use instead.
+        if base.get_bitsize() not in (24, 32):
+            return
+        if base.get_bitsize() == 24:
+            # Scale from 32-bit like the main thread does, so variants match packed and on-demand ones.
+            base = pygame.image.frombytes(pygame.image.tobytes(base, "RGBA"), base.get_size(), "RGBA")
+        for size, fit in sizes:
+            size = (int(size[0]), int(size[1]))
+            key = ("var", path, size, fit)
+            with self._lock:
+                if key in self._entries:
+                    continue
+            self._store(key, scale_surface(base, size, fit), converted=False)
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "mb": round(self.bytes / (1024 * 1024), 1),
+                "budget_mb": round(self.budget_bytes / (1024 * 1024), 1),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+                "pending": len(self._pending),
+                "decode_ms": round(self.decode_ms, 1),
+            }
+
+
+_shared_manager = None
+
+
+def get_asset_manager():
+    global _shared_manager
+    if _shared_manager is None:
+        try:
+            budget_mb = float(os.getenv("JUTSU_ASSET_BUDGET_MB", str(DEFAULT_BUDGET_MB)))
+        except ValueError:
+            budget_mb = DEFAULT_BUDGET_MB
+        _shared_manager = AssetManager(budget_mb=budget_mb, pack=get_asset_pack())
+    return _shared_manager
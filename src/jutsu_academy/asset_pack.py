@@ -0,0 +1,221 @@
+"""
+Pre-processed asset pack: decoded images and sounds, memory-mapped at startup.
+
+Every launch used to decode the UI's PNG/JPEG files and the MP3 sound effects
+before the menu could appear. scripts/build_asset_pack.py runs the game's own
+loaders once at build time and writes what they produced into one file:
+
+- images as raw RGBA (optionally LZ4-compressed): decoded sources and the
+  exact pre-scaled variants AssetManager was asked for, including the
+  background cropped for every RESOLUTION_OPTIONS entry;
+- sound effects as raw PCM in the mixer format they were decoded for.
+
+assets.pack holds the payloads (64-byte aligned) and assets.pack.json the
+index. At runtime the pack is memory-mapped, and images wrap the mapped bytes
+with pygame.image.frombuffer (no copy until AssetManager converts them to the
+display format). Entries are keyed by the path relative to the resource root
+and stamped with the source file's size and mtime; anything missing, stale,
+LZ4 without the lz4 module, or audio packed for a different mixer format
+falls back to decoding the original file.
+"""
+
+import json
+import mmap
+import os
+from pathlib import Path
+
+import pygame
+
+from src.utils.paths import get_runtime_roots, resolve_resource_path
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+PACK_VERSION = 1
+DEFAULT_PACK_PATH = "src/asset_pack/assets.pack"
+_ALIGN = 64
+
+
+def index_path(pack_path):
+    return Path(str(pack_path) + ".json")
+
+
+def relative_keys(path):
+    """Candidate pack keys for path: its POSIX path relative to each runtime root that contains it."""
+    p = Path(path)
+    keys = []
+    for root in get_runtime_roots():
+        try:
+            key = p.relative_to(root).as_posix()
+        except ValueError:
+            continue
+        if key not in keys:
+            keys.append(key)
+    return keys
+
+
+def image_key(rel, size=None, fit=None):
+    if size is None:
+        return rel
+    return f"{rel}@{int(size[0])}x{int(size[1])}:{fit}"
+
+
+def _source_stamp(source_path):
+    st = os.stat(source_path)
+    return {"src_bytes": st.st_size, "src_mtime": int(st.st_mtime)}
+
+
+class AssetPackWriter:
+    def __init__(self, path, compress=False):
+        if compress and lz4_frame is None:
+            raise RuntimeError("--lz4 needs the lz4 package (pip install lz4)")
+        self.path = Path(path)
+        self.compress = bool(compress)
+        self.index = {"version": PACK_VERSION, "mixer": None, "images": {}, "sounds": {}}
+        self._tmp = self.path.with_name(self.path.name + ".tmp")
+        self._fh = None
+        self._offset = 0
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self._tmp, "wb")
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._fh.close()
+        if exc_type is not None:
+            self._tmp.unlink(missing_ok=True)
+            return False
+        os.replace(self._tmp, self.path)
+        with open(index_path(self.path), "w", encoding="utf-8") as f:
+            json.dump(self.index, f, indent=1, sort_keys=True)
+        return False
+
+    def _write(self, data):
+        pad = (-self._offset) % _ALIGN
+        if pad:
+            self._fh.write(b"\0" * pad)
+            self._offset += pad
+        codec = "raw"
+        if self.compress:
+            data = lz4_frame.compress(data)
+            codec = "lz4"
+        offset = self._offset
+        self._fh.write(data)
+        self._offset += len(data)
+        return {"offset": offset, "length": len(data), "codec": codec}
+
+    def add_image(self, key, surf, source_path):
+        entry = self._write(pygame.image.tobytes(surf, "RGBA"))
+        entry["size"] = list(surf.get_size())
+        entry.update(_source_stamp(source_path))
+        self.index["images"][key] = entry
+
+    def add_sound(self, key, sound, source_path):
+        mixer = pygame.mixer.get_init()
+        self.index["mixer"] = list(mixer) if mixer else None
+        entry = self._write(sound.get_raw())
+        entry.update(_source_stamp(source_path))
+        self.index["sounds"][key] = entry
+
+    @property
+    def bytes_written(self):
+        return self._offset
+
+
+class AssetPack:
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(index_path(self.path), "r", encoding="utf-8") as f:
+            self.index = json.load(f)
+        if self.index.get("version") != PACK_VERSION:
+            raise ValueError(f"asset pack version {self.index.get('version')} != {PACK_VERSION}")
+        self._file = open(self.path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mm)
+        self._images = self.index.get("images", {})
+        self._sounds = self.index.get("sounds", {})
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    def _lookup(self, table, path, size=None, fit=None):
+        for rel in relative_keys(path):
+            entry = table.get(image_key(rel, size, fit))
+            if entry is not None:
+                break
+        else:
+            self.misses += 1
+            return None
+        try:
+            st = os.stat(path)
+            # Zip extraction keeps mtimes to two-second resolution.
+            if st.st_size != entry["src_bytes"] or abs(st.st_mtime - entry["src_mtime"]) > 2:
+                self.stale += 1
+                return None
+        except OSError:
+            pass  # shipped without the source file; the pack is all there is
+        data = self._view[entry["offset"]:entry["offset"] + entry["length"]]
+        if entry.get("codec") == "lz4":
+            if lz4_frame is None:
+                self.misses += 1
+                return None
+            data = lz4_frame.decompress(data)
+        self.hits += 1
+        return entry, data
+
+    def image(self, path, size=None, fit=None):
+        """Unconverted RGBA Surface over the mapped bytes, or None to decode the file instead."""
+        found = self._lookup(self._images, path, size, fit)
+        if found is None:
+            return None
+        entry, data = found
+        return pygame.image.frombuffer(data, tuple(entry["size"]), "RGBA")
+
+    def sound(self, path):
+        mixer = pygame.mixer.get_init()
+        if mixer is None or list(mixer) != self.index.get("mixer"):
+            return None
+        found = self._lookup(self._sounds, path)
+        if found is None:
+            return None
+        return pygame.mixer.Sound(buffer=found[1])
+
+    def stats(self):
+        return {
+            "path": str(self.path),
+            "images": len(self._images),
+            "sounds": len(self._sounds),
+            "mb": round(len(self._mm) / (1024 * 1024), 1),
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+        }
+
+
+_shared_pack = None
+_pack_checked = False
+
+
+def get_asset_pack():
+    """The shipped pack, or None if there is none (JUTSU_ASSET_PACK=0 disables, a path overrides)."""
+    global _shared_pack, _pack_checked
+    if _pack_checked:
+        return _shared_pack
+    _pack_checked = True
+    setting = str(os.getenv("JUTSU_ASSET_PACK", "")).strip()
+    if setting.lower() in ("0", "false", "no", "off"):
+        return None
+    path = Path(setting) if setting else resolve_resource_path(DEFAULT_PACK_PATH)
+    if not path.exists() or not index_path(path).exists():
+        return None
+    try:
+        _shared_pack = AssetPack(path)
+    except Exception as e:
+        print(f"[!] Asset pack unusable ({path}): {e}")
+        return None
+    stats = _shared_pack.stats()
+    print(f"[+] Asset pack: {stats['images']} images, {stats['sounds']} sounds ({stats['mb']} MB)")
+    return _shared_pack
@@ -1,5 +1,28 @@
 from src.jutsu_academy.effects.base import BaseEffect, EffectContext
 from src.jutsu_academy.effects.orchestrator import EffectOrchestrator
-from src.jutsu_academy.effects.shadow_clone_effect import ShadowCloneEffect
-from src.jutsu_academy.effects.reaper_death_seal_effect import ReaperDeathSealEffect
-from src.jutsu_academy.effects.water_dragon_effect import WaterDragonEffect
+
+# Effect classes load on first access, so importing the package (or render_queue)
+# from the launcher does not pull in every effect module and its dependencies.
+_LAZY_EFFECTS = {
+    "ShadowCloneEffect": "src.jutsu_academy.effects.shadow_clone_effect",
+    "ReaperDeathSealEffect": "src.jutsu_academy.effects.reaper_death_seal_effect",
+    "WaterDragonEffect": "src.jutsu_academy.effects.water_dragon_effect",
+    "FireParticlesEffect": "src.jutsu_academy.effects.fire_particles_effect",
+}
+
+__all__ = ["BaseEffect", "EffectContext", "EffectOrchestrator", *_LAZY_EFFECTS]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EFFECTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EFFECTS))
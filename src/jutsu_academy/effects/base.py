@@ -26,9 +26,28 @@ class EffectContext:
     scale_y: float = 1.0
     font: Any = None
     debug: bool = False
+    render_queue: Any = None
 
 
 class BaseEffect:
+    # Quality presets, best first; each maps attribute names to values. Empty means no LOD.
+    quality_levels = ()
+    quality_level = 0
+
+    def can_degrade(self):
+        return self.quality_level < len(self.quality_levels) - 1
+
+    def set_quality_level(self, level):
+        levels = self.quality_levels
+        if not levels:
+            return
+        self.quality_level = max(0, min(len(levels) - 1, int(level)))
+        self.apply_quality(levels[self.quality_level])
+
+    def apply_quality(self, settings):
+        for name, value in settings.items():
+            setattr(self, name, value)
+
     def on_jutsu_start(self, context: EffectContext):
         pass
 
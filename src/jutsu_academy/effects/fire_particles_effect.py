@@ -0,0 +1,27 @@
+from src.jutsu_academy.effects.base import BaseEffect
+
+
+class FireParticlesEffect(BaseEffect):
+    """Level of detail for the FireParticleSystems the playing loop drives itself.
+
+    The fireball and phoenix systems are positioned, updated and rendered by
+    PlayingMixin, which charges that work to this effect through
+    EffectOrchestrator.measure(); the governor then steps their capacity and
+    emission like any other effect's quality level.
+    """
+
+    quality_levels = (
+        {"particle_scale": 1.0},
+        {"particle_scale": 0.7},
+        {"particle_scale": 0.5},
+        {"particle_scale": 0.35},
+    )
+
+    def __init__(self, systems):
+        self.systems = list(systems)
+        self.particle_scale = 1.0
+
+    def apply_quality(self, settings):
+        super().apply_quality(settings)
+        for system in self.systems:
+            system.set_detail(self.particle_scale)
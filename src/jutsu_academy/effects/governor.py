@@ -0,0 +1,104 @@
+"""
+Frame-budget governor for effect level of detail.
+
+Effects list their quality levels in BaseEffect.quality_levels, best first.
+The orchestrator times each effect's update() and render() (plus its share of
+the render-queue flush) and reports the numbers here once per frame. When the
+smoothed total goes over budget_ms, the most expensive effect that can still
+degrade drops one level. When there is comfortable headroom, the most recently
+degraded effect that is currently running steps back up. A cooldown between
+steps keeps the levels from oscillating.
+"""
+
+DEFAULT_BUDGET_MS = 8.0
+
+
+class EffectBudgetGovernor:
+    def __init__(
+        self,
+        budget_ms=DEFAULT_BUDGET_MS,
+        smoothing=0.15,
+        cooldown_frames=20,
+        recover_ratio=0.6,
+    ):
+        self.budget_ms = float(budget_ms)
+        self.enabled = self.budget_ms > 0
+        self.smoothing = float(smoothing)
+        self.cooldown_frames = int(cooldown_frames)
+        self.recover_ratio = float(recover_ratio)
+        self.cost_ms = {}       # smoothed per-effect cost, kept while the effect is idle
+        self.total_ms = 0.0     # smoothed total effect cost per frame
+        self._frame = {}
+        self._cooldown = self.cooldown_frames  # let the averages settle before the first decision
+        self._degraded = []     # effect names in the order they were stepped down
+        self.steps_down = 0
+        self.steps_up = 0
+
+    def record(self, name, ms):
+        self._frame[name] = self._frame.get(name, 0.0) + ms
+
+    def end_frame(self, effects):
+        frame = self._frame
+        self._frame = {}
+        k = self.smoothing
+        for name, ms in frame.items():
+            prev = self.cost_ms.get(name)
+            self.cost_ms[name] = ms if prev is None else prev + (ms - prev) * k
+        self.total_ms += (sum(frame.values()) - self.total_ms) * k
+
+        if not self.enabled:
+            return
+        if self._cooldown > 0:
+            self._cooldown -= 1
+            return
+
+        if self.total_ms > self.budget_ms:
+            # Ignore effects too cheap for a step down to matter (e.g. an idle passive effect).
+            floor_ms = self.budget_ms * 0.1
+            candidates = [
+                name for name in frame
+                if name in effects
+                and effects[name].can_degrade()
+                and self.cost_ms.get(name, 0.0) >= floor_ms
+            ]
+            if candidates:
+                name = max(candidates, key=lambda n: self.cost_ms.get(n, 0.0))
+                effect = effects[name]
+                effect.set_quality_level(effect.quality_level + 1)
+                self._degraded.append(name)
+                self.steps_down += 1
+                self._cooldown = self.cooldown_frames
+            return
+
+        if self.total_ms < self.budget_ms * self.recover_ratio:
+            # Only recover effects that are running, so idle ones keep the level they settled at.
+            for i in range(len(self._degraded) - 1, -1, -1):
+                name = self._degraded[i]
+                if name not in frame:
+                    continue
+                effect = effects.get(name)
+                del self._degraded[i]
+                if effect is not None and effect.quality_level > 0:
+                    effect.set_quality_level(effect.quality_level - 1)
+                    self.steps_up += 1
+                    # Recovering is cheaper to get wrong than degrading; wait longer before the next step.
+                    self._cooldown = self.cooldown_frames * 2
+                break
+
+    def reset(self, effects=None):
+        self._frame = {}
+        self._cooldown = self.cooldown_frames
+        self._degraded = []
+        self.total_ms = 0.0
+        for effect in (effects or {}).values():
+            effect.set_quality_level(0)
+
+    def stats(self, effects=None):
+        return {
+            "budget_ms": self.budget_ms,
+            "total_ms": round(self.total_ms, 3),
+            "cost_ms": {name: round(ms, 3) for name, ms in self.cost_ms.items()},
+            "levels": {name: effect.quality_level for name, effect in (effects or {}).items()},
+            "steps_down": self.steps_down,
+            "steps_up": self.steps_up,
+        }
@@ -1,11 +1,21 @@
+import time
+from contextlib import contextmanager
+
 from src.jutsu_academy.effects.base import BaseEffect, EffectContext
+from src.jutsu_academy.effects.governor import DEFAULT_BUDGET_MS, EffectBudgetGovernor
+from src.jutsu_academy.effects.render_queue import RenderQueue
 
 
 class EffectOrchestrator:
-    def __init__(self):
+    def __init__(self, budget_ms=DEFAULT_BUDGET_MS):
         self.effects = {}
         self.active_effect_name = None
         self.passive_effect_names = set()
+        # Blits submitted during a frame (effects, fire particles) are flushed together in render().
+        self.render_queue = RenderQueue()
+        # Steps effect quality down/up to keep their combined cost under budget_ms (0 disables).
+        self.governor = EffectBudgetGovernor(budget_ms)
+        self._external_submitted = {}  # name -> render-queue items queued under measure() this frame
 
     def register(self, effect_name: str, effect: BaseEffect, passive=False):
         self.effects[effect_name] = effect
@@ -25,23 +35,64 @@ class EffectOrchestrator:
             effect.on_jutsu_end(context)
         self.active_effect_name = None
 
+    @contextmanager
+    def measure(self, name):
+        """Charge work done outside update()/render() to the registered effect name.
+
+        Blits it queues on render_queue count toward its share of the flush.
+        """
+        queue = self.render_queue
+        before = len(queue)
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.governor.record(name, (time.perf_counter() - t0) * 1000.0)
+            queued = len(queue) - before
+            if queued > 0:
+                self._external_submitted[name] = self._external_submitted.get(name, 0) + queued
+
     def update(self, context: EffectContext):
         names = set(self.passive_effect_names)
         if self.active_effect_name:
             names.add(self.active_effect_name)
+        governor = self.governor
         for name in names:
             effect = self.effects.get(name)
             if effect:
+                t0 = time.perf_counter()
                 effect.update(context)
+                governor.record(name, (time.perf_counter() - t0) * 1000.0)
 
     def render(self, screen, context: EffectContext):
+        if context.render_queue is None:
+            context.render_queue = self.render_queue
         names = set(self.passive_effect_names)
         if self.active_effect_name:
             names.add(self.active_effect_name)
+        governor = self.governor
+        queue = context.render_queue
+        submitted = self._external_submitted
+        self._external_submitted = {}
         for name in names:
             effect = self.effects.get(name)
             if effect:
+                before = len(queue)
+                t0 = time.perf_counter()
                 effect.render(screen, context)
+                governor.record(name, (time.perf_counter() - t0) * 1000.0)
+                submitted[name] = submitted.get(name, 0) + len(queue) - before
+        if queue is self.render_queue:
+            # Blits are deferred to the flush, so charge its cost by each effect's share of items.
+            queued = len(queue)
+            t0 = time.perf_counter()
+            queue.flush(screen)
+            flush_ms = (time.perf_counter() - t0) * 1000.0
+            if queued > 0:
+                for name, count in submitted.items():
+                    if count > 0:
+                        governor.record(name, flush_ms * count / queued)
+        governor.end_frame(self.effects)
 
     def on_sign_detected(self, sign_name: str, context: EffectContext):
         for name in self.passive_effect_names:
@@ -51,3 +102,6 @@ class EffectOrchestrator:
 
     def reset(self):
         self.active_effect_name = None
+        self.render_queue.clear()
+        self._external_submitted = {}
+        self.governor.reset(self.effects)
@@ -1,24 +1,30 @@
 from pathlib import Path
 
 import cv2
-import mediapipe as mp
 import numpy as np
 import pygame
 import time
-from mediapipe.tasks import python
-from mediapipe.tasks.python import vision
 
 from src.jutsu_academy.effects.base import BaseEffect, EffectContext
+from src.jutsu_academy.effects.render_queue import LAYER_BACKDROP
+from src.jutsu_academy.effects.segmentation_service import get_segmentation_service
 
 
 class ReaperDeathSealEffect(BaseEffect):
     """
     Reaper Death Seal effect:
-    - Uses selfie segmentation (same model family as shadow clone effect).
+    - Uses the shared selfie segmentation service (same segmenter as shadow clone effect).
     - Replaces camera background with death.jpg.
     - Keeps player cutout at original position (no background capture required).
     """
 
+    # LOD presets stepped through by the orchestrator's frame-budget governor.
+    quality_levels = (
+        {"segment_every_n_frames": 1, "edge_blur_sigma": 2.0, "bg_interpolation": cv2.INTER_CUBIC},
+        {"segment_every_n_frames": 2, "edge_blur_sigma": 1.5, "bg_interpolation": cv2.INTER_LINEAR},
+        {"segment_every_n_frames": 3, "edge_blur_sigma": 0.0, "bg_interpolation": cv2.INTER_LINEAR},
+    )
+
     def __init__(self):
         self.sign_aliases = {
             "reaper death seal",
@@ -28,10 +34,10 @@ class ReaperDeathSealEffect(BaseEffect):
             "shiki_fujin",
         }
 
-        self.segment_width = 384
-        self.mask_every_n_frames = 2
         self.alpha_thresh = 0.35
+        self.segment_every_n_frames = 1
         self.edge_blur_sigma = 2.0
+        self.bg_interpolation = cv2.INTER_CUBIC
         self.person_brightness_scale = 0.82
         self.person_darkness_scale = 0.78
         self.background_darkness_scale = 0.58
@@ -46,9 +52,8 @@ class ReaperDeathSealEffect(BaseEffect):
 
         self.enabled = False
         self.active = False
-        self.segmenter = None
+        self.segmentation = None
         self.frame_count = 0
-        self.last_alpha_full = None
         self.prepared_surface = None
         self.effect_alpha = 0.0
         self.effect_started_at = 0.0
@@ -70,22 +75,13 @@ class ReaperDeathSealEffect(BaseEffect):
             if self.bg_image_bgr is None:
                 raise RuntimeError(f"Missing or unreadable background image: {bg_path}")
 
-            model_path = root / "models" / "selfie_segmenter.tflite"
-            base_options = python.BaseOptions(
-                model_asset_path=str(model_path),
-                delegate=python.BaseOptions.Delegate.CPU,
-            )
-            options = vision.ImageSegmenterOptions(
-                base_options=base_options,
-                output_category_mask=True,
-                output_confidence_masks=True,
-            )
-            self.segmenter = vision.ImageSegmenter.create_from_options(options)
+            self.segmentation = get_segmentation_service()
+            if not self.segmentation.enabled:
+                raise RuntimeError(self.segmentation.init_error or "segmenter unavailable")
             return True
         except Exception as e:
             print(f"[!] ReaperDeathSealEffect disabled (init failed): {e}")
             self.bg_image_bgr = None
-            self.segmenter = None
             return False
 
     def _normalize_name(self, name):
@@ -94,20 +90,6 @@ class ReaperDeathSealEffect(BaseEffect):
         s = str(name).strip().lower().replace("-", " ").replace("_", " ")
         return " ".join(s.split())
 
-    def _get_alpha_from_result(self, segmentation_result):
-        confs = getattr(segmentation_result, "confidence_masks", None)
-        if confs and len(confs) >= 2:
-            person_conf = confs[1].numpy_view().astype(np.float32)
-            return np.clip(person_conf, 0.0, 1.0)
-
-        category_mask = segmentation_result.category_mask
-        mask = category_mask.numpy_view()
-        if mask.ndim == 3:
-            mask = mask[:, :, 0]
-        vals, counts = np.unique(mask, return_counts=True)
-        bg_val = vals[np.argmax(counts)]
-        return (mask != bg_val).astype(np.float32)
-
     def _get_animated_bg(self, w, h):
         if self.bg_image_bgr is None:
             return None
@@ -128,7 +110,7 @@ class ReaperDeathSealEffect(BaseEffect):
         scale = max(w / float(src_w), h / float(src_h)) * dyn_zoom
         fit_w = max(1, int(round(src_w * scale)))
         fit_h = max(1, int(round(src_h * scale)))
-        fitted = cv2.resize(self.bg_image_bgr, (fit_w, fit_h), interpolation=cv2.INTER_CUBIC)
+        fitted = cv2.resize(self.bg_image_bgr, (fit_w, fit_h), interpolation=self.bg_interpolation)
 
         float_wave_x = np.sin(2.0 * np.pi * self.bg_float_hz * elapsed)
         float_wave_y = np.cos(2.0 * np.pi * self.bg_float_hz * elapsed * 0.86)
@@ -202,51 +184,31 @@ class ReaperDeathSealEffect(BaseEffect):
         h, w = frame.shape[:2]
         self.frame_count += 1
 
-        run_seg = (self.frame_count % self.mask_every_n_frames == 0) or (self.last_alpha_full is None)
-        if run_seg:
-            if self.segment_width and 0 < self.segment_width < w:
-                scale = self.segment_width / float(w)
-                seg_w = self.segment_width
-                seg_h = max(1, int(h * scale))
-                small = cv2.resize(frame, (seg_w, seg_h), interpolation=cv2.INTER_LINEAR)
-                rgb_small = cv2.cvtColor(small, cv2.COLOR_BGR2RGB)
-                mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_small)
-                result = self.segmenter.segment(mp_image)
-                alpha_small = self._get_alpha_from_result(result)
-                alpha_full = cv2.resize(alpha_small, (w, h), interpolation=cv2.INTER_LINEAR).astype(np.float32)
-            else:
-                rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
-                result = self.segmenter.segment(mp_image)
-                alpha_full = self._get_alpha_from_result(result).astype(np.float32)
-
-            if self.edge_blur_sigma and self.edge_blur_sigma > 0:
-                alpha_full = cv2.GaussianBlur(alpha_full, (0, 0), self.edge_blur_sigma)
-            alpha_full = np.clip(alpha_full, 0.0, 1.0)
-            self.last_alpha_full = alpha_full
-        else:
-            alpha_full = self.last_alpha_full
-
-        if alpha_full is None:
+        if self.frame_count % max(1, self.segment_every_n_frames) == 0:
+            self.segmentation.submit(frame)
+        mask = self.segmentation.latest((w, h))
+        if mask is None:
             return
 
-        # Keep only confident person pixels to avoid ghost halos.
-        alpha_full = np.where(alpha_full >= self.alpha_thresh, alpha_full, 0.0).astype(np.float32)
-        alpha3 = alpha_full[:, :, None]
-
         bg = self._get_animated_bg(w, h)
         if bg is None:
             return
 
         # Blend a touch of original frame into background to keep natural lighting.
         bg_mix = cv2.addWeighted(bg, 1.0 - self.background_keep_ratio, frame, self.background_keep_ratio, 0.0)
-        bg_mix = np.clip(bg_mix.astype(np.float32) * self.background_darkness_scale, 0, 255).astype(np.uint8)
+        composite = cv2.convertScaleAbs(bg_mix, alpha=self.background_darkness_scale)
 
-        # Keep player foreground a bit darker as requested.
-        fg = np.clip(frame.astype(np.float32) * self.person_brightness_scale, 0, 255)
-        fg = np.clip(fg * self.person_darkness_scale, 0, 255)
-        composite = fg * alpha3 + bg_mix.astype(np.float32) * (1.0 - alpha3)
-        composite = np.clip(composite, 0, 255).astype(np.uint8)
+        # Outside the person bbox alpha is zero, so only the crop needs the per-pixel blend.
+        # Keep only confident person pixels to avoid ghost halos.
+        crop = mask.person_crop(pad=12, feather_sigma=self.edge_blur_sigma, alpha_thresh=self.alpha_thresh)
+        if crop is not None:
+            x1, y1, x2, y2, alpha = crop
+            alpha3 = alpha[:, :, None]
+            # Keep player foreground a bit darker as requested.
+            fg = frame[y1:y2, x1:x2].astype(np.float32) * (self.person_brightness_scale * self.person_darkness_scale)
+            region = composite[y1:y2, x1:x2]
+            blended = fg * alpha3 + region.astype(np.float32) * (1.0 - alpha3)
+            composite[y1:y2, x1:x2] = np.clip(blended, 0, 255).astype(np.uint8)
 
         rgb = cv2.cvtColor(composite, cv2.COLOR_BGR2RGB)
         self.prepared_surface = pygame.image.frombuffer(rgb.tobytes(), (w, h), "RGB")
@@ -258,4 +220,7 @@ class ReaperDeathSealEffect(BaseEffect):
         dst_h = max(1, int(self.prepared_surface.get_height() * context.scale_y))
         scaled = pygame.transform.smoothscale(self.prepared_surface, (dst_w, dst_h))
         scaled.set_alpha(int(max(0.0, min(1.0, self.effect_alpha)) * 255))
-        screen.blit(scaled, (context.cam_x, context.cam_y))
+        if context.render_queue is not None:
+            context.render_queue.submit(scaled, (context.cam_x, context.cam_y), 0, LAYER_BACKDROP)
+        else:
+            screen.blit(scaled, (context.cam_x, context.cam_y))
@@ -0,0 +1,78 @@
+"""
+Frame-scoped blit queue shared by all effects.
+
+Effects submit (surface, dest, special_flags) during render(); the orchestrator
+flushes once per frame, issuing one Surface.blits() call per (layer, blend
+mode) group instead of one screen.blit() per sprite. Layers keep the coarse
+draw order deterministic (camera replacements under particles under heads and
+eyes); within a layer, blend-mode groups flush in first-submitted order and
+each group keeps its submission order.
+"""
+
+LAYER_BACKDROP = 0      # full-frame camera replacements and tints
+LAYER_SMOKE = 5         # alpha-blended smoke under the fire
+LAYER_PARTICLES = 10    # additive glows, trails, particle bodies
+LAYER_OVERLAY = 20      # heads, eyes and other sprites drawn on top
+
+
+class RenderQueue:
+    def __init__(self):
+        self._layers = {}
+        self.size = 0
+        self.last_flush_items = 0
+        self.last_flush_calls = 0
+
+    def __len__(self):
+        return self.size
+
+    def submit(self, surface, dest, special_flags=0, layer=LAYER_PARTICLES, area=None):
+        groups = self._layers.get(layer)
+        if groups is None:
+            groups = {}
+            self._layers[layer] = groups
+        items = groups.get(special_flags)
+        if items is None:
+            items = []
+            groups[special_flags] = items
+        items.append((surface, dest, area, special_flags))
+        self.size += 1
+
+    def extend(self, items, layer=LAYER_PARTICLES, special_flags=None):
+        """Append prepared (surface, dest, area, special_flags) tuples.
+
+        Pass special_flags when every item shares it to skip the per-item bucketing.
+        """
+        groups = self._layers.get(layer)
+        if groups is None:
+            groups = {}
+            self._layers[layer] = groups
+        if special_flags is not None:
+            bucket = groups.get(special_flags)
+            if bucket is None:
+                bucket = []
+                groups[special_flags] = bucket
+            bucket.extend(items)
+            self.size += len(items)
+            return
+        for item in items:
+            bucket = groups.get(item[3])
+            if bucket is None:
+                bucket = []
+                groups[item[3]] = bucket
+            bucket.append(item)
+            self.size += 1
+
+    def clear(self):
+        self._layers = {}
+        self.size = 0
+
+    def flush(self, target):
+        calls = 0
+        for layer in sorted(self._layers):
+            for items in self._layers[layer].values():
+                if items:
+                    target.blits(items, doreturn=False)
+                    calls += 1
+        self.last_flush_items = self.size
+        self.last_flush_calls = calls
+        self.clear()
@@ -0,0 +1,328 @@
+"""
+Shared selfie-segmentation service for the camera-replacement effects.
+
+Shadow Clone and Reaper Death Seal used to each load their own ImageSegmenter
+and run it synchronously inside update(), then blur and threshold a
+full-resolution float mask. The service hosts a single segmenter on a worker
+thread: effects hand it the latest camera frame with submit() and read back
+the most recent finished mask with latest(), never waiting on inference.
+
+Masks stay at segmentation resolution. SegmentationMask.person_crop() upsamples
+and feathers only the padded person bounding box, which is the only region
+either effect composites.
+
+Constructing the service is cheap: it only checks that the model file and the
+mediapipe package exist. mediapipe is imported and the segmenter created on
+the worker thread when the first frame arrives.
+"""
+
+import importlib.util
+import threading
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+DEFAULT_SEGMENT_WIDTH = 384
+DEFAULT_ALPHA_THRESH = 0.35
+DEFAULT_MAX_AGE_SEC = 0.5
+
+
+def alpha_from_result(segmentation_result):
+    confs = getattr(segmentation_result, "confidence_masks", None)
+    if confs and len(confs) >= 2:
+        person_conf = confs[1].numpy_view().astype(np.float32)
+        return np.clip(person_conf, 0.0, 1.0)
+
+    category_mask = segmentation_result.category_mask
+    mask = category_mask.numpy_view()
+    if mask.ndim == 3:
+        mask = mask[:, :, 0]
+    vals, counts = np.unique(mask, return_counts=True)
+    bg_val = vals[np.argmax(counts)]
+    return (mask != bg_val).astype(np.float32)
+
+
+class SegmentationMask:
+    """Low-res person alpha for one camera frame, plus its bounding box at that resolution."""
+
+    def __init__(self, alpha_small, frame_size, bbox_small, seq, created_at):
+        self.alpha_small = alpha_small
+        self.frame_size = frame_size  # (w, h) of the camera frame it was computed from
+        self.bbox_small = bbox_small  # (x, y, w, h) of alpha >= thresh, or None when nobody is in frame
+        self.seq = seq
+        self.created_at = created_at
+
+    def age(self, now=None):
+        return (time.perf_counter() if now is None else now) - self.created_at
+
+    def person_crop(self, pad=12, feather_sigma=2.0, alpha_thresh=None):
+        """
+        Return (x1, y1, x2, y2, alpha_crop) in frame pixels, or None when no person was found.
+
+        alpha_crop is float32 in [0, 1], upsampled from the low-res mask over the
+        padded bbox only and feathered there. When alpha_thresh is given, values
+        below it are zeroed.
+        """
+        if self.bbox_small is None:
+            return None
+        w, h = self.frame_size
+        sh, sw = self.alpha_small.shape[:2]
+        fx = w / float(sw)
+        fy = h / float(sh)
+
+        # Pad in frame pixels, plus a small margin so the blur has context at the edges.
+        margin = pad + int(np.ceil(3.0 * max(0.0, feather_sigma)))
+        bx, by, bw, bh = self.bbox_small
+        sx1 = max(0, int(np.floor(bx - margin / fx)))
+        sy1 = max(0, int(np.floor(by - margin / fy)))
+        sx2 = min(sw, int(np.ceil(bx + bw + margin / fx)))
+        sy2 = min(sh, int(np.ceil(by + bh + margin / fy)))
+        x1 = int(round(sx1 * fx))
+        y1 = int(round(sy1 * fy))
+        x2 = min(w, int(round(sx2 * fx)))
+        y2 = min(h, int(round(sy2 * fy)))
+        if x2 <= x1 or y2 <= y1:
+            return None
+
+        alpha = cv2.resize(
+            self.alpha_small[sy1:sy2, sx1:sx2],
+            (x2 - x1, y2 - y1),
+            interpolation=cv2.INTER_LINEAR,
+        )
+        if feather_sigma and feather_sigma > 0:
+            alpha = cv2.GaussianBlur(alpha, (0, 0), feather_sigma)
+        alpha = np.clip(alpha, 0.0, 1.0)
+        if alpha_thresh is not None:
+            alpha[alpha < alpha_thresh] = 0.0
+
+        # Trim the blur margin back to the requested padding around the bbox.
+        tx1 = max(x1, int(bx * fx) - pad)
+        ty1 = max(y1, int(by * fy) - pad)
+        tx2 = min(x2, int(np.ceil((bx + bw) * fx)) + pad)
+        ty2 = min(y2, int(np.ceil((by + bh) * fy)) + pad)
+        alpha = alpha[ty1 - y1:ty2 - y1, tx1 - x1:tx2 - x1]
+        return tx1, ty1, tx2, ty2, np.ascontiguousarray(alpha, dtype=np.float32)
+
+
+class SegmentationService:
+    def __init__(self, segment_width=DEFAULT_SEGMENT_WIDTH, alpha_thresh=DEFAULT_ALPHA_THRESH):
+        self.segment_width = int(segment_width)
+        self.alpha_thresh = float(alpha_thresh)
+        self.segmenter = None
+        self.enabled = False
+        self.init_error = None
+        self.model_path = Path(__file__).resolve().parents[3] / "models" / "selfie_segmenter.tflite"
+        self._mp = None
+        self._init_lock = threading.Lock()
+
+        self._cond = threading.Condition()
+        self._pending = None
+        self._last_src = None
+        self._latest = None
+        self._seq = 0
+        self._thread = None
+        self._stopping = False
+        self.frames_submitted = 0
+        self.frames_segmented = 0
+        self.frames_dropped = 0
+        self.frames_throttled = 0
+        self.last_infer_ms = 0.0
+        self.min_interval = 0.0
+        self._last_submit_at = 0.0
+
+        self.enabled = self._segmenter_available()
+
+    def _segmenter_available(self):
+        if importlib.util.find_spec("mediapipe") is None:
+            self.init_error = "mediapipe is not installed"
+        elif not self.model_path.exists():
+            self.init_error = f"missing model: {self.model_path}"
+        else:
+            return True
+        print(f"[!] Segmentation service disabled: {self.init_error}")
+        return False
+
+    def _ensure_segmenter(self):
+        """Import mediapipe and create the segmenter once; returns False if that failed."""
+        if self.segmenter is not None:
+            return True
+        with self._init_lock:
+            if self.segmenter is not None:
+                return True
+            if not self.enabled:
+                return False
+            try:
+                import mediapipe as mp
+                from mediapipe.tasks import python
+                from mediapipe.tasks.python import vision
+
+                base_options = python.BaseOptions(
+                    model_asset_path=str(self.model_path),
+                    delegate=python.BaseOptions.Delegate.CPU,
+                )
+                options = vision.ImageSegmenterOptions(
+                    base_options=base_options,
+                    output_category_mask=True,
+                    output_confidence_masks=True,
+                )
+                self.segmenter = vision.ImageSegmenter.create_from_options(options)
+                self._mp = mp
+                return True
+            except Exception as e:
+                print(f"[!] Segmentation service disabled (segmenter init failed): {e}")
+                self.init_error = str(e)
+                self.segmenter = None
+                self.enabled = False
+                return False
+
+    def warm_up(self):
+        """Create the segmenter now (e.g. from a warm-up thread) rather than on the first frame."""
+        return self._ensure_segmenter()
+
+    def _ensure_worker(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._worker_loop, name="segmentation", daemon=True)
+        self._thread.start()
+
+    def set_max_rate(self, hz):
+        """Accept at most hz frames per second from submit() (0 = every frame)."""
+        self.min_interval = 1.0 / float(hz) if hz and hz > 0 else 0.0
+
+    def submit(self, frame_bgr):
+        """Queue frame_bgr for segmentation, replacing any frame still waiting. Never blocks on inference."""
+        if not self.enabled or frame_bgr is None:
+            return
+        # Both effects may hand over the same camera frame in one tick.
+        if frame_bgr is self._last_src:
+            return
+        now = time.perf_counter()
+        if now - self._last_submit_at < self.min_interval:
+            self.frames_throttled += 1
+            return
+        self._last_submit_at = now
+        h, w = frame_bgr.shape[:2]
+        if 0 < self.segment_width < w:
+            seg_w = self.segment_width
+            seg_h = max(1, int(h * (seg_w / float(w))))
+            small = cv2.resize(frame_bgr, (seg_w, seg_h), interpolation=cv2.INTER_LINEAR)
+        else:
+            small = frame_bgr.copy()
+        with self._cond:
+            if self._pending is not None:
+                self.frames_dropped += 1
+            self._pending = (small, (w, h))
+            self._last_src = frame_bgr
+            self.frames_submitted += 1
+            self._cond.notify()
+        self._ensure_worker()
+
+    def latest(self, frame_size=None, max_age_sec=DEFAULT_MAX_AGE_SEC):
+        """Most recent finished mask, or None if it is stale or was computed for another frame size."""
+        mask = self._latest
+        if mask is None:
+            return None
+        if frame_size is not None and tuple(frame_size) != tuple(mask.frame_size):
+            return None
+        if max_age_sec is not None and mask.age() > max_age_sec:
+            return None
+        return mask
+
+    def _worker_loop(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._stopping:
+                    self._cond.wait()
+                if self._stopping:
+                    # close() leaves the segmenter to us if it gave up waiting mid-inference.
+                    self._close_segmenter()
+                    return
+                small, frame_size = self._pending
+                self._pending = None
+            if not self._ensure_segmenter():
+                return
+            try:
+                t0 = time.perf_counter()
+                self._latest = self._segment(small, frame_size)
+                self.last_infer_ms = (time.perf_counter() - t0) * 1000.0
+                self.frames_segmented += 1
+            except Exception as e:
+                print(f"[!] Segmentation failed: {e}")
+
+    def _segment(self, small_bgr, frame_size):
+        rgb_small = cv2.cvtColor(small_bgr, cv2.COLOR_BGR2RGB)
+        mp = self._mp
+        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_small)
+        result = self.segmenter.segment(mp_image)
+        alpha_small = alpha_from_result(result)
+        sh, sw = small_bgr.shape[:2]
+        if alpha_small.shape[:2] != (sh, sw):
+            alpha_small = cv2.resize(alpha_small, (sw, sh), interpolation=cv2.INTER_LINEAR)
+        pts = cv2.findNonZero((alpha_small >= self.alpha_thresh).astype(np.uint8))
+        bbox = cv2.boundingRect(pts) if pts is not None else None
+        self._seq += 1
+        return SegmentationMask(alpha_small, frame_size, bbox, self._seq, time.perf_counter())
+
+    def reset(self):
+        with self._cond:
+            self._pending = None
+            self._last_src = None
+        self._latest = None
+        self._last_submit_at = 0.0
+
+    def close(self):
+        with self._cond:
+            self._stopping = True
+            self._pending = None
+            self._cond.notify_all()
+        self.enabled = False
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+            if thread.is_alive():
+                # Still inside segment(); closing the native segmenter under it would be a use-after-close.
+                return
+        self._thread = None
+        self._close_segmenter()
+
+    def _close_segmenter(self):
+        with self._init_lock:
+            if self.segmenter is not None:
+                try:
+                    self.segmenter.close()
+                except Exception:
+                    pass
+                self.segmenter = None
+
+    def stats(self):
+        return {
+            "submitted": self.frames_submitted,
+            "segmented": self.frames_segmented,
+            "dropped": self.frames_dropped,
+            "throttled": self.frames_throttled,
+            "last_infer_ms": round(self.last_infer_ms, 2),
+        }
+
+
+_shared_service = None
+_shared_lock = threading.Lock()
+
+
+def get_segmentation_service():
+    global _shared_service
+    with _shared_lock:
+        if _shared_service is None:
+            _shared_service = SegmentationService()
+        return _shared_service
+
+
+def shutdown_segmentation_service():
+    global _shared_service
+    with _shared_lock:
+        service = _shared_service
+        _shared_service = None
+    if service is not None:
+        service.close()
@@ -1,17 +1,22 @@
 import time
-from pathlib import Path
 
 import cv2
-import mediapipe as mp
 import numpy as np
 import pygame
-from mediapipe.tasks import python
-from mediapipe.tasks.python import vision
 
 from src.jutsu_academy.effects.base import BaseEffect, EffectContext
+from src.jutsu_academy.effects.render_queue import LAYER_BACKDROP
+from src.jutsu_academy.effects.segmentation_service import get_segmentation_service
 
 
 class ShadowCloneEffect(BaseEffect):
+    # LOD presets stepped through by the orchestrator's frame-budget governor.
+    quality_levels = (
+        {"segment_every_n_frames": 1, "edge_blur_sigma": 2.0},
+        {"segment_every_n_frames": 2, "edge_blur_sigma": 1.5},
+        {"segment_every_n_frames": 3, "edge_blur_sigma": 0.0},
+    )
+
     def __init__(self, swap_xy=True):
         self.swap_xy = swap_xy
         self.sign_aliases = {
@@ -27,44 +32,32 @@ class ShadowCloneEffect(BaseEffect):
             "clone",
         }
 
-        self.segment_width = 320
-        self.mask_every_n_frames = 2
-        self.alpha_thresh = 0.35
+        self.segment_every_n_frames = 1
         self.edge_blur_sigma = 2.0
         self.clone_dx_ratio = 0.28
         self.clone_opacity = 0.85
         self.anim_duration_sec = 0.35
         self.fade_in = True
 
-        self.last_alpha_full = None
         self.frame_count = 0
         self.clones_visible = False
         self.animating = False
         self.anim_start = 0.0
-        self.prepared_clones = []
+        self.prepared_clones = []   # frame-space (x, y) of the left and right clone
         self.current_dx_px = 0
+        self._clone_bgr = None      # person crop of the current frame (view, not a copy)
+        self._clone_alpha = None    # uint8 alpha for that crop, opacity already applied
+        self._frame_size = (0, 0)
 
-        self.segmenter = None
-        self.enabled = self._init_segmenter()
-
-    def _init_segmenter(self):
-        try:
-            model_path = Path(__file__).resolve().parents[3] / "models" / "selfie_segmenter.tflite"
-            base_options = python.BaseOptions(
-                model_asset_path=str(model_path),
-                delegate=python.BaseOptions.Delegate.CPU,
-            )
-            options = vision.ImageSegmenterOptions(
-                base_options=base_options,
-                output_category_mask=True,
-                output_confidence_masks=True,
-            )
-            self.segmenter = vision.ImageSegmenter.create_from_options(options)
-            return True
-        except Exception as e:
-            print(f"[!] ShadowCloneEffect disabled (segmenter init failed): {e}")
-            self.segmenter = None
-            return False
+        # One RGBA buffer sized to the on-screen camera rect; each frame's sprite is
+        # written into its top-left corner and both clones blit that area.
+        self._sprite_buf = None
+        self._sprite_surface = None
+
+        self.segmentation = get_segmentation_service()
+        self.enabled = self.segmentation.enabled
+        if not self.enabled:
+            print("[!] ShadowCloneEffect disabled (no segmenter)")
 
     def _normalize_sign_name(self, sign_name):
         if not sign_name:
@@ -74,21 +67,6 @@ class ShadowCloneEffect(BaseEffect):
         s = " ".join(s.split())
         return s
 
-    def _get_alpha_from_result(self, segmentation_result):
-        confs = getattr(segmentation_result, "confidence_masks", None)
-        if confs and len(confs) >= 2:
-            person_conf = confs[1].numpy_view().astype(np.float32)
-            return np.clip(person_conf, 0.0, 1.0)
-
-        category_mask = segmentation_result.category_mask
-        mask = category_mask.numpy_view()
-        if mask.ndim == 3:
-            mask = mask[:, :, 0]
-
-        vals, counts = np.unique(mask, return_counts=True)
-        bg_val = vals[np.argmax(counts)]
-        return (mask != bg_val).astype(np.float32)
-
     def _smoothstep(self, t):
         t = max(0.0, min(1.0, t))
         return t * t * (3.0 - 2.0 * t)
@@ -98,11 +76,15 @@ class ShadowCloneEffect(BaseEffect):
         self.animating = True
         self.clones_visible = False
 
-    def _prepare_surface(self, fg_crop, a_crop, opacity):
-        alpha_u8 = np.clip(a_crop * max(0.0, min(1.0, opacity)) * 255.0, 0, 255).astype(np.uint8)
-        rgb_crop = cv2.cvtColor(fg_crop, cv2.COLOR_BGR2RGB)
-        rgba = np.dstack([rgb_crop, alpha_u8])
-        return pygame.image.frombuffer(rgba.tobytes(), (rgba.shape[1], rgba.shape[0]), "RGBA")
+    def _sprite_target(self, cap_w, cap_h):
+        buf = self._sprite_buf
+        if buf is None or buf.shape[0] < cap_h or buf.shape[1] < cap_w:
+            buf = np.zeros((cap_h, cap_w, 4), dtype=np.uint8)
+            self._sprite_buf = buf
+            # frombuffer shares memory with buf, so later writes show up without a copy.
+            # BGRA matches the display's pixel layout, which keeps the alpha blit on SDL's fast path.
+            self._sprite_surface = pygame.image.frombuffer(buf, (cap_w, cap_h), "BGRA")
+        return buf, self._sprite_surface
 
     def on_jutsu_start(self, context: EffectContext):
         normalized = self._normalize_sign_name(context.jutsu_name)
@@ -134,57 +116,33 @@ class ShadowCloneEffect(BaseEffect):
     def update(self, context: EffectContext):
         self.prepared_clones = []
         self.current_dx_px = 0
+        self._clone_bgr = None
+        self._clone_alpha = None
         if not self.enabled or context.frame_bgr is None:
             return
 
+        # The mask only feeds the clone sprites, so skip segmentation until a burst starts.
+        if not self.animating and not self.clones_visible:
+            return
+
         frame = context.frame_bgr
         h, w = frame.shape[:2]
         self.frame_count += 1
 
-        run_seg = (self.frame_count % self.mask_every_n_frames == 0) or (self.last_alpha_full is None)
-        if run_seg:
-            if self.segment_width and 0 < self.segment_width < w:
-                scale = self.segment_width / float(w)
-                seg_w = self.segment_width
-                seg_h = max(1, int(h * scale))
-                small = cv2.resize(frame, (seg_w, seg_h), interpolation=cv2.INTER_LINEAR)
-                rgb_small = cv2.cvtColor(small, cv2.COLOR_BGR2RGB)
-                mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_small)
-                result = self.segmenter.segment(mp_image)
-                alpha_small = self._get_alpha_from_result(result)
-                alpha_full = cv2.resize(alpha_small, (w, h), interpolation=cv2.INTER_LINEAR).astype(np.float32)
-            else:
-                rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
-                result = self.segmenter.segment(mp_image)
-                alpha_full = self._get_alpha_from_result(result).astype(np.float32)
-
-            if self.edge_blur_sigma and self.edge_blur_sigma > 0:
-                alpha_full = cv2.GaussianBlur(alpha_full, (0, 0), self.edge_blur_sigma)
-                alpha_full = np.clip(alpha_full, 0.0, 1.0)
-            self.last_alpha_full = alpha_full
-        else:
-            alpha_full = self.last_alpha_full
-
-        if alpha_full is None:
+        if self.frame_count % max(1, self.segment_every_n_frames) == 0:
+            self.segmentation.submit(frame)
+        mask = self.segmentation.latest((w, h))
+        if mask is None:
             return
 
-        mask_u8 = (alpha_full >= self.alpha_thresh).astype(np.uint8) * 255
-        pts = cv2.findNonZero(mask_u8)
-        if pts is None:
+        crop = mask.person_crop(pad=12, feather_sigma=self.edge_blur_sigma)
+        if crop is None:
             self.clones_visible = False
             self.animating = False
             return
-
-        x, y, bw, bh = cv2.boundingRect(pts)
-        pad = 12
-        x1 = max(0, x - pad)
-        y1 = max(0, y - pad)
-        x2 = min(w, x + bw + pad)
-        y2 = min(h, y + bh + pad)
+        x1, y1, x2, y2, a_crop = crop
 
         fg_crop = frame[y1:y2, x1:x2]
-        a_crop = alpha_full[y1:y2, x1:x2]
         if fg_crop.size == 0:
             return
 
@@ -206,20 +164,35 @@ class ShadowCloneEffect(BaseEffect):
             return
         self.current_dx_px = int(max(0, dx))
 
-        left_surface = self._prepare_surface(fg_crop, a_crop, op)
-        right_surface = self._prepare_surface(fg_crop, a_crop, op)
-        self.prepared_clones = [
-            (left_surface, x1 - dx, y1),
-            (right_surface, x1 + dx, y1),
-        ]
+        # Both clones are the same sprite; it is scaled and converted once in render().
+        self._clone_bgr = fg_crop
+        self._clone_alpha = cv2.convertScaleAbs(a_crop, alpha=max(0.0, min(1.0, op)) * 255.0)
+        self._frame_size = (w, h)
+        self.prepared_clones = [(x1 - dx, y1), (x1 + dx, y1)]
 
     def render(self, screen, context: EffectContext):
-        if not self.prepared_clones:
+        if not self.prepared_clones or self._clone_bgr is None:
             return
-        for surface, fx, fy in self.prepared_clones:
-            dst_w = max(1, int(surface.get_width() * context.scale_x))
-            dst_h = max(1, int(surface.get_height() * context.scale_y))
-            scaled = pygame.transform.smoothscale(surface, (dst_w, dst_h))
+        crop_h, crop_w = self._clone_bgr.shape[:2]
+        dst_w = max(1, int(crop_w * context.scale_x))
+        dst_h = max(1, int(crop_h * context.scale_y))
+        frame_w, frame_h = self._frame_size
+        buf, surface = self._sprite_target(
+            max(dst_w, int(np.ceil(frame_w * context.scale_x))),
+            max(dst_h, int(np.ceil(frame_h * context.scale_y))),
+        )
+
+        interp = cv2.INTER_AREA if dst_w < crop_w else cv2.INTER_LINEAR
+        region = buf[:dst_h, :dst_w]
+        scaled_bgr = cv2.resize(self._clone_bgr, (dst_w, dst_h), interpolation=interp)
+        cv2.cvtColor(scaled_bgr, cv2.COLOR_BGR2BGRA, dst=region)
+        region[:, :, 3] = cv2.resize(self._clone_alpha, (dst_w, dst_h), interpolation=interp)
+
+        area = pygame.Rect(0, 0, dst_w, dst_h)
+        for fx, fy in self.prepared_clones:
             sx = context.cam_x + int(fx * context.scale_x)
             sy = context.cam_y + int(fy * context.scale_y)
-            screen.blit(scaled, (sx, sy))
+            if context.render_queue is not None:
+                context.render_queue.submit(surface, (sx, sy), 0, LAYER_BACKDROP, area=area)
+            else:
+                screen.blit(surface, (sx, sy), area)
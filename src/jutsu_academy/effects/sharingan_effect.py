@@ -3,14 +3,22 @@ import math
 import pygame
 import numpy as np
 from src.jutsu_academy.effects.base import BaseEffect, EffectContext
+from src.jutsu_academy.effects.render_queue import LAYER_OVERLAY
+from src.jutsu_academy.sprite_atlas import get_sprite_atlas
+
+SIZE_STEP = 4          # px; eye sizes jitter frame to frame, so sprites are cached per bucket
+ANGLE_STEP = 5         # degrees
+WARM_ANGLE_SPAN = 10   # degrees either side of the current eye angle warmed on jutsu start
+
 
 class SharinganEffect(BaseEffect):
     def __init__(self):
         super().__init__()
         self.image = None
-        self._sprite_cache = {}
-        self._feather_cache = {}
+        # Feather masks and finished eye sprites live in the shared, LRU-bounded sprite atlas.
+        self._atlas = get_sprite_atlas()
         self._base_alpha = 0.84
+        self._scale_hint = (1.0, 1.0)   # last frame-to-screen scale seen in render(), used for warm-up
         self._load_image()
 
     def _load_image(self):
@@ -27,63 +35,77 @@ class SharinganEffect(BaseEffect):
         except Exception as e:
             print(f"[!] Sharingan effect image failed to load: {e}")
             self.image = None
-            self._sprite_cache = {}
-            self._feather_cache = {}
 
-    def _get_feather_mask(self, width, height):
-        key = (int(width), int(height))
-        cached = self._feather_cache.get(key)
-        if cached is not None:
-            return cached
+    @staticmethod
+    def _bucket(value, minimum):
+        return max(minimum, int(round(float(value) / SIZE_STEP)) * SIZE_STEP)
 
+    def _get_feather_mask(self, width, height):
         w = max(1, int(width))
         h = max(1, int(height))
 
-        x = np.linspace(-1.0, 1.0, w, dtype=np.float32)[:, None]
-        y = np.linspace(-1.0, 1.0, h, dtype=np.float32)[None, :]
-        dist = np.sqrt(x * x + y * y)
+        def build():
+            x = np.linspace(-1.0, 1.0, w, dtype=np.float32)[:, None]
+            y = np.linspace(-1.0, 1.0, h, dtype=np.float32)[None, :]
+            dist = np.sqrt(x * x + y * y)
 
-        inner = 0.54
-        outer = 1.0
-        falloff = np.clip((outer - dist) / max(1e-6, outer - inner), 0.0, 1.0)
-        mask = np.where(dist <= inner, 1.0, falloff).astype(np.float32)
-        mask = np.power(mask, 1.7)
-        self._feather_cache[key] = mask
-        return mask
+            inner = 0.54
+            outer = 1.0
+            falloff = np.clip((outer - dist) / max(1e-6, outer - inner), 0.0, 1.0)
+            mask = np.where(dist <= inner, 1.0, falloff).astype(np.float32)
+            return np.power(mask, 1.7) * np.float32(self._base_alpha)
 
-    def _build_eye_sprite(self, width, height, angle_deg):
-        quantized_angle = int(round(float(angle_deg) / 5.0) * 5)
-        cache_key = (int(width), int(height), quantized_angle)
-        cached = self._sprite_cache.get(cache_key)
-        if cached is not None:
-            return cached
-
-        w = max(8, int(width))
-        h = max(8, int(height))
+        return self._atlas.get(("sharingan_feather", w, h), build)
 
-        try:
-            surf = pygame.transform.smoothscale(self.image, (w, h))
-        except Exception:
+    def _build_eye_sprite(self, width, height, angle_deg):
+        """Feathered, rotated eye sprite with premultiplied alpha, cached per size bucket and angle."""
+        if self.image is None:
             return None
-
-        try:
-            mask = self._get_feather_mask(w, h)
-            alpha = pygame.surfarray.pixels_alpha(surf)
-            blended = (alpha.astype(np.float32) * mask * float(self._base_alpha))
-            alpha[:] = np.clip(blended, 0.0, 255.0).astype(np.uint8)
-            del alpha
-        except Exception:
-            pass
-
-        if quantized_angle != 0:
-            surf = pygame.transform.rotozoom(surf, -quantized_angle, 1.0)
-
-        self._sprite_cache[cache_key] = surf
-        return surf
+        w = self._bucket(width, 8)
+        h = self._bucket(height, 8)
+        quantized_angle = int(round(float(angle_deg) / ANGLE_STEP) * ANGLE_STEP)
+
+        def build():
+            try:
+                surf = pygame.transform.smoothscale(self.image, (w, h))
+            except Exception:
+                return None
+            try:
+                alpha = pygame.surfarray.pixels_alpha(surf)
+                alpha[:] = np.clip(alpha * self._get_feather_mask(w, h), 0.0, 255.0).astype(np.uint8)
+                del alpha
+            except Exception:
+                pass
+            if quantized_angle != 0:
+                surf = pygame.transform.rotozoom(surf, -quantized_angle, 1.0)
+            if pygame.display.get_surface() is not None:
+                surf = surf.convert_alpha()
+            # Premultiplied so the per-frame composite is a single BLEND_PREMULTIPLIED blit.
+            return surf.premul_alpha()
+
+        return self._atlas.get(("sharingan", w, h, quantized_angle), build)
+
+    def on_jutsu_start(self, context: EffectContext):
+        """Build the sprites the first frames will ask for, around the current eye sizes and angles."""
+        if self.image is None:
+            return
+        scale_x, scale_y = self._scale_hint
+        for eye_size, eye_angle in (
+            (context.left_eye_size, context.left_eye_angle),
+            (context.right_eye_size, context.right_eye_angle),
+        ):
+            if not eye_size:
+                continue
+            target_w = max(14, int(float(eye_size[0]) * scale_x))
+            target_h = max(12, int(float(eye_size[1]) * scale_y))
+            base_angle = float(eye_angle or 0.0)
+            for offset in range(-WARM_ANGLE_SPAN, WARM_ANGLE_SPAN + 1, ANGLE_STEP):
+                self._build_eye_sprite(target_w, target_h, base_angle + offset)
 
     def render(self, screen, context: EffectContext):
         if not self.image:
             return
+        self._scale_hint = (context.scale_x, context.scale_y)
 
         eye_entries = [
             (context.left_eye_pos, context.left_eye_size, context.left_eye_angle),
@@ -116,4 +138,7 @@ class SharinganEffect(BaseEffect):
             if sprite is None:
                 continue
             rect = sprite.get_rect(center=(screen_x, screen_y))
-            screen.blit(sprite, rect)
+            if context.render_queue is not None:
+                context.render_queue.submit(sprite, rect, pygame.BLEND_PREMULTIPLIED, LAYER_OVERLAY)
+            else:
+                screen.blit(sprite, rect, special_flags=pygame.BLEND_PREMULTIPLIED)
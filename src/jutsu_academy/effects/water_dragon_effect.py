@@ -14,11 +14,14 @@ Integrates with the existing BaseEffect / EffectOrchestrator system.
 
 import math
 import time
-import random
 
+import numpy as np
 import pygame
 
 from src.jutsu_academy.effects.base import BaseEffect, EffectContext
+from src.jutsu_academy.effects.render_queue import LAYER_BACKDROP, LAYER_OVERLAY, LAYER_PARTICLES, RenderQueue
+from src.jutsu_academy.particle_engine import ParticleBuffer
+from src.jutsu_academy.sprite_atlas import get_sprite_atlas
 
 
 # ─── Color palette ───────────────────────────────────────────────────────────
@@ -33,45 +36,13 @@ WATER_COLORS = {
 }
 
 
-# ─── Tiny particle helper (reusable across phases) ──────────────────────────
-class _WaterParticle:
-    __slots__ = ("x", "y", "vx", "vy", "lifetime", "max_lifetime",
-                 "size", "color", "gravity", "drag")
-
-    def __init__(self, x, y, vx, vy, lifetime, size, color,
-                 gravity=0.0, drag=0.98):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.size = size
-        self.color = color
-        self.gravity = gravity
-        self.drag = drag
-
-    def update(self, dt):
-        self.vx *= self.drag
-        self.vy *= self.drag
-        self.vy += self.gravity * dt
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.lifetime -= dt
-
-    @property
-    def alive(self):
-        return self.lifetime > 0
-
-    @property
-    def alpha(self):
-        ratio = max(0.0, min(1.0, self.lifetime / self.max_lifetime))
-        return int(255 * ratio)
-
-    @property
-    def current_size(self):
-        ratio = max(0.0, min(1.0, self.lifetime / self.max_lifetime))
-        return max(1, int(self.size * ratio))
+# Weighted palette for random water particles: (cumulative threshold, color).
+# Matches the old per-particle pick: >0.80 core, >0.55 bright, >0.30 mid, >0.10 deep, else dark.
+_PICK_THRESHOLDS = np.array([0.10, 0.30, 0.55, 0.80], dtype=np.float32)
+_PICK_COLORS = np.array(
+    [WATER_COLORS["dark"], WATER_COLORS["deep"], WATER_COLORS["mid"], WATER_COLORS["bright"], WATER_COLORS["core"]],
+    dtype=np.uint8,
+)
 
 
 # ─── Main effect class ──────────────────────────────────────────────────────
@@ -116,6 +87,14 @@ class WaterDragonEffect(BaseEffect):
     SPLASH_EMIT_RATE      = 3       # per frame
     DROPLET_EMIT_RATE     = 4       # per frame
 
+    # LOD presets stepped through by the orchestrator's frame-budget governor.
+    quality_levels = (
+        {"max_particles": 350, "emit_scale": 1.0, "glow_layers": 2},
+        {"max_particles": 240, "emit_scale": 0.7, "glow_layers": 2},
+        {"max_particles": 160, "emit_scale": 0.5, "glow_layers": 1},
+        {"max_particles": 90, "emit_scale": 0.35, "glow_layers": 1},
+    )
+
     def __init__(self):
         self.active = False
         self.effect_started_at = 0.0
@@ -126,11 +105,41 @@ class WaterDragonEffect(BaseEffect):
         self.origin_y = 0
         self.wind_x = 0.0    # head yaw mapped to horizontal bias
 
-        self.particles: list[_WaterParticle] = []
+        self.max_particles = self.MAX_PARTICLES
+        self.emit_scale = 1.0
+        self.glow_layers = 2     # 2 = soft outer halo + core, 1 = core only
+        self.particles = ParticleBuffer(self.max_particles)
         self._phase_time = 0.0       # elapsed since start
 
-        # Pre-allocate a small surface for glow circles (avoids per-frame alloc).
-        self._glow_surf_cache: dict[int, pygame.Surface] = {}
+        # Glow discs come from the shared sprite atlas (rendered once, LRU-bounded).
+        self._atlas = get_sprite_atlas()
+        self._glow_lookup = {}   # (radius, color) -> atlas surface, skips the LRU bookkeeping per sprite
+        self._blit_batch = []
+        self._render_queue = RenderQueue()
+        self._tint_surf = None
+        self._tint_alpha = -1
+        self._build_segment_tables()
+
+    def _build_segment_tables(self):
+        """Per-segment ratio, radius, color and alpha factor; constant for the effect's lifetime."""
+        segments = self.DRAGON_SEGMENTS
+        ratio = np.arange(segments + 1, dtype=np.float64) / segments  # 0 = tail, 1 = head
+        self._seg_ratio = ratio
+        radius = self.DRAGON_BODY_TIP_SIZE + (self.DRAGON_BODY_BASE_SIZE - self.DRAGON_BODY_TIP_SIZE) * ratio
+        self._seg_radius = np.maximum(1, radius.astype(np.int32))
+        self._seg_alpha_factor = np.maximum(0.3, ratio)
+        # Color shifts from deep at tail to bright at head.
+        self._seg_colors = [
+            WATER_COLORS["core"] if r > 0.85
+            else WATER_COLORS["bright"] if r > 0.6
+            else WATER_COLORS["mid"] if r > 0.3
+            else WATER_COLORS["deep"]
+            for r in ratio.tolist()
+        ]
+
+    def apply_quality(self, settings):
+        super().apply_quality(settings)
+        self.particles.resize(self.max_particles)
 
     # ── helpers ──────────────────────────────────────────────────────────
     @staticmethod
@@ -145,32 +154,21 @@ class WaterDragonEffect(BaseEffect):
         s = str(name).strip().lower().replace("-", " ").replace("_", " ")
         return " ".join(s.split())
 
-    def _pick_water_color(self) -> tuple:
-        r = random.random()
-        if r > 0.80:
-            return WATER_COLORS["core"]
-        elif r > 0.55:
-            return WATER_COLORS["bright"]
-        elif r > 0.30:
-            return WATER_COLORS["mid"]
-        elif r > 0.10:
-            return WATER_COLORS["deep"]
-        else:
-            return WATER_COLORS["dark"]
+    @staticmethod
+    def _pick_water_colors(n: int) -> np.ndarray:
+        return _PICK_COLORS[np.searchsorted(_PICK_THRESHOLDS, np.random.random(n), side="left")]
 
     def _glow_surface(self, radius: int, color: tuple, alpha: int) -> pygame.Surface:
-        """Return a cached SRCALPHA surface with a soft glow circle."""
-        key = (radius, color, alpha)
-        cached = self._glow_surf_cache.get(key)
-        if cached is not None:
-            return cached
-        # Limit cache size
-        if len(self._glow_surf_cache) > 512:
-            self._glow_surf_cache.clear()
-        size = radius * 2
-        surf = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(surf, (*color, alpha), (radius, radius), radius)
-        self._glow_surf_cache[key] = surf
+        """Return a shared SRCALPHA glow disc.
+
+        Every glow here is blitted with BLEND_RGB_ADD, which ignores source
+        alpha, so the atlas entry is shared across alpha values.
+        """
+        key = (radius, color)
+        surf = self._glow_lookup.get(key)
+        if surf is None:
+            surf = self._atlas.additive_disc(radius, color)
+            self._glow_lookup[key] = surf
         return surf
 
     # ── BaseEffect interface ─────────────────────────────────────────────
@@ -180,7 +178,6 @@ class WaterDragonEffect(BaseEffect):
             self.active = True
             self.effect_started_at = time.perf_counter()
             self.particles.clear()
-            self._glow_surf_cache.clear()
             # Use provided duration or default.
             dur = getattr(context, "effect_duration", 0.0)
             self.total_duration = max(2.0, float(dur)) if dur else self.TOTAL_DURATION_DEFAULT
@@ -188,7 +185,6 @@ class WaterDragonEffect(BaseEffect):
     def on_jutsu_end(self, context: EffectContext):
         self.active = False
         self.particles.clear()
-        self._glow_surf_cache.clear()
 
     # ── update (called every frame from orchestrator) ────────────────────
     def update(self, context: EffectContext):
@@ -220,148 +216,153 @@ class WaterDragonEffect(BaseEffect):
             self._emit_droplets(dt)
             self._emit_splash(dt)
 
-        # ── Update all living particles ──────────────────────────────────
-        for p in self.particles:
-            p.update(dt)
-        self.particles = [p for p in self.particles if p.alive]
-
-        # Hard cap
-        if len(self.particles) > self.MAX_PARTICLES:
-            self.particles = self.particles[-self.MAX_PARTICLES:]
+        # ── Update all living particles (capacity caps at max_particles) ─
+        self.particles.update_damped(dt)
 
     # ── Particle emitters ────────────────────────────────────────────────
+    def _emit_count(self, rate):
+        return max(1, int(round(rate * self.emit_scale)))
+
     def _emit_gather_vortex(self, dt):
         """Phase 1: swirling water particles converge on origin."""
-        count = 12
-        for _ in range(count):
-            if len(self.particles) >= self.MAX_PARTICLES:
-                break
-            angle = random.uniform(0, math.tau)
-            dist = random.uniform(80, 180)
-            sx = self.origin_x + math.cos(angle) * dist
-            sy = self.origin_y + math.sin(angle) * dist
-            # Velocity points inward toward origin
-            speed = random.uniform(200, 400)
-            vx = (self.origin_x - sx) / max(1, dist) * speed
-            vy = (self.origin_y - sy) / max(1, dist) * speed
-            lt = random.uniform(0.3, 0.6)
-            size = random.uniform(3, 8)
-            self.particles.append(
-                _WaterParticle(sx, sy, vx, vy, lt, size,
-                               self._pick_water_color(), gravity=0, drag=0.95)
-            )
+        n = min(self._emit_count(12), self.particles.free_slots())
+        if n <= 0:
+            return
+        angle = np.random.uniform(0, math.tau, n)
+        dist = np.random.uniform(80, 180, n)
+        sx = self.origin_x + np.cos(angle) * dist
+        sy = self.origin_y + np.sin(angle) * dist
+        # Velocity points inward toward origin
+        speed = np.random.uniform(200, 400, n)
+        inv = speed / np.maximum(1.0, dist)
+        self.particles.spawn(
+            x=sx, y=sy,
+            vx=(self.origin_x - sx) * inv,
+            vy=(self.origin_y - sy) * inv,
+            life=np.random.uniform(0.3, 0.6, n),
+            size=np.random.uniform(3, 8, n),
+            color=self._pick_water_colors(n),
+            gravity=0.0, drag=0.95,
+        )
 
     def _emit_mist(self, dt):
         """Subtle mist cloud trailing behind the dragon head."""
-        for _ in range(self.MIST_EMIT_RATE):
-            if len(self.particles) >= self.MAX_PARTICLES:
-                break
-            offset_x = random.gauss(0, 40)
-            offset_y = random.gauss(0, 40)
-            vx = random.gauss(0, 30)
-            vy = random.gauss(-20, 30)
-            lt = random.uniform(0.6, 1.2)
-            size = random.uniform(10, 22)
-            self.particles.append(
-                _WaterParticle(self.origin_x + offset_x,
-                               self.origin_y + offset_y,
-                               vx, vy, lt, size,
-                               WATER_COLORS["mist"], gravity=15, drag=0.97)
-            )
+        n = min(self._emit_count(self.MIST_EMIT_RATE), self.particles.free_slots())
+        if n <= 0:
+            return
+        self.particles.spawn(
+            x=self.origin_x + np.random.normal(0, 40, n),
+            y=self.origin_y + np.random.normal(0, 40, n),
+            vx=np.random.normal(0, 30, n),
+            vy=np.random.normal(-20, 30, n),
+            life=np.random.uniform(0.6, 1.2, n),
+            size=np.random.uniform(10, 22, n),
+            color=WATER_COLORS["mist"],
+            gravity=15.0, drag=0.97,
+        )
 
-    def _emit_droplets(self, dt):
-        """Small fast droplets spraying outward from body."""
-        dragon_progress = self._smoothstep(
+    def _dragon_progress(self) -> float:
+        return self._smoothstep(
             (self._phase_time - self.GATHER_PHASE_DURATION) / self.DRAGON_RAMP_DURATION
         )
+
+    def _emit_droplets(self, dt):
+        """Small fast droplets spraying outward from body."""
+        dragon_progress = self._dragon_progress()
         if dragon_progress < 0.1:
             return
-        for _ in range(self.DROPLET_EMIT_RATE):
-            if len(self.particles) >= self.MAX_PARTICLES:
-                break
-            # Spawn along the dragon body
-            t_body = random.uniform(0.0, dragon_progress)
-            bx, by = self._dragon_body_pos(t_body)
-            speed = random.uniform(60, 160)
-            angle = random.uniform(0, math.tau)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            lt = random.uniform(0.2, 0.5)
-            size = random.uniform(2, 5)
-            self.particles.append(
-                _WaterParticle(bx, by, vx, vy, lt, size,
-                               self._pick_water_color(), gravity=200, drag=0.96)
-            )
+        n = min(self._emit_count(self.DROPLET_EMIT_RATE), self.particles.free_slots())
+        if n <= 0:
+            return
+        # Spawn along the dragon body
+        bx, by = self._dragon_body_positions(np.random.uniform(0.0, dragon_progress, n))
+        speed = np.random.uniform(60, 160, n)
+        angle = np.random.uniform(0, math.tau, n)
+        self.particles.spawn(
+            x=bx, y=by,
+            vx=np.cos(angle) * speed,
+            vy=np.sin(angle) * speed,
+            life=np.random.uniform(0.2, 0.5, n),
+            size=np.random.uniform(2, 5, n),
+            color=self._pick_water_colors(n),
+            gravity=200.0, drag=0.96,
+        )
 
     def _emit_splash(self, dt):
         """Bigger splash bursts around the dragon head."""
-        dragon_progress = self._smoothstep(
-            (self._phase_time - self.GATHER_PHASE_DURATION) / self.DRAGON_RAMP_DURATION
-        )
+        dragon_progress = self._dragon_progress()
         if dragon_progress < 0.15:
             return
+        n = min(self._emit_count(self.SPLASH_EMIT_RATE), self.particles.free_slots())
+        if n <= 0:
+            return
         head_x, head_y = self._dragon_body_pos(dragon_progress)
-        for _ in range(self.SPLASH_EMIT_RATE):
-            if len(self.particles) >= self.MAX_PARTICLES:
-                break
-            angle = random.uniform(0, math.tau)
-            speed = random.uniform(30, 100)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            lt = random.uniform(0.4, 0.8)
-            size = random.uniform(5, 12)
-            self.particles.append(
-                _WaterParticle(head_x + random.gauss(0, 8),
-                               head_y + random.gauss(0, 8),
-                               vx, vy, lt, size,
-                               WATER_COLORS["bright"], gravity=60, drag=0.97)
-            )
+        angle = np.random.uniform(0, math.tau, n)
+        speed = np.random.uniform(30, 100, n)
+        self.particles.spawn(
+            x=head_x + np.random.normal(0, 8, n),
+            y=head_y + np.random.normal(0, 8, n),
+            vx=np.cos(angle) * speed,
+            vy=np.sin(angle) * speed,
+            life=np.random.uniform(0.4, 0.8, n),
+            size=np.random.uniform(5, 12, n),
+            color=WATER_COLORS["bright"],
+            gravity=60.0, drag=0.97,
+        )
 
     # ── Dragon body geometry ─────────────────────────────────────────────
-    def _dragon_body_pos(self, t: float) -> tuple[float, float]:
+    def _dragon_body_positions(self, t):
         """
-        Return (x, y) screen position for a point at normalized distance *t*
-        (0 = origin/tail, 1 = head) along the dragon body.
+        Return (xs, ys) screen positions for points at normalized distances *t*
+        (array; 0 = origin/tail, 1 = head) along the dragon body.
 
         The head follows a smooth wandering orbit around the origin so the
         dragon swims/loops within the camera area without flying off the top.
         Each body segment trails behind using a time-delayed version of the
         same orbit path, producing a natural serpentine look.
         """
-        t = max(0.0, min(1.0, t))
+        t = np.clip(np.asarray(t, dtype=np.float64), 0.0, 1.0)
 
         # Each body segment uses a time-delayed angle so segments trail
         # behind the head, creating the serpentine body shape.
         trail_delay = (1.0 - t) * 1.8  # seconds of delay for tail end
-        effective_time = max(0.0, self._phase_time - trail_delay)
+        effective_time = np.maximum(0.0, self._phase_time - trail_delay)
 
         # Orbit angle — figure-eight-ish (Lissajous) path
-        theta = effective_time * self.ORBIT_SPEED * math.tau
-        orbit_x = math.sin(theta) * self.ORBIT_RADIUS_X
-        orbit_y = math.sin(theta * 2.0) * self.ORBIT_RADIUS_Y  # double freq → figure-8
+        theta = effective_time * (self.ORBIT_SPEED * math.tau)
+        orbit_x = np.sin(theta) * self.ORBIT_RADIUS_X
+        orbit_y = np.sin(theta * 2.0) * self.ORBIT_RADIUS_Y  # double freq → figure-8
 
         # Add higher-frequency sine wiggle along the body for liveliness
         phase_shift = self._phase_time * 4.0
-        wiggle = math.sin(t * self.DRAGON_FREQUENCY * math.tau + phase_shift) * self.DRAGON_AMPLITUDE * t
+        wiggle = np.sin(t * (self.DRAGON_FREQUENCY * math.tau) + phase_shift) * (self.DRAGON_AMPLITUDE * t)
 
         # Orbit center is above origin so dragon swims in the camera area
         center_x = self.origin_x
         center_y = self.origin_y + self.ORBIT_CENTER_Y_OFFSET
 
         # Lerp tail toward origin so it connects to the "eruption" point
-        anchor_blend = self._smoothstep(t)  # 0→at origin, 1→on orbit
+        anchor_blend = t * t * (3.0 - 2.0 * t)  # 0→at origin, 1→on orbit
         base_x = self.origin_x * (1.0 - anchor_blend) + (center_x + orbit_x) * anchor_blend
         base_y = self.origin_y * (1.0 - anchor_blend) + (center_y + orbit_y) * anchor_blend
 
-        x = base_x + wiggle
-        y = base_y
-        return x, y
+        return base_x + wiggle, base_y
+
+    def _dragon_body_pos(self, t: float) -> tuple[float, float]:
+        xs, ys = self._dragon_body_positions(np.array([t]))
+        return float(xs[0]), float(ys[0])
 
     # ── render (called every frame from orchestrator) ────────────────────
     def render(self, screen: pygame.Surface, context: EffectContext):
         if not self.active:
             return
 
+        # Submit to the orchestrator's frame queue; flush our own when rendered standalone.
+        queue = context.render_queue
+        owns_queue = queue is None
+        if owns_queue:
+            queue = self._render_queue
+
         # Compute dragon extend progress
         after_gather = self._phase_time - self.GATHER_PHASE_DURATION
         dragon_progress = self._smoothstep(after_gather / self.DRAGON_RAMP_DURATION) if after_gather > 0 else 0.0
@@ -383,79 +384,76 @@ class WaterDragonEffect(BaseEffect):
             cam_h = int(context.frame_shape[0] * context.scale_y)
             tint_alpha = int(35 * global_alpha * min(1.0, dragon_progress * 2))
             if tint_alpha > 2:
-                tint = pygame.Surface((cam_w, cam_h), pygame.SRCALPHA)
-                tint.fill((20, 60, 140, tint_alpha))
-                screen.blit(tint, (context.cam_x, context.cam_y))
+                tint = self._tint_surf
+                if tint is None or tint.get_size() != (cam_w, cam_h):
+                    tint = pygame.Surface((cam_w, cam_h), pygame.SRCALPHA)
+                    self._tint_surf = tint
+                    self._tint_alpha = -1
+                if tint_alpha != self._tint_alpha:
+                    tint.fill((20, 60, 140, tint_alpha))
+                    self._tint_alpha = tint_alpha
+                queue.submit(tint, (context.cam_x, context.cam_y), 0, LAYER_BACKDROP)
 
         # 2. Render loose particles (mist, droplets, splash) ──────────────
-        for p in self.particles:
-            sz = p.current_size
-            if sz < 1:
-                continue
-            a = int(p.alpha * global_alpha)
-            if a < 4:
-                continue
-            # Two-layer glow: outer soft + inner bright
-            for layer, (extra, a_factor) in enumerate([(4, 0.4), (0, 1.0)]):
-                r = sz + extra
-                la = max(0, min(255, int(a * a_factor)))
-                if la < 2 or r < 1:
-                    continue
-                glow = self._glow_surface(r, p.color, la)
-                screen.blit(glow, (int(p.x - r), int(p.y - r)),
-                            special_flags=pygame.BLEND_RGB_ADD)
+        batch = self._blit_batch
+        add = pygame.BLEND_RGB_ADD
+        buf = self.particles
+        n = buf.count
+        if n > 0:
+            life_ratio = buf.life_ratio()
+            sizes = np.maximum(1, (buf.size[:n] * life_ratio).astype(np.int32))
+            alphas = ((255.0 * life_ratio).astype(np.int32) * global_alpha).astype(np.int32)
+            visible = np.flatnonzero(alphas >= 4)
+            # Two-layer glow: outer soft (+4 px, 40% alpha) + inner bright.
+            outer = ((alphas[visible] * 0.4).astype(np.int32) >= 2) & (self.glow_layers > 1)
+            glow = self._glow_surface
+            for px, py, sz, has_outer, color in zip(
+                buf.x[:n][visible].tolist(),
+                buf.y[:n][visible].tolist(),
+                sizes[visible].tolist(),
+                outer.tolist(),
+                map(tuple, buf.color[:n][visible].tolist()),
+            ):
+                if has_outer:
+                    r = sz + 4
+                    batch.append((glow(r, color, 255), (int(px - r), int(py - r)), None, add))
+                batch.append((glow(sz, color, 255), (int(px - sz), int(py - sz)), None, add))
 
         # 3. Dragon body ──────────────────────────────────────────────────
         if dragon_progress > 0.01:
-            self._render_dragon_body(screen, dragon_progress, global_alpha)
+            self._render_dragon_body(queue, dragon_progress, global_alpha)
+        queue.extend(batch, LAYER_PARTICLES, special_flags=pygame.BLEND_RGB_ADD)
+        batch.clear()
+        if owns_queue:
+            queue.flush(screen)
 
-    def _render_dragon_body(self, screen: pygame.Surface,
+    def _render_dragon_body(self, queue: RenderQueue,
                             progress: float, global_alpha: float):
         """Draw the serpentine dragon body as a chain of glowing circles."""
-        segments = self.DRAGON_SEGMENTS
-        points: list[tuple[float, float, float]] = []  # (x, y, radius)
-
-        for i in range(segments + 1):
-            t = (i / segments) * progress
-            x, y = self._dragon_body_pos(t)
-            # Radius tapers: thick at head, thin at tail
-            ratio = i / segments  # 0 = tail, 1 = head
-            radius = self.DRAGON_BODY_TIP_SIZE + (self.DRAGON_BODY_BASE_SIZE - self.DRAGON_BODY_TIP_SIZE) * ratio
-            points.append((x, y, radius))
+        batch = self._blit_batch
+        add = pygame.BLEND_RGB_ADD
+        xs, ys = self._dragon_body_positions(self._seg_ratio * progress)
+        seg_alpha = (220.0 * global_alpha * self._seg_alpha_factor).astype(np.int32)
+        outer_alpha = np.minimum(255, (seg_alpha * 0.3).astype(np.int32))
+        glow = self._glow_surface
 
         # Draw from tail to head so head is on top
-        for i, (x, y, radius) in enumerate(points):
-            ratio = i / max(1, len(points) - 1)
-            # Color shifts from deep at tail to bright at head
-            if ratio > 0.85:
-                color = WATER_COLORS["core"]
-            elif ratio > 0.6:
-                color = WATER_COLORS["bright"]
-            elif ratio > 0.3:
-                color = WATER_COLORS["mid"]
-            else:
-                color = WATER_COLORS["deep"]
-
-            a = int(220 * global_alpha * max(0.3, ratio))
-            r = max(1, int(radius))
-
+        for x, y, r, a, outer_a, color in zip(
+            xs.tolist(), ys.tolist(), self._seg_radius.tolist(),
+            seg_alpha.tolist(), outer_alpha.tolist(), self._seg_colors,
+        ):
             # Outer glow layer
-            outer_r = r + 6
-            outer_a = max(0, min(255, int(a * 0.3)))
-            if outer_a > 2:
-                glow = self._glow_surface(outer_r, color, outer_a)
-                screen.blit(glow, (int(x - outer_r), int(y - outer_r)),
-                            special_flags=pygame.BLEND_RGB_ADD)
-
+            if outer_a > 2 and self.glow_layers > 1:
+                outer_r = r + 6
+                batch.append((glow(outer_r, color, outer_a), (int(x - outer_r), int(y - outer_r)), None, add))
             # Core body
             if a > 2:
-                core = self._glow_surface(r, color, min(255, a))
-                screen.blit(core, (int(x - r), int(y - r)),
-                            special_flags=pygame.BLEND_RGB_ADD)
+                batch.append((glow(r, color, min(255, a)), (int(x - r), int(y - r)), None, add))
 
+        points = list(zip(xs.tolist()[-2:], ys.tolist()[-2:]))
         # Dragon head highlight (last point = head)
         if points:
-            hx, hy, _ = points[-1]
+            hx, hy = points[-1]
             head_r = self.DRAGON_HEAD_SIZE
             # Pulsating glow
             pulse = 0.8 + 0.2 * math.sin(self._phase_time * 8.0)
@@ -466,17 +464,16 @@ class WaterDragonEffect(BaseEffect):
             aura_a = max(0, min(255, int(head_a * 0.25)))
             if aura_r > 0 and aura_a > 2:
                 aura = self._glow_surface(aura_r, WATER_COLORS["bright"], aura_a)
-                screen.blit(aura, (int(hx - aura_r), int(hy - aura_r)),
-                            special_flags=pygame.BLEND_RGB_ADD)
+                batch.append((aura, (int(hx - aura_r), int(hy - aura_r)), None, add))
 
             # Draw a fully procedural dragon head that faces movement direction.
             if len(points) >= 2:
-                px, py, _ = points[-2]
+                px, py = points[-2]
                 heading = math.atan2(hy - py, hx - px)
             else:
                 heading = -math.pi / 2
             self._render_head_shape(
-                screen=screen,
+                queue=queue,
                 head_x=hx,
                 head_y=hy,
                 heading_rad=heading,
@@ -486,7 +483,7 @@ class WaterDragonEffect(BaseEffect):
 
     def _render_head_shape(
         self,
-        screen: pygame.Surface,
+        queue: RenderQueue,
         head_x: float,
         head_y: float,
         heading_rad: float,
@@ -589,4 +586,4 @@ class WaterDragonEffect(BaseEffect):
         rotated = pygame.transform.rotozoom(canvas, rot_deg, 1.0)
         rotated.set_alpha(min(255, int(alpha * 0.96)))
         rect = rotated.get_rect(center=(int(head_x), int(head_y)))
-        screen.blit(rotated, rect)
+        queue.submit(rotated, rect, 0, LAYER_OVERLAY)
@@ -0,0 +1,195 @@
+"""
+Independent target rates for UI rendering, camera presentation and detection.
+
+run() used a single clock.tick(FPS) for everything and render_playing() did
+all of it every frame: a blocking cap.read(), the BGR -> Surface conversion
+and rescale, hand detection, and face detection while an effect runs. The UI
+could never be smoother than the camera, and a slow detector stalled both.
+
+FramePacer keeps one target rate per lane:
+
+- "ui": main loop tick rate (all screens),
+- "camera": how often a new camera frame is read and re-presented; frames in
+  between re-blit the last converted surface,
+- "hands" / "face": detector rates; a detector only ever runs on a camera
+  frame it has not seen yet,
+- "segmentation": frames handed to the shared segmentation service.
+
+Priorities follow the gameplay phase (set_phase()):
+
+- sequence (signs being entered): hand detection runs on every fresh camera
+  frame regardless of its own rate, so a sign lands as early as possible;
+- effect (a jutsu is playing): the UI comes first. At most one detector runs
+  per UI frame, and after a frame that overran the UI budget detectors wait
+  up to one extra interval before running again.
+
+Rates come from a preset (PRESETS, picked in Settings) and can be overridden
+per lane with JUTSU_UI_FPS, JUTSU_CAMERA_FPS, JUTSU_HANDS_FPS, JUTSU_FACE_FPS
+and JUTSU_SEGMENTATION_FPS.
+"""
+
+import os
+import time
+
+LANE_UI = "ui"
+LANE_CAMERA = "camera"
+LANE_HANDS = "hands"
+LANE_FACE = "face"
+LANE_SEGMENTATION = "segmentation"
+LANES = (LANE_UI, LANE_CAMERA, LANE_HANDS, LANE_FACE, LANE_SEGMENTATION)
+_DETECTOR_LANES = (LANE_HANDS, LANE_FACE)
+
+PHASE_IDLE = "idle"
+PHASE_SEQUENCE = "sequence"
+PHASE_EFFECT = "effect"
+
+DEFAULT_PRESET = "balanced"
+PRESETS = {
+    "balanced": {"label": "Balanced", LANE_UI: 60, LANE_CAMERA: 30, LANE_HANDS: 30, LANE_FACE: 15, LANE_SEGMENTATION: 15},
+    "smooth_ui": {"label": "Smooth UI", LANE_UI: 60, LANE_CAMERA: 30, LANE_HANDS: 20, LANE_FACE: 10, LANE_SEGMENTATION: 10},
+    "low_latency": {"label": "Low Latency", LANE_UI: 60, LANE_CAMERA: 60, LANE_HANDS: 60, LANE_FACE: 30, LANE_SEGMENTATION: 30},
+    "power_saver": {"label": "Power Saver", LANE_UI: 30, LANE_CAMERA: 24, LANE_HANDS: 15, LANE_FACE: 10, LANE_SEGMENTATION: 8},
+}
+PRESET_NAMES = list(PRESETS.keys())
+
+_ENV_OVERRIDES = {
+    LANE_UI: "JUTSU_UI_FPS",
+    LANE_CAMERA: "JUTSU_CAMERA_FPS",
+    LANE_HANDS: "JUTSU_HANDS_FPS",
+    LANE_FACE: "JUTSU_FACE_FPS",
+    LANE_SEGMENTATION: "JUTSU_SEGMENTATION_FPS",
+}
+_MIN_RATE = 1
+_MAX_RATE = 240
+
+
+def preset_rates(name):
+    """Lane -> rate for preset name (unknown names fall back to the default preset), with env overrides."""
+    preset = PRESETS.get(name) or PRESETS[DEFAULT_PRESET]
+    rates = {lane: int(preset[lane]) for lane in LANES}
+    for lane, env_name in _ENV_OVERRIDES.items():
+        raw = str(os.getenv(env_name, "")).strip()
+        if not raw:
+            continue
+        try:
+            rates[lane] = int(float(raw))
+        except ValueError:
+            print(f"[!] Ignoring {env_name}={raw!r}: not a number")
+    return rates
+
+
+class _Lane:
+    __slots__ = ("rate", "last_run", "last_seq", "runs", "measured_hz")
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.last_run = 0.0
+        self.last_seq = -1
+        self.runs = 0
+        self.measured_hz = 0.0
+
+    def ran(self, now):
+        if self.last_run > 0.0:
+            gap = now - self.last_run
+            if gap > 0.0:
+                hz = 1.0 / gap
+                self.measured_hz = hz if self.measured_hz <= 0.0 else self.measured_hz * 0.9 + hz * 0.1
+        self.last_run = now
+        self.runs += 1
+
+
+class FramePacer:
+    def __init__(self, rates=None, preset=DEFAULT_PRESET):
+        self.preset = preset
+        self.phase = PHASE_IDLE
+        self._lanes = {lane: _Lane(0) for lane in LANES}
+        self._frame_start = 0.0
+        self._last_frame_sec = 0.0
+        self._detector_ran = False
+        self.deferred = 0
+        self.set_rates(rates if rates is not None else preset_rates(preset))
+
+    def set_preset(self, name):
+        self.preset = name if name in PRESETS else DEFAULT_PRESET
+        self.set_rates(preset_rates(self.preset))
+
+    def set_rates(self, rates):
+        for lane, rate in rates.items():
+            if lane in self._lanes:
+                self._lanes[lane].rate = max(_MIN_RATE, min(_MAX_RATE, int(rate)))
+
+    def rate(self, lane):
+        return self._lanes[lane].rate
+
+    def runs(self, lane):
+        return self._lanes[lane].runs
+
+    def ui_fps(self):
+        return self._lanes[LANE_UI].rate
+
+    def set_phase(self, phase):
+        self.phase = phase
+
+    def begin_frame(self, now=None):
+        """Call once per UI frame before asking due()."""
+        now = time.perf_counter() if now is None else now
+        if self._frame_start > 0.0:
+            self._last_frame_sec = now - self._frame_start
+        self._frame_start = now
+        self._detector_ran = False
+        self._lanes[LANE_UI].ran(now)
+
+    def _interval(self, lane):
+        return 1.0 / self._lanes[lane].rate
+
+    def due(self, lane, frame_seq=None, now=None):
+        """True if lane should run this frame; a True answer counts as a run."""
+        now = time.perf_counter() if now is None else now
+        state = self._lanes[lane]
+        if frame_seq is not None and frame_seq == state.last_seq:
+            return False
+
+        interval = self._interval(lane)
+        # A quarter UI frame of slack keeps e.g. 30 Hz on every other 60 Hz frame instead of drifting.
+        slack = 0.25 * self._interval(LANE_UI)
+        elapsed = now - state.last_run
+
+        if lane in _DETECTOR_LANES:
+            if self.phase == PHASE_SEQUENCE and lane == LANE_HANDS:
+                interval = 0.0
+            elif self.phase == PHASE_EFFECT:
+                if self._detector_ran:
+                    return False
+                overran = self._last_frame_sec > 1.5 * self._interval(LANE_UI)
+                if overran and elapsed < 2.0 * interval:
+                    self.deferred += 1
+                    return False
+
+        if elapsed < interval - slack:
+            return False
+        state.ran(now)
+        if frame_seq is not None:
+            state.last_seq = frame_seq
+        if lane in _DETECTOR_LANES:
+            self._detector_ran = True
+        return True
+
+    def reset(self):
+        for state in self._lanes.values():
+            state.last_run = 0.0
+            state.last_seq = -1
+            state.measured_hz = 0.0
+        self._frame_start = 0.0
+        self._last_frame_sec = 0.0
+        self.phase = PHASE_IDLE
+
+    def stats(self):
+        return {
+            "preset": self.preset,
+            "phase": self.phase,
+            "deferred": self.deferred,
+            "lanes": {
+                lane: {"target": state.rate, "measured": round(state.measured_hz, 1), "runs": state.runs}
+                for lane, state in self._lanes.items()
+            },
+        }
@@ -0,0 +1,179 @@
+"""
+Per-stage frame profiler for the pygame hot path.
+
+Usage:
+    with self.profiler.stage("hands"):
+        self.detect_hands(frame)
+
+When disabled, stage() hands back a shared no-op context manager, so an
+instrumented call costs one method call and an attribute check.
+"""
+
+import csv
+import json
+import time
+from pathlib import Path
+
+DEFAULT_CAPACITY = 240
+
+# Display order for the overlay; unknown stages are appended after these.
+STAGE_ORDER = [
+    "capture",
+    "convert",
+    "hands",
+    "face",
+    "features",
+    "knn",
+    "vote",
+    "effects_update",
+    "effects_render",
+    "camera_blit",
+    "flip",
+    "frame",
+]
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _StageTimer:
+    """Fixed-size ring buffer of durations (seconds) that doubles as its own context manager."""
+
+    __slots__ = ("name", "samples", "index", "count", "total", "_started")
+
+    def __init__(self, name, capacity):
+        self.name = name
+        self.samples = [0.0] * capacity
+        self.index = 0
+        self.count = 0
+        self.total = 0
+        self._started = 0.0
+
+    def add(self, seconds):
+        self.samples[self.index] = seconds
+        self.index = (self.index + 1) % len(self.samples)
+        if self.count < len(self.samples):
+            self.count += 1
+        self.total += 1
+
+    def recent(self):
+        if self.count < len(self.samples):
+            return self.samples[:self.count]
+        return self.samples[self.index:] + self.samples[:self.index]
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.add(time.perf_counter() - self._started)
+        return False
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    idx = int(round((len(sorted_values) - 1) * pct / 100.0))
+    return sorted_values[max(0, min(len(sorted_values) - 1, idx))]
+
+
+class FrameProfiler:
+    def __init__(self, capacity=DEFAULT_CAPACITY, enabled=False):
+        self.capacity = max(16, int(capacity))
+        self.enabled = bool(enabled)
+        self.stages = {}
+        self._frame_started = 0.0
+
+    def set_enabled(self, enabled):
+        self.enabled = bool(enabled)
+        self._frame_started = 0.0
+
+    def toggle(self):
+        self.set_enabled(not self.enabled)
+        return self.enabled
+
+    def clear(self):
+        self.stages = {}
+        self._frame_started = 0.0
+
+    def _timer(self, name):
+        timer = self.stages.get(name)
+        if timer is None:
+            timer = _StageTimer(name, self.capacity)
+            self.stages[name] = timer
+        return timer
+
+    def stage(self, name):
+        if not self.enabled:
+            return _NULL_STAGE
+        return self._timer(name)
+
+    def add(self, name, seconds):
+        if self.enabled:
+            self._timer(name).add(float(seconds))
+
+    def mark_frame(self):
+        """Record wall time between consecutive calls as the 'frame' stage."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._frame_started > 0.0:
+            self._timer("frame").add(now - self._frame_started)
+        self._frame_started = now
+
+    def ordered_names(self):
+        known = [name for name in STAGE_ORDER if name in self.stages]
+        extra = sorted(name for name in self.stages if name not in STAGE_ORDER)
+        return known + extra
+
+    def summary(self):
+        out = {}
+        for name in self.ordered_names():
+            timer = self.stages[name]
+            values = sorted(timer.recent())
+            if not values:
+                continue
+            out[name] = {
+                "samples": len(values),
+                "total_samples": int(timer.total),
+                "mean_ms": round(sum(values) / len(values) * 1000.0, 3),
+                "p50_ms": round(_percentile(values, 50) * 1000.0, 3),
+                "p95_ms": round(_percentile(values, 95) * 1000.0, 3),
+                "max_ms": round(values[-1] * 1000.0, 3),
+            }
+        return out
+
+    def dump_json(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "captured_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "capacity": self.capacity,
+            "stages": self.summary(),
+            "samples_ms": {
+                name: [round(v * 1000.0, 3) for v in self.stages[name].recent()]
+                for name in self.ordered_names()
+            },
+        }
+        path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        return path
+
+    def dump_csv(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["stage", "samples", "mean_ms", "p50_ms", "p95_ms", "max_ms"])
+            for name, row in self.summary().items():
+                writer.writerow([name, row["samples"], row["mean_ms"], row["p50_ms"], row["p95_ms"], row["max_ms"]])
+        return path
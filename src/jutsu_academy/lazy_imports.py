@@ -0,0 +1,47 @@
+"""
+Deferred imports for the desktop launcher.
+
+Every mixin star-imports main_pygame_shared, so anything that module imports is
+paid for before the menu can appear. mediapipe and requests are only needed
+once a game starts or a network call is made; binding them as LazyModule
+stand-ins keeps the `mp.Image(...)` / `requests.get(...)` call sites unchanged
+while moving the real import to the first attribute access.
+"""
+
+import importlib
+import sys
+
+
+class LazyModule:
+    """Module stand-in that imports `name` the first time an attribute is read."""
+
+    def __init__(self, name):
+        self.__dict__["_lazy_name"] = name
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            # import_module takes the per-module import lock, so concurrent first uses are safe.
+            module = importlib.import_module(self.__dict__["_lazy_name"])
+            self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "not loaded"
+        return f"<lazy module {self.__dict__['_lazy_name']!r} ({state})>"
+
+
+def lazy_import(name):
+    module = sys.modules.get(name)
+    return module if module is not None else LazyModule(name)
+
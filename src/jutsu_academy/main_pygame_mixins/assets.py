@@ -12,32 +12,15 @@ class AssetsMixin:
         p = self._resolve_asset_path(path)
         if not p.exists():
             p = self._resolve_asset_path("src/pics/placeholder.png")
-        try:
-            img = pygame.image.load(str(p)).convert_alpha()
-            if size:
-                img = pygame.transform.smoothscale(img, size)
-            return img
-        except Exception:
-            return None
+        if size:
+            return self.assets.scaled(p, size)
+        return self.assets.source(p)
 
-    def _load_card_texture_image(self, path):
-        """Load card texture image; fallback to OpenCV decode when pygame decoder fails."""
-        p = self._resolve_asset_path(path)
-        if not p.exists():
-            return None
-        try:
-            return pygame.image.load(str(p)).convert_alpha()
-        except Exception:
-            pass
-        try:
-            frame = cv2.imread(str(p), cv2.IMREAD_COLOR)
-            if frame is None:
-                return None
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            frame = np.transpose(frame, (1, 0, 2))
-            return pygame.surfarray.make_surface(frame).convert_alpha()
-        except Exception:
-            return None
+    def _screen_background(self):
+        """Background at the current screen size, re-cropped if the resolution changed under it."""
+        if self.bg_image is not None and self.bg_image.get_size() != (SCREEN_WIDTH, SCREEN_HEIGHT):
+            self._load_background()
+        return self.bg_image
 
     def _load_feature_icons(self):
         """Load tutorial, mastery, quest and shared UI icons."""
@@ -70,8 +53,8 @@ class AssetsMixin:
             "lock": self._load_ui_image("src/pics/ui/lock.png", (20, 20)),
             "reward_xp": self._load_ui_image("src/pics/ui/reward_xp.png", (20, 20)),
         }
-        self.jutsu_card_textures = {}
-        self.jutsu_card_texture_cache = {}
+        # Card art is only needed on the library/practice screens; decode it off the main thread.
+        self.jutsu_card_texture_paths = {}
         texture_map = {
             "Shadow Clone": "shadow_clone.jpg",
             "Rasengan": "rasengan.jpg",
@@ -87,13 +70,18 @@ class AssetsMixin:
         texture_dir = Path("src/pics/textured_buttons")
         for jutsu_name, filename in texture_map.items():
             texture_path = self._resolve_asset_path(texture_dir / filename)
-            texture = self._load_card_texture_image(texture_path)
-            if texture is not None:
-                self.jutsu_card_textures[jutsu_name] = texture
-        if self.jutsu_card_textures:
-            print(f"[+] Loaded {len(self.jutsu_card_textures)} jutsu card textures")
+            if texture_path.exists():
+                self.jutsu_card_texture_paths[jutsu_name] = texture_path
+                self.assets.preload(texture_path)
+        if self.jutsu_card_texture_paths:
+            print(f"[+] Queued {len(self.jutsu_card_texture_paths)} jutsu card textures")
+        else:
+            print("[!] No jutsu card textures found in src/pics/textured_buttons")
+        self.hands_layout_path = self._resolve_asset_path("src/pics/hands_layout.png")
+        if self.hands_layout_path.exists():
+            self.assets.preload(self.hands_layout_path)
         else:
-            print("[!] No jutsu card textures loaded from src/pics/textured_buttons")
+            self.hands_layout_path = None
 
     def _macos_camera_names(self):
         """Best-effort camera names on macOS via system_profiler."""
@@ -194,33 +182,41 @@ class AssetsMixin:
         v = max(0.0, min(1.0, float(ui_value)))
         return min(0.5, v ** 2.4)
 
-    def _load_sounds(self):
-        """Load sound effects."""
+    def _sound_paths(self):
+        """(name, path, is_jutsu) for every sound effect file the game loads."""
         sounds_dir = self._resolve_asset_path("src/sounds")
-        
+        found = []
         for name in ["each", "complete", "hover", "click", "reward", "level"]:
             for ext in [".mp3", ".wav"]:
                 path = sounds_dir / f"{name}{ext}"
                 if path.exists():
-                    try:
-                        self.sounds[name] = pygame.mixer.Sound(str(path))
-                        print(f"[+] Sound loaded: {name}")
-                        break
-                    except Exception as e:
-                        print(f"[!] Sound load error ({name}): {e}")
-        
-        # Load jutsu-specific sounds
+                    found.append((name, path, False))
+                    break
+
+        # Jutsu-specific sounds
         for name, data in self.jutsu_list.items():
             sound_path = data.get("sound_path")
             resolved_sound = self._resolve_asset_path(sound_path) if sound_path else None
             if resolved_sound and resolved_sound.exists():
-                try:
-                    self.sounds[name] = pygame.mixer.Sound(str(resolved_sound))
-                    if str(name).lower() == "chidori":
-                        self.sounds[name].set_volume(0.3)
-                    print(f"[+] Jutsu sound loaded: {name}")
-                except Exception as e:
-                    print(f"[!] Jutsu sound error ({name}): {e}")
+                found.append((name, resolved_sound, True))
+        return found
+
+    def _load_sound(self, path):
+        """Sound from the asset pack's PCM cache when it has it, else decoded from the file."""
+        pack = getattr(self.assets, "pack", None)
+        sound = pack.sound(path) if pack is not None else None
+        return sound if sound is not None else pygame.mixer.Sound(str(path))
+
+    def _load_sounds(self):
+        """Load sound effects."""
+        for name, path, is_jutsu in self._sound_paths():
+            try:
+                self.sounds[name] = self._load_sound(path)
+                if is_jutsu and str(name).lower() == "chidori":
+                    self.sounds[name].set_volume(0.3)
+                print(f"[+] {'Jutsu sound' if is_jutsu else 'Sound'} loaded: {name}")
+            except Exception as e:
+                print(f"[!] {'Jutsu sound error' if is_jutsu else 'Sound load error'} ({name}): {e}")
 
     def _try_play_music(self):
         """Try to play background music."""
@@ -257,12 +253,16 @@ class AssetsMixin:
             for ext in [".jpeg", ".jpg", ".png"]:
                 path = pics_dir / f"{name}{ext}"
                 if path.exists():
-                    try:
-                        img = pygame.image.load(str(path))
-                        self.icons[name] = pygame.transform.smoothscale(img, (80, 80))
-                        break
-                    except:
-                        pass
+                    # Only the playing HUD shows these; decode in the background meanwhile.
+                    self.icon_paths[name] = path
+                    self.assets.preload(path, sizes=[((80, 80), FIT_STRETCH)])
+                    break
+
+    def _sign_icon(self, name, size=80):
+        path = self.icon_paths.get(name)
+        if path is None:
+            return None
+        return self.assets.scaled(path, (size, size))
 
     def _load_logo(self):
         """Load logo image with proper aspect ratio."""
@@ -272,20 +272,10 @@ class AssetsMixin:
         ]
         for path in logo_paths:
             if path.exists():
-                try:
-                    img = pygame.image.load(str(path))
-                    # Maintain aspect ratio - fit to max width 380, max height 200
-                    w, h = img.get_size()
-                    aspect = w / h
-                    target_w = 380
-                    target_h = int(target_w / aspect)
-                    if target_h > 200:
-                        target_h = 200
-                        target_w = int(target_h * aspect)
-                    self.logo = pygame.transform.smoothscale(img, (target_w, target_h))
+                # Maintain aspect ratio - fit to max width 380, max height 200
+                self.logo = self.assets.scaled(path, (380, 200), fit=FIT_FIT)
+                if self.logo is not None:
                     break
-                except:
-                    pass
 
     def _load_background(self):
         """Load background image with proper aspect ratio (cover)."""
@@ -295,32 +285,14 @@ class AssetsMixin:
         ]
         for path in bg_paths:
             if path.exists():
-                try:
-                    img = pygame.image.load(str(path))
-                    # Scale to cover (maintain aspect ratio, crop if needed)
-                    img_w, img_h = img.get_size()
-                    aspect = img_w / img_h
-                    screen_aspect = SCREEN_WIDTH / SCREEN_HEIGHT
-                    
-                    if aspect > screen_aspect:
-                        # Image is wider - scale by height
-                        new_h = SCREEN_HEIGHT
-                        new_w = int(new_h * aspect)
-                    else:
-                        # Image is taller - scale by width
-                        new_w = SCREEN_WIDTH
-                        new_h = int(new_w / aspect)
-                    
-                    scaled = pygame.transform.smoothscale(img, (new_w, new_h))
-                    # Crop to center
-                    x = (new_w - SCREEN_WIDTH) // 2
-                    y = (new_h - SCREEN_HEIGHT) // 2
-                    self.bg_image = scaled.subsurface((x, y, SCREEN_WIDTH, SCREEN_HEIGHT)).copy()
+                # Scale to cover (maintain aspect ratio, crop to center)
+                self.assets.set_screen_size((SCREEN_WIDTH, SCREEN_HEIGHT))
+                bg = self.assets.screen_variant(path, fit=FIT_COVER)
+                if bg is not None:
+                    self.bg_image = bg
                     print(f"[+] Background loaded: {path}")
                     break
-                except Exception as e:
-                    print(f"[!] Background load error: {e}")
-                    pass
+                print(f"[!] Background load error: {path}")
 
     def _load_social_icons(self):
         """Load social media icons."""
@@ -331,12 +303,10 @@ class AssetsMixin:
             for ext in [".png", ".jpg"]:
                 path = socials_dir / f"{name}{ext}"
                 if path.exists():
-                    try:
-                        img = pygame.image.load(str(path))
-                        self.social_icons[name] = pygame.transform.smoothscale(img, (32, 32))
+                    icon = self.assets.scaled(path, (32, 32))
+                    if icon is not None:
+                        self.social_icons[name] = icon
                         break
-                    except:
-                        pass
 
     def _load_mute_icons(self):
         """Load mute/unmute icons."""
@@ -346,31 +316,24 @@ class AssetsMixin:
         unmute_path = pics_dir / "unmute.png"
         
         if mute_path.exists():
-            try:
-                img = pygame.image.load(str(mute_path))
-                self.mute_icons["mute"] = pygame.transform.smoothscale(img, (32, 32))
-            except:
-                pass
+            self.mute_icons["mute"] = self.assets.scaled(mute_path, (32, 32))
         
         if unmute_path.exists():
-            try:
-                img = pygame.image.load(str(unmute_path))
-                self.mute_icons["unmute"] = pygame.transform.smoothscale(img, (32, 32))
-            except:
-                pass
+            self.mute_icons["unmute"] = self.assets.scaled(unmute_path, (32, 32))
 
     def _load_arrow_icons(self):
         """Load arrow icons for navigation."""
         arrow_path = self._resolve_asset_path("src/pics/left-arrow.png")
         if arrow_path.exists():
-            try:
-                img = pygame.image.load(str(arrow_path))
-                self.arrow_icons["left"] = pygame.transform.smoothscale(img, (50, 50))
+            left = self.assets.scaled(arrow_path, (50, 50))
+            if left is not None:
+                # Copy: the leaderboard changes the arrows' alpha for hover.
+                self.arrow_icons["left"] = left.copy()
                 # Flip horizontally for right arrow
-                self.arrow_icons["right"] = pygame.transform.flip(self.arrow_icons["left"], True, False)
+                self.arrow_icons["right"] = pygame.transform.flip(left, True, False)
                 print("[+] Arrow icons loaded")
-            except Exception as e:
-                print(f"[!] Arrow icon error: {e}")
+            else:
+                print(f"[!] Arrow icon error: could not load {arrow_path}")
 
     def _load_jutsu_videos(self):
         """Load video paths for jutsu effects."""
@@ -380,6 +343,8 @@ class AssetsMixin:
             if resolved_video and resolved_video.exists():
                 self.jutsu_videos[name] = str(resolved_video)
                 print(f"[+] Jutsu video found: {name}")
+                # Decode in the background now so the first cast doesn't wait on it.
+                self.video_sprites.request(name, resolved_video)
 
     def toggle_mute(self):
         """Toggle music mute."""
@@ -397,6 +362,7 @@ class AssetsMixin:
             "debug_hands": False,
             "resolution_idx": 0,
             "fullscreen": False,
+            "frame_pacing": DEFAULT_PACING_PRESET,
         }
 
     def _sanitize_persisted_settings(self, raw):
@@ -424,6 +390,9 @@ class AssetsMixin:
         except Exception:
             pass
         out["fullscreen"] = bool(raw.get("fullscreen", base["fullscreen"]))
+        pacing = str(raw.get("frame_pacing", base["frame_pacing"]) or "")
+        if pacing in PACING_PRESETS:
+            out["frame_pacing"] = pacing
         return out
 
     def _persisted_settings_payload(self):
@@ -434,6 +403,7 @@ class AssetsMixin:
             "debug_hands": self.settings.get("debug_hands", False),
             "resolution_idx": self.settings.get("resolution_idx", 0),
             "fullscreen": self.settings.get("fullscreen", False),
+            "frame_pacing": self.settings.get("frame_pacing", DEFAULT_PACING_PRESET),
         }
         return self._sanitize_persisted_settings(source)
 
@@ -441,6 +411,20 @@ class AssetsMixin:
         # Runtime-only detector policy.
         self.settings["use_mediapipe_signs"] = True
         self.settings["restricted_signs"] = True
+        self._apply_frame_pacing()
+
+    def _apply_frame_pacing(self):
+        """Push the frame pacing preset (plus JUTSU_*_FPS overrides) to the pacer and segmentation service."""
+        pacer = getattr(self, "pacer", None)
+        if pacer is None:
+            return
+        pacer.set_preset(self.settings.get("frame_pacing", DEFAULT_PACING_PRESET))
+        self.settings["frame_rates"] = preset_rates(pacer.preset)
+        try:
+            from src.jutsu_academy.effects.segmentation_service import get_segmentation_service
+            get_segmentation_service().set_max_rate(pacer.rate(LANE_SEGMENTATION))
+        except Exception as e:
+            print(f"[!] Segmentation rate not applied: {e}")
 
     def load_settings(self):
         """
@@ -1,4 +1,5 @@
 from src.jutsu_academy.main_pygame_shared import *
+from src.jutsu_academy.frame_profiler import FrameProfiler
 import datetime
 
 
@@ -577,6 +578,7 @@ class CoreMixin:
     def __init__(self):
         from src.jutsu_academy.effects import (
             EffectOrchestrator,
+            FireParticlesEffect,
             ReaperDeathSealEffect,
             ShadowCloneEffect,
             WaterDragonEffect,
@@ -592,6 +594,16 @@ class CoreMixin:
         self.fullscreen = False
         self.screen = pygame.display.set_mode((self.screen_w, self.screen_h), pygame.HIDDEN)
         self.clock = pygame.time.Clock()
+        self.ui_layers = UILayerCache()  # static backgrounds/overlays, cleared on resize
+        self.assets = get_asset_manager()  # decoded images + pre-scaled variants, JUTSU_ASSET_BUDGET_MB
+        # JUTSU_DIRTY_RECTS=0 redraws and flips every screen every frame, as before.
+        self.redraw = RedrawScheduler(
+            idle_fps=int(os.getenv("JUTSU_IDLE_FPS", str(DEFAULT_IDLE_FPS)) or DEFAULT_IDLE_FPS),
+            enabled=str(os.getenv("JUTSU_DIRTY_RECTS", "1")).strip().lower() not in ("0", "false", "no", "off"),
+        )
+        self._frame_events = []
+        # Per-lane UI / camera / detector rates; the preset comes from settings (_apply_frame_pacing).
+        self.pacer = FramePacer()
         self.running = True
         
         # State
@@ -629,6 +641,7 @@ class CoreMixin:
             "restricted_signs": True,
             "resolution_idx": 0,
             "fullscreen": False,
+            "frame_pacing": DEFAULT_PACING_PRESET,
         }
         self.load_settings()
         self.settings["use_mediapipe_signs"] = True
@@ -663,14 +676,14 @@ class CoreMixin:
         
         # Fonts (Load once to avoid performance issues)
         self.fonts = {
-            "title_lg": pygame.font.Font(None, 80),
-            "title_md": pygame.font.Font(None, 56),
-            "title_sm": pygame.font.Font(None, 40),
-            "body": pygame.font.Font(None, 28),
-            "body_sm": pygame.font.Font(None, 24),
-            "small": pygame.font.Font(None, 18),
-            "tiny": pygame.font.Font(None, 16),
-            "icon": pygame.font.Font(None, 30),
+            "title_lg": cached_font(None, 80),
+            "title_md": cached_font(None, 56),
+            "title_sm": cached_font(None, 40),
+            "body": cached_font(None, 28),
+            "body_sm": cached_font(None, 24),
+            "small": cached_font(None, 18),
+            "tiny": cached_font(None, 16),
+            "icon": cached_font(None, 30),
         }
         
         # Audio
@@ -687,9 +700,9 @@ class CoreMixin:
         self._load_sounds()
         self._try_play_music()
         
-        # ML Models (lazy loaded)
+        # ML Models (loaded by the warm-up thread once the menu is up; see _schedule_model_warmup)
         self.model = None
-        self.recorder = SignRecorder() # MediaPipe + KNN
+        self.recorder = None
         
         # Network & Leaderboard
         self.connection_monitor_interval_s = 10.0
@@ -776,8 +789,8 @@ class CoreMixin:
         self.config_poll_interval_s = 20.0
         self.config_poll_last_at = 0.0
         
-        # Trigger background fetch if online
-        if self.network_manager.client:
+        # Trigger background fetch if online (the fetch thread creates the client, not the boot path)
+        if getattr(self.network_manager, "configured", False):
              threading.Thread(target=self._fetch_announcements, daemon=True).start()
 
         self.class_names = None
@@ -790,9 +803,14 @@ class CoreMixin:
         self.hand_model_path = ""
         self.hand_model_exists = False
         self.last_mp_timestamp = 0
+        # JUTSU_MODEL_WARMUP=0 keeps model loading on the Play/LOADING path.
+        self.model_warmup = ModelWarmup()
+        self.model_warmup_enabled = str(os.getenv("JUTSU_MODEL_WARMUP", "1")).strip().lower() not in ("0", "false", "no", "off")
+        self._schedule_model_warmup()
         
         # Camera
         self.cap = None
+        self._reset_camera_frame()
         self.settings_preview_cap = None
         self.settings_preview_idx = None
         self.settings_preview_enabled = False
@@ -800,10 +818,6 @@ class CoreMixin:
         
         # Game state continued
         self.current_jutsu_idx = 0
-        self.sequence = []
-        self.current_step = 0
-        self.last_sign_time = 0
-        self.cooldown = 0.5
         self.jutsu_active = False
         self.jutsu_start_time = 0
         self.jutsu_duration = 5.0
@@ -855,28 +869,9 @@ class CoreMixin:
         self.last_palm_spans = []
 
         # Robust sign recognition state
-        self.raw_detected_sign = "idle"
-        self.raw_detected_confidence = 0.0
-        self.detected_sign = "idle"
-        self.detected_confidence = 0.0
-        self.last_detected_hands = 0
-        self.last_imputed_hands = 0
-        self.two_hand_distance_norm = None
-        self.two_hand_distance_px = None
-        self.sign_vote_window = []
-        self.last_vote_hits = 0
-        self.vote_window_size = 2
-        self.vote_required_hits = 2
-        self.vote_min_confidence = 0.45
-        self.vote_entry_ttl_s = 0.7
-        self.vote_occlusion_grace_s = 0.24
-        self.vote_reuse_conf_decay = 0.90
-        self.last_stable_vote_label = "idle"
-        self.last_stable_vote_conf = 0.0
-        self.last_stable_vote_time = 0.0
-        self.last_candidate_vote_label = "idle"
-        self.last_candidate_vote_conf = 0.0
-        self.last_candidate_vote_time = 0.0
+        self._init_detection_state()
+        # Optional landmark stream capture for offline replay (F9 while playing).
+        self.landmark_recorder = None
         self.show_detection_panel = False
         self.model_toggle_rect = pygame.Rect(0, 0, 0, 0)
         self.diag_toggle_rect = pygame.Rect(0, 0, 0, 0)
@@ -915,20 +910,33 @@ class CoreMixin:
         self.phoenix_fireball_systems = [FireParticleSystem(72) for _ in range(self.phoenix_fireball_count)]
         for _sys in self.phoenix_fireball_systems:
             _sys.set_style("fireball")
-        self.effect_orchestrator = EffectOrchestrator()
+        # Render the fire palette's glow discs up front so the first fireball frame doesn't hitch.
+        get_sprite_atlas().prewarm_additive_discs(
+            range(1, 64),
+            (COLORS["fire_core"], COLORS["fire_mid"], COLORS["fire_outer"], (255, 250, 215), (255, 130, 40)),
+        )
+        # Effects share a per-frame time budget; the governor lowers their LOD to stay under it (0 disables).
+        try:
+            effect_budget_ms = float(os.getenv("JUTSU_EFFECT_BUDGET_MS", "8"))
+        except ValueError:
+            effect_budget_ms = 8.0
+        self.effect_orchestrator = EffectOrchestrator(budget_ms=effect_budget_ms)
         self.effect_orchestrator.register("clone", ShadowCloneEffect(swap_xy=True), passive=True)
         self.effect_orchestrator.register("reaper", ReaperDeathSealEffect())
         self.effect_orchestrator.register("water", WaterDragonEffect())
         self.effect_orchestrator.register("eye", SharinganEffect())
+        # The playing loop drives the fire systems itself and charges them to "fire" via measure().
+        self.effect_orchestrator.register(
+            "fire", FireParticlesEffect([self.fire_particles, *self.phoenix_fireball_systems])
+        )
         
         # Video overlay for jutsus
         self.current_video = None
-        self.video_cap = None
+        self.video_sprites = VideoSpriteCache()
         self.jutsu_videos = {}
         self._load_jutsu_videos()
         self._load_feature_icons()
         self._load_player_meta()
-        self.sequence_run_start = None
         self.quest_claim_rects = []
         self.tutorial_step_index = 0
         self.tutorial_steps = [
@@ -971,7 +979,7 @@ class CoreMixin:
         ]
 
         # Icons
-        self.icons = {}
+        self.icon_paths = {}
         self._load_icons()
         
         # Logo
@@ -1012,6 +1020,10 @@ class CoreMixin:
         self.frame_count = 0
         self.fps_timer = time.time()
 
+        # Per-stage hot-path profiler (F3 while playing, F4 dumps JSON/CSV).
+        self.settings["show_profiler"] = str(os.getenv("JUTSU_PROFILE", "")).strip().lower() in ("1", "true", "yes", "on")
+        self.profiler = FrameProfiler(enabled=self.settings["show_profiler"])
+
         if (not self.tutorial_seen) and self.state == GameState.MENU:
             self.state = GameState.TUTORIAL
         
@@ -1039,6 +1051,8 @@ class CoreMixin:
 
     def _rebuild_ui_for_screen_size(self):
         """Recreate static UI rects after display size changes."""
+        if hasattr(self, "ui_layers"):
+            self.ui_layers.invalidate()
         if not hasattr(self, "menu_buttons"):
             return
 
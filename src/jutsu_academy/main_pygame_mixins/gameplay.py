@@ -1,5 +1,6 @@
 from src.jutsu_academy.main_pygame_shared import *
 from src.jutsu_academy.effects import EffectContext
+from src.landmark_stream import LandmarkStreamRecorder
 
 
 class GameplayMixin:
@@ -43,6 +44,20 @@ class GameplayMixin:
         min_conf = max(0.30, float(getattr(self, "vote_min_confidence", 0.45)) - 0.10)
         return raw_conf >= min_conf
 
+    def _match_sequence_step(self, detected, now):
+        """Advance the jutsu sequence if detected matches the next sign past the cooldown; returns the step landed (1-based) or 0."""
+        if self.current_step >= len(self.sequence or []):
+            return 0
+        if not self._signs_match(detected, self.sequence[self.current_step]):
+            return 0
+        if now - self.last_sign_time <= self.cooldown:
+            return 0
+        if self.current_step == 0:
+            self.sequence_run_start = now
+        self.current_step += 1
+        self.last_sign_time = now
+        return self.current_step
+
     def _calibration_identity(self):
         if self.discord_user and self.discord_user.get("id"):
             return f"discord:{self.discord_user.get('id')}"
@@ -68,6 +83,33 @@ class GameplayMixin:
         if getattr(self, "recorder", None) and hasattr(self.recorder, "reset_temporal_state"):
             self.recorder.reset_temporal_state()
 
+    def _init_detection_state(self):
+        # Shared by JutsuAcademy and the headless replay host so both start from the same vote/sequence state.
+        self._reset_detection_filters()
+        self.vote_window_size = 2
+        self.vote_required_hits = 2
+        self.vote_min_confidence = 0.45
+        self.vote_entry_ttl_s = 0.7
+        self.vote_occlusion_grace_s = 0.24
+        self.vote_reuse_conf_decay = 0.90
+        # Adaptive vote tuning (window/hits/ttl derived from measured detection rate)
+        self.vote_auto_tune = True
+        self.vote_target_latency_s = 0.15
+        self.vote_target_false_rate = 0.02
+        self.vote_frame_dt = 1.0 / 30.0
+        self.vote_conf_mean = 0.0
+        self.vote_conf_var = 0.0
+        self.vote_conf_samples = 0
+        self.vote_tune_min_samples = 30
+        self.vote_last_frame_at = 0.0
+        self.vote_last_tuned_at = 0.0
+
+        self.sequence = []
+        self.current_step = 0
+        self.last_sign_time = 0
+        self.cooldown = 0.5
+        self.sequence_run_start = None
+
     def toggle_detection_model(self):
         """Switch active sign detector backend."""
         using_mp = bool(self.settings.get("use_mediapipe_signs", False))
@@ -99,9 +141,6 @@ class GameplayMixin:
         self.mastery_panel_data = None
         self.level_up_panel_data = None
         self.current_video = None
-        if self.video_cap:
-            self.video_cap.release()
-            self.video_cap = None
 
         self.hand_pos = None
         self.mouth_pos = None
@@ -144,7 +183,12 @@ class GameplayMixin:
         self.lighting_max = self._clamp(profile.get("lighting_max", 210.0), 120.0, 245.0)
         self.lighting_min_contrast = self._clamp(profile.get("lighting_min_contrast", 22.0), 10.0, 80.0)
         self.vote_min_confidence = self._clamp(profile.get("vote_min_confidence", 0.45), 0.2, 0.9)
+        self.vote_window_size = int(self._clamp(profile.get("vote_window_size", 2), 2, 8))
         self.vote_required_hits = int(self._clamp(profile.get("vote_required_hits", 3), 2, self.vote_window_size))
+        self.vote_entry_ttl_s = self._clamp(profile.get("vote_entry_ttl_s", 0.7), 0.25, 1.2)
+        self.vote_target_latency_s = self._clamp(profile.get("vote_target_latency_s", 0.15), 0.08, 0.5)
+        if "vote_frame_dt" in profile:
+            self.vote_frame_dt = self._clamp(profile.get("vote_frame_dt", 1.0 / 30.0), 1.0 / 120.0, 0.2)
 
     def _restore_calibration_diag_state(self):
         if self.calibration_restore_diag_state is not None:
@@ -366,6 +410,7 @@ class GameplayMixin:
             sample["palm_span"] = float(np.mean(self.last_palm_spans))
         if raw_sign not in ("idle", "unknown"):
             sample["conf"] = float(raw_conf)
+        sample["t"] = time.time()
         self.calibration_samples.append(sample)
 
         # Keep memory bounded.
@@ -405,6 +450,18 @@ class GameplayMixin:
         if conf_vals.size:
             vote_min_conf = self._clamp(float(np.percentile(conf_vals, 30)) * 0.9, 0.25, 0.9)
 
+        # Detection rate seen during calibration drives the vote window/hits.
+        frame_dt = self._vote_frame_period()
+        stamps = np.array([s["t"] for s in self.calibration_samples if "t" in s], dtype=np.float64)
+        if stamps.size >= 3:
+            gaps = np.diff(stamps)
+            gaps = gaps[(gaps > 0.0) & (gaps < 0.5)]
+            if gaps.size:
+                frame_dt = float(np.median(gaps))
+        conf_mean = float(np.mean(conf_vals)) if conf_vals.size else 0.0
+        conf_std = float(np.std(conf_vals)) if conf_vals.size else 0.0
+        window_size, required_hits, entry_ttl = self._compute_vote_tuning(frame_dt, conf_mean, conf_std)
+
         profile = {
             "version": 1,
             "identity": self._calibration_identity(),
@@ -414,7 +471,11 @@ class GameplayMixin:
             "lighting_max": round(lighting_max, 3),
             "lighting_min_contrast": round(lighting_min_contrast, 3),
             "vote_min_confidence": round(vote_min_conf, 3),
-            "vote_required_hits": int(self.vote_required_hits),
+            "vote_required_hits": int(required_hits),
+            "vote_window_size": int(window_size),
+            "vote_entry_ttl_s": round(entry_ttl, 3),
+            "vote_frame_dt": round(frame_dt, 4),
+            "vote_target_latency_s": round(float(self.vote_target_latency_s), 3),
         }
 
         self.calibration_profile = profile
@@ -434,8 +495,70 @@ class GameplayMixin:
         self.calibration_message_until = time.time() + 5.0
         self._restore_calibration_diag_state()
 
-    def _apply_temporal_vote(self, raw_sign, raw_conf, allow_detection, hard_reset=False, hands_now=0):
-        now = time.time()
+    def _vote_frame_period(self):
+        return self._clamp(getattr(self, "vote_frame_dt", 1.0 / 30.0), 1.0 / 120.0, 0.2)
+
+    def _compute_vote_tuning(self, frame_dt, conf_mean, conf_std):
+        """Pick (window, hits, ttl) that confirm within the latency target at the false-trigger target."""
+        frame_dt = self._clamp(frame_dt, 1.0 / 120.0, 0.2)
+        target_latency = self._clamp(getattr(self, "vote_target_latency_s", 0.15), 0.08, 0.5)
+        target_false = self._clamp(getattr(self, "vote_target_false_rate", 0.02), 0.001, 0.2)
+
+        # N hits need N-1 frame intervals after the first matching frame.
+        max_hits = int(self._clamp(1 + int(target_latency / frame_dt), 2, 8))
+
+        # Rough per-frame odds of a spurious label from the KNN confidence spread.
+        if conf_mean > 0.0:
+            p_false = self._clamp((1.0 - conf_mean) * 0.5 + conf_std, 0.02, 0.6)
+        else:
+            p_false = 0.25
+        needed_hits = int(math.ceil(math.log(target_false) / math.log(p_false)))
+        required_hits = int(self._clamp(needed_hits, 2, max_hits))
+
+        # One spare slot absorbs a single dropped/misread frame when the budget allows it.
+        window_size = int(self._clamp(required_hits + (1 if max_hits > required_hits else 0), 2, 8))
+        entry_ttl = self._clamp(max(target_latency * 2.0, window_size * frame_dt * 2.0), 0.25, 1.2)
+        return window_size, required_hits, entry_ttl
+
+    def _observe_vote_frame(self, now, raw_conf, valid):
+        last = float(getattr(self, "vote_last_frame_at", 0.0) or 0.0)
+        self.vote_last_frame_at = now
+        if last > 0.0:
+            gap = now - last
+            # Ignore stalls (loading, menus, alt-tab) so they do not skew the rate.
+            if 0.0 < gap < 0.5:
+                self.vote_frame_dt = self._vote_frame_period() * 0.9 + gap * 0.1
+        if valid:
+            conf = float(max(0.0, raw_conf))
+            self.vote_conf_samples = int(getattr(self, "vote_conf_samples", 0)) + 1
+            # Plain running mean/variance over the first samples, then an EMA; seeding at 0.0 skews early tuning.
+            alpha = max(0.05, 1.0 / self.vote_conf_samples)
+            delta = conf - self.vote_conf_mean
+            self.vote_conf_mean += delta * alpha
+            self.vote_conf_var = (1.0 - alpha) * (self.vote_conf_var + alpha * delta * delta)
+
+        if not getattr(self, "vote_auto_tune", False) or self.calibration_active:
+            return
+        # A saved calibration already chose window/hits/ttl for this player; don't overwrite it every second.
+        profile = getattr(self, "calibration_profile", None)
+        if isinstance(profile, dict) and "vote_required_hits" in profile:
+            return
+        if self.vote_conf_samples < int(getattr(self, "vote_tune_min_samples", 30)):
+            return
+        if now - float(getattr(self, "vote_last_tuned_at", 0.0) or 0.0) < 1.0:
+            return
+        self.vote_last_tuned_at = now
+        window_size, required_hits, entry_ttl = self._compute_vote_tuning(
+            self._vote_frame_period(),
+            self.vote_conf_mean,
+            math.sqrt(max(0.0, self.vote_conf_var)),
+        )
+        self.vote_window_size = window_size
+        self.vote_required_hits = required_hits
+        self.vote_entry_ttl_s = entry_ttl
+
+    def _apply_temporal_vote(self, raw_sign, raw_conf, allow_detection, hard_reset=False, hands_now=0, now=None):
+        now = time.time() if now is None else float(now)
         self.sign_vote_window = [
             item for item in self.sign_vote_window
             if now - item.get("time", 0.0) <= self.vote_entry_ttl_s
@@ -455,6 +578,7 @@ class GameplayMixin:
         normalized = str(raw_sign or "idle").strip().lower()
         hands_now = int(max(0, hands_now))
         invalid_frame = (not allow_detection) or normalized in ("idle", "unknown")
+        self._observe_vote_frame(now, raw_conf, not invalid_frame)
         if not invalid_frame:
             self.sign_vote_window.append({
                 "label": normalized,
@@ -509,7 +633,7 @@ class GameplayMixin:
         if elapsed > 0.35:
             return "idle", 0.0
 
-        frame_count = max(1.0, elapsed / (1.0 / 30.0))
+        frame_count = max(1.0, elapsed / self._vote_frame_period())
         reused_conf = conf * (0.90 ** frame_count)
         min_conf = max(0.15, float(getattr(self, "vote_min_confidence", 0.45)) * 0.60)
         if reused_conf < min_conf:
@@ -532,26 +656,80 @@ class GameplayMixin:
             return "idle", 0.0
 
         decay_base = self._clamp(getattr(self, "vote_reuse_conf_decay", 0.90), 0.5, 0.99)
-        frame_count = max(1.0, elapsed / (1.0 / 30.0))
+        frame_count = max(1.0, elapsed / self._vote_frame_period())
         reused_conf = last_conf * (decay_base ** frame_count)
         return last_label, float(max(0.0, reused_conf))
 
     def predict_sign_with_filters(self, frame, lighting_ok):
         self.last_mp_result = None
-        self.detect_hands(frame)
+        with self.profiler.stage("hands"):
+            self.detect_hands(frame)
 
+        hand_landmarks = []
+        handedness = []
+        if self.last_mp_result and self.last_mp_result.hand_landmarks:
+            hand_landmarks = self.last_mp_result.hand_landmarks
+            handedness = self.last_mp_result.handedness
+        stable_sign = self._classify_hand_landmarks(hand_landmarks, handedness, lighting_ok)
+
+        recorder = getattr(self, "landmark_recorder", None)
+        if recorder is not None and recorder.active:
+            recorder.record(
+                hand_landmarks,
+                handedness,
+                raw_sign=self.raw_detected_sign,
+                raw_conf=self.raw_detected_confidence,
+                stable_sign=stable_sign,
+                stable_conf=self.detected_confidence,
+                lighting_status=self.lighting_status,
+                lighting_mean=self.lighting_mean,
+                lighting_contrast=self.lighting_contrast,
+                lighting_ok=lighting_ok,
+            )
+        return stable_sign
+
+    def _toggle_landmark_recording(self, enabled=None):
+        recorder = getattr(self, "landmark_recorder", None)
+        active = bool(recorder is not None and recorder.active)
+        if enabled is None:
+            enabled = not active
+        if enabled == active:
+            return active
+
+        if not enabled:
+            recorder.stop()
+            return False
+
+        if recorder is None:
+            recorder = LandmarkStreamRecorder(prefix="pygame")
+            self.landmark_recorder = recorder
+        jutsu_name = ""
+        if getattr(self, "jutsu_names", None) and 0 <= self.current_jutsu_idx < len(self.jutsu_names):
+            jutsu_name = self.jutsu_names[self.current_jutsu_idx]
+        return recorder.start(meta={
+            "source": "pygame",
+            "app_version": APP_VERSION,
+            "game_mode": str(getattr(self, "game_mode", "") or ""),
+            "jutsu": jutsu_name,
+            "restricted_signs": bool(self.settings.get("restricted_signs", False)),
+            "vote_window_size": int(self.vote_window_size),
+            "vote_required_hits": int(self.vote_required_hits),
+            "vote_min_confidence": float(self.vote_min_confidence),
+        })
+
+    def _classify_hand_landmarks(self, hand_landmarks, handedness, lighting_ok, now=None):
+        """KNN + two-hand gate + temporal vote on already-detected landmarks (shared with replay tooling)."""
         raw_sign = "idle"
         raw_conf = 0.0
         num_hands = 0
         imputed_hands = 0
 
-        if self.last_mp_result and self.last_mp_result.hand_landmarks:
-            num_hands = len(self.last_mp_result.hand_landmarks)
-            features = self.recorder.process_tasks_landmarks(
-                self.last_mp_result.hand_landmarks,
-                self.last_mp_result.handedness,
-            )
-            label, raw_conf, _ = self.recorder.predict_with_confidence(features)
+        if hand_landmarks:
+            num_hands = len(hand_landmarks)
+            with self.profiler.stage("features"):
+                features = self.recorder.process_tasks_landmarks(hand_landmarks, handedness)
+            with self.profiler.stage("knn"):
+                label, raw_conf, _ = self.recorder.predict_with_confidence(features)
             raw_sign = str(label).strip().lower()
             if hasattr(self.recorder, "get_last_imputed_hand_mask"):
                 imputed_mask = self.recorder.get_last_imputed_hand_mask()
@@ -569,12 +747,14 @@ class GameplayMixin:
         if self.settings.get("restricted_signs", False):
             allow_detection = allow_detection and effective_hands >= 2
 
-        stable_sign, stable_conf = self._apply_temporal_vote(
-            raw_sign,
-            raw_conf,
-            allow_detection,
-            hands_now=num_hands,
-        )
+        with self.profiler.stage("vote"):
+            stable_sign, stable_conf = self._apply_temporal_vote(
+                raw_sign,
+                raw_conf,
+                allow_detection,
+                hands_now=num_hands,
+                now=now,
+            )
 
         self.raw_detected_sign = raw_sign
         self.raw_detected_confidence = float(raw_conf)
@@ -603,10 +783,11 @@ class GameplayMixin:
         self._render_loading()
         pygame.display.flip()
         
-        # Load models if not loaded
-        self.loading_message = "Loading AI models..."
-        self._render_loading()
-        pygame.display.flip()
+        # Models normally finished warming up in the menu; only show this step if we have to wait.
+        if not self._ml_models_ready():
+            self.loading_message = "Loading AI models..."
+            self._render_loading()
+            pygame.display.flip()
         
         if not self._load_ml_models():
             print("[-] Failed to load ML models. Cannot start game.")
@@ -661,17 +842,17 @@ class GameplayMixin:
         self.challenge_started_at_iso = ""
         self.challenge_submission_result = {}
         self.challenge_event_overflow = False
+
+        if str(os.getenv("JUTSU_RECORD_LANDMARKS", "")).strip().lower() in ("1", "true", "yes", "on"):
+            self._toggle_landmark_recording(True)
         
         self.state = GameState.PLAYING
 
     def _render_loading(self):
         """Render loading screen."""
         if hasattr(self, 'bg_image') and self.bg_image:
-             self.screen.blit(self.bg_image, (0, 0))
              # Very dark overlay for loading state
-             overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-             overlay.fill((0, 0, 0, 220)) 
-             self.screen.blit(overlay, (0, 0))
+             self._blit_backdrop((0, 0, 0, 220))
         else:
              self.screen.fill(COLORS["bg_dark"])
         
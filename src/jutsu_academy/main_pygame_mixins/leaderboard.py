@@ -138,9 +138,7 @@ class LeaderboardMixin:
             return
             
         # 1. Dim Backdrop
-        backdrop = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        backdrop.fill((0, 0, 0, 180))
-        self.screen.blit(backdrop, (0, 0))
+        self._blit_dim((0, 0, 0, 180))
         
         # 2. Main Card
         card_w, card_h = 500, 350
@@ -265,7 +263,7 @@ class LeaderboardMixin:
              l_rect = l_arrow.get_rect(center=(center_x - arrow_gap, y_pos))
              self.mode_arrow_left_rect = l_rect
              
-             if l_rect.collidepoint(mp):
+             if self.redraw.hover(l_rect, mp):
                  l_arrow.set_alpha(255)
                  pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
              else:
@@ -279,7 +277,7 @@ class LeaderboardMixin:
              r_rect = r_arrow.get_rect(center=(center_x + arrow_gap, y_pos))
              self.mode_arrow_right_rect = r_rect
              
-             if r_rect.collidepoint(mp):
+             if self.redraw.hover(r_rect, mp):
                  r_arrow.set_alpha(255)
                  pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
              else:
@@ -406,7 +404,7 @@ class LeaderboardMixin:
                  rect = txt.get_rect(center=(center_x - 80, page_y))
                  self.leaderboard_prev_rect = rect 
                  
-                 if rect.collidepoint(pygame.mouse.get_pos()):
+                 if self.redraw.hover(rect):
                      txt = self.fonts["body_sm"].render("< Prev", True, COLORS["accent_glow"])
                      pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
                  self.screen.blit(txt, rect)
@@ -418,7 +416,7 @@ class LeaderboardMixin:
                  rect = txt.get_rect(center=(center_x + 80, page_y))
                  self.leaderboard_next_rect = rect
 
-                 if rect.collidepoint(pygame.mouse.get_pos()):
+                 if self.redraw.hover(rect):
                      txt = self.fonts["body_sm"].render("Next >", True, COLORS["accent_glow"])
                      pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
                  self.screen.blit(txt, rect)
@@ -175,7 +175,16 @@ class PlayingMixin:
                 sys.set_direction(float(b["vx"]), float(b["vy"]), smoothing=0.42)
             sys.update(dt)
 
-    def _render_phoenix_fireballs(self):
+    @staticmethod
+    def _build_phoenix_core(r):
+        core = pygame.Surface((r * 6, r * 6), pygame.SRCALPHA)
+        cx = cy = r * 3
+        pygame.draw.circle(core, (255, 255, 220, 145), (cx, cy), int(r * 0.90))
+        pygame.draw.circle(core, (255, 175, 70, 165), (cx, cy), int(r * 1.45))
+        pygame.draw.circle(core, (255, 90, 35, 125), (cx, cy), int(r * 2.05))
+        return core
+
+    def _render_phoenix_fireballs(self, queue=None):
         if not bool(getattr(self, "phoenix_fireballs_active", False)):
             return
         systems = list(getattr(self, "phoenix_fireball_systems", []) or [])
@@ -185,13 +194,13 @@ class PlayingMixin:
             r = max(8, int(float(b.get("r", 16.0))))
             x = int(float(b.get("x", 0.0)))
             y = int(float(b.get("y", 0.0)))
-            core = pygame.Surface((r * 6, r * 6), pygame.SRCALPHA)
+            core = get_sprite_atlas().get(("phoenix_core", r), lambda: self._build_phoenix_core(r))
             cx = cy = r * 3
-            pygame.draw.circle(core, (255, 255, 220, 145), (cx, cy), int(r * 0.90))
-            pygame.draw.circle(core, (255, 175, 70, 165), (cx, cy), int(r * 1.45))
-            pygame.draw.circle(core, (255, 90, 35, 125), (cx, cy), int(r * 2.05))
-            self.screen.blit(core, (x - cx, y - cy), special_flags=pygame.BLEND_ADD)
-            systems[idx].render(self.screen)
+            if queue is not None:
+                queue.submit(core, (x - cx, y - cy), pygame.BLEND_ADD, LAYER_PARTICLES)
+            else:
+                self.screen.blit(core, (x - cx, y - cy), special_flags=pygame.BLEND_ADD)
+            systems[idx].render(self.screen, queue=queue)
 
     def _trigger_jutsu_payload(self, jutsu_name, effect_name):
         """Trigger sound/effect/video payload for a (sub)jutsu event."""
@@ -260,6 +269,10 @@ class PlayingMixin:
                     jutsu_name=jutsu_name,
                     effect_duration=effect_duration,
                     mouth_pos=self.mouth_pos,
+                    left_eye_size=getattr(self, "left_eye_size", None),
+                    right_eye_size=getattr(self, "right_eye_size", None),
+                    left_eye_angle=float(getattr(self, "left_eye_angle", 0.0) or 0.0),
+                    right_eye_angle=float(getattr(self, "right_eye_angle", 0.0) or 0.0),
                     head_yaw=float(getattr(self, "head_yaw", 0.0) or 0.0),
                     head_pitch=float(getattr(self, "head_pitch", 0.0) or 0.0),
                 ),
@@ -269,10 +282,7 @@ class PlayingMixin:
         video_path = jutsu_data.get("video_path")
         resolved_video = resolve_resource_path(video_path) if video_path else None
         if resolved_video and resolved_video.exists():
-            if self.video_cap:
-                self.video_cap.release()
-                self.video_cap = None
-            self.video_cap = cv2.VideoCapture(str(resolved_video))
+            self.video_sprites.play(jutsu_name, resolved_video)
             self.current_video = jutsu_name
             print(f"[+] Playing video: {resolved_video}")
 
@@ -306,7 +316,7 @@ class PlayingMixin:
         if remaining > 0:
             frac = 1.0 - (elapsed % 1.0) 
             size = int(120 * (1.0 + 0.5 * frac)) 
-            font = pygame.font.Font(None, size) 
+            font = self._font_for_size(size)
             
             txt = font.render(str(remaining), True, (255, 255, 0)) 
             rect = txt.get_rect(center=(cam_x + cam_w // 2, cam_y + cam_h // 2))
@@ -469,16 +479,10 @@ class PlayingMixin:
         """Render game playing state with Challenge Mode support."""
         # 1. Background Logic - Always draw first to clear previous frame
         if hasattr(self, 'bg_image') and self.bg_image:
-             if hasattr(self, 'last_screen_w') and self.last_screen_w != SCREEN_WIDTH:
-                 # Rescale background if screen size changes (simplified check)
-                 self.bg_image = pygame.transform.smoothscale(self.bg_image, (SCREEN_WIDTH, SCREEN_HEIGHT))
-                 self.last_screen_w = SCREEN_WIDTH
-             self.screen.blit(self.bg_image, (0, 0))
-             
+             # Re-crops the background if the screen size changed under it
+             self._screen_background()
              # Professional darken overlay
-             overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-             overlay.fill((0, 0, 0, 180)) 
-             self.screen.blit(overlay, (0, 0))
+             self._blit_backdrop((0, 0, 0, 180))
         else:
              self.screen.fill(COLORS["bg_dark"])
         
@@ -486,14 +490,29 @@ class PlayingMixin:
             self._draw_text_center("Camera Disconnected", 0, COLORS["error"])
             return
         
-        ret, frame = self.cap.read()
-        if not ret:
-            self._draw_text_center("Camera blocked! Check OBS/Discord.", 0, COLORS["error"])
-            return
-        
-        # Flip for mirror
-        frame = cv2.flip(frame, 1)
-        lighting_ok = self._evaluate_lighting(frame)
+        # New camera frames arrive at the pacer's camera rate; UI frames in between reuse the last one.
+        camera_due = self.pacer.due(LANE_CAMERA)
+        # A live webcam is never read slower than it delivers: the backlog would make every read stale.
+        device_fps = float(getattr(self.cap, "device_fps", 0.0) or 0.0)
+        if not camera_due and device_fps > 0.0:
+            camera_due = time.perf_counter() - float(getattr(self, "camera_read_at", 0.0)) >= 1.0 / device_fps
+        if self.camera_frame is None or camera_due:
+            self.camera_read_at = time.perf_counter()
+            with self.profiler.stage("capture"):
+                ret, frame = self.cap.read()
+            if not ret:
+                self._draw_text_center("Camera blocked! Check OBS/Discord.", 0, COLORS["error"])
+                return
+
+            # Flip for mirror
+            with self.profiler.stage("convert"):
+                frame = cv2.flip(frame, 1)
+                self.camera_lighting_ok = self._evaluate_lighting(frame)
+            self.camera_frame = frame
+            self.camera_frame_seq += 1
+        frame = self.camera_frame
+        frame_seq = self.camera_frame_seq
+        lighting_ok = self.camera_lighting_ok
         
         # Camera position on screen (Centered & Scaled)
         # We want to fill the screen as much as possible while maintaining aspect ratio
@@ -530,40 +549,58 @@ class PlayingMixin:
             should_detect = False
         
         # 2. Detection Flow
-        detected = "idle"
+        detected = "idle"      # this frame's detector result; only fresh results drive the sequence
+        shown_sign = "idle"    # what the SIGN label shows
         run_detection = should_detect or self.calibration_active
+        if self.jutsu_active:
+            self.pacer.set_phase(PHASE_EFFECT)
+        elif run_detection:
+            self.pacer.set_phase(PHASE_SEQUENCE)
+        else:
+            self.pacer.set_phase(PHASE_IDLE)
         if run_detection:
             if not self.jutsu_active:
-                # Sequence Phase: Recognition
-                if self.settings.get("use_mediapipe_signs", False):
-                    # MediaPipe + quality gate + temporal consensus
-                    detected = self.predict_sign_with_filters(frame, lighting_ok)
-                else:
-                    # YOLO mode: still run temporal vote + lighting gate for stability.
-                    frame, yolo_sign, yolo_conf = self.detect_and_process(frame)
-                    raw_sign = str(yolo_sign or "idle").strip().lower()
-                    raw_conf = float(max(0.0, yolo_conf))
-                    allow_detection = bool(lighting_ok) and raw_sign not in ("", "idle")
-                    stable_sign, stable_conf = self._apply_temporal_vote(
-                        raw_sign,
-                        raw_conf,
-                        allow_detection,
-                        hands_now=1 if raw_sign not in ("", "idle") else 0,
-                    )
+                # Sequence Phase: Recognition, once per new camera frame
+                hands_due = self.pacer.due(LANE_HANDS, frame_seq)
+                if hands_due:
+                    if self.settings.get("use_mediapipe_signs", False):
+                        # MediaPipe + quality gate + temporal consensus
+                        detected = self.predict_sign_with_filters(frame, lighting_ok)
+                    else:
+                        # YOLO mode: still run temporal vote + lighting gate for stability.
+                        frame, yolo_sign, yolo_conf = self.detect_and_process(frame)
+                        self.camera_frame = frame
+                        raw_sign = str(yolo_sign or "idle").strip().lower()
+                        raw_conf = float(max(0.0, yolo_conf))
+                        allow_detection = bool(lighting_ok) and raw_sign not in ("", "idle")
+                        stable_sign, stable_conf = self._apply_temporal_vote(
+                            raw_sign,
+                            raw_conf,
+                            allow_detection,
+                            hands_now=1 if raw_sign not in ("", "idle") else 0,
+                        )
 
-                    self.raw_detected_sign = raw_sign
-                    self.raw_detected_confidence = raw_conf
-                    self.detected_sign = stable_sign
-                    self.detected_confidence = float(stable_conf)
-                    self.last_detected_hands = 1 if raw_sign not in ("", "idle") else 0
-                    self.two_hand_distance_norm = None
-                    self.two_hand_distance_px = None
-                    self._update_calibration_sample(raw_sign, raw_conf, self.last_detected_hands)
-                    detected = stable_sign
+                        self.raw_detected_sign = raw_sign
+                        self.raw_detected_confidence = raw_conf
+                        self.detected_sign = stable_sign
+                        self.detected_confidence = float(stable_conf)
+                        self.last_detected_hands = 1 if raw_sign not in ("", "idle") else 0
+                        self.two_hand_distance_norm = None
+                        self.two_hand_distance_px = None
+                        self._update_calibration_sample(raw_sign, raw_conf, self.last_detected_hands)
+                        detected = stable_sign
+                    shown_sign = detected
+                else:
+                    # No new frame for the detector: keep the last result on screen so the label doesn't flicker.
+                    shown_sign = str(getattr(self, "detected_sign", "idle") or "idle")
             else:
-                # Effect Phase: switch to MediaPipe for precise tracking
-                self.detect_hands(frame)
-                self.detect_face(frame)
+                # Effect Phase: switch to MediaPipe for precise tracking, each detector at its own rate
+                if self.pacer.due(LANE_HANDS, frame_seq):
+                    with self.profiler.stage("hands"):
+                        self.detect_hands(frame)
+                if self.pacer.due(LANE_FACE, frame_seq):
+                    with self.profiler.stage("face"):
+                        self.detect_face(frame)
         else:
             self._apply_temporal_vote("idle", 0.0, False, hard_reset=True)
             self.raw_detected_sign = "idle"
@@ -602,147 +639,138 @@ class PlayingMixin:
 
         if not self.jutsu_active and should_detect:
             # Check sequence
-            if self.current_step < len(self.sequence):
-                target = self.sequence[self.current_step]
+            target = self.sequence[self.current_step] if self.current_step < len(self.sequence) else ""
+            step_completed = self._match_sequence_step(detected, time.time())
+            if step_completed:
+                if step_completed == 1:
+                    self.combo_triggered_steps = set()
+                    self.combo_clone_hold = False
+                    self.combo_chidori_triple = False
+                    self.combo_rasengan_triple = False
+                    self.current_video = None
                 target_norm = self._normalize_sign_token(target)
-                if self._signs_match(detected, target):
-                    now = time.time()
-                    if now - self.last_sign_time > self.cooldown:
-                        if self.current_step == 0:
-                            self.sequence_run_start = now
-                            self.combo_triggered_steps = set()
-                            self.combo_clone_hold = False
-                            self.combo_chidori_triple = False
-                            self.combo_rasengan_triple = False
-                            self.current_video = None
-                            if getattr(self, "video_cap", None):
-                                self.video_cap.release()
-                                self.video_cap = None
-                        step_completed = self.current_step + 1
-                        self.current_step += 1
-                        self.last_sign_time = now
-                        self.play_sound("each")
-                        self._record_sign_progress()
-                        if self.game_mode == "challenge":
-                            self._challenge_append_event(
-                                "sign_ok",
-                                step=step_completed,
-                                sign=str(target_norm or target),
-                            )
+                self.play_sound("each")
+                self._record_sign_progress()
+                if self.game_mode == "challenge":
+                    self._challenge_append_event(
+                        "sign_ok",
+                        step=step_completed,
+                        sign=str(target_norm or target),
+                    )
 
-                        # Combo checkpoint triggers: allow first jutsu effect to run while continuing signs.
-                        jutsu_name = self.jutsu_names[self.current_jutsu_idx]
-                        jutsu_data = self.jutsu_list[jutsu_name]
-                        combo_parts = jutsu_data.get("combo_parts", [])
-                        if combo_parts:
-                            if not hasattr(self, "combo_triggered_steps"):
-                                self.combo_triggered_steps = set()
-                            for part in combo_parts:
-                                step_idx = int(part.get("at_step", -1))
-                                if self.current_step == step_idx and step_idx not in self.combo_triggered_steps:
-                                    self.combo_triggered_steps.add(step_idx)
-                                    part_name = part.get("name", jutsu_name)
-                                    part_data = self.jutsu_list.get(part_name, {})
-                                    part_effect = part.get("effect", part_data.get("effect"))
-                                    if part_effect == "clone":
-                                        self.combo_clone_hold = True
-                                    if part_effect == "lightning" and str(part_name).lower() == "chidori":
-                                        self.combo_chidori_triple = True
-                                    if part_effect == "rasengan" and str(part_name).lower() == "rasengan":
-                                        self.combo_rasengan_triple = True
-                                    self.play_sound("complete")
-                                    self._trigger_jutsu_payload(part_name, part_effect)
-
-                        if self.current_step >= len(self.sequence):
-                            self.jutsu_active = True
-                            self.jutsu_start_time = time.time()
-                            self.jutsu_duration = float(jutsu_data.get("duration", 5.0))
-                            self.current_step = 0
-                            clear_time = None
-                            if self.game_mode == "challenge":
-                                clear_time = self.jutsu_start_time - self.challenge_start_time
-                            elif self.sequence_run_start:
-                                clear_time = self.jutsu_start_time - self.sequence_run_start
-                            self.sequence_run_start = None
-
-                            # Award XP (Robust Progression)
-                            seq_len = len(self.jutsu_list[jutsu_name]["sequence"])
-                            bonus = seq_len * 10
-                            total_xp = 50 + bonus # Base 50 + complexity bonus
-                            completion_res = self._record_jutsu_completion(
-                                xp_gain=total_xp,
-                                is_challenge=(self.game_mode == "challenge"),
-                                signs_landed=seq_len,
-                                jutsu_name=jutsu_name,
+                # Combo checkpoint triggers: allow first jutsu effect to run while continuing signs.
+                jutsu_name = self.jutsu_names[self.current_jutsu_idx]
+                jutsu_data = self.jutsu_list[jutsu_name]
+                combo_parts = jutsu_data.get("combo_parts", [])
+                if combo_parts:
+                    if not hasattr(self, "combo_triggered_steps"):
+                        self.combo_triggered_steps = set()
+                    for part in combo_parts:
+                        step_idx = int(part.get("at_step", -1))
+                        if self.current_step == step_idx and step_idx not in self.combo_triggered_steps:
+                            self.combo_triggered_steps.add(step_idx)
+                            part_name = part.get("name", jutsu_name)
+                            part_data = self.jutsu_list.get(part_name, {})
+                            part_effect = part.get("effect", part_data.get("effect"))
+                            if part_effect == "clone":
+                                self.combo_clone_hold = True
+                            if part_effect == "lightning" and str(part_name).lower() == "chidori":
+                                self.combo_chidori_triple = True
+                            if part_effect == "rasengan" and str(part_name).lower() == "rasengan":
+                                self.combo_rasengan_triple = True
+                            self.play_sound("complete")
+                            self._trigger_jutsu_payload(part_name, part_effect)
+
+                if self.current_step >= len(self.sequence):
+                    self.jutsu_active = True
+                    self.jutsu_start_time = time.time()
+                    self.jutsu_duration = float(jutsu_data.get("duration", 5.0))
+                    self.current_step = 0
+                    clear_time = None
+                    if self.game_mode == "challenge":
+                        clear_time = self.jutsu_start_time - self.challenge_start_time
+                    elif self.sequence_run_start:
+                        clear_time = self.jutsu_start_time - self.sequence_run_start
+                    self.sequence_run_start = None
+
+                    # Award XP (Robust Progression)
+                    seq_len = len(self.jutsu_list[jutsu_name]["sequence"])
+                    bonus = seq_len * 10
+                    total_xp = 50 + bonus # Base 50 + complexity bonus
+                    completion_res = self._record_jutsu_completion(
+                        xp_gain=total_xp,
+                        is_challenge=(self.game_mode == "challenge"),
+                        signs_landed=seq_len,
+                        jutsu_name=jutsu_name,
+                    )
+                    awarded_xp = int(total_xp)
+                    if isinstance(completion_res, dict) and completion_res.get("ok", False):
+                        self._warned_authoritative_progression_unavailable = False
+                        awarded_xp = int(completion_res.get("xp_awarded", total_xp) or 0)
+                        prev_level = int(completion_res.get("previous_level", self.progression.level))
+                        is_lv_up = bool(completion_res.get("leveled_up", False))
+
+                        if is_lv_up:
+                            self._queue_post_effect_alert(
+                                "level_up",
+                                {"previous_level": prev_level, "source_label": "Jutsu Clear"},
+                                min_delay_s=0.55,
+                            )
+                        else:
+                            self._queue_post_effect_alert(
+                                "unlocks",
+                                {"previous_level": prev_level},
+                                min_delay_s=0.55,
                             )
-                            awarded_xp = int(total_xp)
-                            if isinstance(completion_res, dict) and completion_res.get("ok", False):
-                                self._warned_authoritative_progression_unavailable = False
-                                awarded_xp = int(completion_res.get("xp_awarded", total_xp) or 0)
-                                prev_level = int(completion_res.get("previous_level", self.progression.level))
-                                is_lv_up = bool(completion_res.get("leveled_up", False))
-
-                                if is_lv_up:
-                                    self._queue_post_effect_alert(
-                                        "level_up",
-                                        {"previous_level": prev_level, "source_label": "Jutsu Clear"},
-                                        min_delay_s=0.55,
-                                    )
-                                else:
-                                    self._queue_post_effect_alert(
-                                        "unlocks",
-                                        {"previous_level": prev_level},
-                                        min_delay_s=0.55,
-                                    )
-
-                                # Add XP popup (Centered on Camera feed)
-                                self.xp_popups.append({
-                                    "text": f"+{awarded_xp} XP",
-                                    "x": cam_x + new_w // 2,
-                                    "y": cam_y + new_h // 2,
-                                    "timer": 2.0,
-                                    "color": COLORS["accent"]
-                                })
-                                if is_lv_up:
-                                    self.xp_popups.append({
-                                        "text": f"RANK UP: {self.progression.rank}!",
-                                        "x": cam_x + new_w // 2,
-                                        "y": cam_y + new_h // 2 + 40,
-                                        "timer": 3.0,
-                                        "color": COLORS["success"]
-                                    })
-                            elif self.username != "Guest":
-                                reason = "progression_unavailable"
-                                if isinstance(completion_res, dict):
-                                    reason = str(completion_res.get("reason", reason))
-                                if not getattr(self, "_warned_authoritative_progression_unavailable", False):
-                                    self.show_alert("Progression Sync", f"XP not awarded: {reason}")
-                                    self._warned_authoritative_progression_unavailable = True
-
-                            # STOP TIMER if in challenge
-                            if self.game_mode == "challenge":
-                                self.challenge_final_time = self.jutsu_start_time - self.challenge_start_time
-                                self._challenge_append_event(
-                                    "run_finish",
-                                    final_time=round(float(self.challenge_final_time), 4),
-                                    jutsu=str(jutsu_name).upper(),
-                                )
-
-                            mastery_info = self._record_mastery_completion(jutsu_name, clear_time)
-                            if isinstance(mastery_info, dict) and mastery_info.get("improved", False):
-                                self._queue_post_effect_alert(
-                                    "mastery",
-                                    {"jutsu_name": jutsu_name, "mastery_info": mastery_info},
-                                    min_delay_s=0.7,
-                                )
-
-                            # For normal jutsu, fire completion payload here.
-                            # Combo jutsus trigger payloads at configured checkpoints.
-                            if not combo_parts:
-                                self.play_sound("complete")
-                                self._trigger_jutsu_payload(jutsu_name, jutsu_data.get("effect"))
-                            else:
-                                self.combo_triggered_steps = set()
+
+                        # Add XP popup (Centered on Camera feed)
+                        self.xp_popups.append({
+                            "text": f"+{awarded_xp} XP",
+                            "x": cam_x + new_w // 2,
+                            "y": cam_y + new_h // 2,
+                            "timer": 2.0,
+                            "color": COLORS["accent"]
+                        })
+                        if is_lv_up:
+                            self.xp_popups.append({
+                                "text": f"RANK UP: {self.progression.rank}!",
+                                "x": cam_x + new_w // 2,
+                                "y": cam_y + new_h // 2 + 40,
+                                "timer": 3.0,
+                                "color": COLORS["success"]
+                            })
+                    elif self.username != "Guest":
+                        reason = "progression_unavailable"
+                        if isinstance(completion_res, dict):
+                            reason = str(completion_res.get("reason", reason))
+                        if not getattr(self, "_warned_authoritative_progression_unavailable", False):
+                            self.show_alert("Progression Sync", f"XP not awarded: {reason}")
+                            self._warned_authoritative_progression_unavailable = True
+
+                    # STOP TIMER if in challenge
+                    if self.game_mode == "challenge":
+                        self.challenge_final_time = self.jutsu_start_time - self.challenge_start_time
+                        self._challenge_append_event(
+                            "run_finish",
+                            final_time=round(float(self.challenge_final_time), 4),
+                            jutsu=str(jutsu_name).upper(),
+                        )
+
+                    mastery_info = self._record_mastery_completion(jutsu_name, clear_time)
+                    if isinstance(mastery_info, dict) and mastery_info.get("improved", False):
+                        self._queue_post_effect_alert(
+                            "mastery",
+                            {"jutsu_name": jutsu_name, "mastery_info": mastery_info},
+                            min_delay_s=0.7,
+                        )
+
+                    # For normal jutsu, fire completion payload here.
+                    # Combo jutsus trigger payloads at configured checkpoints.
+                    if not combo_parts:
+                        self.play_sound("complete")
+                        self._trigger_jutsu_payload(jutsu_name, jutsu_data.get("effect"))
+                    else:
+                        self.combo_triggered_steps = set()
         
         # (Camera dimensions already calculated at the top)
         
@@ -767,29 +795,31 @@ class PlayingMixin:
             if hasattr(self.fire_particles, "set_aim"):
                 self.fire_particles.set_aim(yaw=aim_yaw, pitch=aim_pitch)
             self.fire_particles.wind_x = aim_yaw * 210.0
-        self.fire_particles.update(dt)
-        self._update_phoenix_fireballs(dt, cam_x, cam_y, new_w, new_h, mouth_screen)
-        self.effect_orchestrator.update(
-            EffectContext(
-                dt=dt,
-                frame_bgr=frame,
-                frame_shape=frame.shape,
-                hand_pos=effect_hand_pos,
-                mouth_pos=self.mouth_pos,
-                left_eye_pos=self.left_eye_pos,
-                right_eye_pos=self.right_eye_pos,
-                left_eye_size=self.left_eye_size,
-                right_eye_size=self.right_eye_size,
-                left_eye_angle=self.left_eye_angle,
-                right_eye_angle=self.right_eye_angle,
-                head_yaw=float(getattr(self, "head_yaw", 0.0) or 0.0),
-                head_pitch=float(getattr(self, "head_pitch", 0.0) or 0.0),
-                cam_x=cam_x,
-                cam_y=cam_y,
-                scale_x=(new_w / max(1, frame_w)),
-                scale_y=(new_h / max(1, frame_h)),
+        with self.profiler.stage("effects_update"):
+            with self.effect_orchestrator.measure("fire"):
+                self.fire_particles.update(dt)
+                self._update_phoenix_fireballs(dt, cam_x, cam_y, new_w, new_h, mouth_screen)
+            self.effect_orchestrator.update(
+                EffectContext(
+                    dt=dt,
+                    frame_bgr=frame,
+                    frame_shape=frame.shape,
+                    hand_pos=effect_hand_pos,
+                    mouth_pos=self.mouth_pos,
+                    left_eye_pos=self.left_eye_pos,
+                    right_eye_pos=self.right_eye_pos,
+                    left_eye_size=self.left_eye_size,
+                    right_eye_size=self.right_eye_size,
+                    left_eye_angle=self.left_eye_angle,
+                    right_eye_angle=self.right_eye_angle,
+                    head_yaw=float(getattr(self, "head_yaw", 0.0) or 0.0),
+                    head_pitch=float(getattr(self, "head_pitch", 0.0) or 0.0),
+                    cam_x=cam_x,
+                    cam_y=cam_y,
+                    scale_x=(new_w / max(1, frame_w)),
+                    scale_y=(new_h / max(1, frame_h)),
+                )
             )
-        )
         
         # Check jutsu duration
         if self.jutsu_active:
@@ -807,9 +837,6 @@ class PlayingMixin:
                 self.combo_chidori_triple = False
                 self.combo_rasengan_triple = False
                 self.current_video = None
-                if self.video_cap:
-                    self.video_cap.release()
-                    self.video_cap = None
                 
                 # Check for results transition
                 if self.game_mode == "challenge":
@@ -819,18 +846,24 @@ class PlayingMixin:
         self._dispatch_post_effect_alerts()
 
         # Convert and display frame with alpha blending for dimming
-        if self.game_mode == "challenge" and self.challenge_state in ["waiting", "countdown", "results"]:
+        camera_dimmed = self.game_mode == "challenge" and self.challenge_state in ["waiting", "countdown", "results"]
+        if camera_dimmed:
             # Dim the camera frame
             frame = (frame.astype(np.float32) * 0.4).astype(np.uint8)
             
-        cam_surface = self.cv2_to_pygame(frame)
-        cam_surface = pygame.transform.smoothscale(cam_surface, (new_w, new_h))
-        
-        # UI Frame for camera feed
-        pygame.draw.rect(self.screen, (30, 30, 40), (cam_x - 6, cam_y - 6, new_w + 12, new_h + 12), border_radius=14)
-        pygame.draw.rect(self.screen, COLORS["border"], (cam_x - 6, cam_y - 6, new_w + 12, new_h + 12), 2, border_radius=14)
-        
-        self.screen.blit(cam_surface, (cam_x, cam_y))
+        with self.profiler.stage("camera_blit"):
+            # Convert and rescale once per camera frame (hand skeletons may be drawn onto it later).
+            surface_key = (frame_seq, self.pacer.runs(LANE_HANDS), new_w, new_h, camera_dimmed)
+            if surface_key != self._camera_surface_key:
+                self._camera_surface = pygame.transform.smoothscale(self.cv2_to_pygame(frame), (new_w, new_h))
+                self._camera_surface_key = surface_key
+            cam_surface = self._camera_surface
+            
+            # UI Frame for camera feed
+            pygame.draw.rect(self.screen, (30, 30, 40), (cam_x - 6, cam_y - 6, new_w + 12, new_h + 12), border_radius=14)
+            pygame.draw.rect(self.screen, COLORS["border"], (cam_x - 6, cam_y - 6, new_w + 12, new_h + 12), 2, border_radius=14)
+            
+            self.screen.blit(cam_surface, (cam_x, cam_y))
 
         # ── "Show both hands" + live 2-hand distance overlay ───────────────────
         use_mp = bool(self.settings.get("use_mediapipe_signs", False))
@@ -847,27 +880,14 @@ class PlayingMixin:
 
                 one_hand_secs = time.time() - self._no_hands_since
                 if one_hand_secs >= 2.0:
-                    # ── load + cache image at canvas size ──────────────────────
-                    need_reload = (
-                        not hasattr(self, "_hands_layout_surf")
-                        or self._hands_layout_surf is None
-                        or getattr(self, "_hands_layout_size", None) != (new_w, new_h)
-                    )
-                    if need_reload:
-                        import os
-                        _this_dir = os.path.dirname(os.path.abspath(__file__))
-                        _project_root = os.path.normpath(os.path.join(_this_dir, "..", "..", ".."))
-                        img_path = os.path.join(_project_root, "src", "pics", "hands_layout.png")
-                        try:
-                            raw = pygame.image.load(img_path).convert_alpha()
-                            self._hands_layout_surf = pygame.transform.smoothscale(raw, (new_w, new_h))
-                        except Exception:
-                            self._hands_layout_surf = None
-                        self._hands_layout_size = (new_w, new_h)
+                    # ── guide image at canvas size (preloaded, scaled once per size) ──
+                    hands_layout = None
+                    if self.hands_layout_path is not None:
+                        hands_layout = self.assets.scaled(self.hands_layout_path, (new_w, new_h), block=False)
 
                     # overlay image — no tint, just the guide at ~70 % opacity
-                    if self._hands_layout_surf:
-                        img_surf = self._hands_layout_surf.copy()
+                    if hands_layout:
+                        img_surf = hands_layout.copy()
                         img_surf.set_alpha(178)
                         self.screen.blit(img_surf, (cam_x, cam_y))
 
@@ -972,31 +992,35 @@ class PlayingMixin:
 
         
         # Fire particles
-        self.fire_particles.render(self.screen)
-        self._render_phoenix_fireballs()
-        self.effect_orchestrator.render(
-            self.screen,
-            EffectContext(
-                frame_bgr=frame,
-                frame_shape=frame.shape,
-                hand_pos=effect_hand_pos,
-                mouth_pos=self.mouth_pos,
-                left_eye_pos=self.left_eye_pos,
-                right_eye_pos=self.right_eye_pos,
-                left_eye_size=self.left_eye_size,
-                right_eye_size=self.right_eye_size,
-                left_eye_angle=self.left_eye_angle,
-                right_eye_angle=self.right_eye_angle,
-                head_yaw=float(getattr(self, "head_yaw", 0.0) or 0.0),
-                head_pitch=float(getattr(self, "head_pitch", 0.0) or 0.0),
-                cam_x=cam_x,
-                cam_y=cam_y,
-                scale_x=(new_w / max(1, frame_w)),
-                scale_y=(new_h / max(1, frame_h)),
-                font=self.fonts["tiny"],
-                debug=self.settings.get("debug_hands", False),
-            ),
-        )
+        with self.profiler.stage("effects_render"):
+            # Particle blits go into the orchestrator's frame queue and flush with the effects.
+            render_queue = self.effect_orchestrator.render_queue
+            with self.effect_orchestrator.measure("fire"):
+                self.fire_particles.render(self.screen, queue=render_queue)
+                self._render_phoenix_fireballs(queue=render_queue)
+            self.effect_orchestrator.render(
+                self.screen,
+                EffectContext(
+                    frame_bgr=frame,
+                    frame_shape=frame.shape,
+                    hand_pos=effect_hand_pos,
+                    mouth_pos=self.mouth_pos,
+                    left_eye_pos=self.left_eye_pos,
+                    right_eye_pos=self.right_eye_pos,
+                    left_eye_size=self.left_eye_size,
+                    right_eye_size=self.right_eye_size,
+                    left_eye_angle=self.left_eye_angle,
+                    right_eye_angle=self.right_eye_angle,
+                    head_yaw=float(getattr(self, "head_yaw", 0.0) or 0.0),
+                    head_pitch=float(getattr(self, "head_pitch", 0.0) or 0.0),
+                    cam_x=cam_x,
+                    cam_y=cam_y,
+                    scale_x=(new_w / max(1, frame_w)),
+                    scale_y=(new_h / max(1, frame_h)),
+                    font=self.fonts["tiny"],
+                    debug=self.settings.get("debug_hands", False),
+                ),
+            )
         
         # Timer Display (Challenge Mode Active) - Draw on top of frame but under results
         if self.game_mode == "challenge" and self.challenge_state == "active":
@@ -1018,8 +1042,8 @@ class PlayingMixin:
             self.screen.blit(t_txt, (cam_x + 27, cam_y + 21))
 
         # --- Static Sign Prediction Label (Fixed Top-Right) ---
-        if detected and str(detected).lower() != "idle":
-            pred_txt = self.fonts["body"].render(f"SIGN: {detected.upper()}", True, (255, 255, 255))
+        if shown_sign and str(shown_sign).lower() != "idle":
+            pred_txt = self.fonts["body"].render(f"SIGN: {shown_sign.upper()}", True, (255, 255, 255))
             tw, th = pred_txt.get_size()
             
             # Label Panel (Top Right of cam)
@@ -1040,7 +1064,7 @@ class PlayingMixin:
         mp_error = str(getattr(self, "hand_detector_error", "") or "")
         light_color = COLORS["success"] if lighting_ok else COLORS["error"]
         light_text = self.lighting_status.replace("_", " ").upper()
-        vote_text = f"VOTE {self.last_vote_hits}/{self.vote_window_size}"
+        vote_text = f"VOTE {self.last_vote_hits}/{self.vote_window_size} NEED {self.vote_required_hits}"
         if self.calibration_active:
             progress = int(
                 self._clamp(
@@ -1077,6 +1101,11 @@ class PlayingMixin:
                 info_lines.append(f"MP ERR: {mp_error[:46]}")
         if self.calibration_message and time.time() <= self.calibration_message_until:
             info_lines.append(self.calibration_message.upper())
+        landmark_recorder = getattr(self, "landmark_recorder", None)
+        if landmark_recorder is not None and landmark_recorder.active:
+            info_lines.append(
+                f"REC: {landmark_recorder.written_frames} FRAMES ({landmark_recorder.dropped_frames} DROPPED)"
+            )
 
         if getattr(self, "show_detection_panel", False):
             info_x = cam_x + 12
@@ -1135,100 +1164,65 @@ class PlayingMixin:
                     ),
                 )
         
-        # Video overlay (for Chidori, Rasengan, etc.)
-        if self.current_video and self.video_cap and self.video_cap.isOpened():
-            ret, vid_frame = self.video_cap.read()
-            if ret:
-                current_video_name = str(self.current_video).lower()
-                if current_video_name == "chidori":
-                    base_size = 620
-                elif current_video_name == "rasengan":
-                    base_size = 520
-                else:
-                    base_size = 560
-                scale_x = (new_w / max(1, frame_w))
-                scale_y = (new_h / max(1, frame_h))
-
-                # Track Hand
-                if effect_hand_pos:
-                    hx, hy = effect_hand_pos
-                    hx = int(hx)
-                    hy = int(hy)
-                    dynamic_scale = float(getattr(self, "hand_effect_scale", 1.0) or 1.0)
-                    size = int(base_size * dynamic_scale)
-                    should_draw_effect = True
+        # Video overlay (for Chidori, Rasengan, etc.), from pre-decoded or streamed feathered frames.
+        if self.current_video and self.video_sprites.is_ready(self.current_video):
+            current_video_name = str(self.current_video).lower()
+            if current_video_name == "chidori":
+                base_size = 620
+            elif current_video_name == "rasengan":
+                base_size = 520
+            else:
+                base_size = 560
+            scale_x = (new_w / max(1, frame_w))
+            scale_y = (new_h / max(1, frame_h))
+
+            # Track Hand
+            if effect_hand_pos:
+                hx, hy = effect_hand_pos
+                hx = int(hx)
+                hy = int(hy)
+                dynamic_scale = float(getattr(self, "hand_effect_scale", 1.0) or 1.0)
+                size = int(base_size * dynamic_scale)
+                should_draw_effect = True
+            else:
+                # No hand: hide effect until tracking returns.
+                should_draw_effect = False
+
+            vid_surface = self.video_sprites.sprite(self.current_video, size) if should_draw_effect else None
+            if vid_surface is not None:
+                dw, dh = vid_surface.get_size()
+
+                # Blit centered on hand with additive blending.
+                if (
+                    (getattr(self, "combo_chidori_triple", False) and current_video_name == "chidori")
+                    or
+                    (getattr(self, "combo_rasengan_triple", False) and current_video_name == "rasengan")
+                ):
+                    clone_dx_screen = 0
+                    clone_effect = self.effect_orchestrator.effects.get("clone")
+                    if clone_effect is not None:
+                        clone_dx_screen = int(max(0.0, float(getattr(clone_effect, "current_dx_px", 0.0))) * scale_x)
+                        if clone_dx_screen <= 0:
+                            clone_dx_ratio = float(getattr(clone_effect, "clone_dx_ratio", 0.28))
+                            clone_dx_screen = int(max(0.0, clone_dx_ratio) * new_w)
+                    if clone_dx_screen <= 0:
+                        clone_dx_screen = int(new_w * 0.28)
+                    offsets = [(-clone_dx_screen, 0), (0, 0), (clone_dx_screen, 0)]
                 else:
-                    # No hand: hide effect until tracking returns.
-                    should_draw_effect = False
+                    offsets = [(0, 0)]
+                # Hand anchors are in camera-frame coordinates; project them to screen-space.
+                hand_screen_x = cam_x + int(hx * scale_x)
+                hand_screen_y = cam_y + int(hy * scale_y)
+                for ox, oy in offsets:
+                    self.screen.blit(
+                        vid_surface,
+                        (hand_screen_x - dw // 2 + ox, hand_screen_y - dh // 2 + oy),
+                        special_flags=pygame.BLEND_RGB_ADD,
+                    )
 
-                if should_draw_effect:
-                    size = max(320, min(920, size))
-                
-                    # Calculate aspect ratio to avoid stretching
-                    v_h, v_w = vid_frame.shape[:2]
-                    aspect = v_w / v_h
-                    
-                    if aspect > 1: # Landscape
-                        dw, dh = size, int(size / aspect)
-                    else: # Portrait/Square
-                        dw, dh = int(size * aspect), size
-                    
-                    # Resize video (Maintaining aspect ratio)
-                    vid_frame = cv2.resize(vid_frame, (dw, dh))
-                    
-                    # Apply Radial Feathering (Removes hard square edges from video frame)
-                    # Create coordinate grids
-                    Y, X = np.ogrid[:dh, :dw]
-                    center_x, center_y = dw // 2, dh // 2
-                    # Normalized elliptical distance (0.0 at center, 1.0 at edges)
-                    dist = np.sqrt(((X - center_x) / (dw / 2))**2 + ((Y - center_y) / (dh / 2))**2)
-                    # Soft fade starting at 65% of the radius
-                    mask = np.clip(1.0 - (dist - 0.65) / 0.35, 0, 1)
-                    mask = (mask ** 1.5).astype(np.float32) # Smooth falloff
-                    # Apply mask to RGB values
-                    vid_frame = (vid_frame.astype(np.float32) * mask[:, :, np.newaxis]).astype(np.uint8)
-                    
-                    vid_frame = cv2.cvtColor(vid_frame, cv2.COLOR_BGR2RGB)
-                    vid_frame = np.rot90(vid_frame)
-                    vid_frame = np.flipud(vid_frame)
-                    vid_surface = pygame.surfarray.make_surface(vid_frame)
-
-                    # Blit centered on hand with additive blending.
-                    if (
-                        (getattr(self, "combo_chidori_triple", False) and current_video_name == "chidori")
-                        or
-                        (getattr(self, "combo_rasengan_triple", False) and current_video_name == "rasengan")
-                    ):
-                        clone_dx_screen = 0
-                        clone_effect = self.effect_orchestrator.effects.get("clone")
-                        if clone_effect is not None:
-                            clone_dx_screen = int(max(0.0, float(getattr(clone_effect, "current_dx_px", 0.0))) * scale_x)
-                            if clone_dx_screen <= 0:
-                                clone_dx_ratio = float(getattr(clone_effect, "clone_dx_ratio", 0.28))
-                                clone_dx_screen = int(max(0.0, clone_dx_ratio) * new_w)
-                        if clone_dx_screen <= 0:
-                            clone_dx_screen = int(new_w * 0.28)
-                        offsets = [(-clone_dx_screen, 0), (0, 0), (clone_dx_screen, 0)]
-                    else:
-                        offsets = [(0, 0)]
-                    # Hand anchors are in camera-frame coordinates; project them to screen-space.
-                    hand_screen_x = cam_x + int(hx * scale_x)
-                    hand_screen_y = cam_y + int(hy * scale_y)
-                    for ox, oy in offsets:
-                        self.screen.blit(
-                            vid_surface,
-                            (hand_screen_x - dw // 2 + ox, hand_screen_y - dh // 2 + oy),
-                            special_flags=pygame.BLEND_RGB_ADD,
-                        )
-            else:
-                # Video ended, loop it
-                self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-        
         # Progression HUD (MMO Style Top Bar)
         hud_h = 45
-        hud_bg = pygame.Surface((SCREEN_WIDTH, hud_h), pygame.SRCALPHA)
-        hud_bg.fill((20, 20, 25, 230))
-        self.screen.blit(hud_bg, (0, 0))
+        self.screen.blit(self.ui_layers.solid((SCREEN_WIDTH, hud_h), (20, 20, 25, 230)), (0, 0))
         pygame.draw.line(self.screen, COLORS["border"], (0, hud_h), (SCREEN_WIDTH, hud_h), 1)
 
         # Level Badge
@@ -1270,7 +1264,8 @@ class PlayingMixin:
             # Fade out
             alpha = int(min(255, popup["timer"] * 255))
             
-            p_surf = self.fonts["title_sm"].render(popup["text"], True, popup["color"])
+            # Copy: rendered text is shared through the text cache.
+            p_surf = self.fonts["title_sm"].render(popup["text"], True, popup["color"]).copy()
             p_surf.set_alpha(alpha)
             self.screen.blit(p_surf, p_surf.get_rect(center=(popup["x"], popup["y"])))
 
@@ -1459,9 +1454,7 @@ class PlayingMixin:
         display_time = new_best * ease
 
         # ── Dim whole screen ───────────────────────────────────────────────────
-        dim = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        dim.fill((0, 0, 0, 170))
-        self.screen.blit(dim, (0, 0))
+        self._blit_dim((0, 0, 0, 170))
 
         # ── Card geometry ──────────────────────────────────────────────────────
         CW, CH = min(cam_w - 20, 440), min(cam_h - 40, 420)
@@ -1656,9 +1649,7 @@ class PlayingMixin:
         disp_lv = prev_lv + (new_lv - prev_lv) * ease   # counts up
 
         # ── Full-screen dim (drawn last in render_playing, so it covers HUD) ──
-        dim = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        dim.fill((0, 0, 0, 190))
-        self.screen.blit(dim, (0, 0))
+        self._blit_dim((0, 0, 0, 190))
 
         # ── Card ──────────────────────────────────────────────────────────────
         CW = min(460, SCREEN_WIDTH - 80)
@@ -1779,6 +1770,86 @@ class PlayingMixin:
 
         self._level_up_cont_rect = cont_rect
         return True
+
+    def _render_profiler_overlay(self):
+        """Per-stage timing overlay (F3). Bars show p95, the tick marks mean."""
+        summary = self.profiler.summary()
+        if not summary:
+            return
+
+        font = self.fonts["tiny"]
+        row_h = 16
+        panel_w = 340
+        panel_h = 30 + (len(summary) + 3) * row_h
+        panel_x = SCREEN_WIDTH - panel_w - 12
+        panel_y = 60
+        budget_ms = 1000.0 / max(1, self.pacer.ui_fps())
+
+        panel = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
+        pygame.draw.rect(panel, (12, 12, 20, 200), (0, 0, panel_w, panel_h), border_radius=8)
+        pygame.draw.rect(panel, (90, 90, 130, 200), (0, 0, panel_w, panel_h), 1, border_radius=8)
+        self.screen.blit(panel, (panel_x, panel_y))
+
+        header = font.render("STAGE      MEAN   P95  (F4 DUMP)", True, COLORS["text_dim"])
+        self.screen.blit(header, (panel_x + 10, panel_y + 8))
+
+        bar_x = panel_x + 186
+        bar_w = panel_w - 196
+        y = panel_y + 26
+        for name, row in summary.items():
+            color = COLORS["success"]
+            if row["p95_ms"] > budget_ms * 0.5:
+                color = COLORS["error"]
+            elif row["p95_ms"] > budget_ms * 0.25:
+                color = COLORS["accent"]
+            label = font.render(f"{name[:10]:<10} {row['mean_ms']:5.1f} {row['p95_ms']:5.1f}", True, COLORS["text"])
+            self.screen.blit(label, (panel_x + 10, y))
+            fill = int(bar_w * min(1.0, row["p95_ms"] / budget_ms))
+            pygame.draw.rect(self.screen, (40, 40, 55), (bar_x, y + 3, bar_w, row_h - 7))
+            if fill > 0:
+                pygame.draw.rect(self.screen, color, (bar_x, y + 3, fill, row_h - 7))
+            mean_x = bar_x + int(bar_w * min(1.0, row["mean_ms"] / budget_ms))
+            pygame.draw.line(self.screen, (255, 255, 255), (mean_x, y + 1), (mean_x, y + row_h - 3))
+            y += row_h
+
+        text_stats = get_text_cache().stats()
+        label = font.render(
+            f"text cache {text_stats['hit_rate'] * 100:5.1f}% hit  {text_stats['entries']} / {text_stats['mb']:.1f} MB",
+            True,
+            COLORS["text_dim"],
+        )
+        self.screen.blit(label, (panel_x + 10, y))
+
+        # Frame pacing: target -> measured rate per lane (segmentation is throttled in the service).
+        pacing = self.pacer.stats()
+        lanes = pacing["lanes"]
+        label = font.render(
+            f"pacing {pacing['preset']} / {pacing['phase']}  deferred {pacing['deferred']}",
+            True,
+            COLORS["text_dim"],
+        )
+        self.screen.blit(label, (panel_x + 10, y + row_h))
+        rates = "  ".join(
+            f"{short} {lanes[lane]['target']}>{lanes[lane]['measured']:.0f}"
+            for short, lane in (("ui", "ui"), ("cam", LANE_CAMERA), ("hand", LANE_HANDS), ("face", LANE_FACE))
+        )
+        label = font.render(f"{rates}  seg {lanes[LANE_SEGMENTATION]['target']}", True, COLORS["text_dim"])
+        self.screen.blit(label, (panel_x + 10, y + 2 * row_h))
+
+    def _dump_profiler_report(self):
+        if not self.profiler.stages:
+            return None
+        out_dir = Path.home() / ".jutsu_academy" / "profiles"
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        try:
+            json_path = self.profiler.dump_json(out_dir / f"profile_{stamp}.json")
+            self.profiler.dump_csv(out_dir / f"profile_{stamp}.csv")
+            print(f"[+] Profiler report written: {json_path}")
+            return json_path
+        except Exception as e:
+            print(f"[!] Profiler dump failed: {e}")
+            return None
+
     def _render_icon_bar(self, x, y, bar_w):
         """Render the jutsu sequence icon bar with dynamic scaling."""
         n = len(self.sequence)
@@ -1843,11 +1914,8 @@ class PlayingMixin:
                 pygame.draw.rect(self.screen, COLORS["accent"], (ix - 4, iy - 4, icon_size + 8, icon_size + 8), border_radius=10)
             
             # Icon
-            if sign in self.icons:
-                icon_surf = self.icons[sign]
-                if icon_surf.get_width() != icon_size:
-                    icon_surf = pygame.transform.smoothscale(icon_surf, (icon_size, icon_size))
-                
+            icon_surf = self._sign_icon(sign, icon_size)
+            if icon_surf is not None:
                 icon = icon_surf.copy()
                 if self.jutsu_active and i < progress_step:
                     warm = pygame.Surface((icon_size, icon_size), pygame.SRCALPHA)
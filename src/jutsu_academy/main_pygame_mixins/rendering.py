@@ -36,7 +36,7 @@ class RenderingMixin:
             self._dynamic_font_cache = cache
         key = int(px_size)
         if key not in cache:
-            cache[key] = pygame.font.Font(None, key)
+            cache[key] = cached_font(None, key)
         return cache[key]
 
     def _wrap_text_to_width(self, font, text, max_width):
@@ -72,50 +72,86 @@ class RenderingMixin:
         return font, lines[: max_lines - 1] + [" ".join(lines[max_lines - 1 :])]
 
     def _get_jutsu_card_texture_surface(self, jutsu_name, width, height, radius=10):
-        textures = getattr(self, "jutsu_card_textures", {})
-        if not isinstance(textures, dict):
-            return None
-        base = textures.get(jutsu_name)
-        if base is None:
+        path = getattr(self, "jutsu_card_texture_paths", {}).get(jutsu_name)
+        if path is None:
             return None
+        # Cover-scaled, centre-cropped; None while the background preload is still decoding it.
+        return self.assets.scaled(path, (int(width), int(height)), fit=FIT_COVER, block=False)
+
+    def _blit_backdrop(self, overlay_rgba):
+        """Background image (or bg_dark) under a full-screen dimmer, composited once per size."""
+        size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        bg = self.bg_image if getattr(self, "bg_image", None) else None
+        overlay_rgba = tuple(overlay_rgba)
+
+        def build():
+            surf = pygame.Surface(size).convert()
+            if bg is not None:
+                surf.blit(bg, (0, 0))
+            else:
+                surf.fill(COLORS["bg_dark"])
+            surf.blit(self.ui_layers.solid(size, overlay_rgba), (0, 0))
+            return surf
 
-        cache = getattr(self, "jutsu_card_texture_cache", None)
-        if cache is None:
-            cache = {}
-            self.jutsu_card_texture_cache = cache
-
-        key = (str(jutsu_name), int(width), int(height), int(radius))
-        cached = cache.get(key)
-        if cached is not None:
-            return cached
-
-        try:
-            orig_w, orig_h = base.get_size()
-            scale = max(width / orig_w, height / orig_h)
-            new_w = int(math.ceil(orig_w * scale))
-            new_h = int(math.ceil(orig_h * scale))
-            scaled = pygame.transform.smoothscale(base, (new_w, new_h))
-            
-            # Center crop
-            x_offset = max(0, (new_w - width) // 2)
-            y_offset = max(0, (new_h - height) // 2)
-            tex = scaled.subsurface(pygame.Rect(x_offset, y_offset, width, height)).copy().convert_alpha()
-            
-            cache[key] = tex
-            return tex
-        except Exception:
-            return None
+        self.screen.blit(self.ui_layers.get("backdrop", size, build, (bg, overlay_rgba)), (0, 0))
+
+    def _blit_dim(self, rgba):
+        self.screen.blit(self.ui_layers.solid((SCREEN_WIDTH, SCREEN_HEIGHT), rgba), (0, 0))
+
+    def _menu_static_layer(self):
+        size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        bg = self.bg_image if self.bg_image else None
+        logo = self.logo if self.logo else None
+
+        def build():
+            surf = pygame.Surface(size).convert()
+            if bg is not None:
+                surf.blit(bg, (0, 0))
+            else:
+                surf.fill(COLORS["bg_dark"])
+
+            # Subtle gradient overlay for better text contrast
+            # Top gradient (darker)
+            top_grad = pygame.Surface((SCREEN_WIDTH, 200), pygame.SRCALPHA)
+            for y in range(200):
+                alpha = int(180 * (1 - y/200))
+                pygame.draw.line(top_grad, (0, 0, 0, alpha), (0, y), (SCREEN_WIDTH, y))
+            surf.blit(top_grad, (0, 0))
+
+            # Bottom gradient (darker)
+            bot_grad = pygame.Surface((SCREEN_WIDTH, 150), pygame.SRCALPHA)
+            for y in range(150):
+                alpha = int(200 * (y/150))
+                pygame.draw.line(bot_grad, (0, 0, 0, alpha), (0, y), (SCREEN_WIDTH, y))
+            surf.blit(bot_grad, (0, SCREEN_HEIGHT - 150))
+
+            # General darkening
+            surf.blit(self.ui_layers.solid(size, (0, 0, 0, 80)), (0, 0))
+
+            # Hero Section (Logo & Subtitle)
+            if logo is not None:
+                logo_rect = logo.get_rect(center=(SCREEN_WIDTH // 2, 160))
+                # Subtle shadow for logo
+                shadow_surf = pygame.transform.scale(logo, (logo_rect.width + 10, logo_rect.height + 10))
+                shadow_surf.fill((0, 0, 0, 100), special_flags=pygame.BLEND_RGBA_MULT)
+                surf.blit(shadow_surf, (logo_rect.x - 5, logo_rect.y + 5))
+                surf.blit(logo, logo_rect)
+            else:
+                title = self.fonts["title_lg"].render("JUTSU ACADEMY", True, COLORS["accent"])
+                surf.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 150)))
+
+            # Subtitle - with shadow effect
+            sub_shadow = self.fonts["body"].render("TRAIN • MASTER • RANK UP", True, (0, 0, 0))
+            surf.blit(sub_shadow, sub_shadow.get_rect(center=(SCREEN_WIDTH // 2 + 2, 332)))
+            subtitle = self.fonts["body"].render("TRAIN • MASTER • RANK UP", True, COLORS["accent_glow"])
+            surf.blit(subtitle, subtitle.get_rect(center=(SCREEN_WIDTH // 2, 330)))
+            return surf
+
+        return self.ui_layers.get("menu_static", size, build, (bg, logo))
 
     def render_maintenance_required(self):
         """Render hard-blocking maintenance gate when service is unavailable."""
-        if self.bg_image:
-            self.screen.blit(self.bg_image, (0, 0))
-        else:
-            self.screen.fill(COLORS["bg_dark"])
-
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 220))
-        self.screen.blit(overlay, (0, 0))
+        self._blit_backdrop((0, 0, 0, 220))
 
         card_w, card_h = 720, 430
         card_x = (SCREEN_WIDTH - card_w) // 2
@@ -181,14 +217,7 @@ class RenderingMixin:
 
     def render_update_required(self):
         """Render hard-blocking update gate when client version is outdated."""
-        if self.bg_image:
-            self.screen.blit(self.bg_image, (0, 0))
-        else:
-            self.screen.fill(COLORS["bg_dark"])
-
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 220))
-        self.screen.blit(overlay, (0, 0))
+        self._blit_backdrop((0, 0, 0, 220))
 
         card_w, card_h = 720, 430
         card_x = (SCREEN_WIDTH - card_w) // 2
@@ -259,56 +288,11 @@ class RenderingMixin:
 
     def render_menu(self):
         """Render main menu with cleaner, game-like aesthetic."""
-        # 1. Background & Overlay
-        if self.bg_image:
-            self.screen.blit(self.bg_image, (0, 0))
-        else:
-            self.screen.fill(COLORS["bg_dark"])
-            
+        # 1-2. Background, gradients, logo and subtitle never change between frames: one cached blit.
+        self.screen.blit(self._menu_static_layer(), (0, 0))
+
         any_hovered = False
-        
-        # Subtle gradient overlay for better text contrast
-        # Top gradient (darker)
-        top_grad = pygame.Surface((SCREEN_WIDTH, 200), pygame.SRCALPHA)
-        for y in range(200):
-            alpha = int(180 * (1 - y/200))
-            pygame.draw.line(top_grad, (0, 0, 0, alpha), (0, y), (SCREEN_WIDTH, y))
-        self.screen.blit(top_grad, (0, 0))
-        
-        # Bottom gradient (darker)
-        bot_grad = pygame.Surface((SCREEN_WIDTH, 150), pygame.SRCALPHA)
-        for y in range(150):
-            alpha = int(200 * (y/150))
-            pygame.draw.line(bot_grad, (0, 0, 0, alpha), (0, y), (SCREEN_WIDTH, y))
-        self.screen.blit(bot_grad, (0, SCREEN_HEIGHT - 150))
-        
-        # General darkening
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 80))
-        self.screen.blit(overlay, (0, 0))
-        
-        # 2. Hero Section (Logo & Subtitle)
-        if self.logo:
-            logo_rect = self.logo.get_rect(center=(SCREEN_WIDTH // 2, 160))
-            # Subtle shadow for logo
-            shadow_surf = pygame.transform.scale(self.logo, (logo_rect.width + 10, logo_rect.height + 10))
-            shadow_surf.fill((0, 0, 0, 100), special_flags=pygame.BLEND_RGBA_MULT)
-            self.screen.blit(shadow_surf, (logo_rect.x - 5, logo_rect.y + 5))
-            self.screen.blit(self.logo, logo_rect)
-        else:
-            title = self.fonts["title_lg"].render("JUTSU ACADEMY", True, COLORS["accent"])
-            title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 150))
-            self.screen.blit(title, title_rect)
-        
-        # Subtitle - with shadow effect
-        # Shadow
-        sub_shadow = self.fonts["body"].render("TRAIN • MASTER • RANK UP", True, (0, 0, 0))
-        self.screen.blit(sub_shadow, sub_shadow.get_rect(center=(SCREEN_WIDTH // 2 + 2, 332)))
-        # Main text
-        subtitle = self.fonts["body"].render("TRAIN • MASTER • RANK UP", True, COLORS["accent_glow"])
-        sub_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, 330))
-        self.screen.blit(subtitle, sub_rect)
-        
+
         # Buttons - update hover status for cursor
         any_button_hovered = False
         for btn in self.menu_buttons.values():
@@ -338,10 +322,10 @@ class RenderingMixin:
                 icon = self.social_icons[icon_name]
                 if is_hovered:
                     # Glow/Scale
-                    scaled = pygame.transform.smoothscale(icon, (36, 36))
+                    scaled = self.ui_layers.get("social_icon", (36, 36), lambda: pygame.transform.smoothscale(icon, (36, 36)), (icon,))
                     self.screen.blit(scaled, (x+2, social_y+2))
                 else:
-                    icon_sm = pygame.transform.smoothscale(icon, (32, 32))
+                    icon_sm = self.ui_layers.get("social_icon", (32, 32), lambda: pygame.transform.smoothscale(icon, (32, 32)), (icon,))
                     self.screen.blit(icon_sm, (x+4, social_y+4))
             
 
@@ -366,7 +350,7 @@ class RenderingMixin:
             icon = self.mute_icons[icon_key]
             if mute_hovered:
                 # brighter/larger
-                scaled = pygame.transform.smoothscale(icon, (36, 36))
+                scaled = self.ui_layers.get("mute_icon", (36, 36), lambda: pygame.transform.smoothscale(icon, (36, 36)), (icon,))
                 self.screen.blit(scaled, (self.mute_button_rect.x + 2, self.mute_button_rect.y + 2))
             else:
                 self.screen.blit(icon, (self.mute_button_rect.x + 4, self.mute_button_rect.y + 4))
@@ -488,9 +472,7 @@ class RenderingMixin:
     def render_login_modal(self):
         """Render the login requirement modal."""
         # 1. Dark overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200)) # Darker than normal overlay
-        self.screen.blit(overlay, (0, 0))
+        self._blit_dim((0, 0, 0, 200)) # Darker than normal overlay
         
         # 2. Modal Box
         modal_w, modal_h = 500, 300
@@ -606,9 +588,7 @@ class RenderingMixin:
     def render_quit_confirm(self):
         """Render the quit confirmation modal."""
         # 1. Dark overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200)) # Darker than normal overlay
-        self.screen.blit(overlay, (0, 0))
+        self._blit_dim((0, 0, 0, 200)) # Darker than normal overlay
         
         # 2. Modal Box
         modal_w, modal_h = 500, 280
@@ -677,9 +657,7 @@ class RenderingMixin:
         self.welcome_modal_timer += dt
         
         # 1. Dark overlay with subtle blur-like darkening
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((10, 10, 15, 230)) # Extra dark blue-ish
-        self.screen.blit(overlay, (0, 0))
+        self._blit_dim((10, 10, 15, 230)) # Extra dark blue-ish
         
         # 2. Modal Dimensions
         modal_w, modal_h = 560, 420
@@ -792,9 +770,7 @@ class RenderingMixin:
     def render_error_modal(self):
         """Render a generic error modal."""
         # 1. Dark overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 220))
-        self.screen.blit(overlay, (0, 0))
+        self._blit_dim((0, 0, 0, 220))
         
         # 2. Modal Box
         modal_w, modal_h = 550, 300
@@ -849,9 +825,7 @@ class RenderingMixin:
     def render_logout_confirm(self):
         """Render the logout confirmation modal."""
         # 1. Dark overlay (darker)
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        self.screen.blit(overlay, (0, 0))
+        self._blit_dim((0, 0, 0, 200))
         
         # 2. Modal Box
         modal_w, modal_h = 500, 280
@@ -918,9 +892,7 @@ class RenderingMixin:
     def render_connection_lost(self):
         """Render the connection lost modal."""
         # 1. Dark overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 220))
-        self.screen.blit(overlay, (0, 0))
+        self._blit_dim((0, 0, 0, 220))
         
         # 2. Modal Box
         modal_w, modal_h = 500, 280
@@ -1063,7 +1035,18 @@ class RenderingMixin:
         preview_title = self.fonts["body"].render("CAMERA PREVIEW", True, COLORS["accent"])
         self.screen.blit(preview_title, (right_rect.x + 14, right_rect.y + 12))
 
-        preview_rect = pygame.Rect(right_rect.x + 14, right_rect.y + 50, right_rect.width - 28, right_rect.height - 100)
+        # Frame pacing preset in the pane header, its per-lane rates under the preview.
+        self.pacing_dropdown.width = min(190, right_rect.width - 230)
+        self.pacing_dropdown.x = right_rect.right - 14 - self.pacing_dropdown.width
+        self.pacing_dropdown.y = right_rect.y + 8
+        self.pacing_dropdown.rect = pygame.Rect(
+            self.pacing_dropdown.x,
+            self.pacing_dropdown.y,
+            self.pacing_dropdown.width,
+            self.pacing_dropdown.height,
+        )
+
+        preview_rect = pygame.Rect(right_rect.x + 14, right_rect.y + 56, right_rect.width - 28, right_rect.height - 124)
         pygame.draw.rect(self.screen, (12, 12, 16), preview_rect, border_radius=10)
         pygame.draw.rect(self.screen, COLORS["border"], preview_rect, 1, border_radius=10)
 
@@ -1097,6 +1080,16 @@ class RenderingMixin:
             no_cam = self.fonts["body_sm"].render(status, True, COLORS["text_dim"])
             self.screen.blit(no_cam, no_cam.get_rect(center=(preview_rect.centerx, preview_rect.centery - 24)))
 
+        rates = self.settings.get("frame_rates") or {}
+        pacing_line = self.fonts["tiny"].render(
+            "Pacing  UI {ui}  Camera {camera}  Hands {hands}  Face {face}  Seg {segmentation} fps".format(
+                **{lane: rates.get(lane, "-") for lane in ("ui", "camera", "hands", "face", "segmentation")}
+            ),
+            True,
+            COLORS["text_dim"],
+        )
+        self.screen.blit(pacing_line, (right_rect.x + 14, right_rect.bottom - 46))
+
         hint = self.fonts["tiny"].render("Camera opens only in Settings preview and in active game.", True, COLORS["text_muted"])
         self.screen.blit(hint, (right_rect.x + 14, right_rect.bottom - 24))
 
@@ -1107,19 +1100,17 @@ class RenderingMixin:
         # Render dropdowns last so their options are always in front
         self.camera_dropdown.render(self.screen)
         self.resolution_dropdown.render(self.screen)
+        self.pacing_dropdown.render(self.screen)
 
     def render_practice_select(self):
         """Render practice mode selection in grouped 'Select Your Path' style."""
         if self.bg_image:
-             bg = pygame.transform.smoothscale(self.bg_image, (SCREEN_WIDTH, SCREEN_HEIGHT))
-             self.screen.blit(bg, (0, 0))
+             self.screen.blit(self._screen_background(), (0, 0))
         else:
              self.screen.fill(COLORS["bg_dark"])
              
         # Overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 210))
-        self.screen.blit(overlay, (0, 0))
+        self._blit_dim((0, 0, 0, 210))
 
         panel_w, panel_h = 740, 680
         panel_x = (SCREEN_WIDTH - panel_w) // 2
@@ -1157,7 +1148,7 @@ class RenderingMixin:
         def draw_mode_card(name, title_text, desc_text, base_color, local_y, h=74):
             btn = self.practice_buttons[name]
             btn.rect = pygame.Rect(content_area.x + 27, content_area.y + local_y - self.practice_scroll_y, content_area.width - 54, h)
-            hovered = btn.rect.collidepoint(mouse_pos) and btn.enabled
+            hovered = self.redraw.hover(btn.rect, mouse_pos) and btn.enabled
             card = pygame.Surface((btn.rect.width, btn.rect.height), pygame.SRCALPHA)
             card.fill((0, 0, 0, 0))
             pygame.draw.rect(card, base_color, card.get_rect(), border_radius=14)
@@ -1223,14 +1214,11 @@ class RenderingMixin:
     def render_calibration_gate(self):
         """Render first-time calibration gate before entering Free Play / Rank Mode."""
         if self.bg_image:
-            bg = pygame.transform.smoothscale(self.bg_image, (SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.screen.blit(bg, (0, 0))
+            self.screen.blit(self._screen_background(), (0, 0))
         else:
             self.screen.fill(COLORS["bg_dark"])
 
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 210))
-        self.screen.blit(overlay, (0, 0))
+        self._blit_dim((0, 0, 0, 210))
 
         panel_w, panel_h = 860, 680
         panel_x = (SCREEN_WIDTH - panel_w) // 2
@@ -1493,14 +1481,7 @@ class RenderingMixin:
 
     def render_about(self):
         """Render upgraded About page."""
-        if self.bg_image:
-            self.screen.blit(self.bg_image, (0, 0))
-        else:
-            self.screen.fill(COLORS["bg_dark"])
-
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        self.screen.blit(overlay, (0, 0))
+        self._blit_backdrop((0, 0, 0, 200))
 
         title = self.fonts["title_md"].render("ABOUT JUTSU ACADEMY", True, COLORS["accent"])
         self.screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 58)))
@@ -1694,14 +1675,7 @@ class RenderingMixin:
 
     def render_tutorial(self):
         """Render first-time onboarding/tutorial."""
-        if self.bg_image:
-            self.screen.blit(self.bg_image, (0, 0))
-        else:
-            self.screen.fill(COLORS["bg_dark"])
-
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 210))
-        self.screen.blit(overlay, (0, 0))
+        self._blit_backdrop((0, 0, 0, 210))
 
         step_idx = max(0, min(getattr(self, "tutorial_step_index", 0), len(self.tutorial_steps) - 1))
         step = self.tutorial_steps[step_idx]
@@ -1870,14 +1844,7 @@ class RenderingMixin:
     def render_quests(self):
         """Render daily/weekly quest board."""
         self.quest_claim_rects = []
-        if self.bg_image:
-            self.screen.blit(self.bg_image, (0, 0))
-        else:
-            self.screen.fill(COLORS["bg_dark"])
-
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        self.screen.blit(overlay, (0, 0))
+        self._blit_backdrop((0, 0, 0, 200))
 
         title = self.fonts["title_md"].render("QUEST BOARD", True, COLORS["accent"])
         self.screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 64)))
@@ -1966,14 +1933,7 @@ class RenderingMixin:
     def render_jutsu_library(self):
         """Render tiered jutsu library page with lock/unlock status."""
         self.library_item_rects = []
-        if self.bg_image:
-            self.screen.blit(self.bg_image, (0, 0))
-        else:
-            self.screen.fill(COLORS["bg_dark"])
-
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 120))
-        self.screen.blit(overlay, (0, 0))
+        self._blit_backdrop((0, 0, 0, 120))
 
         title = self.fonts["title_md"].render("JUTSU LIBRARY", True, COLORS["accent"])
         self.screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 70)))
@@ -2038,7 +1998,7 @@ class RenderingMixin:
                 unlocked = self.progression.level >= req_lv
                 card_rect = pygame.Rect(x, row_y, card_w, card_h)
                 hoverable = self.library_mode in ["freeplay", "challenge"]
-                hovered = hoverable and card_rect.collidepoint(pygame.mouse.get_pos())
+                hovered = hoverable and self.redraw.hover(card_rect)
 
                 if unlocked:
                     fill = (35, 52, 42, 230)
@@ -2158,9 +2118,7 @@ class RenderingMixin:
             out.append(current)
             return out
 
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 220))
-        self.screen.blit(overlay, (0, 0))
+        self._blit_dim((0, 0, 0, 220))
 
         modal_w = max(520, min(760, SCREEN_WIDTH - 80))
         text_max_w = modal_w - 110
@@ -2218,7 +2176,7 @@ class RenderingMixin:
 
         btn_w, btn_h = 220, 56
         self.alert_ok_rect = pygame.Rect(modal_rect.centerx - btn_w // 2, modal_rect.bottom - 82, btn_w, btn_h)
-        hovered = self.alert_ok_rect.collidepoint(pygame.mouse.get_pos())
+        hovered = self.redraw.hover(self.alert_ok_rect)
         color = COLORS["accent_glow"] if hovered else COLORS["accent"]
         btn_shadow = self.alert_ok_rect.move(0, 4)
         pygame.draw.rect(self.screen, (0, 0, 0, 110), btn_shadow, border_radius=12)
@@ -8,6 +8,7 @@ class RuntimeMixin:
         
         # Capture events first
         events = pygame.event.get()
+        self._frame_events = events
         if getattr(self, "_pending_runtime_settings_apply", False):
             self._pending_runtime_settings_apply = False
             try:
@@ -30,7 +31,7 @@ class RuntimeMixin:
 
         # Poll app_config periodically so maintenance/update toggles can apply live.
         now = time.time()
-        if self.network_manager and self.network_manager.client:
+        if self.network_manager and getattr(self.network_manager, "configured", False):
             if (not self.announcements_loading) and (now - getattr(self, "config_poll_last_at", 0.0) >= getattr(self, "config_poll_interval_s", 20.0)):
                 self.config_poll_last_at = now
                 threading.Thread(target=self._fetch_announcements, daemon=True).start()
@@ -200,6 +201,14 @@ class RuntimeMixin:
                     elif event.key == pygame.K_c:
                         self.start_calibration(manual=True, force_show_diag=True)
                         self.play_sound("click")
+                    elif event.key == pygame.K_F9:
+                        self._toggle_landmark_recording()
+                        self.play_sound("click")
+                    elif event.key == pygame.K_F3:
+                        self.settings["show_profiler"] = self.profiler.toggle()
+                        self.play_sound("click")
+                    elif event.key == pygame.K_F4:
+                        self._dump_profiler_report()
                     elif event.key == pygame.K_m:
                         self.play_sound("error")
                         if hasattr(self, "show_alert"):
@@ -423,6 +432,11 @@ class RuntimeMixin:
                 self.screen_h = rh
                 self.settings["resolution_idx"] = res_idx
                 self._apply_display_mode()
+
+            # Frame pacing — apply immediately on change
+            if self.pacing_dropdown.update(mouse_pos, mouse_click, self.play_sound):
+                self.settings["frame_pacing"] = PACING_PRESET_NAMES[self.pacing_dropdown.selected_idx]
+                self._apply_frame_pacing()
             
             # Keep restricted signs always ON and non-interactive.
             self.settings_checkboxes["restricted"].checked = True
@@ -462,6 +476,7 @@ class RuntimeMixin:
                         # Resolution & fullscreen
                         self.settings["resolution_idx"] = self.resolution_dropdown.selected_idx
                         self.settings["fullscreen"] = self.settings_checkboxes["fullscreen"].checked
+                        self.settings["frame_pacing"] = PACING_PRESET_NAMES[self.pacing_dropdown.selected_idx]
 
                         res_idx = self.settings["resolution_idx"]
                         if 0 <= res_idx < len(RESOLUTION_OPTIONS):
@@ -768,14 +783,80 @@ class RuntimeMixin:
                     self.switch_jutsu(1)
                     self.play_sound("click")
 
+    _STATIC_SCREENS = (
+        GameState.ABOUT,
+        GameState.QUESTS,
+        GameState.JUTSU_LIBRARY,
+        GameState.SETTINGS,
+        GameState.LEADERBOARD,
+        GameState.PRACTICE_SELECT,
+    )
+
+    def _static_screen_key(self):
+        """Signature of what a static screen draws besides widgets and hover highlights; None = redraw every frame."""
+        state = self.state
+        if state not in self._STATIC_SCREENS:
+            return None
+        if getattr(self, "level_up_panel_data", None):
+            return None
+        if state == GameState.SETTINGS and self.settings_preview_enabled:
+            return None
+        return (
+            state,
+            self.screen.get_size(),
+            self.about_scroll_y,
+            self.practice_scroll_y,
+            self.library_mode,
+            id(self.active_alert) if self.active_alert else None,
+            self.leaderboard_loading,
+            getattr(self, "leaderboard_mode", None),
+            getattr(self, "leaderboard_page", 0),
+            id(self.leaderboard_data),
+            len(self.leaderboard_avatars),
+            id(self.quest_state),
+            self.progression.xp,
+            self.username,
+            self.settings.get("frame_pacing"),
+        )
+
+    def _static_screen_widgets(self):
+        state = self.state
+        if state == GameState.SETTINGS:
+            return [
+                *self.settings_sliders.values(),
+                self.camera_dropdown,
+                self.resolution_dropdown,
+                self.pacing_dropdown,
+                *self.settings_checkboxes.values(),
+                *self.settings_buttons.values(),
+            ]
+        buttons = {
+            GameState.ABOUT: self.about_buttons,
+            GameState.QUESTS: self.quest_buttons,
+            GameState.JUTSU_LIBRARY: self.library_buttons,
+            GameState.LEADERBOARD: self.leaderboard_buttons,
+            GameState.PRACTICE_SELECT: self.practice_buttons,
+        }.get(state)
+        return list(buttons.values()) if buttons else []
+
     def run(self):
         """Main game loop."""
         try:
             while self.running:
-                dt = self.clock.tick(FPS) / 1000.0
+                # UI rate from the frame pacer; static screens with nothing to redraw tick at the idle rate.
+                dt = self.clock.tick(self.redraw.tick_rate(self.pacer.ui_fps())) / 1000.0
+                self.pacer.begin_frame()
 
                 self.handle_events()
 
+                key = self._static_screen_key()
+                redraw_mode, redraw_rects = self.redraw.plan(
+                    key, self._frame_events, self._static_screen_widgets() if key is not None else ()
+                )
+                if redraw_mode == REDRAW_SKIP:
+                    continue
+                self.redraw.begin_render()
+
                 # Render based on state
                 if self.state == GameState.MENU:
                     self.render_menu()
@@ -807,6 +888,8 @@ class RuntimeMixin:
                     self._render_loading()
                 elif self.state == GameState.PLAYING:
                     self.render_playing(dt)
+                    if self.profiler.enabled:
+                        self._render_profiler_overlay()
                 elif self.state == GameState.LOGIN_MODAL:
                     # Render underlying state first for background context
                     if self.prev_state == GameState.MENU:
@@ -860,7 +943,17 @@ class RuntimeMixin:
                                 if hasattr(self, "_activate_next_reward_panel"):
                                     self._activate_next_reward_panel()
 
-                pygame.display.flip()
+                self.redraw.end_render()
+                with self.profiler.stage("flip"):
+                    if redraw_mode == REDRAW_RECTS:
+                        pygame.display.update(redraw_rects)
+                    else:
+                        pygame.display.flip()
+                self.profiler.mark_frame()
+
+                # The first frame is on screen; load session models in the background from here on.
+                if self.model_warmup_enabled and not self.model_warmup.started:
+                    self.model_warmup.start()
         finally:
             self.cleanup()
 
@@ -875,9 +968,20 @@ class RuntimeMixin:
             self._submit_challenge_score_on_exit(blocking=True)
         if hasattr(self, "_reset_active_effects"):
             self._reset_active_effects(reset_calibration=True)
+        if hasattr(self, "_toggle_landmark_recording"):
+            self._toggle_landmark_recording(False)
         self._stop_camera()
         if hasattr(self, "_stop_settings_camera_preview"):
             self._stop_settings_camera_preview()
+        if hasattr(self, "video_sprites"):
+            self.video_sprites.close()
+        if hasattr(self, "model_warmup"):
+            self.model_warmup.stop()
+        try:
+            from src.jutsu_academy.effects.segmentation_service import shutdown_segmentation_service
+            shutdown_segmentation_service()
+        except Exception:
+            pass
         if pygame.mixer.get_init():
             pygame.mixer.stop()
         pygame.quit()
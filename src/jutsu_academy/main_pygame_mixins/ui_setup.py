@@ -51,6 +51,13 @@ class UISetupMixin:
         if res_idx < 0 or res_idx >= len(res_labels):
             res_idx = 0
         self.resolution_dropdown = Dropdown(cx - 60, cy + 410, 230, res_labels, res_idx)
+
+        # Frame pacing preset dropdown (UI / camera / detection rates)
+        pacing = self.settings.get("frame_pacing", DEFAULT_PACING_PRESET)
+        pacing_idx = PACING_PRESET_NAMES.index(pacing) if pacing in PACING_PRESET_NAMES else 0
+        self.pacing_dropdown = Dropdown(
+            cx + 200, cy, 190, [PACING_PRESETS[name]["label"] for name in PACING_PRESET_NAMES], pacing_idx
+        )
         
         self.settings_buttons = {
             "preview_toggle": Button(cx - 100, cy + 395, 220, 44, "ENABLE PREVIEW", color=COLORS["bg_card"]),
@@ -94,18 +101,8 @@ class UISetupMixin:
             return True
 
         self._stop_settings_camera_preview()
-        capture_idx = self._resolve_camera_capture_index(idx)
-
-        if os.name == "nt":
-            cap = cv2.VideoCapture(capture_idx, cv2.CAP_DSHOW)
-        else:
-            cap = cv2.VideoCapture(capture_idx)
-        cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-        cap.set(cv2.CAP_PROP_FPS, 30)
-
-        if not cap.isOpened():
-            cap.release()
+        cap = self._open_camera_source(self._resolve_camera_capture_index(idx))
+        if cap is None:
             self.settings_preview_cap = None
             self.settings_preview_idx = None
             return False
@@ -200,19 +197,77 @@ class UISetupMixin:
             "skip": Button(cx - 80, SCREEN_HEIGHT - 110, 160, 52, "SKIP", color=COLORS["bg_card"]),
         }
 
+    def _schedule_model_warmup(self):
+        """Queue the models a session needs on the warm-up thread, most urgent first."""
+        warmup = self.model_warmup
+        warmup.schedule("hand_tracker", self._load_hand_tracker, priority=0)
+        warmup.schedule("sign_classifier", self._load_sign_classifier, priority=1)
+        # Face and segmentation only feed effects, which cope with them arriving late.
+        warmup.schedule("face_landmarker", self._load_face_landmarker, priority=2)
+        warmup.schedule("segmenter", self._warm_segmenter, priority=3)
+
+    def _ml_models_ready(self):
+        warmup = self.model_warmup
+        return warmup.is_ready("hand_tracker") and warmup.is_ready("sign_classifier")
+
     def _load_ml_models(self):
-        """Load ML models (called when starting game)."""
-        if self.model is not None:
+        """Load ML models (called when starting game); only blocks on warm-up tasks still outstanding."""
+        if self.class_names is None:
+            weights = get_latest_weights()
+            if not weights:
+                print("[!] No YOLO weights found (YOLO path is locked anyway). Continuing with MediaPipe only.")
+            print("[*] YOLO mapping verified. Loading skipped (model locked).")
+            self.model = None
+            self.class_names = get_class_names()
+
+        self._schedule_model_warmup()
+        warmup = self.model_warmup
+        try:
+            hand_ok = bool(warmup.wait("hand_tracker"))
+            warmup.wait("sign_classifier")
+            if not warmup.started:
+                # No warm-up thread (JUTSU_MODEL_WARMUP=0): nothing else would load the face
+                # landmarker, so load it here. The segmenter still loads on first use.
+                warmup.wait("face_landmarker")
+        except Exception as e:
+            if not self.hand_detector_error:
+                self.hand_detector_error = str(e)
+            hand_ok = False
+        if not hand_ok:
+            # Let the next attempt retry instead of returning the cached failure.
+            warmup.discard("hand_tracker")
+            warmup.discard("sign_classifier")
+        return hand_ok
+
+    def _load_sign_classifier(self):
+        if self.recorder is None:
+            self.recorder = SignRecorder()  # MediaPipe landmarks -> KNN
+        return True
+
+    def _warm_segmenter(self):
+        from src.jutsu_academy.effects.segmentation_service import get_segmentation_service
+
+        return get_segmentation_service().warm_up()
+
+    def _load_face_landmarker(self):
+        face_path = resolve_resource_path("models/face_landmarker.task")
+        if not face_path.exists():
+            print(f"[!] Face model not found: {face_path}")
+            return False
+        try:
+            from mediapipe.tasks import python
+            from mediapipe.tasks.python import vision
+
+            base_options = python.BaseOptions(model_asset_path=str(face_path))
+            options = vision.FaceLandmarkerOptions(base_options=base_options, num_faces=1)
+            self.face_landmarker = vision.FaceLandmarker.create_from_options(options)
+            print(f"[+] Face detection loaded: {face_path}")
             return True
-        
-        weights = get_latest_weights()
-        if not weights:
-            print("[!] No YOLO weights found (YOLO path is locked anyway). Continuing with MediaPipe only.")
-        
-        print("[*] YOLO mapping verified. Loading skipped (model locked).")
-        self.model = None
-        self.class_names = get_class_names()
-        
+        except Exception as e:
+            print(f"[!] Face detection failed: {e}")
+            return False
+
+    def _load_hand_tracker(self):
         self.hand_landmarker = None
         self.hand_landmarker_image = None
         self.legacy_hands = None
@@ -229,18 +284,6 @@ class UISetupMixin:
             print(f"[!] MediaPipe Tasks import failed: {e}")
 
         if python is not None and vision is not None:
-            face_path = resolve_resource_path("models/face_landmarker.task")
-            if face_path.exists():
-                try:
-                    base_options = python.BaseOptions(model_asset_path=str(face_path))
-                    options = vision.FaceLandmarkerOptions(base_options=base_options, num_faces=1)
-                    self.face_landmarker = vision.FaceLandmarker.create_from_options(options)
-                    print(f"[+] Face detection loaded: {face_path}")
-                except Exception as e:
-                    print(f"[!] Face detection failed: {e}")
-            else:
-                print(f"[!] Face model not found: {face_path}")
-
             hand_path = resolve_resource_path("models/hand_landmarker.task")
             self.hand_model_path = str(hand_path)
             self.hand_model_exists = bool(hand_path.exists())
@@ -311,30 +354,39 @@ class UISetupMixin:
             return False
         return True
 
+    def _open_camera_source(self, capture_idx):
+        """Frame source for a camera index; JUTSU_FRAME_SOURCE swaps in a video file, image directory or "synthetic"."""
+        # Use DirectShow on Windows for better compatibility (probe_backends=False)
+        return open_frame_source(
+            source_spec("", capture_idx), 640, 480, fps=30, probe_backends=False, verify_reads=0,
+        )
+
     def _start_camera(self):
         """Start camera capture."""
         if self.cap is not None:
             self.cap.release()
+        self._reset_camera_frame()
         
         cam_idx = self.settings["camera_idx"]
-        cam_idx = self._resolve_camera_capture_index(cam_idx)
-        # Use DirectShow on Windows for better compatibility
-        if os.name == 'nt':
-            self.cap = cv2.VideoCapture(cam_idx, cv2.CAP_DSHOW)
-        else:
-            self.cap = cv2.VideoCapture(cam_idx)
-            
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-        self.cap.set(cv2.CAP_PROP_FPS, 30)
-        
-        return self.cap.isOpened()
+        self.cap = self._open_camera_source(self._resolve_camera_capture_index(cam_idx))
+        return self.cap is not None and self.cap.isOpened()
 
     def _stop_camera(self):
         """Stop camera capture."""
         if self.cap is not None:
             self.cap.release()
             self.cap = None
+        self._reset_camera_frame()
+
+    def _reset_camera_frame(self):
+        """Forget the last camera frame/surface the pacer re-presents between camera reads."""
+        self.camera_frame = None
+        self.camera_frame_seq = 0
+        self.camera_read_at = 0.0
+        self.camera_lighting_ok = False
+        self._camera_surface_key = None
+        self._camera_surface = None
+        self.pacer.reset()
 
     def play_sound(self, name):
         """Play a sound effect."""
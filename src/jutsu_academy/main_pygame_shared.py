@@ -27,14 +27,12 @@ import json
 import webbrowser
 import threading
 import os
-import requests
 import ast
 from io import BytesIO
+from itertools import repeat
 
 # Add parent path to import utils
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from ultralytics import YOLO
-import mediapipe as mp
 
 from src.utils.paths import (
     get_class_names,
@@ -44,14 +42,56 @@ from src.utils.paths import (
 )
 from src.jutsu_registry import OFFICIAL_JUTSUS
 from src.mp_trainer import SignRecorder
+from src.frame_source import open_frame_source, source_spec
+from src.jutsu_academy.particle_engine import (
+    KIND_FIREBALL_CORE,
+    KIND_FIREBALL_EMBER,
+    KIND_FIREBALL_SMOKE,
+    KIND_FIREBALL_SPARK,
+    KIND_PHOENIX,
+    ParticleBuffer,
+)
+from src.jutsu_academy.sprite_atlas import flush_blits, get_sprite_atlas
+from src.jutsu_academy.video_sprite_cache import VideoSpriteCache
+from src.jutsu_academy.model_warmup import ModelWarmup
+from src.jutsu_academy.ui_layer_cache import UILayerCache
+from src.jutsu_academy.asset_manager import FIT_COVER, FIT_FIT, FIT_STRETCH, get_asset_manager
+from src.jutsu_academy.text_cache import cached_font, get_text_cache
+from src.jutsu_academy.redraw_scheduler import (
+    DEFAULT_IDLE_FPS,
+    RECTS as REDRAW_RECTS,
+    SKIP as REDRAW_SKIP,
+    RedrawScheduler,
+)
+from src.jutsu_academy.frame_pacer import (
+    DEFAULT_PRESET as DEFAULT_PACING_PRESET,
+    LANE_CAMERA,
+    LANE_FACE,
+    LANE_HANDS,
+    LANE_SEGMENTATION,
+    PHASE_EFFECT,
+    PHASE_IDLE,
+    PHASE_SEQUENCE,
+    PRESET_NAMES as PACING_PRESET_NAMES,
+    PRESETS as PACING_PRESETS,
+    FramePacer,
+    preset_rates,
+)
+from src.jutsu_academy.effects.render_queue import LAYER_PARTICLES, LAYER_SMOKE
+from src.jutsu_academy.lazy_imports import lazy_import
+
+# Heavy optional imports stay off the menu path; the real import happens on first use.
+mp = lazy_import("mediapipe")
+requests = lazy_import("requests")
 
 # Safe Import NetworkManager
 try:
     from src.jutsu_academy.network_manager import NetworkManager
 except ImportError:
-    print("[!] NetworkManager import failed (missing supabase?). using mock.")
+    print("[!] NetworkManager import failed. using mock.")
     class NetworkManager:
         def __init__(self): self.client = None
+        configured = False
         def get_leaderboard(self, **kwargs): return []
         def submit_score(self, **kwargs): pass
         def issue_run_token(self, **kwargs): return {"ok": False, "token": "offline_mock", "source": "mock"}
@@ -141,50 +181,43 @@ COLORS = {
 # ═══════════════════════════════════════════════════════════════════════════
 # PARTICLE SYSTEM
 # ═══════════════════════════════════════════════════════════════════════════
-class Particle:
-    def __init__(
-        self,
-        x,
-        y,
-        vx,
-        vy,
-        lifetime,
-        size,
-        color,
-        kind="fireball",
-        sway_strength=30.0,
-        gravity=0.0,
-    ):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.size = size
-        self.color = color
-        self.kind = str(kind or "fireball")
-        self.sway_strength = float(sway_strength)
-        self.gravity = float(gravity)
-    
-    def update(self, dt, wind_x=0):
-        self.x += (self.vx + wind_x) * dt
-        self.y += self.vy * dt
-        self.vy += self.gravity * dt
-        self.lifetime -= dt
-        self.x += math.sin(time.time() * 5 + self.y * 0.05) * self.sway_strength * dt
-    
-    def is_alive(self):
-        return self.lifetime > 0
-    
-    def get_alpha(self):
-        return max(0, min(255, int(255 * (self.lifetime / self.max_lifetime))))
-
-
 class FireParticleSystem:
+    # Per-kind spawn tables for the fireball style: (roll upper bound, lifetime range, size range, sway, gravity).
+    _FIREBALL_KINDS = (
+        (0.44, KIND_FIREBALL_CORE, (0.28, 0.64), (14.0, 34.0), 10.0, 64.0),
+        (0.82, KIND_FIREBALL_EMBER, (0.52, 1.35), (5.0, 16.0), 33.0, 130.0),
+        (0.93, KIND_FIREBALL_SPARK, (0.18, 0.44), (2.0, 5.8), 6.0, 190.0),
+        (1.01, KIND_FIREBALL_SMOKE, (0.85, 1.95), (16.0, 40.0), 16.0, -16.0),
+    )
+    # Velocity trails behind fireball particles: (kind, length, size decay, base alpha, spacing).
+    _FIREBALL_TRAILS = (
+        (KIND_FIREBALL_CORE, 5, 0.11, 0.54, 4.2),
+        (KIND_FIREBALL_SPARK, 6, 0.14, 0.68, 3.1),
+        (KIND_FIREBALL_EMBER, 3, 0.13, 0.46, 3.8),
+    )
+    # Glow discs per kind: (size multiplier, alpha multiplier, COLORS key or None for the particle color).
+    _GLOW_STEPS = (
+        ((KIND_FIREBALL_CORE,), (
+            (1.85, 0.28, "fire_outer"),
+            (1.35, 0.42, "fire_mid"),
+            (0.92, 0.64, "fire_core"),
+        )),
+        ((KIND_FIREBALL_SPARK,), (
+            (1.40, 0.22, "fire_mid"),
+            (0.95, 0.50, "fire_core"),
+        )),
+        ((KIND_FIREBALL_EMBER, KIND_PHOENIX), (
+            (1.55, 0.24, "fire_outer"),
+            (1.10, 0.44, "fire_mid"),
+            (0.80, 0.60, None),
+        )),
+    )
+
     def __init__(self, max_particles=150):
-        self.particles = []
+        self.particles = ParticleBuffer(max_particles)
         self.max_particles = max_particles
+        self.base_max_particles = max_particles
+        self.emit_scale = 1.0
         self.emitting = False
         self.emit_x = 0
         self.emit_y = 0
@@ -210,6 +243,12 @@ class FireParticleSystem:
             # Fire an immediate multi-shot burst on the next update tick.
             self._phoenix_burst_accum_s = self.phoenix_burst_interval_s
     
+    def set_detail(self, scale):
+        """Scale capacity and emission against the constructed size (1.0 = full detail)."""
+        scale = max(0.1, min(1.0, float(scale)))
+        self.emit_scale = scale
+        self.max_particles = max(8, int(round(self.base_max_particles * scale)))
+
     def set_position(self, x, y):
         self.emit_x = x
         self.emit_y = y
@@ -239,129 +278,117 @@ class FireParticleSystem:
         dir_y = -0.82 + pitch_n * 1.05
         self.set_direction(dir_x, dir_y, smoothing=0.32)
     
-    def _spawn_fireball_particle(self):
+    def _spawn_fireball_particles(self, n):
+        if n <= 0:
+            return
         wind_n = float(np.clip(self.wind_x / 320.0, -1.0, 1.0))
         base_dx = float(self.aim_dx)
         base_dy = float(self.aim_dy)
         perp_x = -base_dy
         perp_y = base_dx
-        spread = float(np.random.uniform(-0.42, 0.42))
+        spread = np.random.uniform(-0.42, 0.42, n)
         dir_x = base_dx + perp_x * spread + wind_n * 0.16
         dir_y = base_dy + perp_y * spread * 0.72
-        dir_n = math.hypot(dir_x, dir_y)
-        if dir_n > 1e-6:
-            dir_x /= dir_n
-            dir_y /= dir_n
-        else:
-            dir_x, dir_y = 0.0, -1.0
+        dir_n = np.hypot(dir_x, dir_y)
+        ok = dir_n > 1e-6
+        safe_n = np.where(ok, dir_n, 1.0)
+        dir_x = np.where(ok, dir_x / safe_n, 0.0)
+        dir_y = np.where(ok, dir_y / safe_n, -1.0)
 
-        speed = float(np.random.uniform(240.0, 520.0))
-        speed *= float(np.random.uniform(0.84, 1.16))
+        speed = np.random.uniform(240.0, 520.0, n) * np.random.uniform(0.84, 1.16, n)
         vx = dir_x * speed + wind_n * 75.0
         vy = dir_y * speed
 
-        roll = float(np.random.random())
-        if roll < 0.44:
-            kind = "fireball_core"
-            lifetime = float(np.random.uniform(0.28, 0.64))
-            size = float(np.random.uniform(14.0, 34.0))
-            color = COLORS["fire_core"] if np.random.random() > 0.35 else COLORS["fire_mid"]
-            sway_strength = 10.0
-            gravity = 64.0
-        elif roll < 0.82:
-            kind = "fireball_ember"
-            lifetime = float(np.random.uniform(0.52, 1.35))
-            size = float(np.random.uniform(5.0, 16.0))
-            color = COLORS["fire_mid"] if np.random.random() > 0.40 else COLORS["fire_outer"]
-            sway_strength = 33.0
-            gravity = 130.0
-        elif roll < 0.93:
-            kind = "fireball_spark"
-            lifetime = float(np.random.uniform(0.18, 0.44))
-            size = float(np.random.uniform(2.0, 5.8))
-            color = COLORS["fire_core"]
-            sway_strength = 6.0
-            gravity = 190.0
-        else:
-            kind = "fireball_smoke"
-            lifetime = float(np.random.uniform(0.85, 1.95))
-            size = float(np.random.uniform(16.0, 40.0))
-            color = (72, 46, 34)
-            sway_strength = 16.0
-            gravity = -16.0
-            vx *= 0.48
-            vy *= 0.38
-
-        self.particles.append(
-            Particle(
-                self.emit_x + np.random.uniform(-16, 16),
-                self.emit_y + np.random.uniform(-10, 10),
-                vx,
-                vy,
-                lifetime,
-                size,
-                color,
-                kind=kind,
-                sway_strength=sway_strength,
-                gravity=gravity,
-            )
+        roll = np.random.random(n)
+        pick = np.random.random(n)
+        u_life = np.random.random(n)
+        u_size = np.random.random(n)
+        kind = np.empty(n, dtype=np.int8)
+        life = np.empty(n, dtype=np.float32)
+        size = np.empty(n, dtype=np.float32)
+        sway = np.empty(n, dtype=np.float32)
+        gravity = np.empty(n, dtype=np.float32)
+        lower = 0.0
+        for upper, kind_id, life_rng, size_rng, sway_v, gravity_v in self._FIREBALL_KINDS:
+            m = (roll >= lower) & (roll < upper)
+            lower = upper
+            kind[m] = kind_id
+            life[m] = life_rng[0] + u_life[m] * (life_rng[1] - life_rng[0])
+            size[m] = size_rng[0] + u_size[m] * (size_rng[1] - size_rng[0])
+            sway[m] = sway_v
+            gravity[m] = gravity_v
+
+        color = np.empty((n, 3), dtype=np.uint8)
+        color[:] = COLORS["fire_core"]
+        color[(kind == KIND_FIREBALL_CORE) & (pick <= 0.35)] = COLORS["fire_mid"]
+        ember = kind == KIND_FIREBALL_EMBER
+        color[ember & (pick > 0.40)] = COLORS["fire_mid"]
+        color[ember & (pick <= 0.40)] = COLORS["fire_outer"]
+        smoke = kind == KIND_FIREBALL_SMOKE
+        color[smoke] = (72, 46, 34)
+        vx = np.where(smoke, vx * 0.48, vx)
+        vy = np.where(smoke, vy * 0.38, vy)
+
+        self.particles.spawn(
+            x=self.emit_x + np.random.uniform(-16, 16, n),
+            y=self.emit_y + np.random.uniform(-10, 10, n),
+            vx=vx,
+            vy=vy,
+            life=life,
+            size=size,
+            color=color,
+            kind=kind,
+            sway=sway,
+            gravity=gravity,
         )
 
-    def _spawn_phoenix_particle(self, lane_angle, lane_offset_x, lane_offset_y):
-        angle = float(lane_angle) + np.random.uniform(-0.07, 0.07)
-
-        speed = np.random.uniform(165, 290)
-        vx = speed * math.sin(angle)
-        vy = -speed * np.random.uniform(0.82, 1.16)
-
-        lifetime = np.random.uniform(0.34, 0.74)
-        size = np.random.uniform(7, 16)
-
-        heat = np.random.random()
-        if heat > 0.86:
-            color = (255, 255, 220)
-        elif heat > 0.48:
-            color = (255, 170, 55)
-        else:
-            color = (255, 85, 28)
-
-        self.particles.append(
-            Particle(
-                self.emit_x + float(lane_offset_x) + np.random.uniform(-4, 4),
-                self.emit_y + float(lane_offset_y) + np.random.uniform(-3, 3),
-                vx,
-                vy,
-                lifetime,
-                size,
-                color,
-                kind="phoenix",
-                sway_strength=9.0,
-                gravity=145.0,
-            )
+    def _spawn_phoenix_burst(self):
+        per_lane = max(1, int(round(self.phoenix_particles_per_lane * self.emit_scale)))
+        lane_angle = np.repeat(np.asarray(self.phoenix_lane_angles, dtype=np.float32), per_lane)
+        lane_offset_x = np.repeat(np.asarray(self.phoenix_lane_offsets, dtype=np.float32), per_lane)
+        lane_offset_y = -np.abs(lane_offset_x) * 0.11
+        n = min(lane_angle.size, self.particles.free_slots())
+        if n <= 0:
+            return
+        lane_angle = lane_angle[:n]
+        lane_offset_x = lane_offset_x[:n]
+        lane_offset_y = lane_offset_y[:n]
+
+        angle = lane_angle + np.random.uniform(-0.07, 0.07, n)
+        speed = np.random.uniform(165, 290, n)
+        heat = np.random.random(n)
+        color = np.empty((n, 3), dtype=np.uint8)
+        color[:] = (255, 85, 28)
+        color[heat > 0.48] = (255, 170, 55)
+        color[heat > 0.86] = (255, 255, 220)
+
+        self.particles.spawn(
+            x=self.emit_x + lane_offset_x + np.random.uniform(-4, 4, n),
+            y=self.emit_y + lane_offset_y + np.random.uniform(-3, 3, n),
+            vx=speed * np.sin(angle),
+            vy=-speed * np.random.uniform(0.82, 1.16, n),
+            life=np.random.uniform(0.34, 0.74, n),
+            size=np.random.uniform(7, 16, n),
+            color=color,
+            kind=KIND_PHOENIX,
+            sway=9.0,
+            gravity=145.0,
         )
 
     def emit(self, count=5):
         if not self.emitting:
             return
+        if self.particles.capacity != int(self.max_particles):
+            self.particles.resize(self.max_particles)
 
         if self.style == "phoenix":
-            for lane_angle, lane_offset_x in zip(self.phoenix_lane_angles, self.phoenix_lane_offsets):
-                lane_offset_y = -abs(lane_offset_x) * 0.11
-                for _ in range(max(1, int(self.phoenix_particles_per_lane))):
-                    if len(self.particles) >= self.max_particles:
-                        return
-                    self._spawn_phoenix_particle(lane_angle, lane_offset_x, lane_offset_y)
+            self._spawn_phoenix_burst()
             return
 
-        for _ in range(count):
-            if len(self.particles) >= self.max_particles:
-                break
-            self._spawn_fireball_particle()
+        self._spawn_fireball_particles(min(int(count), self.particles.free_slots()))
     
     def update(self, dt):
-        for p in self.particles:
-            p.update(dt, self.wind_x)
-        self.particles = [p for p in self.particles if p.is_alive()]
+        self.particles.update(dt, self.wind_x, time.time())
         if self.emitting:
             if self.style == "phoenix":
                 self._phoenix_burst_accum_s += max(0.0, float(dt))
@@ -369,18 +396,24 @@ class FireParticleSystem:
                     self._phoenix_burst_accum_s -= self.phoenix_burst_interval_s
                     self.emit()
             else:
-                if int(self.max_particles) >= 180:
+                if int(self.base_max_particles) >= 180:
                     emit_n = 18
-                elif int(self.max_particles) >= 120:
+                elif int(self.base_max_particles) >= 120:
                     emit_n = 14
                 else:
                     emit_n = 7
-                self.emit(emit_n)
+                self.emit(max(1, int(round(emit_n * self.emit_scale))))
                 self._muzzle_pulse = min(1.0, self._muzzle_pulse + dt * 7.5)
         else:
             self._muzzle_pulse = max(0.0, self._muzzle_pulse - dt * 4.5)
     
-    def render(self, surface):
+    def render(self, surface, queue=None):
+        """Draw to surface, or hand the blits to an effects RenderQueue to flush later."""
+        atlas = get_sprite_atlas()
+        add = pygame.BLEND_ADD
+        # Additive blits ignore source alpha, so glow/trail sprites are shared per (radius, color).
+        batch = []
+        smoke_batch = []
         if self.style == "fireball" and (self.emitting or self._muzzle_pulse > 0.02):
             now = time.time()
             pulse = 0.72 + 0.28 * math.sin(now * 13.0)
@@ -396,148 +429,147 @@ class FireParticleSystem:
             base_y = int(self.emit_y + jitter_y + dir_push_y)
             wind_push = int(np.clip(self.wind_x, -260.0, 260.0) * 0.11)
 
-            for radius_mul, alpha_mul, color, ox, oy in (
-                (2.55, 0.28, (255, 70, 20), -2, 2),
-                (1.95, 0.42, (255, 112, 36), 0, 0),
-                (1.38, 0.58, (255, 170, 58), 1, -1),
-                (0.90, 0.74, (255, 235, 175), 0, -1),
+            for radius_mul, color, ox, oy in (
+                (2.55, (255, 70, 20), -2, 2),
+                (1.95, (255, 112, 36), 0, 0),
+                (1.38, (255, 170, 58), 1, -1),
+                (0.90, (255, 235, 175), 0, -1),
             ):
                 r = int(max(6, 20 * radius_mul))
-                a = int(max(0, min(255, 255 * pwr * alpha_mul)))
-                s = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
-                pygame.draw.circle(s, (*color, a), (r, r), r)
-                surface.blit(
-                    s,
-                    (base_x + ox + wind_push - r, base_y + oy - r),
-                    special_flags=pygame.BLEND_ADD,
-                )
+                batch.append((atlas.additive_disc(r, color), (base_x + ox + wind_push - r, base_y + oy - r), None, add))
 
             flare_w = int(max(24, 72 * (0.45 + pwr)))
             flare_h = int(max(10, 19 * (0.45 + pwr)))
-            flare_alpha = int(max(0, min(220, 190 * pwr)))
-            flare = pygame.Surface((flare_w * 2, flare_h * 2), pygame.SRCALPHA)
-            pygame.draw.ellipse(flare, (255, 120, 32, flare_alpha), (0, 0, flare_w * 2, flare_h * 2))
             flare_angle = -math.degrees(math.atan2(aim_dy, aim_dx))
-            flare = pygame.transform.rotate(flare, flare_angle)
+            flare = atlas.rotated_ellipse(flare_w, flare_h, (255, 120, 32), 255, flare_angle)
             flare_center_x = base_x + wind_push + int(aim_dx * flare_w * 0.62)
             flare_center_y = base_y + int(aim_dy * flare_w * 0.62)
-            flare_rect = flare.get_rect(center=(flare_center_x, flare_center_y))
-            surface.blit(
-                flare,
-                flare_rect,
-                special_flags=pygame.BLEND_ADD,
-            )
+            batch.append((flare, flare.get_rect(center=(flare_center_x, flare_center_y)), None, add))
 
+        buf = self.particles
+        n = buf.count
+        if n <= 0:
+            self._submit(surface, queue, smoke_batch, batch)
+            return
         particle_t = time.time()
-        for p in self.particles:
-            flicker = 0.88 + 0.12 * math.sin(particle_t * 26.0 + p.x * 0.07 + p.y * 0.05)
-            alpha = int(p.get_alpha() * flicker)
-            life_ratio = p.lifetime / p.max_lifetime
-            size = int(p.size * life_ratio)
-            
-            if size < 2:
-                continue
+        xs = buf.x[:n]
+        ys = buf.y[:n]
+        life_ratio = buf.life_ratio()
+        flicker = 0.88 + 0.12 * np.sin(particle_t * 26.0 + xs * 0.07 + ys * 0.05)
+        alphas = (np.clip((255.0 * life_ratio).astype(np.int32), 0, 255) * flicker).astype(np.int32)
+        sizes = (buf.size[:n] * life_ratio).astype(np.int32)
+        visible = np.flatnonzero(sizes >= 2)
+        if visible.size == 0:
+            self._submit(surface, queue, smoke_batch, batch)
+            return
 
-            if p.kind == "phoenix":
-                trail_size = max(2, int(size * 0.62))
-                trail_alpha = max(0, int(alpha * 0.58))
-                if trail_alpha > 0:
-                    tx = int(p.x - p.vx * 0.018)
-                    ty = int(p.y - p.vy * 0.018)
-                    trail_color = (255, 130, 40, trail_alpha)
-                    trail_surf = pygame.Surface((trail_size * 4, trail_size * 4), pygame.SRCALPHA)
-                    pygame.draw.circle(trail_surf, trail_color, (trail_size * 2, trail_size * 2), trail_size)
-                    surface.blit(
-                        trail_surf,
-                        (tx - trail_size * 2, ty - trail_size * 2),
-                        special_flags=pygame.BLEND_ADD,
-                    )
-            elif p.kind == "fireball_smoke":
-                smoke_a = max(0, int(alpha * 0.34))
-                if smoke_a > 0:
-                    smoke_r = max(4, int(size * 1.20))
-                    smoke = pygame.Surface((smoke_r * 2, smoke_r * 2), pygame.SRCALPHA)
-                    pygame.draw.circle(smoke, (*p.color, smoke_a), (smoke_r, smoke_r), smoke_r)
-                    inner_r = max(2, int(smoke_r * 0.70))
-                    inner_col = (95, 64, 44, max(0, int(smoke_a * 0.72)))
-                    pygame.draw.circle(smoke, inner_col, (smoke_r, smoke_r), inner_r)
-                    surface.blit(smoke, (int(p.x - smoke_r), int(p.y - smoke_r)))
+        px = xs[visible].astype(np.float64)
+        py = ys[visible].astype(np.float64)
+        pvx = buf.vx[:n][visible].astype(np.float64)
+        pvy = buf.vy[:n][visible].astype(np.float64)
+        alpha = alphas[visible]
+        size = sizes[visible]
+        kind = buf.kind[:n][visible]
+        colors = buf.color[:n][visible]
+
+        # Smoke is alpha-blended, so it keeps particle order; it is a small share of the pool.
+        m = (kind == KIND_FIREBALL_SMOKE) & ((alpha * 0.34).astype(np.int32) > 0)
+        if m.any():
+            smoke_r = np.maximum(4, (size[m] * 1.20).astype(np.int32))
+            smoke_a = (alpha[m] * 0.34).astype(np.int32)
+            left = (px[m] - smoke_r).astype(np.int32).tolist()
+            top = (py[m] - smoke_r).astype(np.int32).tolist()
+            puffs = {}
+            for r, a, rgb, x, y in zip(smoke_r.tolist(), smoke_a.tolist(), map(tuple, colors[m].tolist()), left, top):
+                key = (r, atlas.quantize_alpha(a), rgb)
+                puff = puffs.get(key)
+                if puff is None:
+                    puff = puffs[key] = atlas.smoke_puff(r, rgb, a, (95, 64, 44))
+                smoke_batch.append((puff, (x, y), None, 0))
+
+        # Everything below is additive, where draw order does not change the result, so the
+        # blits are built per layer over whole arrays with one atlas lookup per sprite.
+        phoenix = kind == KIND_PHOENIX
+        m = phoenix & ((alpha * 0.58).astype(np.int32) > 0)
+        if m.any():
+            r = np.maximum(2, (size[m] * 0.62).astype(np.int32))
+            tx = (px[m] - pvx[m] * 0.018).astype(np.int32)
+            ty = (py[m] - pvy[m] * 0.018).astype(np.int32)
+            self._queue_discs(batch, atlas, tx - r, ty - r, r, (255, 130, 40))
+
+        color_keys = (colors[:, 0].astype(np.int32) << 16) | (colors[:, 1].astype(np.int32) << 8) | colors[:, 2]
+        for kind_id, trail_len, trail_decay, trail_alpha_base, spacing in self._FIREBALL_TRAILS:
+            sel = np.flatnonzero(kind == kind_id)
+            if sel.size == 0:
                 continue
-            else:
-                speed = math.hypot(p.vx, p.vy)
-                inv_speed = 1.0 / max(1e-4, speed)
-                dir_x = p.vx * inv_speed
-                dir_y = p.vy * inv_speed
-
-                if p.kind == "fireball_core":
-                    trail_len = 5
-                    trail_decay = 0.11
-                    trail_alpha_base = 0.54
-                    spacing = 4.2
-                elif p.kind == "fireball_spark":
-                    trail_len = 6
-                    trail_decay = 0.14
-                    trail_alpha_base = 0.68
-                    spacing = 3.1
-                else:
-                    trail_len = 3
-                    trail_decay = 0.13
-                    trail_alpha_base = 0.46
-                    spacing = 3.8
-
-                for t in range(trail_len):
-                    back = (t + 1) * (spacing + size * 0.22)
-                    tx = int(p.x - dir_x * back)
-                    ty = int(p.y - dir_y * back)
-                    trail_size = max(1, int(size * (0.70 - t * trail_decay)))
-                    trail_alpha = max(0, int(alpha * (trail_alpha_base - t * 0.11)))
-                    if trail_alpha <= 0:
-                        continue
-                    trail_color = (*p.color, trail_alpha)
-                    trail_surf = pygame.Surface((trail_size * 4, trail_size * 4), pygame.SRCALPHA)
-                    pygame.draw.circle(trail_surf, trail_color, (trail_size * 2, trail_size * 2), trail_size)
-                    surface.blit(
-                        trail_surf,
-                        (tx - trail_size * 2, ty - trail_size * 2),
-                        special_flags=pygame.BLEND_ADD,
-                    )
-            
-            if p.kind == "fireball_core":
-                glow_steps = (
-                    (1.85, 0.28, COLORS["fire_outer"]),
-                    (1.35, 0.42, COLORS["fire_mid"]),
-                    (0.92, 0.64, COLORS["fire_core"]),
-                )
-            elif p.kind == "fireball_spark":
-                glow_steps = (
-                    (1.40, 0.22, COLORS["fire_mid"]),
-                    (0.95, 0.50, COLORS["fire_core"]),
-                )
-            else:
-                glow_steps = (
-                    (1.55, 0.24, COLORS["fire_outer"]),
-                    (1.10, 0.44, COLORS["fire_mid"]),
-                    (0.80, 0.60, p.color),
-                )
-
+            k_px, k_py, k_alpha, k_size, k_keys = px[sel], py[sel], alpha[sel], size[sel], color_keys[sel]
+            k_vx, k_vy = pvx[sel], pvy[sel]
+            inv_speed = 1.0 / np.maximum(1e-4, np.hypot(k_vx, k_vy))
+            k_dx = k_vx * inv_speed
+            k_dy = k_vy * inv_speed
+            for t in range(trail_len):
+                m = (k_alpha * (trail_alpha_base - t * 0.11)).astype(np.int32) > 0
+                if not m.any():
+                    break  # the alpha factor only shrinks along the trail
+                back = (t + 1) * (spacing + k_size[m] * 0.22)
+                tx = (k_px[m] - k_dx[m] * back).astype(np.int32)
+                ty = (k_py[m] - k_dy[m] * back).astype(np.int32)
+                r = np.maximum(1, (k_size[m] * (0.70 - t * trail_decay)).astype(np.int32))
+                self._queue_colored_discs(batch, atlas, tx - r, ty - r, r, k_keys[m])
+
+        for kind_ids, glow_steps in self._GLOW_STEPS:
+            sel = np.flatnonzero(np.isin(kind, kind_ids))
+            if sel.size == 0:
+                continue
+            k_px, k_py, k_alpha, k_size, k_keys = px[sel], py[sel], alpha[sel], size[sel], color_keys[sel]
             for glow_mul, alpha_mul, glow_color in glow_steps:
-                glow_size = max(1, int(size * glow_mul))
-                glow_alpha = max(0, int(alpha * alpha_mul))
-                if glow_alpha <= 0:
+                m = (k_alpha * alpha_mul).astype(np.int32) > 0
+                if not m.any():
                     continue
-                
-                color_with_alpha = (*glow_color, glow_alpha)
-                temp_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(temp_surf, color_with_alpha, (glow_size, glow_size), glow_size)
-                surface.blit(temp_surf, (int(p.x - glow_size), int(p.y - glow_size)), special_flags=pygame.BLEND_ADD)
-
-            if p.kind == "fireball_core":
-                core_r = max(1, int(size * 0.40))
-                core_a = max(0, min(255, int(alpha * 0.96)))
-                if core_a > 0:
-                    core = pygame.Surface((core_r * 2, core_r * 2), pygame.SRCALPHA)
-                    pygame.draw.circle(core, (255, 250, 215, core_a), (core_r, core_r), core_r)
-                    surface.blit(core, (int(p.x - core_r), int(p.y - core_r)), special_flags=pygame.BLEND_ADD)
+                r = np.maximum(1, (k_size[m] * glow_mul).astype(np.int32))
+                left = (k_px[m] - r).astype(np.int32)
+                top = (k_py[m] - r).astype(np.int32)
+                if glow_color is None:
+                    self._queue_colored_discs(batch, atlas, left, top, r, k_keys[m])
+                else:
+                    self._queue_discs(batch, atlas, left, top, r, COLORS[glow_color])
+
+        m = (kind == KIND_FIREBALL_CORE) & ((alpha * 0.96).astype(np.int32) > 0)
+        if m.any():
+            r = np.maximum(1, (size[m] * 0.40).astype(np.int32))
+            self._queue_discs(batch, atlas, (px[m] - r).astype(np.int32), (py[m] - r).astype(np.int32), r, (255, 250, 215))
+
+        self._submit(surface, queue, smoke_batch, batch)
+
+    @staticmethod
+    def _queue_discs(batch, atlas, left, top, radii, color):
+        """Append additive disc blits at (left, top); the atlas is asked once per radius."""
+        radii = radii.tolist()
+        sprites = {r: atlas.additive_disc(r, color) for r in set(radii)}
+        batch.extend(zip(
+            map(sprites.__getitem__, radii),
+            zip(left.tolist(), top.tolist()),
+            repeat(None),
+            repeat(pygame.BLEND_ADD),
+        ))
+
+    @classmethod
+    def _queue_colored_discs(cls, batch, atlas, left, top, radii, color_keys):
+        """_queue_discs() for per-particle colors packed as 0xRRGGBB, bucketed by color."""
+        for key in np.unique(color_keys).tolist():
+            m = color_keys == key
+            color = ((key >> 16) & 0xFF, (key >> 8) & 0xFF, key & 0xFF)
+            cls._queue_discs(batch, atlas, left[m], top[m], radii[m], color)
+
+    @staticmethod
+    def _submit(surface, queue, smoke_batch, glow_batch):
+        # Smoke is alpha-blended and sits under the additive flame layers.
+        if queue is not None:
+            queue.extend(smoke_batch, LAYER_SMOKE, special_flags=0)
+            queue.extend(glow_batch, LAYER_PARTICLES, special_flags=pygame.BLEND_ADD)
+        else:
+            flush_blits(surface, smoke_batch)
+            flush_blits(surface, glow_batch)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -593,7 +625,7 @@ class Button:
     
     def render(self, surface):
         if self.font is None:
-            self.font = pygame.font.Font(None, self.font_size)
+            self.font = cached_font(None, self.font_size)
         
         # Background
         if not self.enabled:
@@ -622,6 +654,17 @@ class Button:
         text_surf = self.font.render(self.text, True, text_color)
         text_rect = text_surf.get_rect(center=self.rect.center)
         surface.blit(text_surf, text_rect)
+
+    def visual_state(self):
+        return (self.text, self.enabled, self.hovered, self.pressed, self.color)
+
+    def dirty_rect(self):
+        # Button plus its drop shadow; long labels can spill past the rect.
+        rect = self.rect.union(self.rect.move(0, 3))
+        if self.font is not None:
+            w, h = self.font.size(self.text)
+            rect = rect.union(pygame.Rect(0, 0, w, h).move(self.rect.centerx - w // 2, self.rect.centery - h // 2))
+        return rect
         
 
 
@@ -666,7 +709,7 @@ class Slider:
     
     def render(self, surface):
         if self.font is None:
-            self.font = pygame.font.Font(None, 24)
+            self.font = cached_font(None, 24)
         
         # Label
         label_surf = self.font.render(f"{self.label}: {int(self.value * 100)}%", True, COLORS["text"])
@@ -685,6 +728,16 @@ class Slider:
         knob_x = self.x + fill_width
         pygame.draw.circle(surface, COLORS["text"], (knob_x, self.y + 5), 12)
         pygame.draw.circle(surface, COLORS["accent"], (knob_x, self.y + 5), 8)
+
+    def visual_state(self):
+        return (self.label, int(self.width * self.value), int(self.value * 100))
+
+    def dirty_rect(self):
+        # Label above the track through the bottom of the knob (radius 12 around y + 5).
+        label_w = self.width
+        if self.font is not None:
+            label_w = max(label_w, self.font.size(f"{self.label}: 100%")[0])
+        return pygame.Rect(self.x - 12, self.y - 25, max(self.width + 24, label_w + 12), 42)
         
 
 
@@ -713,12 +766,11 @@ class Dropdown:
         try:
             down_path = resolve_resource_path("src/pics/down.png")
             up_path = resolve_resource_path("src/pics/up.png")
+            # Shared with every other Dropdown through the asset manager.
             if down_path.exists():
-                img = pygame.image.load(str(down_path))
-                self.icon_down = pygame.transform.smoothscale(img, (18, 18))
+                self.icon_down = get_asset_manager().scaled(down_path, (18, 18))
             if up_path.exists():
-                img = pygame.image.load(str(up_path))
-                self.icon_up = pygame.transform.smoothscale(img, (18, 18))
+                self.icon_up = get_asset_manager().scaled(up_path, (18, 18))
         except Exception:
             self.icon_down = None
             self.icon_up = None
@@ -767,7 +819,7 @@ class Dropdown:
     
     def render(self, surface):
         if self.font is None:
-            self.font = pygame.font.Font(None, 26)
+            self.font = cached_font(None, 26)
         self._load_icons()
         
         # Main box
@@ -814,6 +866,22 @@ class Dropdown:
                 text = self.font.render(label, True, COLORS["text"])
                 surface.blit(text, (self.x + 15, opt_rect.y + 10))
 
+    def visual_state(self):
+        hovered = None
+        if self.is_open:
+            mouse_pos = pygame.mouse.get_pos()
+            for i in range(len(self.options)):
+                if self._option_rect(i).collidepoint(mouse_pos):
+                    hovered = i
+                    break
+        return (self.selected_idx, self.is_open, self.open_upward, tuple(self.options), hovered)
+
+    def dirty_rect(self):
+        rect = self.rect.copy()
+        if self.is_open and self.options:
+            rect = rect.union(self._option_rect(0)).union(self._option_rect(len(self.options) - 1))
+        return rect
+
 class Checkbox:
     def __init__(self, x, y, size, label, initial=False):
         self.rect = pygame.Rect(x, y, size, size)
@@ -831,7 +899,7 @@ class Checkbox:
     
     def render(self, surface):
         if self.font is None:
-            self.font = pygame.font.Font(None, 24)
+            self.font = cached_font(None, 24)
             
         # Box
         pygame.draw.rect(surface, COLORS["bg_card"], self.rect, border_radius=4)
@@ -845,6 +913,13 @@ class Checkbox:
         # Label
         label_surf = self.font.render(self.label, True, COLORS["text"])
         surface.blit(label_surf, (self.rect.right + 10, self.rect.y + (self.size - 24)//2 + 4))
+
+    def visual_state(self):
+        return (self.label, self.checked)
+
+    def dirty_rect(self):
+        label_w = self.font.size(self.label)[0] if self.font is not None else 200
+        return pygame.Rect(self.rect.x, self.rect.y, self.size + 10 + label_w, max(self.size, 24))
         
 
 
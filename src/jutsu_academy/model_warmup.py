@@ -0,0 +1,121 @@
+"""
+Background warm-up for the models a game session needs.
+
+start_game used to create the hand/face landmarkers behind a blocking LOADING
+screen, every time Play was pressed. ModelWarmup runs the same loaders on one
+daemon thread once the menu is on screen, highest priority first, and exposes
+each as a concurrent.futures.Future. wait() returns at once for a finished
+task; a task that has not started yet is taken off the queue and run on the
+caller's thread instead of waiting behind lower-priority work.
+"""
+
+import heapq
+import threading
+import time
+from concurrent.futures import Future
+
+
+class ModelWarmup:
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._heap = []          # (priority, order, name)
+        self._pending = {}       # name -> fn, for tasks nobody has started
+        self._futures = {}
+        self._order = 0
+        self._thread = None
+        self._stopping = False
+        self.timings_ms = {}
+
+    @property
+    def started(self):
+        return self._thread is not None
+
+    def schedule(self, name, fn, priority=0):
+        """Queue fn() under `name`; lower priority runs first. Returns the task's Future."""
+        with self._cond:
+            future = self._futures.get(name)
+            if future is not None:
+                return future
+            future = Future()
+            self._futures[name] = future
+            self._pending[name] = fn
+            heapq.heappush(self._heap, (priority, self._order, name))
+            self._order += 1
+            self._cond.notify()
+            return future
+
+    def start(self):
+        with self._cond:
+            if self._thread is not None:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._worker_loop, name="model-warmup", daemon=True)
+        self._thread.start()
+
+    def _take(self, name):
+        with self._cond:
+            return self._pending.pop(name, None)
+
+    def _run(self, name, fn):
+        future = self._futures[name]
+        if not future.set_running_or_notify_cancel():
+            return
+        t0 = time.perf_counter()
+        try:
+            result = fn()
+        except Exception as e:
+            print(f"[!] Warm-up '{name}' failed: {e}")
+            future.set_exception(e)
+            return
+        finally:
+            self.timings_ms[name] = round((time.perf_counter() - t0) * 1000.0, 1)
+        print(f"[+] Warm-up '{name}' ready in {self.timings_ms[name]:.0f} ms")
+        future.set_result(result)
+
+    def _worker_loop(self):
+        while True:
+            with self._cond:
+                while not self._stopping and not self._heap:
+                    self._cond.wait()
+                if self._stopping:
+                    return
+                _, _, name = heapq.heappop(self._heap)
+                fn = self._pending.pop(name, None)
+            if fn is not None:
+                self._run(name, fn)
+
+    def is_ready(self, name):
+        future = self._futures.get(name)
+        return future is not None and future.done()
+
+    def wait(self, name, timeout=None):
+        """Result of task `name`, running it here if the worker has not picked it up yet."""
+        future = self._futures.get(name)
+        if future is None:
+            raise KeyError(f"no warm-up task named {name!r}")
+        if not future.done():
+            fn = self._take(name)
+            if fn is not None:
+                self._run(name, fn)
+        return future.result(timeout=timeout)
+
+    def discard(self, name):
+        """Forget a finished task so the next schedule() under `name` runs it again."""
+        with self._cond:
+            future = self._futures.get(name)
+            if future is not None and future.done():
+                del self._futures[name]
+
+    def stop(self):
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+
+    def stats(self):
+        tasks = {}
+        for name, future in list(self._futures.items()):
+            if not future.done():
+                tasks[name] = "running" if future.running() else "queued"
+            else:
+                tasks[name] = "failed" if future.exception() is not None else "ready"
+        return {"tasks": tasks, "timings_ms": dict(self.timings_ms)}
@@ -1,4 +1,3 @@
-from supabase import create_client, Client
 from pathlib import Path
 import json
 import time
@@ -8,7 +7,6 @@ import cv2
 import threading
 import hashlib
 import datetime
-import requests
 import sys
 from email.utils import parsedate_to_datetime
 
@@ -135,9 +133,10 @@ class NetworkManager:
         
         if not self.url or not self.key:
             print("[!] Supabase credentials missing (checked .env, web/.env.local)")
-            self.client = None
-        else:
-            self.client: Client = create_client(self.url, self.key)
+        # The supabase client (and its httpx/realtime import tree) is created on first use.
+        self._client = None
+        self._client_failed = False
+        self._client_lock = threading.Lock()
 
         allow_direct_raw = str(env.get("ALLOW_DIRECT_LEADERBOARD_WRITE", "")).strip().lower()
         self.allow_direct_leaderboard_write = allow_direct_raw in {"1", "true", "yes", "on"}
@@ -160,6 +159,24 @@ class NetworkManager:
         self.active_username = ""
         self.active_discord_id = ""
 
+    @property
+    def configured(self):
+        """True when credentials exist, without creating the client."""
+        return bool(self.url and self.key)
+
+    @property
+    def client(self):
+        if self._client is None and not self._client_failed and self.configured:
+            with self._client_lock:
+                if self._client is None and not self._client_failed:
+                    try:
+                        from supabase import create_client
+                        self._client = create_client(self.url, self.key)
+                    except Exception as e:
+                        print(f"[!] Supabase client unavailable: {e}")
+                        self._client_failed = True
+        return self._client
+
     def set_active_identity(self, username=None, discord_id=None):
         """Set the active client identity used for guarded RPC calls."""
         self.active_username = str(username or "").strip()
@@ -579,6 +596,8 @@ class NetworkManager:
             headers["apikey"] = self.key
             headers["Authorization"] = f"Bearer {self.key}"
 
+        import requests
+
         base = self.url.rstrip("/")
         candidates = [base, f"{base}/rest/v1/"]
 
@@ -0,0 +1,134 @@
+"""
+Structure-of-arrays particle storage for the fire/phoenix systems and the water dragon.
+
+Every attribute lives in one preallocated NumPy array indexed by particle slot,
+so update() is a handful of vectorized ops instead of a Python call per
+particle, and spawning writes whole batches at once. Dead particles are
+removed by alive-mask compaction, which keeps live particles packed in
+[0, count) and preserves their spawn order (older particles draw first).
+"""
+
+import math
+
+import numpy as np
+
+# Particle kinds (stored as small ints in ParticleBuffer.kind).
+KIND_FIREBALL_CORE = 0
+KIND_FIREBALL_EMBER = 1
+KIND_FIREBALL_SPARK = 2
+KIND_FIREBALL_SMOKE = 3
+KIND_PHOENIX = 4
+
+_FLOAT_FIELDS = ("x", "y", "vx", "vy", "life", "max_life", "size", "sway", "gravity", "drag")
+
+
+def _head(value, n):
+    arr = np.asarray(value)
+    return arr if arr.ndim == 0 else arr[:n]
+
+
+class ParticleBuffer:
+    def __init__(self, capacity=150):
+        self.capacity = 0
+        self.count = 0
+        self._allocate(max(1, int(capacity)))
+
+    def _allocate(self, capacity):
+        old_count = self.count
+        old = {name: getattr(self, name, None) for name in _FLOAT_FIELDS + ("color", "kind")}
+        for name in _FLOAT_FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float32))
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        keep = min(old_count, capacity)
+        if keep > 0:
+            for name, arr in old.items():
+                getattr(self, name)[:keep] = arr[:keep]
+        self.capacity = capacity
+        self.count = keep
+
+    def resize(self, capacity):
+        capacity = max(1, int(capacity))
+        if capacity != self.capacity:
+            self._allocate(capacity)
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def free_slots(self):
+        return self.capacity - self.count
+
+    def spawn(self, x, y, vx, vy, life, size, color, kind=0, sway=0.0, gravity=0.0, drag=1.0):
+        """Append a batch; scalars broadcast. Returns how many were actually added."""
+        life = np.asarray(life, dtype=np.float32).reshape(-1)
+        n = min(life.size, self.free_slots())
+        if n <= 0:
+            return 0
+        s = slice(self.count, self.count + n)
+        for name, value in (
+            ("x", x), ("y", y), ("vx", vx), ("vy", vy), ("size", size),
+            ("kind", kind), ("sway", sway), ("gravity", gravity), ("drag", drag),
+        ):
+            getattr(self, name)[s] = _head(value, n)
+        self.life[s] = life[:n]
+        self.max_life[s] = life[:n]
+        self.color[s] = _head(np.asarray(color, dtype=np.uint8), n) if np.ndim(color) > 1 else color
+        self.count += n
+        return n
+
+    def update(self, dt, wind_x=0.0, now=0.0):
+        """Velocity, gravity, lifetime and sway integration for all live particles."""
+        n = self.count
+        if n <= 0:
+            return
+        dt = np.float32(dt)
+        x = self.x[:n]
+        y = self.y[:n]
+        vy = self.vy[:n]
+        x += (self.vx[:n] + np.float32(wind_x)) * dt
+        y += vy * dt
+        vy += self.gravity[:n] * dt
+        self.life[:n] -= dt
+        # Wrap the phase in float64 first: at epoch-sized `now` a float32 only resolves ~1000 s steps.
+        phase = np.float32(math.fmod(now * 5.0, math.tau))
+        x += np.sin(phase + y * np.float32(0.05)) * self.sway[:n] * dt
+        self.compact()
+
+    def update_damped(self, dt):
+        """Drag-then-gravity integration used by the water dragon's particles."""
+        n = self.count
+        if n <= 0:
+            return
+        dt = np.float32(dt)
+        vx = self.vx[:n]
+        vy = self.vy[:n]
+        drag = self.drag[:n]
+        vx *= drag
+        vy *= drag
+        vy += self.gravity[:n] * dt
+        self.x[:n] += vx * dt
+        self.y[:n] += vy * dt
+        self.life[:n] -= dt
+        self.compact()
+
+    def compact(self):
+        n = self.count
+        if n <= 0:
+            return
+        alive = self.life[:n] > 0.0
+        keep = int(np.count_nonzero(alive))
+        if keep == n:
+            return
+        for name in _FLOAT_FIELDS:
+            arr = getattr(self, name)
+            arr[:keep] = arr[:n][alive]
+        self.color[:keep] = self.color[:n][alive]
+        self.kind[:keep] = self.kind[:n][alive]
+        self.count = keep
+
+    def life_ratio(self):
+        n = self.count
+        return np.clip(self.life[:n] / np.maximum(self.max_life[:n], 1e-6), 0.0, 1.0)
@@ -0,0 +1,125 @@
+"""
+Dirty-rectangle presentation and idle throttling for static screens.
+
+About, Quests, the Jutsu Library, Settings, Leaderboard and Practice Select are
+drawn immediate-mode like every other screen, so the main loop used to
+redraw and flip them at full FPS even when nothing on them changed. For those
+screens the loop asks plan() what the next frame needs:
+
+- "full": the screen signature changed (state, window size, scroll offset,
+  loaded data, open modal), a non-motion input event arrived, or the periodic
+  refresh came due (covers background-thread updates the signature misses).
+- "rects": only widgets whose visual_state() changed, or hover regions whose
+  hover flag flipped, need presenting; the frame is rendered into the back
+  buffer and only those rectangles go to display.update().
+- "skip": nothing changed; no render, no flip, and the loop ticks at
+  idle_fps instead of FPS.
+
+Hover highlights drawn outside the widget classes register their rect through
+hover(), which is a drop-in for rect.collidepoint(mouse_pos).
+"""
+
+import time
+
+import pygame
+
+DEFAULT_IDLE_FPS = 20
+DEFAULT_REFRESH_SEC = 0.5
+
+FULL = "full"
+RECTS = "rects"
+SKIP = "skip"
+
+# Pointer movement only matters where it changes a widget or hover region, which plan() diffs itself.
+_PASSIVE_EVENTS = frozenset({pygame.MOUSEMOTION})
+
+
+class RedrawScheduler:
+    def __init__(self, idle_fps=DEFAULT_IDLE_FPS, refresh_sec=DEFAULT_REFRESH_SEC, enabled=True):
+        self.enabled = bool(enabled)
+        self.idle_fps = max(1, int(idle_fps))
+        self.refresh_sec = float(refresh_sec)
+        self.idle = False
+        self._key = None
+        self._last_full = 0.0
+        self._widgets = {}          # id(widget) -> (visual_state, dirty_rect) as last presented
+        self._hover_regions = []    # (rect, hovered) registered by the last render
+        self._hover_next = []
+        self.frames = {FULL: 0, RECTS: 0, SKIP: 0}
+
+    def hover(self, rect, mouse_pos=None):
+        """rect.collidepoint() for hover effects, remembered so a hover change triggers a redraw."""
+        if mouse_pos is None:
+            mouse_pos = pygame.mouse.get_pos()
+        hovered = bool(rect.collidepoint(mouse_pos))
+        self._hover_next.append((pygame.Rect(rect), hovered))
+        return hovered
+
+    def begin_render(self):
+        self._hover_next = []
+
+    def end_render(self):
+        self._hover_regions = self._hover_next
+        self._hover_next = []
+
+    def reset(self):
+        self._key = None
+        self._widgets = {}
+        self._hover_regions = []
+        self.idle = False
+
+    def plan(self, key, events, widgets, now=None):
+        """Return (mode, rects) for the next frame; key=None means the screen always redraws fully."""
+        if not self.enabled or key is None:
+            self.reset()
+            self.frames[FULL] += 1
+            return FULL, []
+
+        now = time.perf_counter() if now is None else now
+        full = (
+            key != self._key
+            or now - self._last_full >= self.refresh_sec
+            or any(event.type not in _PASSIVE_EVENTS for event in events)
+        )
+
+        rects = []
+        widgets_now = {}
+        for widget in widgets:
+            state = widget.visual_state()
+            rect = widget.dirty_rect()
+            prev = self._widgets.get(id(widget))
+            if prev is None or prev[0] != state:
+                # Union with the old rect so a shrinking widget (closing dropdown) clears what it covered.
+                rects.append(rect if prev is None else rect.union(prev[1]))
+            widgets_now[id(widget)] = (state, rect)
+        self._widgets = widgets_now
+
+        mouse_pos = pygame.mouse.get_pos()
+        for rect, hovered in self._hover_regions:
+            if bool(rect.collidepoint(mouse_pos)) != hovered:
+                rects.append(rect)
+
+        self._key = key
+        if full:
+            self._last_full = now
+            mode = FULL
+            rects = []
+        elif rects:
+            mode = RECTS
+        else:
+            mode = SKIP
+        self.idle = mode == SKIP
+        self.frames[mode] += 1
+        return mode, rects
+
+    def tick_rate(self, fps):
+        return min(fps, self.idle_fps) if self.idle else fps
+
+    def stats(self):
+        total = sum(self.frames.values())
+        return {
+            "enabled": self.enabled,
+            "idle_fps": self.idle_fps,
+            "frames": dict(self.frames),
+            "skip_rate": round(self.frames[SKIP] / total, 4) if total else 0.0,
+        }
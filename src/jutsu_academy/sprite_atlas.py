@@ -0,0 +1,141 @@
+"""
+Shared cache of pre-rendered effect sprites (glow discs, trails, smoke puffs, flares).
+
+Particle renderers used to allocate a fresh SRCALPHA surface and draw a circle
+for every particle layer on every frame. The atlas renders each distinct sprite
+once and hands the same Surface back on later requests, bounded by an LRU.
+
+Additive blits (BLEND_ADD / BLEND_RGB_ADD onto the opaque screen) ignore source
+alpha, so additive_disc() keys on (radius, color) only; that keeps the whole
+fire palette within a few hundred entries. Sprites drawn with normal alpha
+blending key on a quantized alpha instead.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+DEFAULT_MAX_ENTRIES = 2048
+DEFAULT_ALPHA_STEP = 8
+
+
+class SpriteAtlas:
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, alpha_step=DEFAULT_ALPHA_STEP):
+        self.max_entries = max(64, int(max_entries))
+        self.alpha_step = max(1, int(alpha_step))
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def quantize_alpha(self, alpha):
+        a = max(0, min(255, int(alpha)))
+        step = self.alpha_step
+        return min(255, int(round(a / step) * step))
+
+    def get(self, key, factory):
+        """Return the cached surface for key, building it with factory() on a miss."""
+        surf = self._entries.get(key)
+        if surf is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = factory()
+        self._entries[key] = surf
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return surf
+
+    def disc(self, radius, color, alpha=255):
+        """(2r x 2r) SRCALPHA surface with one filled circle; alpha is quantized."""
+        if alpha == 255:
+            # Hot path: exact key already normalized by the caller.
+            key = ("disc", radius, color, 255)
+            surf = self._entries.get(key)
+            if surf is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return surf
+        r = max(1, int(radius))
+        rgb = tuple(int(c) for c in color[:3])
+        a = self.quantize_alpha(alpha)
+        return self.get(("disc", r, rgb, a), lambda: _draw_disc(r, rgb, a))
+
+    def additive_disc(self, radius, color):
+        """Disc for BLEND_ADD blits, where source alpha has no effect on the result."""
+        return self.disc(radius, color, 255)
+
+    def smoke_puff(self, radius, color, alpha, inner_color, inner_ratio=0.70, inner_alpha_ratio=0.72):
+        r = max(1, int(radius))
+        rgb = tuple(int(c) for c in color[:3])
+        inner_rgb = tuple(int(c) for c in inner_color[:3])
+        a = self.quantize_alpha(alpha)
+
+        def build():
+            surf = _draw_disc(r, rgb, a)
+            inner_r = max(2, int(r * inner_ratio))
+            pygame.draw.circle(surf, (*inner_rgb, max(0, int(a * inner_alpha_ratio))), (r, r), inner_r)
+            return surf
+
+        return self.get(("smoke", r, rgb, a, inner_rgb, inner_ratio, inner_alpha_ratio), build)
+
+    def rotated_ellipse(self, half_w, half_h, color, alpha, angle_deg, angle_step=3):
+        """Filled ellipse (2w x 2h) rotated by a quantized angle; used for muzzle flares."""
+        w = max(1, int(half_w))
+        h = max(1, int(half_h))
+        rgb = tuple(int(c) for c in color[:3])
+        a = self.quantize_alpha(alpha)
+        angle = int(round(float(angle_deg) / angle_step) * angle_step) % 360
+
+        def build():
+            surf = pygame.Surface((w * 2, h * 2), pygame.SRCALPHA)
+            pygame.draw.ellipse(surf, (*rgb, a), (0, 0, w * 2, h * 2))
+            return pygame.transform.rotate(surf, angle)
+
+        return self.get(("ellipse", w, h, rgb, a, angle), build)
+
+    def prewarm_additive_discs(self, radii, colors):
+        for color in colors:
+            for r in radii:
+                self.additive_disc(r, color)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+def _draw_disc(r, rgb, a):
+    surf = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surf, (*rgb, a), (r, r), r)
+    return surf
+
+
+def flush_blits(target, batch):
+    """Submit (surface, dest, area, special_flags) tuples in one Surface.blits() call."""
+    if batch:
+        target.blits(batch, doreturn=False)
+        batch.clear()
+
+
+_shared_atlas = None
+
+
+def get_sprite_atlas():
+    global _shared_atlas
+    if _shared_atlas is None:
+        _shared_atlas = SpriteAtlas()
+    return _shared_atlas
@@ -0,0 +1,139 @@
+"""
+LRU cache of rendered text surfaces.
+
+Menus, the gameplay HUD and the shared widgets call font.render() for the same
+strings every frame (labels, button captions, sign names, XP). CachedFont wraps
+a pygame.font.Font and answers render() from a shared TextSurfaceCache keyed on
+(font, style, text, antialias, color, background); every other attribute goes
+to the wrapped font. The cache is bounded both by entry count and by surface
+memory, so per-frame strings like timers only churn the cold end of the LRU.
+
+Returned surfaces are shared between callers: copy() one before changing it
+(set_alpha, drawing onto it).
+"""
+
+import itertools
+from collections import OrderedDict
+
+import pygame
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_MB = 32.0
+
+_STYLE_ATTRS = ("bold", "italic", "underline", "strikethrough")
+_font_ids = itertools.count()
+
+
+def _color_key(color):
+    if type(color) is tuple or isinstance(color, str):
+        return color
+    return tuple(color)
+
+
+class TextSurfaceCache:
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_mb=DEFAULT_MAX_MB):
+        self.max_entries = max(16, int(max_entries))
+        self.max_bytes = int(float(max_mb) * 1024 * 1024)
+        self._entries = OrderedDict()  # key -> (surface, nbytes)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def render(self, font, font_key, text, antialias, color, background=None):
+        """font.render(...) through the cache; font_key identifies font and style."""
+        key = (
+            font_key,
+            text,
+            bool(antialias),
+            _color_key(color),
+            None if background is None else _color_key(background),
+        )
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        if background is None:
+            surf = font.render(text, antialias, color)
+        else:
+            surf = font.render(text, antialias, color, background)
+        nbytes = surf.get_bytesize() * surf.get_width() * surf.get_height()
+        # A single huge string is not worth flushing a quarter of the cache for.
+        if nbytes * 4 <= self.max_bytes:
+            self._entries[key] = (surf, nbytes)
+            self.bytes += nbytes
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+        return surf
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "mb": round(self.bytes / (1024 * 1024), 2),
+        }
+
+
+class CachedFont:
+    """pygame.font.Font stand-in whose render() goes through a TextSurfaceCache."""
+
+    def __init__(self, font, cache=None):
+        object.__setattr__(self, "font", font)
+        object.__setattr__(self, "cache", cache if cache is not None else get_text_cache())
+        object.__setattr__(self, "_id", next(_font_ids))
+        self._restyle()
+
+    def _restyle(self):
+        style = tuple(bool(getattr(self.font, attr, False)) for attr in _STYLE_ATTRS)
+        object.__setattr__(self, "_key", (self._id, style))
+
+    def render(self, text, antialias, color, background=None):
+        return self.cache.render(self.font, self._key, text, antialias, color, background)
+
+    def __getattr__(self, name):
+        attr = getattr(self.font, name)
+        if name.startswith("set_") and name[4:] in _STYLE_ATTRS:
+            def set_style(value):
+                attr(value)
+                self._restyle()
+
+            return set_style
+        return attr
+
+    def __setattr__(self, name, value):
+        if name in _STYLE_ATTRS:
+            setattr(self.font, name, value)
+            self._restyle()
+            return
+        object.__setattr__(self, name, value)
+
+
+def cached_font(path, size, cache=None):
+    """CachedFont for pygame.font.Font(path, size)."""
+    return CachedFont(pygame.font.Font(path, size), cache)
+
+
+_shared_cache = None
+
+
+def get_text_cache():
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = TextSurfaceCache()
+    return _shared_cache
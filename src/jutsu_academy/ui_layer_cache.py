@@ -0,0 +1,68 @@
+"""
+Pre-rendered static UI layers (backgrounds, gradients, dim overlays, HUD strips).
+
+Menu and modal screens used to rebuild these every frame: the menu drew its
+top and bottom gradients one pygame.draw.line per row, and most screens
+allocated and filled a full-screen SRCALPHA overlay just to darken the
+background. A layer is built once by its factory and reused until the screen
+size changes or the caller invalidates it; keys are (size, layer id, params),
+so a layer whose look depends on state (which background image, which alpha)
+puts that state in params.
+"""
+
+import pygame
+
+
+class UILayerCache:
+    def __init__(self):
+        self._layers = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._layers)
+
+    def get(self, layer_id, size, factory, params=()):
+        """Return the cached surface for (size, layer_id, params), building it with factory() on a miss."""
+        key = (tuple(size), layer_id, params)
+        surf = self._layers.get(key)
+        if surf is not None:
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = factory()
+        self._layers[key] = surf
+        return surf
+
+    def solid(self, size, rgba):
+        """Full-size surface filled with one RGBA colour (the usual modal dimmer)."""
+        rgba = tuple(int(c) for c in rgba)
+
+        def build():
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            surf.fill(rgba)
+            return surf
+
+        return self.get("solid", size, build, rgba)
+
+    def invalidate(self, layer_id=None):
+        """Drop every layer, or only those built under layer_id."""
+        if layer_id is None:
+            self._layers.clear()
+            return
+        for key in [key for key in self._layers if key[1] == layer_id]:
+            del self._layers[key]
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "layers": len(self._layers),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "mb": round(
+                sum(s.get_bytesize() * s.get_width() * s.get_height() for s in self._layers.values())
+                / (1024 * 1024),
+                1,
+            ),
+        }
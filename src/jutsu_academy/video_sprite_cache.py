@@ -0,0 +1,334 @@
+"""
+Pre-decoded, pre-feathered jutsu video overlays.
+
+The playing loop used to read the overlay clip with VideoCapture every frame,
+resize it, rebuild the radial feather mask in float32, convert colour,
+rot90/flipud and make a new surface, then seek back to frame 0 to loop.
+
+VideoSpriteCache decodes each clip on a background thread into compact uint8
+frames at a capped master resolution, with the feather already multiplied in
+(premultiplied against black, which is all BLEND_RGB_ADD needs). Clips whose
+decoded size fits max_clip_bytes are decoded once and kept; longer clips are
+streamed instead: a decoder thread prefetches a bounded number of frames ahead
+into a queue and wraps around at the end itself, so the render thread never
+seeks. Playback follows the wall clock at the clip's own frame rate, and a
+streamed clip drops queued frames it has fallen behind on.
+
+Playback asks for the current frame at a quantized on-screen size. Each size
+owns one persistent BGRA buffer and the surface that wraps it, so a frame costs
+a single small resize into that buffer; nothing is allocated per frame.
+"""
+
+import queue
+import threading
+import time
+
+import cv2
+import numpy as np
+import pygame
+
+DEFAULT_MASTER_EDGE = 480
+DEFAULT_SIZE_STEP = 40
+DEFAULT_MAX_CLIP_BYTES = 48 * 1024 * 1024
+DEFAULT_PREFETCH_FRAMES = 24
+DEFAULT_STREAM_BYTES = 16 * 1024 * 1024
+MIN_OVERLAY_SIZE = 320
+MAX_OVERLAY_SIZE = 920
+
+
+def feather_mask(w, h, start=0.65, power=1.5):
+    """Elliptical radial fade: 1.0 inside `start` of the radius, 0.0 at the edge."""
+    Y, X = np.ogrid[:h, :w]
+    center_x, center_y = w // 2, h // 2
+    dist = np.sqrt(((X - center_x) / (w / 2)) ** 2 + ((Y - center_y) / (h / 2)) ** 2)
+    mask = np.clip(1.0 - (dist - start) / (1.0 - start), 0, 1)
+    return (mask ** power).astype(np.float32)
+
+
+class _Clip:
+    """Fully decoded clip; frames become playable as they are appended."""
+
+    streaming = False
+
+    def __init__(self, path):
+        self.path = path
+        self.frames = []
+        self.aspect = 1.0
+        self.fps = 30.0
+        self.done = False
+        self.failed = False
+        self.started_at = time.perf_counter()
+
+    def restart(self):
+        self.started_at = time.perf_counter()
+
+    def ready(self):
+        return bool(self.frames)
+
+    def current(self, now):
+        n = len(self.frames)
+        if n == 0:
+            return None, None
+        index = int((now - self.started_at) * self.fps)
+        # Loop once fully decoded; while loading, hold the newest frame.
+        index = index % n if self.done else min(index, n - 1)
+        return index, self.frames[index]
+
+
+class _StreamingClip:
+    """Clip played from a bounded prefetch queue filled by its own decoder thread."""
+
+    streaming = True
+
+    def __init__(self, path, queue_len):
+        self.path = path
+        self.aspect = 1.0
+        self.fps = 30.0
+        self.done = True
+        self.failed = False
+        self.frames_dropped = 0
+        self._queue = queue.Queue(maxsize=max(2, int(queue_len)))
+        self._generation = 0
+        self._stop = threading.Event()
+        self._current = None  # (generation, seq, frame)
+        self.started_at = time.perf_counter()
+
+    def restart(self):
+        self._generation += 1
+        self._current = None
+        self.started_at = time.perf_counter()
+        # Free the slots now so the decoder isn't stuck behind stale frames.
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+    def ready(self):
+        return self._current is not None or not self._queue.empty()
+
+    def current(self, now):
+        target = int((now - self.started_at) * self.fps)
+        gen = self._generation
+        cur = self._current
+        pulled = 0
+        while cur is None or cur[1] < target:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item[0] != gen:
+                continue
+            cur = item
+            pulled += 1
+        # Every frame pulled past the first in one call was never shown.
+        self.frames_dropped += max(0, pulled - 1)
+        self._current = cur
+        if cur is None:
+            return None, None
+        return cur[1], cur[2]
+
+    def stop(self):
+        self._stop.set()
+
+    def run(self, cap, prepare):
+        seq = 0
+        gen = self._generation
+        try:
+            while not self._stop.is_set():
+                if gen != self._generation:
+                    gen = self._generation
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                    seq = 0
+                ret, frame = cap.read()
+                if not ret:
+                    # Wrap on the decoder thread; seq keeps counting so playback never jumps back.
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                    ret, frame = cap.read()
+                    if not ret:
+                        print(f"[!] Video overlay stream ended unexpectedly: {self.path}")
+                        self.failed = True
+                        return
+                item = (gen, seq, prepare(frame))
+                seq += 1
+                while not self._stop.is_set():
+                    try:
+                        self._queue.put(item, timeout=0.1)
+                        break
+                    except queue.Full:
+                        if gen != self._generation:
+                            break
+        finally:
+            cap.release()
+
+
+class VideoSpriteCache:
+    def __init__(
+        self,
+        master_edge=DEFAULT_MASTER_EDGE,
+        size_step=DEFAULT_SIZE_STEP,
+        max_clip_bytes=DEFAULT_MAX_CLIP_BYTES,
+        prefetch_frames=DEFAULT_PREFETCH_FRAMES,
+        max_stream_bytes=DEFAULT_STREAM_BYTES,
+    ):
+        self.master_edge = int(master_edge)
+        self.size_step = max(1, int(size_step))
+        self.max_clip_bytes = int(max_clip_bytes)
+        self.prefetch_frames = max(2, int(prefetch_frames))
+        self.max_stream_bytes = int(max_stream_bytes)
+        self._clips = {}
+        self._lock = threading.Lock()
+        self._targets = {}  # (w, h) -> (bgra buffer, surface sharing it)
+        self._last_key = None
+
+    def request(self, name, path):
+        """Start decoding `path` under `name` unless it is already loaded or loading."""
+        key = str(name).lower()
+        path = str(path)
+        with self._lock:
+            clip = self._clips.get(key)
+            if clip is not None and clip.path == path and not clip.failed:
+                return clip
+            if clip is not None and clip.streaming:
+                clip.stop()
+            clip = _Clip(path)
+            self._clips[key] = clip
+        threading.Thread(target=self._open, args=(key, clip), daemon=True).start()
+        return clip
+
+    def play(self, name, path):
+        """request() and restart playback from the first frame."""
+        self.request(name, path).restart()
+
+    def _open(self, key, clip):
+        cap = cv2.VideoCapture(clip.path)
+        ret, first = cap.read() if cap.isOpened() else (False, None)
+        if not ret:
+            print(f"[!] Video overlay unreadable: {clip.path}")
+            cap.release()
+            clip.failed = True
+            clip.done = True
+            return
+
+        v_h, v_w = first.shape[:2]
+        scale = min(1.0, self.master_edge / float(max(v_w, v_h)))
+        m_w = max(1, int(round(v_w * scale)))
+        m_h = max(1, int(round(v_h * scale)))
+        # Feather once per clip; per-size resizes keep it because the mask is smooth.
+        mask3 = feather_mask(m_w, m_h)[:, :, None]
+
+        def prepare(frame):
+            if frame.shape[1] != m_w or frame.shape[0] != m_h:
+                frame = cv2.resize(frame, (m_w, m_h), interpolation=cv2.INTER_AREA)
+            return (frame.astype(np.float32) * mask3).astype(np.uint8)
+
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        fps = float(fps) if fps and np.isfinite(fps) and fps > 0 else 30.0
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+        frame_bytes = m_w * m_h * 3
+
+        if 0 < frame_count * frame_bytes <= self.max_clip_bytes:
+            clip.aspect = v_w / float(max(1, v_h))
+            clip.fps = fps
+            self._decode_all(clip, cap, first, prepare)
+            return
+
+        # Too long (or unknown length): stream with a bounded prefetch queue.
+        queue_len = min(self.prefetch_frames, max(2, self.max_stream_bytes // max(1, frame_bytes)))
+        stream = _StreamingClip(clip.path, queue_len)
+        stream.aspect = v_w / float(max(1, v_h))
+        stream.fps = fps
+        stream.started_at = clip.started_at
+        with self._lock:
+            if self._clips.get(key) is not clip:
+                cap.release()
+                return
+            self._clips[key] = stream
+        print(f"[+] Video overlay streaming: {clip.path} ({queue_len} frame prefetch)")
+        cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        stream.run(cap, prepare)
+
+    def _decode_all(self, clip, cap, first, prepare):
+        try:
+            frame = first
+            while frame is not None:
+                clip.frames.append(prepare(frame))
+                ret, frame = cap.read()
+                if not ret:
+                    frame = None
+            print(f"[+] Video overlay cached: {clip.path} ({len(clip.frames)} frames)")
+        except Exception as e:
+            print(f"[!] Video overlay decode failed: {e}")
+            clip.failed = not clip.frames
+        finally:
+            cap.release()
+            clip.done = True
+
+    def is_ready(self, name):
+        clip = self._clips.get(str(name).lower())
+        return clip is not None and clip.ready()
+
+    def quantize_size(self, size):
+        size = max(MIN_OVERLAY_SIZE, min(MAX_OVERLAY_SIZE, int(size)))
+        return int(round(size / float(self.size_step)) * self.size_step)
+
+    def sprite(self, name, size, now=None):
+        """Feathered overlay surface for the clip's current frame at the quantized `size`, or None while loading."""
+        key_name = str(name).lower()
+        clip = self._clips.get(key_name)
+        if clip is None:
+            return None
+        index, frame = clip.current(time.perf_counter() if now is None else now)
+        if frame is None:
+            return None
+        size = self.quantize_size(size)
+        if clip.aspect > 1:
+            dw, dh = size, max(1, int(size / clip.aspect))
+        else:
+            dw, dh = max(1, int(size * clip.aspect)), size
+
+        target = self._targets.get((dw, dh))
+        if target is None:
+            buf = np.zeros((dh, dw, 4), dtype=np.uint8)
+            # BGRA matches the display layout; alpha is ignored by BLEND_RGB_ADD.
+            target = (buf, pygame.image.frombuffer(buf, (dw, dh), "BGRA"))
+            self._targets[(dw, dh)] = target
+        buf, surf = target
+
+        key = (key_name, index, dw, dh)
+        if key != self._last_key:
+            scaled = cv2.resize(frame, (dw, dh), interpolation=cv2.INTER_LINEAR)
+            cv2.cvtColor(scaled, cv2.COLOR_BGR2BGRA, dst=buf)
+            self._last_key = key
+        return surf
+
+    def clear_targets(self):
+        self._targets.clear()
+        self._last_key = None
+
+    def close(self):
+        with self._lock:
+            clips = list(self._clips.values())
+            self._clips.clear()
+        for clip in clips:
+            if clip.streaming:
+                clip.stop()
+        self.clear_targets()
+
+    def stats(self):
+        return {
+            "cached": {
+                name: len(clip.frames) for name, clip in self._clips.items() if not clip.streaming
+            },
+            "streaming": {
+                name: {"queued": clip._queue.qsize(), "dropped": clip.frames_dropped}
+                for name, clip in self._clips.items()
+                if clip.streaming
+            },
+            "clip_mb": round(
+                sum(f.nbytes for clip in self._clips.values() if not clip.streaming for f in clip.frames)
+                / (1024 * 1024),
+                1,
+            ),
+            "targets": len(self._targets),
+        }
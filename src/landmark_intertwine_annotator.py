@@ -24,6 +24,7 @@ from __future__ import annotations
 import argparse
 import json
 import math
+import sys
 import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -31,6 +32,12 @@ from pathlib import Path
 
 import cv2
 
+try:
+    from src.frame_source import add_frame_source_args, open_frame_source, source_spec
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from src.frame_source import add_frame_source_args, open_frame_source, source_spec
+
 try:
     import mediapipe as mp
     from mediapipe.tasks import python
@@ -263,28 +270,8 @@ def display_to_norm_xy(x_px: int, y_px: int, width: int, height: int, mirror_vie
     return x, y
 
 
-def open_camera(camera_index: int, width: int, height: int):
-    backends = [("DEFAULT", None)]
-    if hasattr(cv2, "CAP_DSHOW"):
-        backends.insert(0, ("DSHOW", cv2.CAP_DSHOW))
-    if hasattr(cv2, "CAP_MSMF"):
-        backends.append(("MSMF", cv2.CAP_MSMF))
-
-    for backend_name, backend in backends:
-        cap = cv2.VideoCapture(camera_index) if backend is None else cv2.VideoCapture(camera_index, backend)
-        if not cap.isOpened():
-            cap.release()
-            continue
-        cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
-        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
-        for _ in range(18):
-            ok, _ = cap.read()
-            if ok:
-                print(f"[+] Camera {camera_index} opened via {backend_name}.")
-                return cap
-            time.sleep(0.02)
-        cap.release()
-    return None
+def open_camera(source: str, width: int, height: int, realtime: bool | None = None, loop: bool | None = None):
+    return open_frame_source(source, width, height, realtime=realtime, loop=loop, verify_reads=18)
 
 
 def draw_recording_preview(frame_bgr, result) -> None:
@@ -387,7 +374,7 @@ def draw_recording_preview(frame_bgr, result) -> None:
 
 def record_frames_from_camera(
     frames_dir: Path,
-    camera_index: int,
+    source: str,
     width: int,
     height: int,
     interval_s: float,
@@ -396,12 +383,14 @@ def record_frames_from_camera(
     model_path: Path | None = None,
     show_preview_skeleton: bool = True,
     finish_action: str = "label",
+    realtime: bool | None = None,
+    loop: bool | None = None,
 ) -> tuple[int, str]:
     frames_dir.mkdir(parents=True, exist_ok=True)
-    cap = open_camera(camera_index=camera_index, width=width, height=height)
+    cap = open_camera(source, width=width, height=height, realtime=realtime, loop=loop)
     if cap is None:
-        print(f"[-] Could not open camera {camera_index} for recording.")
-        return 0
+        print(f"[-] Could not open frame source {source!r} for recording.")
+        return 0, "quit"
 
     window_name = "Intertwine Recorder"
     cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
@@ -472,6 +461,9 @@ def record_frames_from_camera(
         while True:
             ok, frame_raw = cap.read()
             if not ok:
+                if not cap.isOpened():
+                    print("[*] Frame source ended.")
+                    break
                 time.sleep(0.01)
                 continue
             frame_view = cv2.flip(frame_raw, 1) if mirror_view else frame_raw
@@ -512,7 +504,7 @@ def record_frames_from_camera(
                 status = "REC" if recording else "PAUSED"
             cv2.putText(
                 view,
-                f"Recorder [{status}]  saved={saved}  interval={interval_s:.2f}s  cam={camera_index}",
+                f"Recorder [{status}]  saved={saved}  interval={interval_s:.2f}s  src={source}",
                 (10, 24),
                 cv2.FONT_HERSHEY_SIMPLEX,
                 0.62,
@@ -1095,6 +1087,7 @@ def main() -> int:
         action="store_true",
         help="Disable live hand-skeleton preview while recording.",
     )
+    add_frame_source_args(parser)
     args = parser.parse_args()
 
     frames_dir = Path(args.frames_dir).expanduser().resolve()
@@ -1111,7 +1104,7 @@ def main() -> int:
             return 0, "quit"
         return record_frames_from_camera(
             frames_dir=frames_dir,
-            camera_index=int(args.camera),
+            source=source_spec(args.source, int(args.camera)),
             width=max(320, int(args.record_width)),
             height=max(240, int(args.record_height)),
             interval_s=float(args.record_interval),
@@ -1120,6 +1113,8 @@ def main() -> int:
             model_path=model_path,
             show_preview_skeleton=not bool(args.no_record_preview),
             finish_action=finish_action,
+            realtime=False if args.source_fast else None,
+            loop=False if args.source_once else None,
         )
 
     if selected_mode in ("record", "both"):
@@ -0,0 +1,243 @@
+"""
+Landmark stream recorder.
+
+Writes per-frame hand landmarks, handedness, lighting stats and raw/stable
+predictions to rotating JSONL.gz files that src/replay_detection.py can replay.
+
+The caller only enqueues references to the detector output; serialization,
+compression and file rotation all happen on a background writer thread so the
+frame loop pays roughly the cost of a queue put. When the queue is full the
+frame is dropped (and counted) instead of blocking the game.
+"""
+
+import gzip
+import json
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+
+DEFAULT_MAX_FILE_BYTES = 16 * 1024 * 1024
+DEFAULT_MAX_FILES = 8
+DEFAULT_QUEUE_SIZE = 900
+
+
+def default_log_dir() -> Path:
+    override = str(os.getenv("JUTSU_LANDMARK_LOG_DIR", "")).strip()
+    if override:
+        return Path(override).expanduser().resolve()
+    return Path.home() / ".jutsu_academy" / "landmark_logs"
+
+
+def _hands_payload(hand_landmarks, handedness):
+    hands = []
+    for idx, landmarks in enumerate(hand_landmarks or []):
+        side = "Unknown"
+        score = 0.0
+        if handedness and idx < len(handedness) and handedness[idx]:
+            category = handedness[idx][0]
+            side = str(getattr(category, "category_name", "Unknown"))
+            score = float(getattr(category, "score", 0.0) or 0.0)
+        hands.append({
+            "handedness": side,
+            "score": round(score, 3),
+            "landmarks": [[round(lm.x, 5), round(lm.y, 5), round(lm.z, 5)] for lm in landmarks],
+        })
+    return hands
+
+
+class LandmarkStreamRecorder:
+    def __init__(
+        self,
+        out_dir=None,
+        prefix="session",
+        max_file_bytes=DEFAULT_MAX_FILE_BYTES,
+        max_files=DEFAULT_MAX_FILES,
+        queue_size=DEFAULT_QUEUE_SIZE,
+    ):
+        self.out_dir = Path(out_dir) if out_dir else default_log_dir()
+        self.prefix = str(prefix or "session")
+        self.max_file_bytes = max(64 * 1024, int(max_file_bytes))
+        self.max_files = max(1, int(max_files))
+        self.queue = queue.Queue(maxsize=max(16, int(queue_size)))
+        self.dropped_frames = 0
+        self.written_frames = 0
+        self.current_path = None
+        self._raw_file = None
+        self._gz_file = None
+        self._part = 0
+        self._session_tag = ""
+        self._thread = None
+        self._stopping = False
+        self._stop_token = object()
+
+    @property
+    def active(self):
+        return self._thread is not None and self._thread.is_alive() and not self._stopping
+
+    def start(self, meta=None):
+        if self.active:
+            return True
+        if self._thread is not None and self._thread.is_alive():
+            # A writer that outlived stop()'s join is still flushing; a second one would share the queue.
+            print("[!] Landmark recorder: previous session is still being written; try again shortly.")
+            return False
+        self._drain_queue()
+        self._stopping = False
+        try:
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            print(f"[!] Landmark recorder: cannot create {self.out_dir}: {e}")
+            return False
+        self._session_tag = time.strftime("%Y%m%d-%H%M%S")
+        self._part = 0
+        self.dropped_frames = 0
+        self.written_frames = 0
+        self._thread = threading.Thread(target=self._writer_loop, name="landmark-writer", daemon=True)
+        self._thread.start()
+        self.queue.put({"type": "meta", "t": time.time(), **(meta or {})})
+        print(f"[+] Landmark recording started: {self.out_dir}")
+        return True
+
+    def stop(self, timeout=2.0):
+        if self._thread is None:
+            return
+        if not self._stopping:
+            self._stopping = True
+            # The writer drains the queue, so the sentinel always fits eventually; give up only if it died.
+            while self._thread.is_alive():
+                try:
+                    self.queue.put(self._stop_token, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+        self._thread.join(timeout=timeout)
+        if self._thread.is_alive():
+            print(f"[!] Landmark recorder: writer still flushing after {timeout:.1f}s: {self.current_path}")
+            return
+        self._thread = None
+        self._drain_queue()
+        print(
+            f"[+] Landmark recording stopped ({self.written_frames} frames, "
+            f"{self.dropped_frames} dropped): {self.current_path}"
+        )
+
+    def record(
+        self,
+        hand_landmarks,
+        handedness,
+        raw_sign="idle",
+        raw_conf=0.0,
+        stable_sign="idle",
+        stable_conf=0.0,
+        lighting_status="unknown",
+        lighting_mean=0.0,
+        lighting_contrast=0.0,
+        lighting_ok=True,
+        t=None,
+    ):
+        """Queue one frame. Landmark objects are serialized on the writer thread."""
+        if self._thread is None or self._stopping:
+            return
+        item = (
+            time.time() if t is None else float(t),
+            hand_landmarks,
+            handedness,
+            raw_sign,
+            raw_conf,
+            stable_sign,
+            stable_conf,
+            lighting_status,
+            lighting_mean,
+            lighting_contrast,
+            lighting_ok,
+        )
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            self.dropped_frames += 1
+
+    def _drain_queue(self):
+        while True:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                return
+
+    def _open_next_file(self):
+        self._close_file()
+        self._part += 1
+        name = f"{self.prefix}_{self._session_tag}_{self._part:03d}.jsonl.gz"
+        self.current_path = self.out_dir / name
+        self._raw_file = open(self.current_path, "wb")
+        self._gz_file = gzip.GzipFile(fileobj=self._raw_file, mode="wb", compresslevel=5)
+        self._prune_old_files()
+
+    def _close_file(self):
+        if self._gz_file is not None:
+            try:
+                self._gz_file.close()
+            except Exception:
+                pass
+            self._gz_file = None
+        if self._raw_file is not None:
+            try:
+                self._raw_file.close()
+            except Exception:
+                pass
+            self._raw_file = None
+
+    def _prune_old_files(self):
+        files = sorted(self.out_dir.glob(f"{self.prefix}_*.jsonl.gz"), key=lambda p: p.stat().st_mtime)
+        for old in files[:-self.max_files]:
+            try:
+                old.unlink()
+            except Exception:
+                pass
+
+    def _serialize(self, item):
+        if isinstance(item, dict):
+            return item
+        (
+            t, hand_landmarks, handedness, raw_sign, raw_conf, stable_sign, stable_conf,
+            lighting_status, lighting_mean, lighting_contrast, lighting_ok,
+        ) = item
+        return {
+            "t": round(t, 4),
+            "hands": _hands_payload(hand_landmarks, handedness),
+            "lighting_ok": bool(lighting_ok),
+            "lighting": {
+                "status": str(lighting_status),
+                "mean": round(float(lighting_mean), 2),
+                "contrast": round(float(lighting_contrast), 2),
+            },
+            "raw_sign": str(raw_sign),
+            "raw_conf": round(float(raw_conf), 4),
+            "stable_sign": str(stable_sign),
+            "stable_conf": round(float(stable_conf), 4),
+        }
+
+    def _writer_loop(self):
+        try:
+            self._open_next_file()
+        except Exception as e:
+            print(f"[!] Landmark recorder: cannot open log file: {e}")
+            return
+        try:
+            while True:
+                item = self.queue.get()
+                if item is self._stop_token:
+                    break
+                try:
+                    line = json.dumps(self._serialize(item), separators=(",", ":")) + "\n"
+                    self._gz_file.write(line.encode("utf-8"))
+                    self.written_frames += 1
+                except Exception as e:
+                    print(f"[!] Landmark recorder write error: {e}")
+                    continue
+                # Compressed bytes on disk; gzip buffers so this lags slightly behind.
+                if self._raw_file.tell() >= self.max_file_bytes:
+                    self._open_next_file()
+        finally:
+            self._close_file()
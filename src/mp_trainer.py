@@ -1,5 +1,4 @@
 import cv2
-import mediapipe as mp
 import numpy as np
 import csv
 import time
@@ -11,9 +10,12 @@ import shutil
 import sys
 from pathlib import Path
 
-# MediaPipe Tasks API Imports (Fix for missing mediapipe.solutions)
-from mediapipe.tasks import python
-from mediapipe.tasks.python import vision
+try:
+    from src.frame_source import add_frame_source_args, open_frame_source, source_spec
+except ImportError:
+    # Run as a script (python src/mp_trainer.py): make the repo root importable.
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from src.frame_source import add_frame_source_args, open_frame_source, source_spec
 
 # Constants
 LABELS = ["Idle", "Tiger", "Ram", "Snake", "Horse", "Rat", "Boar", "Dog", "Bird", "Monkey", "Ox", "Dragon", "Hare", "Clap"]
@@ -111,39 +113,18 @@ DATA_FILE = _resolve_data_file_path()
 MODEL_PATH = _resolve_model_path()
 
 
-def open_camera(camera_index=0, width=640, height=480):
+def open_camera(camera_index=0, width=640, height=480, realtime=None, loop=None):
     """
-    Open a camera backend that can actually deliver frames.
-    Some Windows backends report opened=True but return empty reads forever.
+    Open a frame source that can actually deliver frames (see src/frame_source.py).
+    Webcams probe DSHOW / DEFAULT / MSMF, since some Windows backends report
+    opened=True but return empty reads forever.
     """
-    backends = [("DSHOW", cv2.CAP_DSHOW), ("DEFAULT", None)]
-    if hasattr(cv2, "CAP_MSMF"):
-        backends.append(("MSMF", cv2.CAP_MSMF))
-
-    for backend_name, backend in backends:
-        cap = cv2.VideoCapture(camera_index) if backend is None else cv2.VideoCapture(camera_index, backend)
-        if not cap.isOpened():
-            cap.release()
-            continue
-
-        cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
-        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
-
-        # Warm up and verify real frame delivery.
-        for _ in range(20):
-            ok, _ = cap.read()
-            if ok:
-                print(f"[+] Camera {camera_index} opened via {backend_name}.")
-                return cap
-            time.sleep(0.03)
-
-        print(f"[!] Camera {camera_index} via {backend_name} opened but returned no frames; trying next backend...")
-        cap.release()
-
-    return None
+    return open_frame_source(camera_index, width, height, realtime=realtime, loop=loop)
 
 class SignRecorder:
-    def __init__(self):
+    def __init__(self, data_file=None):
+        # Resolved per instance so tools can point at their own CSV (default: DATA_FILE).
+        self.data_file = Path(data_file if data_file is not None else DATA_FILE)
         self.mode = "PREDICT" # PREDICT or RECORD
         self.current_label_idx = 1 # Start with Tiger (Index 1), Idle is 0
         self.recording_frames = 0
@@ -161,9 +142,9 @@ class SignRecorder:
         self.reset_temporal_state()
         
         # Ensure database exists
-        DATA_FILE.parent.mkdir(parents=True, exist_ok=True)
-        if not DATA_FILE.exists():
-            with open(DATA_FILE, 'w', newline='') as f:
+        self.data_file.parent.mkdir(parents=True, exist_ok=True)
+        if not self.data_file.exists():
+            with open(self.data_file, 'w', newline='') as f:
                 writer = csv.writer(f)
                 # Header: label, then 42 sets of (x,y,z) coords (21 per hand * 2 hands)
                 header = ["label"] + [f"h1_{i}_{ax}" for i in range(21) for ax in "xyz"] + \
@@ -190,7 +171,7 @@ class SignRecorder:
     def _load_and_train(self):
         """Train a KNN model in memory if CSV has data."""
         try:
-            if not DATA_FILE.exists():
+            if not self.data_file.exists():
                 return
 
             max_rows = max(500, int(os.getenv("MP_TRAINER_MAX_ROWS", str(DEFAULT_MAX_TRAIN_ROWS))))
@@ -198,7 +179,7 @@ class SignRecorder:
             total_rows = 0
 
             # Reservoir sample to avoid loading the full DB into RAM.
-            with open(DATA_FILE, 'r', newline='') as f:
+            with open(self.data_file, 'r', newline='') as f:
                 reader = csv.reader(f)
                 next(reader, None)  # header
                 for row in reader:
@@ -419,7 +400,7 @@ class SignRecorder:
                     rows_to_write.append(mirrored)
                     mirrored_count += 1
 
-        with open(DATA_FILE, 'a', newline='') as f:
+        with open(self.data_file, 'a', newline='') as f:
             writer = csv.writer(f)
             writer.writerows(rows_to_write)
 
@@ -516,7 +497,13 @@ def draw_hand_landmarks(image, hand_landmarks):
             cx, cy = int(lm.x * w), int(lm.y * h)
             cv2.circle(image, (cx, cy), 4, (0, 0, 255), -1)
 
-def main(camera_index=0):
+def main(camera_index=0, source="", realtime=None, loop=None):
+    # MediaPipe is only needed by the recorder CLI; SignRecorder itself is pure KNN,
+    # so the launcher can import it without loading MediaPipe.
+    import mediapipe as mp
+    from mediapipe.tasks import python
+    from mediapipe.tasks.python import vision
+
     # Setup Tasks API Detector
     base_options = python.BaseOptions(model_asset_path=str(MODEL_PATH))
     options = vision.HandLandmarkerOptions(
@@ -528,9 +515,10 @@ def main(camera_index=0):
     )
     detector = vision.HandLandmarker.create_from_options(options)
 
-    cap = open_camera(camera_index, width=640, height=480)
+    spec = source_spec(source, camera_index)
+    cap = open_camera(spec, width=640, height=480, realtime=realtime, loop=loop)
     if cap is None:
-        print(f"[-] Could not read frames from camera {camera_index} on any backend (DSHOW/DEFAULT/MSMF).")
+        print(f"[-] Could not read frames from source {spec!r} (webcams: tried DSHOW/DEFAULT/MSMF).")
         detector.close()
         return
          
@@ -670,5 +658,11 @@ def main(camera_index=0):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="MediaPipe Jutsu Trainer")
     parser.add_argument("--camera", "-c", type=int, default=0, help="Camera index (default: 0)")
+    add_frame_source_args(parser)
     args = parser.parse_args()
-    main(camera_index=args.camera)
+    main(
+        camera_index=args.camera,
+        source=args.source,
+        realtime=False if args.source_fast else None,
+        loop=False if args.source_once else None,
+    )
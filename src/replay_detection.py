@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""Replay recorded hand landmarks (or a video) through the game's sign-detection stack.
+
+Runs the exact pygame path headlessly:
+  landmarks -> SignRecorder KNN -> two-hand gate -> temporal vote -> jutsu sequence
+
+Inputs:
+- Landmark stream (.jsonl / .jsonl.gz), one frame per line:
+    {"t": 12.345, "hands": [{"handedness": "Right", "landmarks": [[x, y, z], ...21]}],
+     "lighting_ok": true, "label": "tiger"}
+  "label" (ground-truth sign for that frame) and "lighting_ok" are optional.
+- Video file (.mp4/.avi/...): hands are extracted with MediaPipe HandLandmarker (VIDEO mode).
+
+Usage examples:
+  python src/replay_detection.py --input captures/session.jsonl.gz
+  python src/replay_detection.py --input clip.mp4 --expect-sign tiger
+  python src/replay_detection.py --input session.jsonl --jutsu Fireball --json-out replay.json \\
+      --max-false-triggers 0 --max-median-latency-ms 250
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.jutsu_academy.frame_profiler import FrameProfiler
+from src.jutsu_academy.main_pygame_mixins.gameplay import GameplayMixin
+from src.jutsu_registry import OFFICIAL_JUTSUS
+from src.mp_trainer import DATA_FILE, SignRecorder
+from src.utils.paths import resolve_resource_path
+
+VIDEO_SUFFIXES = {".mp4", ".avi", ".mov", ".mkv", ".webm", ".m4v"}
+
+
+@dataclass
+class ReplayStats:
+    source: str
+    frames: int = 0
+    duration_s: float = 0.0
+    wall_s: float = 0.0
+    pipeline_s: float = 0.0
+    latencies_ms: dict[str, list[float]] = field(default_factory=dict)
+    missed: dict[str, int] = field(default_factory=dict)
+    false_triggers: list[dict] = field(default_factory=list)
+    stable_onsets: dict[str, int] = field(default_factory=dict)
+    jutsu_clears: list[dict] = field(default_factory=list)
+    vote_window_size: int = 0
+    vote_required_hits: int = 0
+
+    def median_latency_ms(self) -> float | None:
+        values = [v for items in self.latencies_ms.values() for v in items]
+        return round(float(statistics.median(values)), 1) if values else None
+
+    def to_dict(self) -> dict:
+        per_sign = {}
+        for label in sorted(set(self.latencies_ms) | set(self.missed)):
+            values = self.latencies_ms.get(label, [])
+            per_sign[label] = {
+                "confirmed": len(values),
+                "missed": int(self.missed.get(label, 0)),
+                "latency_ms_median": round(float(statistics.median(values)), 1) if values else None,
+                "latency_ms_max": round(float(max(values)), 1) if values else None,
+            }
+        return {
+            "source": self.source,
+            "frames": self.frames,
+            "duration_s": round(self.duration_s, 3),
+            "wall_s": round(self.wall_s, 3),
+            "throughput_fps": round(self.frames / self.wall_s, 1) if self.wall_s > 0 else None,
+            "pipeline_fps": round(self.frames / self.pipeline_s, 1) if self.pipeline_s > 0 else None,
+            "median_latency_ms": self.median_latency_ms(),
+            "per_sign": per_sign,
+            "false_triggers": len(self.false_triggers),
+            "false_trigger_events": self.false_triggers,
+            "stable_onsets": dict(sorted(self.stable_onsets.items())),
+            "jutsu_clears": self.jutsu_clears,
+            "vote_window_size": self.vote_window_size,
+            "vote_required_hits": self.vote_required_hits,
+        }
+
+
+class ReplayDetector(GameplayMixin):
+    """Minimal host for GameplayMixin's vote/sequence logic without pygame or a camera."""
+
+    def __init__(self, restricted_signs=True, game_mode="practice", auto_tune=True, signs_db=None):
+        self.settings = {"restricted_signs": bool(restricted_signs)}
+        self.game_mode = game_mode
+        self.calibration_active = False
+        self.profiler = FrameProfiler(enabled=False)
+        # SignRecorder creates an empty dataset when the file is missing; replay needs a trained one.
+        data_file = Path(signs_db).expanduser().resolve() if signs_db else DATA_FILE
+        if not Path(data_file).exists():
+            raise FileNotFoundError(f"Sign dataset not found: {data_file} (pass --signs-db)")
+        self.recorder = SignRecorder(data_file=data_file)
+
+        self._init_detection_state()
+        self.vote_auto_tune = bool(auto_tune)
+
+    def set_jutsu(self, jutsu_name):
+        self.sequence = list(OFFICIAL_JUTSUS.get(jutsu_name, {}).get("sequence", []))
+        self.current_step = 0
+        self.sequence_run_start = None
+
+    def step_sequence(self, detected, now):
+        """GameplayMixin's sequence matcher plus the game's completion reset. Returns clear time when the jutsu completes."""
+        if not self._match_sequence_step(detected, now) or self.current_step < len(self.sequence):
+            return None
+        clear_time = now - float(self.sequence_run_start or now)
+        self.current_step = 0
+        self.sequence_run_start = None
+        return clear_time
+
+
+def _open_text(path: Path):
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    return path.open("r", encoding="utf-8")
+
+
+def _to_landmarks(points):
+    return [SimpleNamespace(x=float(p[0]), y=float(p[1]), z=float(p[2]) if len(p) > 2 else 0.0) for p in points]
+
+
+def iter_jsonl_frames(path: Path):
+    """Yield (t, hand_landmarks, handedness, lighting_ok, label) from a landmark stream."""
+    with _open_text(path) as file:
+        for line_no, line in enumerate(file, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                print(f"[!] Skipping malformed line {line_no}")
+                continue
+            if record.get("type") not in (None, "frame"):
+                continue
+
+            hand_landmarks = []
+            handedness = []
+            for hand in record.get("hands", []) or []:
+                points = hand.get("landmarks") or []
+                if len(points) != 21:
+                    continue
+                hand_landmarks.append(_to_landmarks(points))
+                handedness.append([
+                    SimpleNamespace(
+                        category_name=str(hand.get("handedness", "Unknown")),
+                        score=float(hand.get("score", 1.0) or 0.0),
+                    )
+                ])
+            t = float(record.get("t", record.get("timestamp", 0.0)) or 0.0)
+            label = record.get("label")
+            yield t, hand_landmarks, handedness, bool(record.get("lighting_ok", True)), label
+
+
+def iter_video_frames(path: Path, flip=True):
+    """Yield (t, hand_landmarks, handedness, lighting_ok, None) by running MediaPipe on a video."""
+    import cv2
+    import mediapipe as mp
+    from mediapipe.tasks import python
+    from mediapipe.tasks.python import vision
+
+    hand_path = resolve_resource_path("models/hand_landmarker.task")
+    if not hand_path.exists():
+        raise FileNotFoundError(f"Hand model not found: {hand_path}")
+    options = vision.HandLandmarkerOptions(
+        base_options=python.BaseOptions(model_asset_path=str(hand_path)),
+        num_hands=2,
+        running_mode=vision.RunningMode.VIDEO,
+        min_hand_detection_confidence=0.25,
+        min_hand_presence_confidence=0.25,
+        min_tracking_confidence=0.25,
+    )
+    landmarker = vision.HandLandmarker.create_from_options(options)
+    cap = cv2.VideoCapture(str(path))
+    if not cap.isOpened():
+        landmarker.close()
+        raise RuntimeError(f"Could not open video: {path}")
+
+    fps = float(cap.get(cv2.CAP_PROP_FPS) or 0.0) or 30.0
+    frame_idx = 0
+    last_ts_ms = -1
+    try:
+        while True:
+            ok, frame = cap.read()
+            if not ok:
+                break
+            if flip:
+                frame = cv2.flip(frame, 1)
+            t = frame_idx / fps
+            ts_ms = max(last_ts_ms + 1, int(t * 1000))
+            last_ts_ms = ts_ms
+            frame_idx += 1
+
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            mean = float(gray.mean())
+            contrast = float(gray.std())
+            lighting_ok = 45.0 <= mean <= 210.0 and contrast >= 22.0
+
+            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            result = landmarker.detect_for_video(mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb), ts_ms)
+            yield t, list(result.hand_landmarks or []), list(result.handedness or []), lighting_ok, None
+    finally:
+        cap.release()
+        landmarker.close()
+
+
+def _normalize(label) -> str:
+    token = str(label or "").strip().lower()
+    return "idle" if token in ("", "none", "unknown") else token
+
+
+def replay(frames, detector: ReplayDetector, source: str, expect_sign: str = "", jutsu: str = "") -> ReplayStats:
+    stats = ReplayStats(source=source)
+    if jutsu:
+        detector.set_jutsu(jutsu)
+
+    expect_sign = _normalize(expect_sign) if expect_sign else ""
+    first_t = None
+    last_t = 0.0
+    prev_stable = "idle"
+    segment_label = "idle"
+    segment_start = 0.0
+    segment_confirmed = False
+
+    def close_segment():
+        if segment_label != "idle" and not segment_confirmed:
+            stats.missed[segment_label] = stats.missed.get(segment_label, 0) + 1
+
+    wall_start = time.perf_counter()
+    for t, hand_landmarks, handedness, lighting_ok, label in frames:
+        if first_t is None:
+            first_t = t
+        last_t = t
+        truth = _normalize(label) if label is not None else (expect_sign or None)
+
+        if truth is not None and truth != segment_label:
+            close_segment()
+            segment_label = truth
+            segment_start = t
+            segment_confirmed = False
+
+        step_start = time.perf_counter()
+        stable = detector._classify_hand_landmarks(hand_landmarks, handedness, lighting_ok, now=t)
+        clear_time = detector.step_sequence(stable, t)
+        stats.pipeline_s += time.perf_counter() - step_start
+        stats.frames += 1
+
+        stable = _normalize(stable)
+        if stable != "idle" and stable != prev_stable:
+            stats.stable_onsets[stable] = stats.stable_onsets.get(stable, 0) + 1
+            if truth is not None and stable != truth:
+                stats.false_triggers.append({"t": round(t, 3), "detected": stable, "expected": truth})
+        if truth is not None and truth != "idle" and stable == truth and not segment_confirmed:
+            segment_confirmed = True
+            stats.latencies_ms.setdefault(truth, []).append((t - segment_start) * 1000.0)
+        if clear_time is not None:
+            stats.jutsu_clears.append({"t": round(t, 3), "clear_time_s": round(clear_time, 3)})
+        prev_stable = stable
+
+    close_segment()
+    stats.wall_s = time.perf_counter() - wall_start
+    stats.duration_s = max(0.0, last_t - (first_t or 0.0))
+    stats.vote_window_size = int(detector.vote_window_size)
+    stats.vote_required_hits = int(detector.vote_required_hits)
+    return stats
+
+
+def print_summary(payload: dict) -> None:
+    print("[Replay]")
+    print(f"  Source: {payload['source']}")
+    print(f"  Frames: {payload['frames']} over {payload['duration_s']}s")
+    print(f"  Throughput: {payload['throughput_fps']} fps (pipeline only: {payload['pipeline_fps']} fps)")
+    print(f"  Vote: {payload['vote_required_hits']}/{payload['vote_window_size']} hits")
+    print(f"  Median confirmation latency: {payload['median_latency_ms']} ms")
+    print(f"  False triggers: {payload['false_triggers']}")
+    if payload["per_sign"]:
+        print("  Per sign:")
+        for label, row in payload["per_sign"].items():
+            print(
+                f"    - {label}: confirmed={row['confirmed']} missed={row['missed']} "
+                f"median={row['latency_ms_median']}ms max={row['latency_ms_max']}ms"
+            )
+    if payload["stable_onsets"]:
+        print("  Stable onsets:")
+        for label, count in payload["stable_onsets"].items():
+            print(f"    - {label}: {count}")
+    if payload["jutsu_clears"]:
+        times = ", ".join(f"{row['clear_time_s']}s" for row in payload["jutsu_clears"])
+        print(f"  Jutsu clears: {len(payload['jutsu_clears'])} ({times})")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Replay landmark streams or videos through the sign-detection stack.")
+    parser.add_argument("--input", required=True, help="Landmark stream (.jsonl/.jsonl.gz) or video file.")
+    parser.add_argument("--expect-sign", default="", help="Ground-truth sign for inputs without per-frame labels.")
+    parser.add_argument("--jutsu", default="", help="Also run sequence matching for this jutsu (e.g. Fireball).")
+    parser.add_argument("--signs-db", default="", help="Sign dataset CSV (default: the game's mediapipe_signs_db.csv).")
+    parser.add_argument("--mode", default="practice", help="Game mode to emulate (challenge enforces lighting gate).")
+    parser.add_argument("--no-restricted", action="store_true", help="Disable the two-hand gate.")
+    parser.add_argument("--no-auto-tune", action="store_true", help="Keep fixed vote window/hits.")
+    parser.add_argument("--no-flip", action="store_true", help="Do not mirror video frames before detection.")
+    parser.add_argument("--max-false-triggers", type=int, default=-1, help="Fail if false triggers exceed this.")
+    parser.add_argument("--max-median-latency-ms", type=float, default=0.0, help="Fail if median latency exceeds this.")
+    parser.add_argument("--min-fps", type=float, default=0.0, help="Fail if pipeline throughput is below this.")
+    parser.add_argument("--json", action="store_true", help="Print JSON summary to stdout.")
+    parser.add_argument("--json-out", default="", help="Optional path to write JSON summary.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    input_path = Path(args.input).expanduser().resolve()
+    if not input_path.exists():
+        print(f"[-] Input not found: {input_path}")
+        return 1
+    if args.jutsu and args.jutsu not in OFFICIAL_JUTSUS:
+        print(f"[-] Unknown jutsu: {args.jutsu}")
+        return 1
+
+    try:
+        detector = ReplayDetector(
+            restricted_signs=not args.no_restricted,
+            game_mode=args.mode,
+            auto_tune=not args.no_auto_tune,
+            signs_db=args.signs_db or None,
+        )
+    except FileNotFoundError as exc:
+        print(f"[-] {exc}")
+        return 1
+    if input_path.suffix.lower() in VIDEO_SUFFIXES:
+        frames = iter_video_frames(input_path, flip=not args.no_flip)
+    else:
+        frames = iter_jsonl_frames(input_path)
+
+    try:
+        stats = replay(frames, detector, str(input_path), expect_sign=args.expect_sign, jutsu=args.jutsu)
+    except Exception as exc:
+        print(f"[-] Replay failed: {exc}")
+        return 1
+
+    payload = stats.to_dict()
+    failures = []
+    if args.max_false_triggers >= 0 and payload["false_triggers"] > args.max_false_triggers:
+        failures.append(f"False triggers {payload['false_triggers']} > {args.max_false_triggers}.")
+    median = payload["median_latency_ms"]
+    if args.max_median_latency_ms > 0 and (median is None or median > args.max_median_latency_ms):
+        failures.append(f"Median latency {median} ms > {args.max_median_latency_ms} ms.")
+    if args.min_fps > 0 and (payload["pipeline_fps"] or 0.0) < args.min_fps:
+        failures.append(f"Pipeline fps {payload['pipeline_fps']} < {args.min_fps}.")
+    payload["failures"] = failures
+    payload["ok"] = len(failures) == 0
+
+    if args.json:
+        print(json.dumps(payload, indent=2, ensure_ascii=True))
+    else:
+        print_summary(payload)
+        print("[Gate]")
+        for line in failures or ["OK"]:
+            print(f"  - {line}")
+
+    if args.json_out:
+        json_out_path = Path(args.json_out).expanduser().resolve()
+        json_out_path.parent.mkdir(parents=True, exist_ok=True)
+        json_out_path.write_text(json.dumps(payload, indent=2, ensure_ascii=True) + "\n", encoding="utf-8")
+        print(f"[+] Wrote JSON report: {json_out_path}")
+
+    return 0 if not failures else 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())